@@ -3,11 +3,15 @@
 # -*- coding:o utf-8 -*-
 # It contains the main function for the game.
 
+import time
+
+# Taken before any other import so the startup budget covers module loading
+startup_time = time.perf_counter()
+
 import pygame
 import sys
 import asyncio
 import os
-import random
 import logging
 from datetime import datetime
 
@@ -20,70 +24,13 @@ log_filename = os.path.join(
     logs_dir, f"game_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
 )
 
-logger = logging.getLogger()
-logger.setLevel(logging.DEBUG)
-
-file_handler = logging.FileHandler(log_filename, mode="w", encoding="utf-8")
-file_handler.setLevel(logging.DEBUG)
-console_handler = logging.StreamHandler()
-console_handler.setLevel(logging.INFO)
-
-formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-file_handler.setFormatter(formatter)
-console_handler.setFormatter(formatter)
-
-logger.addHandler(file_handler)
-logger.addHandler(console_handler)
-
-
-class LogRedirector:
-    def __init__(self, logger, level):
-        self.logger = logger
-        self.level = level
-        self.buffer = ""
-        self._writing = False
-
-    def write(self, buf):
-        if self._writing:
-            if sys.__stdout__ is not None:
-                try:
-                    sys.__stdout__.write(buf)
-                except (AttributeError, IOError):
-                    pass
-            return
-
-        self._writing = True
-        try:
-            for line in buf.rstrip().splitlines():
-                if line.strip():
-                    self.logger.log(self.level, line.rstrip())
-
-            if sys.__stdout__ is not None:
-                try:
-                    sys.__stdout__.write(buf)
-                except (AttributeError, IOError):
-                    pass
-        except Exception as e:
-            if not self._writing:
-                print(f"Error in LogRedirector: {e}", file=sys.__stderr__)
-        finally:
-            self._writing = False
-
-    def flush(self):
-        try:
-            if hasattr(sys, "__stdout__") and sys.__stdout__ is not None:
-                sys.__stdout__.flush()
-        except (AttributeError, IOError):
-            pass
-
+from src.Log_Manager import log_manager
 
-sys.stdout = LogRedirector(logger, logging.INFO)
-sys.stderr = LogRedirector(logger, logging.ERROR)
+logger = logging.getLogger()
+log_manager.start(log_filename)
 
 logger.info("=== Game Session Started ===")
 
-file_handler.flush()
-
 pygame.init()
 os.chdir(os.path.dirname(os.path.abspath(__file__)))
 
@@ -106,6 +53,17 @@ from src.UI import (
     KeyboardShortcutsPage,
 )
 from src.Font_Manager import font_manager
+from src.Frame_Profiler import frame_profiler
+from src.Loadexcel import preload_property_data
+from src.Asset_Manager import asset_manager
+from src.Replay_Log import ReplayLog
+from src.Save_Game import AUTOSAVE_PATH, Autosaver, has_autosave, load_game
+from src.Page_Router import PageRouter
+from src.Game_Intro import GameIntro, is_fast_start
+
+logger.info(
+    f"Modules imported in {(time.perf_counter() - startup_time) * 1000:.0f}ms"
+)
 
 WINDOW_SIZE = (1280, 720)
 WHITE = (255, 255, 255)
@@ -126,6 +84,19 @@ HOTEL_REPLACES_HOUSES = True  # When building a hotel, houses are returned to ba
 
 FPS = 30
 
+# F4 writes a Chrome trace of this many of the most recent frames
+TRACE_FRAMES = FPS * 5
+
+# Images a new game converts while it is being built, as soon as the board appears
+GAME_IMAGES = ("board.png", "background.jpg") + tuple(
+    f"Dice/{i}.png" for i in range(1, 7)
+)
+TOKEN_SIZE = (40, 40)
+
+# Time allowed from process start to the first main menu frame, not counting
+# the company logo screens
+STARTUP_BUDGET_MS = 1000
+
 GAME_INSTRUCTIONS = [
     "Use WASD or Arrow keys to move",
     "Press + or - to zoom",
@@ -138,6 +109,18 @@ GAME_INSTRUCTIONS = [
     "Collect £200 when passing GO",
 ]
 
+MENU_PAGES = {
+    "main_menu": MainMenuPage,
+    "start": StartPage,
+    "how_to_play": HowToPlayPage,
+    "keyboard_shortcuts": KeyboardShortcutsPage,
+    "settings": SettingsPage,
+    "ai_difficulty": AIDifficultyPage,
+    "game_mode": GameModePage,
+}
+# Rebuilt after each game, so the next one starts from empty setup pages
+GAME_SETUP_PAGES = ("start", "ai_difficulty", "game_mode")
+
 
 async def apply_screen_settings(resolution):
     global WINDOW_SIZE
@@ -146,11 +129,7 @@ async def apply_screen_settings(resolution):
 
     pygame.display.set_caption("Property Tycoon Alpha 25.03.2025")
     try:
-        icon_path = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)), "assets", "image", "icon.ico"
-        )
-        icon = pygame.image.load(icon_path)
-        pygame.display.set_icon(icon)
+        pygame.display.set_icon(asset_manager.get_image("icon.ico"))
     except (pygame.error, FileNotFoundError) as e:
         logger.error(f"Could not load game icon: {e}")
 
@@ -215,7 +194,29 @@ def create_game(player_info, game_settings):
         game_mode=game_settings.get("mode", "full"),
         time_limit=game_settings.get("time_limit"),
         ai_difficulty=game_settings.get("ai_difficulty", "easy"),
+        seed=game_settings.get("seed"),
+    )
+
+    # Seed and decisions go to disk as they happen, so a crashed game can still be replayed
+    replay_path = os.path.join(
+        logs_dir, f"replay_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+    )
+    game.logic.replay_log = ReplayLog(replay_path)
+    game.logic.replay_log.start(
+        game.rng_service.seed,
+        [
+            {
+                "name": player.name,
+                "is_ai": player.is_ai,
+                "ai_difficulty": player.ai_difficulty,
+            }
+            for player in players
+        ],
+        mode=game_settings.get("mode", "full"),
+        time_limit=game_settings.get("time_limit"),
+        ai_difficulty=game_settings.get("ai_difficulty", "easy"),
     )
+    logger.info(f"Game seed {game.rng_service.seed}, replay log {replay_path}")
 
     game.bank_money = bank_money
     game.free_parking_pot = 0
@@ -225,6 +226,91 @@ def create_game(player_info, game_settings):
     return game
 
 
+async def warm_game_assets(player_info):
+    """Convert the board, dice and token images one at a time between intro frames"""
+    _, _, _, token_indices = player_info
+    for key in GAME_IMAGES:
+        try:
+            asset_manager.get_image(key)
+        except (pygame.error, FileNotFoundError) as e:
+            logger.warning(f"Could not warm image {key}: {e}")
+        await asyncio.sleep(0)
+
+    for token_index in token_indices:
+        key = f"Playertoken ({token_index + 1}).png"
+        try:
+            asset_manager.get_scaled(key, TOKEN_SIZE)
+        except (pygame.error, FileNotFoundError) as e:
+            logger.warning(f"Could not warm image {key}: {e}")
+        await asyncio.sleep(0)
+
+
+async def start_game(player_info, game_settings):
+    # Board data finishes loading on its worker thread while the intro plays,
+    # and the game's images are converted on this thread between intro frames,
+    # so skipping the intro leaves only what is still unfinished to wait for
+    start = time.perf_counter()
+    preload = preload_property_data()
+    warm = asyncio.create_task(warm_game_assets(player_info))
+    if is_fast_start():
+        intro_result = "off"
+    else:
+        intro = GameIntro(pygame.display.get_surface())
+        intro_result = "played" if await intro.play() else "skipped"
+    await warm
+    await asyncio.to_thread(preload.join)
+
+    game = create_game(player_info, game_settings)
+    logger.info(
+        f"Game ready after {(time.perf_counter() - start) * 1000:.0f}ms "
+        f"(intro {intro_result})"
+    )
+    return game
+
+
+def show_page(router, name):
+    page = router.show(name)
+    if name == "main_menu":
+        # The autosave comes and goes between visits, so the button is checked each time
+        page.can_continue = has_autosave()
+    return page
+
+
+def load_saved_game():
+    try:
+        game, game_settings = load_game(AUTOSAVE_PATH)
+    except (OSError, ValueError, KeyError) as e:
+        logger.error(f"Could not load saved game from {AUTOSAVE_PATH}: {e}")
+        return None
+    logger.info(f"Loaded saved game from {AUTOSAVE_PATH}")
+    return game, game_settings
+
+
+def get_autosave_point(game):
+    """Say where the game is for autosaving, or None while a move is half finished"""
+    if game.ai_scheduler.is_pending() or any(
+        player.is_moving for player in game.players
+    ):
+        return None
+
+    # A closed auction stays on the logic, marked completed, until the next one
+    auction = game.logic.current_auction
+    if auction and not auction.get("completed", False):
+        if game.state != "AUCTION":
+            return None
+        # Saved after every bid or pass, so a restart resumes the auction
+        return (
+            game.logic.turn_count,
+            auction["property_position"],
+            auction["current_bid"],
+            len(auction["passed_players"]),
+            auction["current_bidder_index"],
+        )
+    if game.state != "ROLL":
+        return None
+    return (game.logic.turn_count,)
+
+
 async def run_game(game, game_settings):
     running = True
     game_over_data = None
@@ -232,19 +318,12 @@ async def run_game(game, game_settings):
     last_ai_progress_time = pygame.time.get_ticks()
     ai_timeout_duration = 10000
 
-    last_log_flush_time = pygame.time.get_ticks()
-    log_flush_interval = 1500
-
     logger.info(f"Starting game with settings: {game_settings}")
     logger.info(f"Players: {[player.name for player in game.players]}")
     logger.info(f"Game mode: {game_settings.get('mode', 'full')}")
     if game_settings.get("time_limit"):
         logger.info(f"Time limit: {game_settings.get('time_limit')} seconds")
 
-    for handler in logger.handlers:
-        if isinstance(handler, logging.FileHandler):
-            handler.flush()
-
     time_warning_active = False
     warning_flash_rate = 300
     warning_edge_size = 0
@@ -264,19 +343,19 @@ async def run_game(game, game_settings):
 
     event_handler.handle_motion((0, 0))
 
+    autosaver = Autosaver(AUTOSAVE_PATH)
+    autosaver.start()
+    last_autosave_point = None
+
     sound_manager.play_music(loop=-1)
 
     while running:
         await asyncio.sleep(0)
+        frame_profiler.begin_frame()
+        span_start = frame_profiler.clock()
 
         current_time = pygame.time.get_ticks()
 
-        if current_time - last_log_flush_time > log_flush_interval:
-            last_log_flush_time = current_time
-            for handler in logger.handlers:
-                if isinstance(handler, logging.FileHandler):
-                    handler.flush()
-
         if (
             game_settings["mode"] == "abridged"
             and current_time - last_time_check > 1000
@@ -320,6 +399,9 @@ async def run_game(game, game_settings):
                 running = False
                 continue
 
+        frame_profiler.record("sync", span_start, frame_profiler.clock())
+        span_start = frame_profiler.clock()
+
         if game.current_player_is_ai and not game.game_paused:
             if current_time - last_ai_progress_time > ai_timeout_duration:
                 logger.warning(
@@ -344,6 +426,7 @@ async def run_game(game, game_settings):
 
                     game.state = "ROLL"
                     game.current_player_is_ai = False
+                    game.ai_scheduler.cancel_all()
 
                     game_actions.check_and_trigger_ai_turn()
 
@@ -352,6 +435,7 @@ async def run_game(game, game_settings):
         if not game.current_player_is_ai:
             last_ai_progress_time = current_time
 
+        frame_profiler.record("ai", span_start, frame_profiler.clock())
         renderer.draw()
 
         if hasattr(game, "waiting_for_animation") and game.waiting_for_animation:
@@ -359,9 +443,11 @@ async def run_game(game, game_settings):
             if not any_moving:
                 game.waiting_for_animation = False
             else:
-                pygame.display.flip()
+                with frame_profiler.span("flip"):
+                    pygame.display.flip()
                 continue
 
+        span_start = frame_profiler.clock()
         for game_event in pygame.event.get():
             if game_event.type == pygame.QUIT:
                 safe_exit()
@@ -382,7 +468,23 @@ async def run_game(game, game_settings):
             elif game_event.type == pygame.KEYDOWN:
                 logger.debug(f"Key pressed: {pygame.key.name(game_event.key)}")
 
-                if game_event.key == pygame.K_ESCAPE:
+                if game_event.key == pygame.K_F3:
+                    frame_profiler.toggle_overlay()
+                    renderer.invalidate()
+                elif game_event.key == pygame.K_F4:
+                    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                    trace_path = os.path.join(logs_dir, f"frame_trace_{stamp}.json")
+                    frame_profiler.dump_chrome_trace(
+                        trace_path,
+                        first_frame=frame_profiler.frame_number - TRACE_FRAMES,
+                    )
+                    frame_profiler.dump_stats(
+                        os.path.join(logs_dir, f"frame_stats_{stamp}.json")
+                    )
+                    logger.info(
+                        f"Trace of the last {TRACE_FRAMES} frames written to {trace_path}"
+                    )
+                elif game_event.key == pygame.K_ESCAPE:
                     if game.game_mode == "abridged" and game.time_limit:
                         current_time = pygame.time.get_ticks()
                         if game.game_paused:
@@ -407,6 +509,9 @@ async def run_game(game, game_settings):
             elif game_event.type == pygame.MOUSEMOTION:
                 event_handler.handle_motion(game_event.pos)
 
+        frame_profiler.record("events", span_start, frame_profiler.clock())
+        span_start = frame_profiler.clock()
+
         current_time = pygame.time.get_ticks()
         if (
             hasattr(game, "last_debug_time")
@@ -466,6 +571,9 @@ async def run_game(game, game_settings):
                 )
                 game.state = "AUCTION"
 
+        frame_profiler.record("sync", span_start, frame_profiler.clock())
+        span_start = frame_profiler.clock()
+
         if (
             game.state == "ROLL"
             and game.logic.players
@@ -479,7 +587,7 @@ async def run_game(game, game_settings):
                     ai_player = player
                     break
 
-            if ai_player and ai_player.is_ai:
+            if ai_player and ai_player.is_ai and not game.ai_scheduler.is_pending():
                 if not isinstance(ai_player.position, int) or not (
                     1 <= ai_player.position <= 40
                 ):
@@ -499,6 +607,8 @@ async def run_game(game, game_settings):
             and not any(player.is_moving for player in game.players)
         ):
             auction_data = game.logic.current_auction
+            # Bid deadlines sit on the engine's timer heap, so a quiet frame is one comparison
+            game.logic.auction_engine.poll()
 
             if (
                 auction_data is not None
@@ -532,63 +642,46 @@ async def run_game(game, game_settings):
                         logger.debug(f"Minimum bid: £{auction_data['minimum_bid']}")
                         logger.debug(f"AI money: £{current_bidder['money']}")
 
-                        ai_decision = random.random() > 0.5
+                        if game.ai_difficulty == "expert":
+                            choose_bid = None
+                        else:
+
+                            def choose_bid(
+                                bidder=current_bidder,
+                                auction=auction_data,
+                                ai_rng=game.rng_service.ai_stream(
+                                    current_bidder["name"]
+                                ),
+                            ):
+                                if (
+                                    ai_rng.random() > 0.5
+                                    and bidder["money"] >= auction["minimum_bid"]
+                                ):
+                                    return min(
+                                        bidder["money"],
+                                        auction["minimum_bid"] + ai_rng.randint(10, 50),
+                                    )
+                                return None
+
+                        # Expert bids each run a search, so those stay on the AI worker
                         if (
-                            ai_decision
-                            and current_bidder["money"] >= auction_data["minimum_bid"]
+                            choose_bid is not None
+                            and game.logic.auction_engine.is_ai_only(auction_data)
                         ):
-                            bid_amount = min(
-                                current_bidder["money"],
-                                auction_data["minimum_bid"] + random.randint(10, 50),
-                            )
                             logger.debug(
-                                f"AI {current_bidder['name']} bids £{bid_amount}"
-                            )
-                            success, message = game.logic.process_auction_bid(
-                                current_bidder, bid_amount
+                                "Only AI bidders left - fast-forwarding auction"
                             )
-                            game.board.add_message(message)
+                            game.logic.auction_engine.fast_forward(choose_bid)
                         else:
-                            logger.debug(f"AI {current_bidder['name']} passes")
-                            success, message = game.logic.process_auction_pass(
-                                current_bidder
+                            game_actions.request_ai_auction_bid(
+                                current_bidder, choose_bid
                             )
-                            game.board.add_message(message)
-
-                if (
-                    hasattr(game.logic, "current_auction")
-                    and game.logic.current_auction
-                ):
-                    result_message = game.logic.check_auction_end()
-                    if result_message == "auction_completed":
-                        logger.info("Auction completed in main loop - setting up delay")
-
-                        if (
-                            hasattr(game.logic, "current_auction")
-                            and game.logic.current_auction is not None
-                        ):
-                            if game.logic.current_auction.get("highest_bidder"):
-                                winner = game.logic.current_auction["highest_bidder"]
-                                property_name = game.logic.current_auction["property"][
-                                    "name"
-                                ]
-                                bid_amount = game.logic.current_auction["current_bid"]
-                                game.board.add_message(
-                                    f"{winner['name']} won {property_name} for £{bid_amount}"
-                                )
-                            else:
-                                property_name = game.logic.current_auction["property"][
-                                    "name"
-                                ]
-                                game.board.add_message(f"No one bid on {property_name}")
-
-                        game.auction_end_time = pygame.time.get_ticks()
-                        game.auction_end_delay = 3000
-                        game.auction_completed = True
-                        game.board.update_ownership(game.logic.properties)
 
                 delattr(game, "auction_processing")
 
+        frame_profiler.record("ai", span_start, frame_profiler.clock())
+        span_start = frame_profiler.clock()
+
         any_moving = any(player.is_moving for player in game.players)
         if (
             not any_moving
@@ -634,10 +727,27 @@ async def run_game(game, game_settings):
             game_over_data = game_actions.end_abridged_game()
             running = False
 
-        pygame.display.flip()
+        autosave_point = get_autosave_point(game) if running else None
+        if autosave_point is not None and autosave_point != last_autosave_point:
+            autosaver.save(game)
+            last_autosave_point = autosave_point
 
+        frame_profiler.record("sync", span_start, frame_profiler.clock())
+        frame_profiler.end_frame()
         clock.tick(FPS)
 
+    game.ai_scheduler.cancel_all()
+    if game.logic.replay_log:
+        game.logic.replay_log.close()
+    if game_over_data:
+        # A finished game has nothing left to continue
+        autosaver.discard()
+    else:
+        autosaver.stop()
+    logger.info(
+        f"Autosave: {autosaver.saves_written} saves, {autosaver.bytes_written} bytes"
+    )
+    logger.info(f"Valuation cache: {game.logic.properties.valuations.get_stats()}")
     sound_manager.stop_music()
     return game_over_data
 
@@ -717,11 +827,9 @@ async def handle_end_game(game_over_data):
                 current_page.handle_motion(end_event.pos)
 
 
-async def show_logo_screen(screen, logo_path, scale_factor=0.5):
+async def show_logo_screen(screen, logo_key, scale_factor=0.5):
     try:
-        base_path = os.path.dirname(os.path.abspath(__file__))
-        bg_path = os.path.join(base_path, "assets/image/starterbackground.png")
-        original_background = pygame.image.load(bg_path)
+        original_background = asset_manager.get_image("starterbackground.png")
         window_size = screen.get_size()
         window_width, window_height = window_size
 
@@ -743,7 +851,7 @@ async def show_logo_screen(screen, logo_path, scale_factor=0.5):
             original_background, (scaled_width, scaled_height)
         )
 
-        logo = pygame.image.load(logo_path)
+        logo = asset_manager.get_image(logo_key)
 
         logo_width = int(window_size[0] * scale_factor)
         logo_height = int(logo_width * (logo.get_height() / logo.get_width()))
@@ -794,16 +902,13 @@ async def show_logo_screen(screen, logo_path, scale_factor=0.5):
 
 
 async def show_company_logo(screen):
-    base_path = os.path.dirname(os.path.abspath(__file__))
     from src.Sound_Manager import sound_manager
 
-    logo_path = os.path.join(base_path, "assets/image/Watson Games 2025.png")
     sound_manager.play_sound("watson_games")
-    await show_logo_screen(screen, logo_path, scale_factor=0.7)
+    await show_logo_screen(screen, "Watson Games 2025.png", scale_factor=0.7)
 
-    group_logo_path = os.path.join(base_path, "assets/image/Group 5 Persent.png")
     sound_manager.play_sound("group_present")
-    await show_logo_screen(screen, group_logo_path, scale_factor=0.9)
+    await show_logo_screen(screen, "Group 5 Persent.png", scale_factor=0.9)
 
     sound_manager.play_sound("game_start")
 
@@ -813,16 +918,26 @@ async def main():
     font_manager.update_scale_factor(WINDOW_SIZE[0], WINDOW_SIZE[1])
     screen = await apply_screen_settings(WINDOW_SIZE)
 
+    # Images are read from disk on a worker thread while sounds load and the logos play
+    asset_manager.preload()
+
     sound_manager.load_sounds()
     sound_manager.load_music()
 
+    preload_property_data()
+
+    logo_start_time = time.perf_counter()
     await show_company_logo(screen)
+    logo_duration = time.perf_counter() - logo_start_time
 
     clock = pygame.time.Clock()
+    first_menu_drawn = False
+
+    router = PageRouter(MENU_PAGES, instructions=GAME_INSTRUCTIONS)
 
     while True:
         await asyncio.sleep(0)
-        current_page = MainMenuPage(instructions=GAME_INSTRUCTIONS)
+        current_page = show_page(router, "main_menu")
         player_info = None
         game_settings = None
         ai_difficulty = None
@@ -831,6 +946,21 @@ async def main():
         while game_running:
             current_page.draw()
 
+            if not first_menu_drawn:
+                first_menu_drawn = True
+                total_ms = (time.perf_counter() - startup_time) * 1000
+                startup_ms = total_ms - logo_duration * 1000
+                logger.info(
+                    f"First menu frame after {total_ms:.0f}ms "
+                    f"({startup_ms:.0f}ms excluding logo screens, "
+                    f"budget {STARTUP_BUDGET_MS}ms)"
+                )
+                logger.info(f"Image assets: {asset_manager.get_stats()}")
+                if startup_ms > STARTUP_BUDGET_MS:
+                    logger.warning(
+                        f"Startup exceeded budget by {startup_ms - STARTUP_BUDGET_MS:.0f}ms"
+                    )
+
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     safe_exit()
@@ -848,85 +978,77 @@ async def main():
                     if result:
                         if isinstance(current_page, MainMenuPage):
                             if result == "start":
-                                current_page = StartPage(instructions=GAME_INSTRUCTIONS)
+                                current_page = show_page(router, "start")
                             elif result == "how_to_play":
-                                current_page = HowToPlayPage(
-                                    instructions=GAME_INSTRUCTIONS
-                                )
+                                current_page = show_page(router, "how_to_play")
                             elif result == "settings":
-                                current_page = SettingsPage(
-                                    instructions=GAME_INSTRUCTIONS
-                                )
+                                current_page = show_page(router, "settings")
+                            elif result == "continue":
+                                loaded = load_saved_game()
+                                if loaded:
+                                    game, game_settings = loaded
+                                    game_over_data = await run_game(game, game_settings)
+                                    if game_over_data:
+                                        await handle_end_game(game_over_data)
+                                    router.reset(*GAME_SETUP_PAGES)
+                                    current_page = show_page(router, "main_menu")
                         elif isinstance(current_page, HowToPlayPage):
                             if result == "keyboard_shortcuts":
-                                current_page = KeyboardShortcutsPage(
-                                    instructions=GAME_INSTRUCTIONS
-                                )
+                                current_page = show_page(router, "keyboard_shortcuts")
                             else:
-                                current_page = MainMenuPage(
-                                    instructions=GAME_INSTRUCTIONS
-                                )
+                                current_page = show_page(router, "main_menu")
                         elif isinstance(current_page, KeyboardShortcutsPage):
-                            current_page = HowToPlayPage(instructions=GAME_INSTRUCTIONS)
+                            current_page = show_page(router, "how_to_play")
                         elif isinstance(current_page, SettingsPage):
                             settings = current_page.get_settings()
                             if settings["resolution"] != WINDOW_SIZE:
                                 screen = await apply_screen_settings(
                                     settings["resolution"]
                                 )
-                            current_page = MainMenuPage(instructions=GAME_INSTRUCTIONS)
+                            if result is True:
+                                # A new font only shows on pages built after it
+                                router.reset()
+                            current_page = show_page(router, "main_menu")
                         elif isinstance(current_page, StartPage):
                             if result == "back":
-                                current_page = MainMenuPage(
-                                    instructions=GAME_INSTRUCTIONS
-                                )
+                                current_page = show_page(router, "main_menu")
                             else:
                                 player_info = current_page.get_player_info()
                                 if player_info[2] > 0:
-                                    current_page = AIDifficultyPage(
-                                        instructions=GAME_INSTRUCTIONS
-                                    )
+                                    current_page = show_page(router, "ai_difficulty")
                                 else:
-                                    current_page = GameModePage(
-                                        instructions=GAME_INSTRUCTIONS
-                                    )
+                                    current_page = show_page(router, "game_mode")
                         elif isinstance(current_page, AIDifficultyPage):
                             if result == "back":
-                                current_page = StartPage(instructions=GAME_INSTRUCTIONS)
+                                current_page = show_page(router, "start")
                             else:
                                 ai_difficulty = result
-                                current_page = GameModePage(
-                                    instructions=GAME_INSTRUCTIONS
-                                )
+                                current_page = show_page(router, "game_mode")
                         elif isinstance(current_page, GameModePage):
                             if result == "back":
                                 if ai_difficulty:
-                                    current_page = AIDifficultyPage(
-                                        instructions=GAME_INSTRUCTIONS
-                                    )
+                                    current_page = show_page(router, "ai_difficulty")
                                 else:
-                                    current_page = StartPage(
-                                        instructions=GAME_INSTRUCTIONS
-                                    )
+                                    current_page = show_page(router, "start")
                             else:
                                 game_settings = current_page.get_game_settings()
                                 if ai_difficulty:
                                     game_settings["ai_difficulty"] = ai_difficulty
 
-                                game = create_game(player_info, game_settings)
+                                game = await start_game(player_info, game_settings)
                                 game_over_data = await run_game(game, game_settings)
 
                                 if game_over_data:
                                     play_again = await handle_end_game(game_over_data)
                                     if play_again:
-                                        current_page = MainMenuPage(
-                                            instructions=GAME_INSTRUCTIONS
-                                        )
+                                        router.reset(*GAME_SETUP_PAGES)
+                                        current_page = show_page(router, "main_menu")
 
                 elif event.type == pygame.MOUSEMOTION:
                     current_page.handle_motion(event.pos)
                 elif event.type == pygame.VIDEORESIZE:
                     screen = await apply_screen_settings((event.w, event.h))
+                    current_page = show_page(router, router.current)
 
             pygame.display.flip()
 
@@ -936,16 +1058,9 @@ async def main():
 
 def safe_exit(code=0):
     logger.info("Game is shutting down...")
-
-    sys.stdout = sys.__stdout__
-    sys.stderr = sys.__stderr__
-
-    for handler in logger.handlers:
-        if isinstance(handler, logging.FileHandler):
-            handler.flush()
-
     logger.info("=== Game Session Ended ===")
 
+    log_manager.stop()
     logging.shutdown()
 
     pygame.quit()
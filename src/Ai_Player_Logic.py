@@ -1,14 +1,18 @@
 # Property Tycoon ai_player_logic.py
 # It contains the classes for the AI players, such as the AI player logic, the AI player strategy, and the AI player actions.
 
+import logging
 import random
 from src.Property import Property
-from src.Player import Player
+from src.Valuation_Cache import get_cached_valuation
+
+logger = logging.getLogger(__name__)
 
 
 class EasyAIPlayer:
-    def __init__(self, difficulty="easy"):
+    def __init__(self, difficulty="easy", rng=None):
         self.difficulty = "easy"
+        self.rng = rng or random
         self.strategy = {
             "easy": {
                 "max_bid_multiplier": 0.8,
@@ -44,14 +48,15 @@ class EasyAIPlayer:
         return property.houses <= min_houses
 
     def get_property_value(self, property_data, ai_player, board_properties):
-        print("\n=== AI Property Value Calculation Debug ===")
-        print(
-            f"Evaluating property: {property_data.name if hasattr(property_data, 'name') else 'Unknown'}"
+        logger.debug("=== AI Property Value Calculation Debug ===")
+        logger.debug(
+            "Evaluating property: %s",
+            property_data.name if hasattr(property_data, "name") else "Unknown",
         )
 
         base_value = property_data.price
         multiplier = 1.0
-        print(f"Base value: £{base_value}")
+        logger.debug("Base value: £%s", base_value)
 
         if hasattr(property_data, "group"):
             owned_in_group = sum(
@@ -66,14 +71,14 @@ class EasyAIPlayer:
                 for p in board_properties
                 if hasattr(p, "group") and p.group == property_data.group
             )
-            print(f"Color group analysis:")
-            print(f"- Group: {property_data.group}")
-            print(f"- Owned in group: {owned_in_group}/{total_in_group}")
+            logger.debug("Color group analysis:")
+            logger.debug("- Group: %s", property_data.group)
+            logger.debug("- Owned in group: %s/%s", owned_in_group, total_in_group)
 
             if owned_in_group > 0:
                 group_bonus = 0.3 * (owned_in_group / total_in_group)
                 multiplier += group_bonus
-                print(f"- Adding group ownership bonus: +{group_bonus:.2f}x")
+                logger.debug("- Adding group ownership bonus: +%.2fx", group_bonus)
 
         if property_data.is_station:
             owned_stations = sum(
@@ -81,24 +86,24 @@ class EasyAIPlayer:
             )
             station_bonus = 0.25 * owned_stations
             multiplier += station_bonus
-            print(f"Station analysis:")
-            print(f"- Owned stations: {owned_stations}")
-            print(f"- Adding station bonus: +{station_bonus:.2f}x")
+            logger.debug("Station analysis:")
+            logger.debug("- Owned stations: %s", owned_stations)
+            logger.debug("- Adding station bonus: +%.2fx", station_bonus)
 
         elif property_data.is_utility:
             owned_utilities = sum(
                 1 for p in board_properties if p.is_utility and p.owner == ai_player
             )
-            print(f"Utility analysis:")
-            print(f"- Owned utilities: {owned_utilities}")
+            logger.debug("Utility analysis:")
+            logger.debug("- Owned utilities: %s", owned_utilities)
             if owned_utilities > 0:
                 multiplier += 0.5
-                print("- Adding utility bonus: +0.5x")
+                logger.debug("- Adding utility bonus: +0.5x")
 
         final_value = base_value * multiplier
-        print(f"Final calculations:")
-        print(f"- Total multiplier: {multiplier:.2f}x")
-        print(f"- Final perceived value: £{final_value:.2f}")
+        logger.debug("Final calculations:")
+        logger.debug("- Total multiplier: %.2fx", multiplier)
+        logger.debug("- Final perceived value: £%.2f", final_value)
         return final_value
 
     def handle_turn(
@@ -118,7 +123,10 @@ class EasyAIPlayer:
                     actions["paid_rent"] = True
 
             elif not current_location.owner:
-                if random.random() < 0.7 and ai_player.money >= current_location.price:
+                if (
+                    self.rng.random() < 0.7
+                    and ai_player.money >= current_location.price
+                ):
                     success = ai_player.buy_property(current_location)
                     actions["bought_property"] = success
 
@@ -131,7 +139,7 @@ class EasyAIPlayer:
                         if self.check_group_ownership(
                             color_group, board_properties, ai_player.name
                         ):
-                            if random.random() < 0.5:
+                            if self.rng.random() < 0.5:
                                 group_properties = self.get_group_properties(
                                     color_group, board_properties
                                 )
@@ -217,7 +225,7 @@ class EasyAIPlayer:
             if property_data.owner and property_data.owner != ai_player:
                 return True
             elif not property_data.owner:
-                if random.random() < 0.7 and ai_player.money >= property_data.price:
+                if self.rng.random() < 0.7 and ai_player.money >= property_data.price:
                     return True
                 return False
 
@@ -266,14 +274,14 @@ class EasyAIPlayer:
             self.last_bid_amount = 0
             self.last_bid_property = property_data["name"]
 
-        print("\n=== AI Auction Bid Logic Debug ===")
-        print(f"AI Player: {ai_player}")
-        print(f"Current minimum bid: £{current_minimum}")
-        print(f"Available money: £{ai_player.money}")
-        print(f"Previous bid on this property: £{self.last_bid_amount}")
+        logger.debug("=== AI Auction Bid Logic Debug ===")
+        logger.debug("AI Player: %s", ai_player)
+        logger.debug("Current minimum bid: £%s", current_minimum)
+        logger.debug("Available money: £%s", ai_player.money)
+        logger.debug("Previous bid on this property: £%s", self.last_bid_amount)
 
         if ai_player.money < current_minimum:
-            print("DECISION: Cannot bid - insufficient funds")
+            logger.debug("DECISION: Cannot bid - insufficient funds")
             return None
 
         perceived_value = self.get_property_value(
@@ -285,47 +293,48 @@ class EasyAIPlayer:
         )
 
         if self.last_bid_amount >= max_bid * 0.8:
-            print("DECISION: Already reached maximum desired bid")
+            logger.debug("DECISION: Already reached maximum desired bid")
             return None
 
-        print(f"\nBid limit calculation:")
-        print(f"- Perceived value: £{perceived_value}")
-        print(
-            f"- Easy difficulty multiplier: {self.strategy['easy']['max_bid_multiplier']}x"
+        logger.debug("Bid limit calculation:")
+        logger.debug("- Perceived value: £%s", perceived_value)
+        logger.debug(
+            "- Easy difficulty multiplier: %sx",
+            self.strategy["easy"]["max_bid_multiplier"],
         )
-        print(f"- Maximum possible bid: £{max_bid}")
+        logger.debug("- Maximum possible bid: £%s", max_bid)
 
         if max_bid <= current_minimum:
-            print("DECISION: Cannot bid - maximum possible bid is below minimum")
+            logger.debug("DECISION: Cannot bid - maximum possible bid is below minimum")
             return None
 
         bid_headroom = max_bid - current_minimum
         increment = min(50, max(10, int(bid_headroom * 0.2)))
-        print(f"\nBid increment analysis:")
-        print(f"- Bid headroom: £{bid_headroom}")
-        print(f"- Calculated increment: £{increment}")
+        logger.debug("Bid increment analysis:")
+        logger.debug("- Bid headroom: £%s", bid_headroom)
+        logger.debug("- Calculated increment: £%s", increment)
 
-        import random
-
-        bid = current_minimum + random.randint(10, increment)
+        bid = current_minimum + self.rng.randint(10, increment)
         bid = min(bid, max_bid)
-        print(f"- Initial bid calculation: £{bid}")
+        logger.debug("- Initial bid calculation: £%s", bid)
 
         if bid > perceived_value * 0.6:
-            risky_bid_chance = random.random()
-            print(f"\nRisk assessment:")
-            print(
-                f"- Bid (£{bid}) is above 60% of perceived value (£{perceived_value * 0.6:.2f})"
+            risky_bid_chance = self.rng.random()
+            logger.debug("Risk assessment:")
+            logger.debug(
+                "- Bid (£%s) is above 60%% of perceived value (£%.2f)",
+                bid,
+                perceived_value * 0.6,
             )
-            print(
-                f"- Random chance to pass: {risky_bid_chance:.2f} (will pass if < 0.3)"
+            logger.debug(
+                "- Random chance to pass: %.2f (will pass if < 0.3)", risky_bid_chance
             )
             if risky_bid_chance < 0.3:
-                print("DECISION: Passing due to risk assessment")
+                logger.debug("DECISION: Passing due to risk assessment")
                 return None
 
         self.last_bid_amount = bid
-        print(f"FINAL DECISION: Bidding £{bid}")
+        logger.debug("FINAL DECISION: Bidding £%s", bid)
         return bid
 
     def handle_jail_strategy(self, ai_player, jail_free_cards):
@@ -346,32 +355,35 @@ class EasyAIPlayer:
         if ai_player["money"] < 200:
             return None
 
-        groups = set()
-        for prop in board_properties.values():
-            if "group" in prop:
-                groups.add(prop["group"])
+        for group_properties in self.get_completed_groups(
+            ai_player["name"], board_properties
+        ):
+            for prop in group_properties:
+                current_houses = prop.get("houses", 0)
+                if current_houses < 4:
+                    min_houses = min(p.get("houses", 0) for p in group_properties)
+                    if current_houses <= min_houses:
+                        house_cost = prop["price"] / 2
+                        if ai_player["money"] >= house_cost * 1.5:
+                            return prop
+        return None
 
-        for color_group in groups:
-            group_properties = [
-                p
-                for p in board_properties.values()
-                if p.get("group") == color_group and p.get("owner") == ai_player["name"]
+    def get_completed_groups(self, player_name, board_properties):
+        if hasattr(board_properties, "get_completed_groups"):
+            return [
+                board_properties.get_group(group)
+                for group in board_properties.get_completed_groups(player_name)
             ]
 
-            total_in_group = sum(
-                1 for p in board_properties.values() if p.get("group") == color_group
-            )
-
-            if len(group_properties) == total_in_group:
-                for prop in group_properties:
-                    current_houses = prop.get("houses", 0)
-                    if current_houses < 4:
-                        min_houses = min(p.get("houses", 0) for p in group_properties)
-                        if current_houses <= min_houses:
-                            house_cost = prop["price"] / 2
-                            if ai_player["money"] >= house_cost * 1.5:
-                                return prop
-        return None
+        groups = {}
+        for prop in board_properties.values():
+            if "group" in prop:
+                groups.setdefault(prop["group"], []).append(prop)
+        return [
+            group_properties
+            for group_properties in groups.values()
+            if all(p.get("owner") == player_name for p in group_properties)
+        ]
 
     def handle_emergency_cash(self, ai_player, required_amount, board_properties):
         if ai_player["money"] >= required_amount:
@@ -433,11 +445,20 @@ class EasyAIPlayer:
 
         total_value_difference = (offered_value + cash_difference) - requested_value
 
-        return total_value_difference > 0 and random.random() < 0.8
+        return total_value_difference > 0 and self.rng.random() < 0.8
 
     def get_property_value(self, property_data, owned_properties, total_money):
-        print("\n=== AI Property Valuation Debug ===")
-        print(f"DEBUG: Evaluating value of {property_data['name']}")
+        # Reused until the board's ownership or development changes
+        return get_cached_valuation(
+            "easy",
+            property_data,
+            owned_properties,
+            lambda: self.calculate_property_value(property_data, owned_properties),
+        )
+
+    def calculate_property_value(self, property_data, owned_properties):
+        logger.debug("=== AI Property Valuation Debug ===")
+        logger.debug("DEBUG: Evaluating value of %s", property_data["name"])
 
         base_value = property_data["price"]
         value_multiplier = 1.0
@@ -447,13 +468,14 @@ class EasyAIPlayer:
                 1 for p in owned_properties if p.get("group") == property_data["group"]
             )
             total_in_group = property_data.get("group_size", 3)
-            print(f"DEBUG: Color group: {property_data['group']}")
-            print(f"DEBUG: Owned in group: {owned_in_group}/{total_in_group}")
+            logger.debug("DEBUG: Color group: %s", property_data["group"])
+            logger.debug("DEBUG: Owned in group: %s/%s", owned_in_group, total_in_group)
 
             if owned_in_group > 0:
                 value_multiplier += 0.3 * (owned_in_group / total_in_group)
-                print(
-                    f"DEBUG: Group ownership bonus applied: {0.3 * (owned_in_group / total_in_group)}"
+                logger.debug(
+                    "DEBUG: Group ownership bonus applied: %s",
+                    0.3 * (owned_in_group / total_in_group),
                 )
 
         if "Station" in property_data["name"]:
@@ -461,8 +483,8 @@ class EasyAIPlayer:
                 1 for p in owned_properties if "Station" in p.get("name", "")
             )
             value_multiplier += 0.25 * owned_stations
-            print(f"DEBUG: Owned stations: {owned_stations}")
-            print(f"DEBUG: Station bonus applied: {0.25 * owned_stations}")
+            logger.debug("DEBUG: Owned stations: %s", owned_stations)
+            logger.debug("DEBUG: Station bonus applied: %s", 0.25 * owned_stations)
 
         elif property_data["name"] in ["Tesla Power Co", "Edison Water"]:
             owned_utilities = sum(
@@ -472,18 +494,31 @@ class EasyAIPlayer:
             )
             if owned_utilities > 0:
                 value_multiplier += 0.5
-                print(f"DEBUG: Utility bonus applied: 0.5")
+                logger.debug("DEBUG: Utility bonus applied: 0.5")
+
+        from src.Landing_Model import get_landing_model
+
+        landing_model = get_landing_model()
+        if landing_model and "position" in property_data:
+            landing_weight = landing_model.get_landing_weight(property_data["position"])
+            value_multiplier *= landing_weight
+            logger.debug(
+                "DEBUG: Landing frequency weight applied: %.2f", landing_weight
+            )
 
         value_multiplier *= self.strategy["easy"]["max_bid_multiplier"]
         final_value = base_value * value_multiplier
 
-        print(f"DEBUG: Base value: £{base_value}")
-        print(f"DEBUG: Final multiplier: {value_multiplier}")
-        print(f"DEBUG: Final calculated value: £{final_value}")
+        logger.debug("DEBUG: Base value: £%s", base_value)
+        logger.debug("DEBUG: Final multiplier: %s", value_multiplier)
+        logger.debug("DEBUG: Final calculated value: £%s", final_value)
 
         return final_value
 
-    def should_buy_property(self, property_data, player_money, owned_properties):
+    def should_buy_property(
+        self, property_data, player_money, owned_properties, player_name=None
+    ):
+        # player_name is only used by AIs that look at the whole game, like the expert
         print("\n=== AI Purchase Decision Debug ===")
         print(f"DEBUG: Evaluating purchase of {property_data['name']}")
         print(f"DEBUG: Property price: £{property_data['price']}")
@@ -510,32 +545,37 @@ class EasyAIPlayer:
         )
 
     def make_auction_bid(
-        self, property_data, current_bid, player_money, owned_properties
+        self,
+        property_data,
+        current_bid,
+        player_money,
+        owned_properties,
+        player_name=None,
     ):
-        print("\n=== AI Auction Bid Debug ===")
-        print(f"DEBUG: AI evaluating bid for {property_data['name']}")
-        print(f"DEBUG: Current bid: £{current_bid}")
-        print(f"DEBUG: AI money available: £{player_money}")
+        logger.debug("=== AI Auction Bid Debug ===")
+        logger.debug("DEBUG: AI evaluating bid for %s", property_data["name"])
+        logger.debug("DEBUG: Current bid: £%s", current_bid)
+        logger.debug("DEBUG: AI money available: £%s", player_money)
 
         if player_money <= current_bid:
-            print("DEBUG: AI cannot afford current bid")
+            logger.debug("DEBUG: AI cannot afford current bid")
             return None
 
         property_value = self.get_property_value(
             property_data, owned_properties, player_money
         )
-        print(f"DEBUG: Calculated property value: £{property_value}")
+        logger.debug("DEBUG: Calculated property value: £%s", property_value)
 
         max_bid = min(player_money * 0.7, property_value * 1.1)
-        print(f"DEBUG: Maximum bid calculated: £{max_bid}")
+        logger.debug("DEBUG: Maximum bid calculated: £%s", max_bid)
 
         if current_bid >= max_bid:
-            print("DEBUG: Maximum bid too low - passing")
+            logger.debug("DEBUG: Maximum bid too low - passing")
             return None
 
         bid_increment = 10
         final_bid = min(current_bid + bid_increment, max_bid)
-        print(f"DEBUG: Final bid decision: £{final_bid}")
+        logger.debug("DEBUG: Final bid decision: £%s", final_bid)
 
         return final_bid
 
@@ -655,10 +695,11 @@ class EasyAIPlayer:
 
 
 class HardAIPlayer:
-    def __init__(self):
+    def __init__(self, rng=None):
         self.difficulty = "hard"
+        self.rng = rng or random
         self.mood_modifier = 0.0
-        self.easy_ai = EasyAIPlayer()
+        self.easy_ai = EasyAIPlayer(rng=self.rng)
         print("HardAIPlayer initialized with emotion system")
 
     def update_mood(self, is_happy):
@@ -676,11 +717,12 @@ class HardAIPlayer:
         return max(0.0, min(1.0, adjusted))
 
     def get_property_value(self, property_data, ai_player, board_properties):
-        print("\n=== HARD AI Property Value Calculation Debug ===")
-        print(
-            f"DEBUG: Hard AI evaluating property: {property_data.name if hasattr(property_data, 'name') else 'Unknown'}"
+        logger.debug("=== HARD AI Property Value Calculation Debug ===")
+        logger.debug(
+            "DEBUG: Hard AI evaluating property: %s",
+            property_data.name if hasattr(property_data, "name") else "Unknown",
         )
-        print(f"DEBUG: Current mood modifier: {self.mood_modifier}")
+        logger.debug("DEBUG: Current mood modifier: %s", self.mood_modifier)
 
         base_value = self.easy_ai.get_property_value(
             property_data, ai_player, board_properties
@@ -689,20 +731,25 @@ class HardAIPlayer:
         mood_multiplier = 1.0 + (self.mood_modifier * 2.0)
         final_value = base_value * mood_multiplier
 
-        print(f"DEBUG: Base value: £{base_value}")
-        print(f"DEBUG: Amplified mood multiplier: {mood_multiplier}")
-        print(f"DEBUG: Final value: £{final_value}")
+        logger.debug("DEBUG: Base value: £%s", base_value)
+        logger.debug("DEBUG: Amplified mood multiplier: %s", mood_multiplier)
+        logger.debug("DEBUG: Final value: £%s", final_value)
         return final_value
 
     def get_auction_bid(
         self, current_minimum, property_data, ai_player, board_properties
     ):
-        print("\n=== HARD AI Auction Bid Logic Debug ===")
-        print(
-            f"DEBUG: Hard AI evaluating bid for: {property_data['name'] if isinstance(property_data, dict) and 'name' in property_data else 'Unknown'}"
+        logger.debug("=== HARD AI Auction Bid Logic Debug ===")
+        logger.debug(
+            "DEBUG: Hard AI evaluating bid for: %s",
+            (
+                property_data["name"]
+                if isinstance(property_data, dict) and "name" in property_data
+                else "Unknown"
+            ),
         )
-        print(f"DEBUG: Current minimum bid: £{current_minimum}")
-        print(f"DEBUG: Current mood modifier: {self.mood_modifier}")
+        logger.debug("DEBUG: Current minimum bid: £%s", current_minimum)
+        logger.debug("DEBUG: Current mood modifier: %s", self.mood_modifier)
 
         base_bid = self.easy_ai.get_auction_bid(
             current_minimum, property_data, ai_player, board_properties
@@ -710,19 +757,19 @@ class HardAIPlayer:
 
         if base_bid is None:
             angry_bid_chance = self.get_adjusted_probability(0.0)
-            print(f"DEBUG: Chance to bid anyway: {angry_bid_chance}")
+            logger.debug("DEBUG: Chance to bid anyway: %s", angry_bid_chance)
 
-            if random.random() < angry_bid_chance:
+            if self.rng.random() < angry_bid_chance:
                 perceived_value = self.get_property_value(
                     property_data, ai_player, board_properties
                 )
-                bid = current_minimum + random.randint(
+                bid = current_minimum + self.rng.randint(
                     10, 50 + int(100 * max(0, self.mood_modifier))
                 )
                 bid = min(
                     bid, ai_player.money * (0.7 + max(0, self.mood_modifier * 0.2))
                 )
-                print(f"DEBUG: Emotion triggered bid: £{bid}")
+                logger.debug("DEBUG: Emotion triggered bid: £%s", bid)
                 return bid
             return None
 
@@ -732,9 +779,9 @@ class HardAIPlayer:
         max_percentage = 0.9 + max(0, self.mood_modifier * 0.1)
         final_bid = min(final_bid, int(ai_player.money * max_percentage))
 
-        print(f"DEBUG: Base bid: £{base_bid}")
-        print(f"DEBUG: Amplified mood multiplier: {mood_multiplier}")
-        print(f"DEBUG: Final bid: £{final_bid}")
+        logger.debug("DEBUG: Base bid: £%s", base_bid)
+        logger.debug("DEBUG: Amplified mood multiplier: %s", mood_multiplier)
+        logger.debug("DEBUG: Final bid: £%s", final_bid)
         return final_bid
 
     def handle_jail_strategy(self, ai_player, jail_free_cards):
@@ -752,7 +799,7 @@ class HardAIPlayer:
             pay_chance = self.get_adjusted_probability(0.5)
             print(f"DEBUG: Chance to pay fine: {pay_chance}")
 
-            if random.random() < pay_chance:
+            if self.rng.random() < pay_chance:
                 print(f"DEBUG: Emotion triggered decision to pay fine")
                 return "pay_fine"
 
@@ -781,7 +828,7 @@ class HardAIPlayer:
             if ai_player["money"] >= money_threshold:
                 develop_chance = self.get_adjusted_probability(0.3)
 
-                if random.random() < develop_chance:
+                if self.rng.random() < develop_chance:
                     player_properties = []
                     for prop_key, prop in board_properties.items():
                         if (
@@ -808,7 +855,9 @@ class HardAIPlayer:
 
         return base_result
 
-    def should_buy_property(self, property_data, player_money, owned_properties):
+    def should_buy_property(
+        self, property_data, player_money, owned_properties, player_name=None
+    ):
         print("\n=== HARD AI Purchase Decision Debug ===")
         print(f"DEBUG: Hard AI evaluating purchase of {property_data['name']}")
         print(f"DEBUG: Property price: £{property_data['price']}")
@@ -826,7 +875,7 @@ class HardAIPlayer:
             max_price_ratio = 0.7 + (self.mood_modifier * 0.2)
             can_afford = player_money * max_price_ratio >= property_data["price"]
 
-            if can_afford and random.random() < buy_chance:
+            if can_afford and self.rng.random() < buy_chance:
                 print(f"DEBUG: Emotion triggered decision to buy property")
                 print(f"DEBUG: Max price ratio: {max_price_ratio}")
                 return True
@@ -835,7 +884,7 @@ class HardAIPlayer:
             pass_chance = -self.mood_modifier * 1.5
             print(f"DEBUG: Amplified chance to pass: {pass_chance}")
 
-            if random.random() < pass_chance:
+            if self.rng.random() < pass_chance:
                 print(f"DEBUG: Emotion triggered decision to pass on property")
                 return False
 
@@ -0,0 +1,92 @@
+# Property Tycoon Ai_Scheduler.py
+# It contains the AI scheduler, which works out AI decisions on a worker thread and applies them back on the game thread.
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+# Pauses that let players follow what the AI is doing, measured from when the job is queued
+AI_TURN_DELAY_MS = 500
+AI_BUY_DELAY_MS = 1500
+AI_DECISION_WORKERS = 1
+
+
+class AIScheduler:
+    def __init__(self, max_workers=AI_DECISION_WORKERS):
+        # One worker keeps decisions in order and off the game thread
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="AIDecision"
+        )
+        self.pending = {}
+        self.decisions_run = 0
+        self.errors = 0
+
+    def is_pending(self, key=None):
+        """Check whether a job, or any job when key is None, is still waiting"""
+        if key is None:
+            return bool(self.pending)
+        return key in self.pending
+
+    def submit(self, key, decide, apply, delay_ms=0, default=None):
+        """Run decide() on the worker after delay_ms, then apply(result) on the game thread"""
+        # One job per key at a time, and apply gets default if decide raises
+        if key in self.pending:
+            return False
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop, e.g. in headless tools, so decide straight away
+            apply(self._decide_now(key, decide, default))
+            return True
+
+        self.pending[key] = loop.create_task(
+            self._run(key, decide, apply, delay_ms, default)
+        )
+        return True
+
+    def _decide_now(self, key, decide, default):
+        if decide is None:
+            return default
+        try:
+            result = decide()
+        except Exception as e:
+            print(f"Error in AI decision '{key}': {e}")
+            self.errors += 1
+            return default
+        self.decisions_run += 1
+        return result
+
+    async def _run(self, key, decide, apply, delay_ms, default):
+        try:
+            if delay_ms:
+                await asyncio.sleep(delay_ms / 1000)
+            result = default
+            if decide is not None:
+                try:
+                    result = await asyncio.get_running_loop().run_in_executor(
+                        self.executor, decide
+                    )
+                    self.decisions_run += 1
+                except Exception as e:
+                    print(f"Error in AI decision '{key}': {e}")
+                    self.errors += 1
+        finally:
+            if self.pending.get(key) is asyncio.current_task():
+                del self.pending[key]
+
+        # The event loop runs on the game thread, so this is safe to touch game state
+        try:
+            apply(result)
+        except Exception as e:
+            print(f"Error applying AI decision '{key}': {e}")
+            self.errors += 1
+
+    def cancel_all(self):
+        """Drop every job that has not been applied yet"""
+        for task in self.pending.values():
+            task.cancel()
+        self.pending.clear()
+
+    def shutdown(self):
+        self.cancel_all()
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,117 @@
+# Property Tycoon Asset_Manager.py
+# It contains the asset manager, which reads every image under assets/image on a worker thread and hands out shared display-format surfaces by file name.
+
+import os
+import threading
+import pygame
+from src.Surface_Cache import surface_cache
+
+base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMAGE_DIR = os.path.join(base_path, "assets", "image")
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".ico")
+
+
+class AssetManager:
+    def __init__(self, image_dir=IMAGE_DIR):
+        self.image_dir = image_dir
+        self._loaded = {}
+        self._images = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self.preloaded = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get_keys(self):
+        """Get the key of every image file, its path under assets/image such as "Dice/1.png" """
+        keys = []
+        for folder, _, files in os.walk(self.image_dir):
+            for file_name in sorted(files):
+                if file_name.lower().endswith(IMAGE_EXTENSIONS):
+                    path = os.path.join(folder, file_name)
+                    keys.append(
+                        os.path.relpath(path, self.image_dir).replace("\\", "/")
+                    )
+        return sorted(keys)
+
+    def preload(self):
+        """Start reading every image from disk on a worker thread"""
+        if self._thread is not None:
+            return self._thread
+        self._thread = threading.Thread(
+            target=self._preload_all, name="asset-preload", daemon=True
+        )
+        self._thread.start()
+        return self._thread
+
+    def wait(self, timeout=None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _preload_all(self):
+        for key in self.get_keys():
+            with self._lock:
+                if key in self._loaded or key in self._images:
+                    continue
+            try:
+                surface = pygame.image.load(os.path.join(self.image_dir, key))
+            except (pygame.error, FileNotFoundError) as e:
+                print(f"Could not preload image {key}: {e}")
+                continue
+            with self._lock:
+                if key not in self._images:
+                    self._loaded[key] = surface
+                    self.preloaded += 1
+
+    @staticmethod
+    def _convert(surface):
+        # Converting needs a display, so it happens on the game thread the first time a surface is used
+        if pygame.display.get_surface() is None:
+            return surface
+        if surface.get_flags() & pygame.SRCALPHA:
+            return surface.convert_alpha()
+        return surface.convert()
+
+    def get_image(self, key):
+        """Get the shared surface for an image; callers copy it before drawing on it"""
+        with self._lock:
+            surface = self._images.get(key)
+            if surface is not None:
+                self.hits += 1
+                return surface
+            surface = self._loaded.pop(key, None)
+
+        if surface is None:
+            # Not preloaded yet, so read it now; a missing file raises like pygame.image.load
+            self.misses += 1
+            surface = pygame.image.load(os.path.join(self.image_dir, key))
+        else:
+            self.hits += 1
+
+        surface = self._convert(surface)
+        with self._lock:
+            return self._images.setdefault(key, surface)
+
+    def get_scaled(self, key, size):
+        """Get an image scaled to size, kept in the surface cache between callers"""
+        size = (int(size[0]), int(size[1]))
+        cache_key = ("asset", key, size)
+        surface = surface_cache.get(cache_key)
+        if surface is None:
+            surface = surface_cache.put(
+                cache_key, pygame.transform.scale(self.get_image(key), size)
+            )
+        return surface
+
+    def get_stats(self):
+        """Get how many images were preloaded, converted, and found ready or read late"""
+        with self._lock:
+            return {
+                "preloaded": self.preloaded,
+                "converted": len(self._images),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+asset_manager = AssetManager()
@@ -0,0 +1,143 @@
+# Property Tycoon Auction_Engine.py
+# It contains the auction engine, which keeps auction deadlines on a timer heap and tells listeners about bids, passes and results.
+
+import heapq
+import itertools
+
+AUCTION_BID_ACCEPTED = "bid_accepted"
+AUCTION_BIDDER_PASSED = "bidder_passed"
+AUCTION_CLOSED = "auction_closed"
+
+AUCTION_TURN_MS = 30000
+FAST_FORWARD_MAX_STEPS = 200
+
+
+class AuctionEngine:
+    def __init__(self, logic, clock=None):
+        # clock returns milliseconds, the same as GameLogic.clock
+        self.logic = logic
+        self.clock = clock or logic.clock
+        self.timers = []
+        self.timer_ids = itertools.count()
+        self.cancelled = set()
+        self.turn_timer = None
+        self.listeners = {}
+        self.timers_fired = 0
+
+    def subscribe(self, event, callback):
+        """Call callback(auction, **details) whenever event happens"""
+        self.listeners.setdefault(event, []).append(callback)
+
+    def unsubscribe(self, event, callback):
+        if callback in self.listeners.get(event, []):
+            self.listeners[event].remove(callback)
+
+    def emit(self, event, auction, **details):
+        for callback in list(self.listeners.get(event, [])):
+            try:
+                callback(auction, **details)
+            except Exception as e:
+                print(f"Error in auction listener for '{event}': {e}")
+
+    def schedule(self, delay_ms, callback):
+        timer_id = next(self.timer_ids)
+        heapq.heappush(self.timers, (self.clock() + delay_ms, timer_id, callback))
+        return timer_id
+
+    def cancel(self, timer_id):
+        if timer_id is not None:
+            self.cancelled.add(timer_id)
+
+    def clear(self):
+        self.timers.clear()
+        self.cancelled.clear()
+        self.turn_timer = None
+
+    def next_deadline(self):
+        while self.timers and self.timers[0][1] in self.cancelled:
+            self.cancelled.discard(heapq.heappop(self.timers)[1])
+        return self.timers[0][0] if self.timers else None
+
+    def poll(self):
+        """Fire every timer that is due, and return how many fired"""
+        # Only the earliest deadline is looked at, so a quiet frame costs one comparison
+        fired = 0
+        now = self.clock()
+        while True:
+            deadline = self.next_deadline()
+            if deadline is None or deadline > now:
+                return fired
+            _, timer_id, callback = heapq.heappop(self.timers)
+            fired += 1
+            self.timers_fired += 1
+            callback()
+
+    def start(self, auction):
+        self.clear()
+        self.restart_turn(auction)
+
+    def restart_turn(self, auction):
+        """Give the current bidder a fresh deadline"""
+        self.cancel(self.turn_timer)
+        auction["start_time"] = self.clock()
+        self.turn_timer = self.schedule(
+            auction["duration"], lambda: self.on_turn_timeout(auction)
+        )
+
+    def time_remaining(self, auction):
+        return max(0, auction["start_time"] + auction["duration"] - self.clock())
+
+    def on_turn_timeout(self, auction):
+        logic = self.logic
+        if getattr(logic, "current_auction", None) is not auction or auction.get(
+            "completed", False
+        ):
+            return
+        bidder = auction["active_players"][auction["current_bidder_index"]]
+        print(f"{bidder['name']} took too long to bid - automatically passed")
+        logic.add_message(f"{bidder['name']} took too long to bid")
+        logic.process_auction_pass(bidder)
+
+    def finish(self, auction):
+        self.clear()
+        winner = auction["highest_bidder"]
+        self.emit(
+            AUCTION_CLOSED,
+            auction,
+            winner=winner,
+            amount=auction["current_bid"] if winner else 0,
+        )
+
+    def is_ai_only(self, auction):
+        return all(
+            p.get("is_ai", False)
+            for p in auction["active_players"]
+            if p["name"] not in auction["passed_players"]
+        )
+
+    def fast_forward(self, choose_bid, max_steps=FAST_FORWARD_MAX_STEPS):
+        """Play the current auction to the end without waiting on the clock"""
+        # choose_bid(bidder, auction) returns a bid amount, or None to pass
+        logic = self.logic
+        auction = getattr(logic, "current_auction", None)
+        steps = 0
+
+        while auction and not auction["completed"] and steps < max_steps:
+            steps += 1
+            bidder = auction["active_players"][auction["current_bidder_index"]]
+
+            if bidder["name"] in auction["passed_players"]:
+                logic.move_to_next_bidder()
+            else:
+                bid = choose_bid(bidder, auction)
+                accepted = False
+                if bid and bid >= auction["minimum_bid"]:
+                    accepted, _ = logic.process_auction_bid(bidder, bid)
+                if not accepted:
+                    logic.process_auction_pass(bidder)
+
+            logic.check_auction_end()
+
+        if auction and not auction["completed"]:
+            logic.close_auction()
+        return auction
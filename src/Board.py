@@ -9,6 +9,8 @@ from src.Property import Property
 from typing import Optional, List
 from src.Loadexcel import load_property_data
 from src.Font_Manager import font_manager
+from src.Surface_Cache import surface_cache
+from src.Asset_Manager import asset_manager
 
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -34,23 +36,35 @@ GROUP_COLORS = {
 
 base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+ZOOM_STEP = 0.05
+# Zooming uses fast rescales until the zoom has been still this long
+ZOOM_SETTLE_MS = 250
+
 
 class CameraControls:
     def __init__(self):
         self.zoom_level = 1.0
         self.offset_x = 0
         self.offset_y = 0
-        self.move_speed = 5
-        self.zoom_speed = 0.05
+        # Stepped once per frame by GameRenderer
+        self.move_speed = 15
+        self.zoom_speed = 0.15
         self.min_zoom = 0.5
         self.max_zoom = 2.0
+        self.zoom_changed_time = None
 
     def handle_camera_controls(self, keys):
+        previous_zoom = self.zoom_level
         if keys[pygame.K_PLUS] or keys[pygame.K_EQUALS]:
             self.zoom_level = min(self.max_zoom, self.zoom_level + self.zoom_speed)
         if keys[pygame.K_MINUS]:
             self.zoom_level = max(self.min_zoom, self.zoom_level - self.zoom_speed)
 
+        if self.zoom_level != previous_zoom:
+            # Snap to whole zoom steps so scaled surfaces can be reused
+            self.zoom_level = self.get_zoom_step() * ZOOM_STEP
+            self.zoom_changed_time = pygame.time.get_ticks()
+
         adjusted_speed = self.move_speed * (1 / self.zoom_level)
 
         if keys[pygame.K_w] or keys[pygame.K_UP]:
@@ -69,6 +83,15 @@ class CameraControls:
 
         return self.zoom_level, self.offset_x, self.offset_y
 
+    def get_zoom_step(self):
+        return round(self.zoom_level / ZOOM_STEP)
+
+    def is_zooming(self):
+        return (
+            self.zoom_changed_time is not None
+            and pygame.time.get_ticks() - self.zoom_changed_time < ZOOM_SETTLE_MS
+        )
+
 
 class Board:
     def __init__(self, players):
@@ -80,25 +103,27 @@ class Board:
         self.project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
         try:
-            self.board_image = pygame.image.load(
-                os.path.join(self.project_root, "assets/image/board.png")
-            )
+            self.board_image = asset_manager.get_image("board.png")
         except (pygame.error, FileNotFoundError) as e:
             print(f"Could not load board image: {e}")
             self.board_image = None
 
         try:
-            self.original_background = pygame.image.load(
-                os.path.join(self.project_root, "assets/image/background.jpg")
-            )
-            self.original_background = self.original_background.convert()
-            self.background_image = self.original_background.copy()
+            self.original_background = asset_manager.get_image("background.jpg")
+            self.background_image = self.original_background
         except (pygame.error, FileNotFoundError) as e:
             print(f"Could not load background image: {e}")
             self.original_background = None
             self.background_image = None
 
         self.board_rects = self._create_board_rects()
+
+        # Message log panel reused between frames until the log changes
+        self.message_log_surface = None
+        self.message_log_key = None
+        self.message_log_rect = None
+        self.token_glows = {}
+
         self.messages = []
         self.message_times = []
         self.message_font = font_manager.get_font(15)
@@ -261,15 +286,18 @@ class Board:
             pos_x = max(rect.x + 2, min(pos_x, rect.x + rect.width - 42))
             pos_y = max(rect.y + 2, min(pos_y, rect.y + rect.height - 42))
 
-        glow_surface = pygame.Surface((44, 44), pygame.SRCALPHA)
-        for i in range(4):
-            alpha = int(100 * (1 - i / 4))
-            pygame.draw.rect(
-                glow_surface,
-                (*player.color[:3], alpha),
-                pygame.Rect(i, i, 44 - i * 2, 44 - i * 2),
-                border_radius=5,
-            )
+        glow_surface = self.token_glows.get(player.color[:3])
+        if glow_surface is None:
+            glow_surface = pygame.Surface((44, 44), pygame.SRCALPHA)
+            for i in range(4):
+                alpha = int(100 * (1 - i / 4))
+                pygame.draw.rect(
+                    glow_surface,
+                    (*player.color[:3], alpha),
+                    pygame.Rect(i, i, 44 - i * 2, 44 - i * 2),
+                    border_radius=5,
+                )
+            self.token_glows[player.color[:3]] = glow_surface
         screen.blit(glow_surface, (pos_x - 2, pos_y - 2 - player.animation_offset))
 
         if player.player_image:
@@ -307,12 +335,11 @@ class Board:
 
         return pos_x, pos_y
 
-    def draw(self, screen):
-        window_width = screen.get_width()
-        window_height = screen.get_height()
-        base_board_size = int(window_height * 0.9)
-        board_size = int(base_board_size * self.camera.zoom_level)
-        board_size = max(1, board_size)
+    def _get_background_layer(self, window_width, window_height):
+        key = ("background", (window_width, window_height))
+        layer = surface_cache.get(key)
+        if layer is not None:
+            return layer
 
         game_surface = pygame.Surface((window_width, window_height))
         game_surface.fill(WHITE)
@@ -339,85 +366,45 @@ class Board:
         else:
             game_surface.fill(UI_BG)
 
-        keys = pygame.key.get_pressed()
-        zoom, offset_x, offset_y = self.camera.handle_camera_controls(keys)
-        self.camera.zoom_level = zoom
-        self.camera.offset_x = offset_x
-        self.camera.offset_y = offset_y
-
-        self.update_board_positions()
-
-        board_x = ((window_width - board_size) // 2) + self.camera.offset_x
-        board_y = ((window_height - board_size) // 2) + self.camera.offset_y
+        return surface_cache.put(key, game_surface.convert())
+
+    def _get_board_surface(self, board_size):
+        zoom_step = self.camera.get_zoom_step()
+        smooth_key = ("board", (board_size, board_size), zoom_step, "smooth")
+        board_surface = surface_cache.get(smooth_key)
+        if board_surface is not None:
+            return board_surface
+
+        zooming = self.camera.is_zooming()
+        key = ("board", (board_size, board_size), zoom_step, "fast")
+        if zooming:
+            board_surface = surface_cache.get(key)
+            if board_surface is not None:
+                return board_surface
+        else:
+            key = smooth_key
 
         board_surface = pygame.Surface((board_size, board_size))
         board_surface.fill(WHITE)
         if self.board_image:
-            scaled_board = pygame.transform.smoothscale(
-                self.board_image, (board_size, board_size)
-            )
+            scale = pygame.transform.scale if zooming else pygame.transform.smoothscale
+            scaled_board = scale(self.board_image, (board_size, board_size))
             board_surface.blit(scaled_board, (0, 0))
-        game_surface.blit(board_surface, (board_x, board_y))
-
-        transparent_surface = pygame.Surface(
-            (window_width, window_height), pygame.SRCALPHA
-        )
-
-        for player in self.players:
-            if not isinstance(player.position, int) or not (1 <= player.position <= 40):
-                print(
-                    f"Warning: Invalid position {player.position} detected for {player.name} in draw, resetting to position 1"
-                )
-                player.position = 1
-
-            if player.is_moving and player.current_path_index < len(player.move_path):
-                rect_for_animation = None
-
-                if player.current_path_index == 0:
-                    start_pos = player.move_start_position - 1
-                    end_pos = player.move_path[0] - 1
-                else:
-                    start_pos = player.move_path[player.current_path_index - 1] - 1
-                    end_pos = player.move_path[player.current_path_index] - 1
+        return surface_cache.put(key, board_surface.convert())
 
-                start_pos = max(0, min(start_pos, len(self.board_rects) - 1))
-                end_pos = max(0, min(end_pos, len(self.board_rects) - 1))
+    def _get_message_log(self, info_panel_width, info_panel_height, shadow_depth):
+        key = tuple(self.messages)
+        if self.message_log_surface is not None and self.message_log_key == key:
+            return self.message_log_surface
 
-                if 0 <= start_pos < len(self.board_rects) and 0 <= end_pos < len(
-                    self.board_rects
-                ):
-                    rect_for_animation = self.board_rects[start_pos]
-                    is_corner = (
-                        rect_for_animation.width > rect_for_animation.height + 10
-                        or rect_for_animation.height > rect_for_animation.width + 10
-                    )
-                    self.draw_player(
-                        transparent_surface,
-                        player,
-                        rect_for_animation,
-                        player.player_number,
-                    )
-            else:
-                pos_index = max(0, min(player.position - 1, len(self.board_rects) - 1))
-                player_rect = self.board_rects[pos_index]
-                self.draw_player(
-                    transparent_surface, player, player_rect, player.player_number
-                )
-
-        info_panel_width = 290
-        info_panel_height = 230
-        info_panel_x = 20
-        info_panel_y = window_height - info_panel_height - 20
-
-        shadow_depth = 6
-        panel_shadow = pygame.Surface(
+        log_surface = pygame.Surface(
             (info_panel_width + shadow_depth * 2, info_panel_height + shadow_depth * 2),
             pygame.SRCALPHA,
         )
         for i in range(shadow_depth):
             alpha = int(120 * (1 - i / shadow_depth))
             pygame.draw.rect(
-                panel_shadow,
+                log_surface,
                 (*BLACK, alpha),
                 pygame.Rect(
                     i,
@@ -427,9 +414,6 @@ class Board:
                 ),
                 border_radius=12,
             )
-        transparent_surface.blit(
-            panel_shadow, (info_panel_x - shadow_depth, info_panel_y - shadow_depth)
-        )
 
         info_panel = pygame.Surface(
             (info_panel_width, info_panel_height), pygame.SRCALPHA
@@ -449,7 +433,7 @@ class Board:
         )
 
         title_font = font_manager.get_font(20)
-        title_text = title_font.render("MESSAGE LOG", True, WHITE)
+        title_text = font_manager.render_text(title_font, "MESSAGE LOG", True, WHITE)
         title_rect = title_text.get_rect(
             center=(info_panel_width // 2, header_height // 2)
         )
@@ -460,20 +444,84 @@ class Board:
             info_panel, WHITE, info_panel.get_rect(), border_width, border_radius=10
         )
 
-        transparent_surface.blit(info_panel, (info_panel_x, info_panel_y))
+        log_surface.blit(info_panel, (shadow_depth, shadow_depth))
 
         line_height = self.message_font.get_height() + 5
         max_messages = (info_panel_height - header_height - 20) // line_height
         visible_messages = self.messages[-max_messages:]
-        text_y = info_panel_y + header_height + 10
+        text_y = shadow_depth + header_height + 10
 
         for message in visible_messages:
-            text = self.message_font.render(message, True, WHITE)
-            transparent_surface.blit(text, (info_panel_x + 15, text_y))
+            text = font_manager.render_text(self.message_font, message, True, WHITE)
+            log_surface.blit(text, (shadow_depth + 15, text_y))
             text_y += line_height
 
-        game_surface.blit(transparent_surface, (0, 0))
-        screen.blit(game_surface, (0, 0))
+        self.message_log_surface = log_surface
+        self.message_log_key = key
+        return log_surface
+
+    def draw(self, screen):
+        window_width = screen.get_width()
+        window_height = screen.get_height()
+        base_board_size = int(window_height * 0.9)
+        board_size = int(base_board_size * self.camera.zoom_level)
+        board_size = max(1, board_size)
+
+        self.update_board_positions()
+
+        board_x = ((window_width - board_size) // 2) + self.camera.offset_x
+        board_y = ((window_height - board_size) // 2) + self.camera.offset_y
+
+        screen.blit(self._get_background_layer(window_width, window_height), (0, 0))
+        screen.blit(self._get_board_surface(board_size), (board_x, board_y))
+
+        for player in self.players:
+            if not isinstance(player.position, int) or not (1 <= player.position <= 40):
+                print(
+                    f"Warning: Invalid position {player.position} detected for {player.name} in draw, resetting to position 1"
+                )
+                player.position = 1
+
+            if player.is_moving and player.current_path_index < len(player.move_path):
+                rect_for_animation = None
+
+                if player.current_path_index == 0:
+                    start_pos = player.move_start_position - 1
+                    end_pos = player.move_path[0] - 1
+                else:
+                    start_pos = player.move_path[player.current_path_index - 1] - 1
+                    end_pos = player.move_path[player.current_path_index] - 1
+
+                start_pos = max(0, min(start_pos, len(self.board_rects) - 1))
+                end_pos = max(0, min(end_pos, len(self.board_rects) - 1))
+
+                if 0 <= start_pos < len(self.board_rects) and 0 <= end_pos < len(
+                    self.board_rects
+                ):
+                    rect_for_animation = self.board_rects[start_pos]
+                    self.draw_player(
+                        screen,
+                        player,
+                        rect_for_animation,
+                        player.player_number,
+                    )
+            else:
+                pos_index = max(0, min(player.position - 1, len(self.board_rects) - 1))
+                player_rect = self.board_rects[pos_index]
+                self.draw_player(screen, player, player_rect, player.player_number)
+
+        info_panel_width = 290
+        info_panel_height = 230
+        info_panel_x = 20
+        info_panel_y = window_height - info_panel_height - 20
+        shadow_depth = 6
+
+        log_surface = self._get_message_log(
+            info_panel_width, info_panel_height, shadow_depth
+        )
+        self.message_log_rect = screen.blit(
+            log_surface, (info_panel_x - shadow_depth, info_panel_y - shadow_depth)
+        )
 
     def get_space(self, position):
         array_pos = (position - 1) % 40
@@ -0,0 +1,222 @@
+# Property Tycoon Board_State.py
+# It contains the compact board state, which packs ownership, houses, mortgages and player state into one NumPy record for cheap copies.
+
+import numpy as np
+
+MAX_SPACES = 40
+MAX_PLAYERS = 8
+NO_OWNER = -1
+
+STATE_DTYPE = np.dtype(
+    [
+        ("owner", "i1", MAX_SPACES),
+        ("houses", "i1", MAX_SPACES),
+        ("mortgaged", "?", MAX_SPACES),
+        ("money", "f8", MAX_PLAYERS),
+        ("position", "i1", MAX_PLAYERS),
+        ("in_jail", "?", MAX_PLAYERS),
+        ("jail_turns", "i1", MAX_PLAYERS),
+        ("active", "?", MAX_PLAYERS),
+        ("current_player", "i1"),
+        ("bank_money", "f8"),
+        ("free_parking", "f8"),
+    ]
+)
+
+
+def _number(value):
+    # Money is stored as a float, but whole amounts go back as ints like the game uses
+    value = value.item()
+    return int(value) if value.is_integer() else value
+
+
+class BoardLayout:
+    __slots__ = ("keys", "key_index", "names", "name_index")
+
+    def __init__(self, keys, names):
+        # Shared by every clone, so only the state record is ever copied
+        self.keys = tuple(keys)
+        self.key_index = {key: index for index, key in enumerate(self.keys)}
+        self.names = tuple(names)
+        self.name_index = {name: index for index, name in enumerate(self.names)}
+
+
+class BoardState:
+    __slots__ = ("data", "layout")
+
+    def __init__(self, data, layout):
+        self.data = data
+        self.layout = layout
+
+    @classmethod
+    def from_properties(
+        cls, properties, players=(), current_player=0, bank_money=0, free_parking=0
+    ):
+        """Pack a properties dict and player dicts into a new state"""
+        keys = sorted(properties, key=int)
+        if len(keys) > MAX_SPACES:
+            raise ValueError(f"A board state holds at most {MAX_SPACES} spaces")
+
+        names = [player["name"] for player in players]
+        for key in keys:
+            owner = properties[key].get("owner")
+            if owner is not None and owner not in names:
+                names.append(owner)
+        if len(names) > MAX_PLAYERS:
+            raise ValueError(f"A board state holds at most {MAX_PLAYERS} players")
+
+        layout = BoardLayout(keys, names)
+        data = np.zeros((), dtype=STATE_DTYPE)
+        data["owner"] = NO_OWNER
+
+        for index, key in enumerate(keys):
+            space = properties[key]
+            owner = space.get("owner")
+            if owner is not None:
+                data["owner"][index] = layout.name_index[owner]
+            data["houses"][index] = space.get("houses", 0)
+            data["mortgaged"][index] = space.get("is_mortgaged", False)
+
+        for index, player in enumerate(players):
+            data["money"][index] = player["money"]
+            data["position"][index] = player["position"]
+            data["in_jail"][index] = player.get("in_jail", False)
+            data["jail_turns"][index] = player.get("jail_turns", 0)
+            data["active"][index] = True
+
+        data["current_player"] = current_player
+        data["bank_money"] = bank_money
+        data["free_parking"] = free_parking
+        return cls(data, layout)
+
+    @classmethod
+    def from_game(cls, logic):
+        return cls.from_properties(
+            logic.properties,
+            logic.players,
+            logic.current_player_index,
+            logic.bank_money,
+            logic.free_parking_fund,
+        )
+
+    def clone(self):
+        return BoardState(self.data.copy(), self.layout)
+
+    @property
+    def nbytes(self):
+        return self.data.nbytes
+
+    def get_space_index(self, position):
+        return self.layout.key_index[str(position)]
+
+    def get_player_index(self, name):
+        return self.layout.name_index[name]
+
+    def get_owner(self, position):
+        owner = self.data["owner"][self.get_space_index(position)]
+        return None if owner == NO_OWNER else self.layout.names[owner]
+
+    def set_owner(self, position, name):
+        owner = NO_OWNER if name is None else self.get_player_index(name)
+        self.data["owner"][self.get_space_index(position)] = owner
+
+    def get_houses(self, position):
+        return int(self.data["houses"][self.get_space_index(position)])
+
+    def set_houses(self, position, houses):
+        self.data["houses"][self.get_space_index(position)] = houses
+
+    def is_mortgaged(self, position):
+        return bool(self.data["mortgaged"][self.get_space_index(position)])
+
+    def set_mortgaged(self, position, mortgaged):
+        self.data["mortgaged"][self.get_space_index(position)] = mortgaged
+
+    def get_money(self, name):
+        return _number(self.data["money"][self.get_player_index(name)])
+
+    def add_money(self, name, amount):
+        self.data["money"][self.get_player_index(name)] += amount
+
+    def get_position(self, name):
+        return int(self.data["position"][self.get_player_index(name)])
+
+    def set_position(self, name, position):
+        self.data["position"][self.get_player_index(name)] = position
+
+    def is_in_jail(self, name):
+        return bool(self.data["in_jail"][self.get_player_index(name)])
+
+    def set_in_jail(self, name, in_jail):
+        index = self.get_player_index(name)
+        self.data["in_jail"][index] = in_jail
+        self.data["jail_turns"][index] = 0
+
+    def add_free_parking(self, amount):
+        self.data["free_parking"] += amount
+
+    def get_owned_positions(self, name):
+        owned = np.flatnonzero(self.data["owner"] == self.get_player_index(name))
+        return [int(self.layout.keys[index]) for index in owned]
+
+    def _space_values(self, index, space):
+        # Only fields the original dict had, or that now differ from the default, are written
+        values = {}
+        owner = int(self.data["owner"][index])
+        if "owner" in space or owner != NO_OWNER:
+            values["owner"] = None if owner == NO_OWNER else self.layout.names[owner]
+        houses = int(self.data["houses"][index])
+        if "houses" in space or houses:
+            values["houses"] = houses
+        mortgaged = bool(self.data["mortgaged"][index])
+        if "is_mortgaged" in space or mortgaged:
+            values["is_mortgaged"] = mortgaged
+        return values
+
+    def to_properties(self, properties):
+        """Build a properties dict like properties but holding this state's values"""
+        result = {}
+        for key, space in properties.items():
+            space = dict(space)
+            index = self.layout.key_index.get(key)
+            if index is not None:
+                for field, value in self._space_values(index, space).items():
+                    if space.get(field) != value:
+                        space[field] = value
+            result[key] = space
+        return result
+
+    def apply_to_properties(self, properties):
+        """Write this state's values into properties, touching only what differs"""
+        for key, index in self.layout.key_index.items():
+            space = properties[key]
+            for field, value in self._space_values(index, space).items():
+                if space.get(field) != value:
+                    space[field] = value
+
+    def apply_to_game(self, logic):
+        """Write this state back into a GameLogic's properties and players"""
+        self.apply_to_properties(logic.properties)
+
+        data = self.data
+        for player in logic.players:
+            index = self.layout.name_index.get(player["name"])
+            if index is None or not data["active"][index]:
+                continue
+            values = {
+                "money": _number(data["money"][index]),
+                "position": int(data["position"][index]),
+            }
+            if "in_jail" in player or data["in_jail"][index]:
+                values["in_jail"] = bool(data["in_jail"][index])
+            if "jail_turns" in player or data["jail_turns"][index]:
+                values["jail_turns"] = int(data["jail_turns"][index])
+            for field, value in values.items():
+                if player.get(field) != value:
+                    player[field] = value
+
+        logic.current_player_index = int(data["current_player"])
+        if logic.bank_money != _number(data["bank_money"]):
+            logic.bank_money = _number(data["bank_money"])
+        if logic.free_parking_fund != _number(data["free_parking"]):
+            logic.free_parking_fund = _number(data["free_parking"])
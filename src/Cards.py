@@ -24,8 +24,9 @@ class Card:
 
 
 class CardDeck:
-    def __init__(self, card_type):
+    def __init__(self, card_type, rng=None):
         self.card_type = card_type
+        self.rng = rng or random
         self.cards = []
         self.discard_pile = []
         self.initialize_deck()
@@ -45,14 +46,14 @@ class CardDeck:
                 card_type=self.card_type,
             )
             self.cards.append(card)
-        random.shuffle(self.cards)
+        self.rng.shuffle(self.cards)
 
     def draw_card(self):
         if not self.cards:
             if self.discard_pile:
                 self.cards = self.discard_pile
                 self.discard_pile = []
-                random.shuffle(self.cards)
+                self.rng.shuffle(self.cards)
             else:
                 return None
 
@@ -93,7 +94,7 @@ class CardDeck:
         if not self.cards and self.discard_pile:
             self.cards = self.discard_pile
             self.discard_pile = []
-            random.shuffle(self.cards)
+            self.rng.shuffle(self.cards)
         return self.cards[-1] if self.cards else None
 
     def get_remaining_count(self):
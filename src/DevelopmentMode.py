@@ -101,11 +101,7 @@ class DevelopmentMode:
             )
             return False
 
-        owned_properties = [
-            prop
-            for prop in self.game.logic.properties.values()
-            if prop.get("owner") == player["name"]
-        ]
+        owned_properties = self.game.logic.properties.get_owned(player["name"])
 
         if not owned_properties:
             print(f"Development: Cannot develop - {player['name']} owns no properties")
@@ -405,17 +401,12 @@ class DevelopmentMode:
         current_player_logic = self.game.logic.players[
             self.game.logic.current_player_index
         ]
-        player_obj = next(
-            (p for p in self.game.players if p.name == current_player_logic["name"]),
-            None,
-        )
+        player_obj = self.game.get_player(current_player_logic["name"])
 
         if player_obj and not player_obj.is_ai and self.is_active:
-            owned_properties = [
-                prop
-                for prop in self.game.logic.properties.values()
-                if prop.get("owner") == current_player_logic["name"]
-            ]
+            owned_properties = self.game.logic.properties.get_owned(
+                current_player_logic["name"]
+            )
 
             for prop in owned_properties:
                 if "position" in prop:
@@ -464,8 +455,8 @@ class DevelopmentMode:
 
         current_player = self.game.logic.players[self.game.logic.current_player_index]
 
-        header_text = self.font.render(
-            f"Develop {property_data['name']}", True, ACCENT_COLOR
+        header_text = font_manager.render_text(
+            self.font, f"Develop {property_data['name']}", True, ACCENT_COLOR
         )
         self.screen.blit(header_text, (card_x + 20, card_y + 20))
 
@@ -484,29 +475,35 @@ class DevelopmentMode:
             )
             y_offset += 20
 
-        price_text = info_font.render(f"Price: £{property_data['price']}", True, BLACK)
+        price_text = font_manager.render_text(
+            info_font, f"Price: £{property_data['price']}", True, BLACK
+        )
         self.screen.blit(price_text, (card_x + padding, y_offset))
         y_offset += line_height
 
         houses = property_data.get("houses", 0)
         house_text_str = f"Houses: {houses}" if houses < 5 else "Hotel Built"
-        house_text = info_font.render(house_text_str, True, BLACK)
+        house_text = font_manager.render_text(info_font, house_text_str, True, BLACK)
         self.screen.blit(house_text, (card_x + padding, y_offset))
         y_offset += line_height
 
         rent = self.game.logic.calculate_space_rent(property_data, current_player)
-        rent_text = info_font.render(f"Current Rent: £{rent}", True, DARK_GREEN)
+        rent_text = font_manager.render_text(
+            info_font, f"Current Rent: £{rent}", True, DARK_GREEN
+        )
         self.screen.blit(rent_text, (card_x + padding, y_offset))
         y_offset += line_height
 
         if property_data.get("is_mortgaged", False):
-            mortgage_text = info_font.render("[MORTGAGED]", True, ERROR_COLOR)
+            mortgage_text = font_manager.render_text(
+                info_font, "[MORTGAGED]", True, ERROR_COLOR
+            )
             self.screen.blit(mortgage_text, (card_x + padding, y_offset))
             y_offset += line_height
         else:
             mortgage_val = property_data.get("price", 0) // 2
-            mortgage_text = info_font.render(
-                f"Mortgage Value: £{mortgage_val}", True, GRAY
+            mortgage_text = font_manager.render_text(
+                info_font, f"Mortgage Value: £{mortgage_val}", True, GRAY
             )
             self.screen.blit(mortgage_text, (card_x + padding, y_offset))
             y_offset += line_height
@@ -666,8 +663,8 @@ class DevelopmentMode:
         self.screen.blit(button_surface, button_rect)
 
         text_color = CREAM if active else LIGHT_GRAY
-        text_shadow_surf = self.small_font.render(text, True, BLACK)
-        text_surf = self.small_font.render(text, True, text_color)
+        text_shadow_surf = font_manager.render_text(self.small_font, text, True, BLACK)
+        text_surf = font_manager.render_text(self.small_font, text, True, text_color)
         text_rect = text_surf.get_rect(center=button_rect.center)
         shadow_text_rect = text_rect.copy()
         shadow_text_rect.topleft = (text_rect.left + 1, text_rect.top + 1)
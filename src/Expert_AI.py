@@ -0,0 +1,510 @@
+# Property Tycoon Expert_AI.py
+# It contains the expert AI, which plays short random games from a copy of the board for each choice it has and keeps the one that did best.
+
+import logging
+import random
+import time
+
+from src.Ai_Player_Logic import HardAIPlayer
+from src.Board_State import BoardState, NO_OWNER
+from src.Rent_Table import STATION_BASE_RENT, UTILITY_MULTIPLIERS
+
+logger = logging.getLogger(__name__)
+
+# One decision has to fit inside a frame at 30 FPS (about 33 ms) with room to draw it
+EXPERT_TIME_BUDGET = 0.025
+EXPERT_MAX_ROUNDS = 200
+EXPERT_PLAYOUT_TURNS = 48
+
+GO_MONEY = 200
+JAIL_POSITION = 11
+GO_TO_JAIL_POSITION = 31
+FREE_PARKING_POSITION = 21
+JAIL_FINE = 50
+MAX_JAIL_TURNS = 3
+MAX_HOUSES = 5
+AUCTION_BID_STEP = 10
+
+# Playout players follow the same rough odds as the running game's AI
+PLAYOUT_BUY_CHANCE = 0.7
+PLAYOUT_BUILD_CHANCE = 0.5
+PLAYOUT_PAY_JAIL_CHANCE = 0.5
+PLAYOUT_BUILD_RESERVE = 200
+
+SPACE_OTHER = 0
+SPACE_PROPERTY = 1
+SPACE_STATION = 2
+SPACE_UTILITY = 3
+SPACE_TAX = 4
+SPACE_KINDS = {
+    "property": SPACE_PROPERTY,
+    "station": SPACE_STATION,
+    "utility": SPACE_UTILITY,
+    "tax": SPACE_TAX,
+}
+
+
+def _no_action(state):
+    pass
+
+
+class PlayoutBoard:
+    def __init__(self, properties, layout):
+        # Playouts work on plain lists, so board index i is position i + 1
+        size = len(layout.keys)
+        self.size = size
+        self.valid = layout.keys == tuple(str(i) for i in range(1, size + 1))
+        self.kind = [SPACE_OTHER] * size
+        self.price = [0] * size
+        self.rent = [0] * size
+        self.house_rents = [()] * size
+        self.tax = [0] * size
+        self.group = [-1] * size
+        self.groups = []
+
+        group_ids = {}
+        for index, key in enumerate(layout.keys):
+            space = properties[key]
+            kind = SPACE_KINDS.get(space.get("type"), SPACE_OTHER)
+            if kind == SPACE_TAX:
+                self.tax[index] = space.get("amount", 0)
+            elif kind != SPACE_OTHER and space.get("can_be_bought", True):
+                self.price[index] = space.get("price", 0)
+                self.rent[index] = space.get("rent", 0)
+                self.house_rents[index] = tuple(space.get("house_costs", ()))
+                if kind == SPACE_PROPERTY and space.get("group"):
+                    group = group_ids.setdefault(space["group"], len(group_ids))
+                    if group == len(self.groups):
+                        self.groups.append([])
+                    self.groups[group].append(index)
+                    self.group[index] = group
+            else:
+                kind = SPACE_OTHER
+            self.kind[index] = kind
+
+        self.stations = [i for i, kind in enumerate(self.kind) if kind == SPACE_STATION]
+        self.utilities = [
+            i for i, kind in enumerate(self.kind) if kind == SPACE_UTILITY
+        ]
+
+    def get_rent(self, index, owner, houses, dice_total):
+        kind = self.kind[index]
+        player = owner[index]
+        if kind == SPACE_STATION:
+            count = sum(1 for i in self.stations if owner[i] == player)
+            return STATION_BASE_RENT * (2 ** (count - 1))
+        if kind == SPACE_UTILITY:
+            count = sum(1 for i in self.utilities if owner[i] == player)
+            return dice_total * UTILITY_MULTIPLIERS[1 if count > 1 else 0]
+        if houses[index] > 0:
+            house_rents = self.house_rents[index]
+            return house_rents[min(houses[index], len(house_rents)) - 1]
+        group = self.group[index]
+        if group >= 0 and all(owner[i] == player for i in self.groups[group]):
+            return self.rent[index] * 2
+        return self.rent[index]
+
+    def get_worth(self, player, owner, houses, mortgaged, money):
+        worth = money[player]
+        for index, space_owner in enumerate(owner):
+            if space_owner == player:
+                price = self.price[index]
+                worth += price / 2 if mortgaged[index] else price
+                worth += houses[index] * price / 2
+        return worth
+
+    def run(self, state, player, rng, turns):
+        """Play turns random turns from state and score player by share of total worth"""
+        data = state.data
+        owner = data["owner"].tolist()
+        houses = data["houses"].tolist()
+        mortgaged = data["mortgaged"].tolist()
+        money = data["money"].tolist()
+        position = data["position"].tolist()
+        in_jail = data["in_jail"].tolist()
+        jail_turns = data["jail_turns"].tolist()
+        active = data["active"].tolist()
+        free_parking = float(data["free_parking"])
+        current = int(data["current_player"])
+        count = len(state.layout.names)
+        size = self.size
+
+        for _ in range(turns):
+            if sum(active[:count]) <= 1:
+                break
+            while not active[current % count]:
+                current += 1
+            mover = current % count
+            current = mover + 1
+
+            dice1 = rng.randint(1, 6)
+            dice2 = rng.randint(1, 6)
+
+            if in_jail[mover]:
+                if dice1 == dice2:
+                    in_jail[mover] = False
+                elif jail_turns[mover] + 1 >= MAX_JAIL_TURNS or (
+                    money[mover] >= JAIL_FINE and rng.random() < PLAYOUT_PAY_JAIL_CHANCE
+                ):
+                    money[mover] -= JAIL_FINE
+                    free_parking += JAIL_FINE
+                    in_jail[mover] = False
+                else:
+                    jail_turns[mover] += 1
+                    continue
+                jail_turns[mover] = 0
+
+            new_position = position[mover] + dice1 + dice2
+            if new_position >= size:
+                money[mover] += GO_MONEY
+            new_position = new_position % size or size
+            position[mover] = new_position
+            index = new_position - 1
+            kind = self.kind[index]
+
+            if new_position == GO_TO_JAIL_POSITION:
+                position[mover] = JAIL_POSITION
+                in_jail[mover] = True
+                jail_turns[mover] = 0
+                continue
+
+            if new_position == FREE_PARKING_POSITION:
+                money[mover] += free_parking
+                free_parking = 0
+            elif kind == SPACE_TAX:
+                money[mover] -= self.tax[index]
+            elif kind != SPACE_OTHER:
+                space_owner = owner[index]
+                if space_owner == NO_OWNER:
+                    price = self.price[index]
+                    if money[mover] >= price and rng.random() < PLAYOUT_BUY_CHANCE:
+                        money[mover] -= price
+                        owner[index] = mover
+                elif (
+                    space_owner != mover
+                    and not mortgaged[index]
+                    and not in_jail[space_owner]
+                ):
+                    rent = self.get_rent(index, owner, houses, dice1 + dice2)
+                    money[mover] -= rent
+                    money[space_owner] += rent
+
+            if money[mover] < 0:
+                self._raise_cash(mover, owner, houses, mortgaged, money)
+                if money[mover] < 0:
+                    active[mover] = False
+                    for i, space_owner in enumerate(owner):
+                        if space_owner == mover:
+                            owner[i] = NO_OWNER
+                            houses[i] = 0
+                            mortgaged[i] = False
+            elif (
+                money[mover] > PLAYOUT_BUILD_RESERVE
+                and rng.random() < PLAYOUT_BUILD_CHANCE
+            ):
+                self._build(mover, owner, houses, mortgaged, money)
+
+        if not active[player]:
+            return 0.0
+        total = sum(
+            self.get_worth(i, owner, houses, mortgaged, money)
+            for i in range(count)
+            if active[i]
+        )
+        if total <= 0:
+            return 0.0
+        return self.get_worth(player, owner, houses, mortgaged, money) / total
+
+    def _raise_cash(self, player, owner, houses, mortgaged, money):
+        for index, space_owner in enumerate(owner):
+            while space_owner == player and houses[index] and money[player] < 0:
+                houses[index] -= 1
+                money[player] += self.price[index] / 4
+        for index, space_owner in enumerate(owner):
+            if money[player] >= 0:
+                return
+            if space_owner == player and not mortgaged[index] and not houses[index]:
+                mortgaged[index] = True
+                money[player] += self.price[index] // 2
+
+    def _build(self, player, owner, houses, mortgaged, money):
+        for group in self.groups:
+            if not all(owner[i] == player and not mortgaged[i] for i in group):
+                continue
+            index = min(group, key=lambda i: houses[i])
+            cost = self.price[index] / 2
+            if (
+                houses[index] < MAX_HOUSES
+                and money[player] - cost >= PLAYOUT_BUILD_RESERVE
+            ):
+                houses[index] += 1
+                money[player] -= cost
+                return
+
+
+class ExpertAIPlayer(HardAIPlayer):
+    def __init__(
+        self,
+        logic=None,
+        rng=None,
+        time_budget=EXPERT_TIME_BUDGET,
+        max_rounds=EXPERT_MAX_ROUNDS,
+        playout_turns=EXPERT_PLAYOUT_TURNS,
+        clock=time.perf_counter,
+    ):
+        super().__init__(rng=rng)
+        self.difficulty = "expert"
+        self.logic = logic
+        # time_budget=None plays exactly max_rounds, so seeded simulations repeat
+        self.time_budget = time_budget
+        self.max_rounds = max_rounds
+        self.playout_turns = playout_turns
+        self.clock = clock
+        self.playout_rng = random.Random(self.rng.getrandbits(64))
+        self.last_decision = None
+        self._board = None
+        self._board_properties = None
+        logger.debug("ExpertAIPlayer initialized with playout search")
+
+    def _get_board(self, state):
+        properties = self.logic.properties
+        if self._board is None or self._board_properties is not properties:
+            self._board = PlayoutBoard(properties, state.layout)
+            self._board_properties = properties
+        return self._board
+
+    def _snapshot(self, player_name):
+        """Copy the game into a board state, or None if the playouts cannot run"""
+        if self.logic is None or player_name is None:
+            return None
+        try:
+            state = BoardState.from_game(self.logic)
+        except (AttributeError, KeyError, ValueError) as e:
+            logger.debug("DEBUG: Expert AI cannot copy the board: %s", e)
+            return None
+        if player_name not in state.layout.name_index:
+            return None
+        if not self._get_board(state).valid:
+            return None
+
+        # Playouts start with the turn after the deciding player's
+        player_count = len(self.logic.players)
+        player_index = state.get_player_index(player_name)
+        if player_index < player_count:
+            state.data["current_player"] = (player_index + 1) % player_count
+        return state
+
+    def choose(self, state, player_name, actions):
+        """Play out each action from copies of state and return the name of the best one"""
+        names = list(actions)
+        if len(names) == 1:
+            return names[0]
+
+        board = self._get_board(state)
+        player_index = state.get_player_index(player_name)
+        totals = dict.fromkeys(names, 0.0)
+        started = self.clock()
+        rounds = 0
+
+        while rounds < self.max_rounds:
+            if (
+                rounds
+                and self.time_budget is not None
+                and self.clock() - started >= self.time_budget
+            ):
+                break
+            # Every action gets the same dice in a round, so only the action differs
+            seed = self.playout_rng.getrandbits(32)
+            for name in names:
+                playout_state = state.clone()
+                actions[name](playout_state)
+                totals[name] += board.run(
+                    playout_state,
+                    player_index,
+                    random.Random(seed),
+                    self.playout_turns,
+                )
+            rounds += 1
+
+        best = max(names, key=lambda name: totals[name])
+        self.last_decision = {
+            "choice": best,
+            "rounds": rounds,
+            "playouts": rounds * len(names),
+            "seconds": self.clock() - started,
+            "scores": {name: totals[name] / rounds for name in names},
+        }
+        logger.debug(
+            "DEBUG: Expert AI chose %s after %s rounds in %.1fms",
+            best,
+            rounds,
+            self.last_decision["seconds"] * 1000,
+        )
+        return best
+
+    def _get_auction(self):
+        auction = getattr(self.logic, "current_auction", None)
+        if not auction or auction.get("completed"):
+            return None
+        return auction
+
+    def should_buy_property(
+        self, property_data, player_money, owned_properties, player_name=None
+    ):
+        logger.debug("=== EXPERT AI Purchase Decision Debug ===")
+        if player_money < property_data["price"]:
+            logger.debug("DEBUG: AI cannot afford property")
+            return False
+
+        state = self._snapshot(player_name)
+        if state is None:
+            return super().should_buy_property(
+                property_data, player_money, owned_properties, player_name
+            )
+
+        position = property_data["position"]
+        price = property_data["price"]
+
+        def buy(state):
+            state.set_owner(position, player_name)
+            state.add_money(player_name, -price)
+
+        choice = self.choose(state, player_name, {"pass": _no_action, "buy": buy})
+        return choice == "buy"
+
+    def make_auction_bid(
+        self,
+        property_data,
+        current_bid,
+        player_money,
+        owned_properties,
+        player_name=None,
+    ):
+        logger.debug("=== EXPERT AI Auction Bid Debug ===")
+        auction = self._get_auction()
+        if auction is None or player_money <= current_bid:
+            return None
+
+        state = self._snapshot(player_name)
+        if state is None:
+            return None
+
+        bid = max(current_bid + AUCTION_BID_STEP, auction.get("minimum_bid", 0))
+        if bid > player_money:
+            return None
+
+        position = property_data["position"]
+        rival = auction.get("highest_bidder")
+        rival_name = rival["name"] if rival else None
+
+        def win(state):
+            state.set_owner(position, player_name)
+            state.add_money(player_name, -bid)
+
+        def lose(state):
+            # Passing leaves the current highest bid standing
+            if rival_name in state.layout.name_index and rival_name != player_name:
+                state.set_owner(position, rival_name)
+                state.add_money(rival_name, -current_bid)
+
+        choice = self.choose(state, player_name, {"pass": lose, "bid": win})
+        return bid if choice == "bid" else None
+
+    def handle_property_development(self, ai_player, board_properties):
+        logger.debug("=== EXPERT AI Development Strategy Debug ===")
+        player_name = ai_player["name"]
+        state = self._snapshot(player_name)
+        if state is None:
+            return super().handle_property_development(ai_player, board_properties)
+
+        candidates = {}
+        for group_properties in self.easy_ai.get_completed_groups(
+            player_name, board_properties
+        ):
+            if any(prop.get("is_mortgaged", False) for prop in group_properties):
+                continue
+            min_houses = min(prop.get("houses", 0) for prop in group_properties)
+            for prop in group_properties:
+                houses = prop.get("houses", 0)
+                if (
+                    houses == min_houses
+                    and houses < MAX_HOUSES
+                    and ai_player["money"] >= prop["price"] / 2
+                ):
+                    candidates[prop["name"]] = prop
+        if not candidates:
+            return None
+
+        def build(prop):
+            def apply(state):
+                state.set_houses(prop["position"], prop.get("houses", 0) + 1)
+                state.add_money(player_name, -prop["price"] / 2)
+
+            return apply
+
+        actions = {"none": _no_action}
+        for name, prop in candidates.items():
+            actions[name] = build(prop)
+        return candidates.get(self.choose(state, player_name, actions))
+
+    def get_jail_choice(self, player):
+        """Pick "card", "pay" or "roll" for a player stuck in jail"""
+        logger.debug("=== EXPERT AI Jail Strategy Debug ===")
+        player_name = player["name"]
+        state = self._snapshot(player_name)
+        if state is None:
+            return None
+
+        actions = {"roll": _no_action}
+        if self.logic.jail_free_cards.get(player_name, 0) > 0:
+
+            def use_card(state):
+                state.set_in_jail(player_name, False)
+
+            actions["card"] = use_card
+        if player["money"] >= JAIL_FINE:
+
+            def pay(state):
+                state.set_in_jail(player_name, False)
+                state.add_money(player_name, -JAIL_FINE)
+                state.add_free_parking(JAIL_FINE)
+
+            actions["pay"] = pay
+        return self.choose(state, player_name, actions)
+
+    def get_mortgage_order(self, player, owned_properties, amount_needed):
+        """Order owned_properties so the ones best given up are mortgaged first"""
+        logger.debug("=== EXPERT AI Mortgage Strategy Debug ===")
+        player_name = player["name"]
+        state = self._snapshot(player_name)
+        mortgageable = [
+            prop
+            for prop in owned_properties
+            if not prop.get("is_mortgaged", False) and prop.get("houses", 0) == 0
+        ]
+        if state is None or len(mortgageable) < 2:
+            return owned_properties
+
+        def plan_from(first):
+            # Mortgage first, then the rest in board order until there is enough
+            plan = []
+            money = player["money"]
+            for prop in [first] + [p for p in mortgageable if p is not first]:
+                if money >= amount_needed:
+                    break
+                plan.append(prop)
+                money += prop["price"] // 2
+            return plan
+
+        def mortgage(plan):
+            def apply(state):
+                for prop in plan:
+                    state.set_mortgaged(prop["position"], True)
+                    state.add_money(player_name, prop["price"] // 2)
+
+            return apply
+
+        plans = {prop["name"]: plan_from(prop) for prop in mortgageable}
+        actions = {name: mortgage(plan) for name, plan in plans.items()}
+        plan = plans[self.choose(state, player_name, actions)]
+        return plan + [prop for prop in owned_properties if prop not in plan]
@@ -3,13 +3,20 @@
 
 import pygame
 import os
+from collections import OrderedDict
 
 
 class FontManager:
     _instance = None
     _fonts = {}
+    _font_keys = {}
     _current_font_path = None
 
+    _text_cache = OrderedDict()
+    _text_cache_limit = 2048
+    _text_hits = 0
+    _text_misses = 0
+
     _base_width = 1280
     _base_height = 720
     _scale_factor = 1.0
@@ -34,15 +41,59 @@ class FontManager:
             except (pygame.error, FileNotFoundError) as e:
                 print(f"Error loading font {cls._current_font_path}: {e}")
                 cls._fonts[cache_key] = pygame.font.Font(None, scaled_size)
+            cls._font_keys[cls._fonts[cache_key]] = cache_key
 
         return cls._fonts[cache_key]
 
+    @classmethod
+    def render_text(cls, font, text, antialias, color, background=None):
+        """Render text through the shared cache (the surface must not be modified)"""
+        font_key = cls._font_keys.get(font)
+        if font_key is None:
+            # Fonts created outside the manager have no stable key to cache under
+            return font.render(text, antialias, color, background)
+
+        cache_key = (
+            font_key,
+            text,
+            antialias,
+            tuple(color),
+            tuple(background) if background is not None else None,
+        )
+        surface = cls._text_cache.get(cache_key)
+        if surface is not None:
+            cls._text_cache.move_to_end(cache_key)
+            cls._text_hits += 1
+            return surface
+
+        cls._text_misses += 1
+        surface = font.render(text, antialias, color, background)
+        cls._text_cache[cache_key] = surface
+        if len(cls._text_cache) > cls._text_cache_limit:
+            cls._text_cache.popitem(last=False)
+        return surface
+
+    @classmethod
+    def get_text_cache_stats(cls):
+        """Get the text cache size and hit/miss counters"""
+        return {
+            "entries": len(cls._text_cache),
+            "limit": cls._text_cache_limit,
+            "hits": cls._text_hits,
+            "misses": cls._text_misses,
+        }
+
+    @classmethod
+    def clear_text_cache(cls):
+        """Clear the rendered text cache"""
+        cls._text_cache.clear()
+
     @classmethod
     def update_font_path(cls, new_font_path):
         """Update the current font and clear the cache"""
         if cls._current_font_path != new_font_path:
             cls._current_font_path = new_font_path
-            cls._fonts.clear()
+            cls.clear_cache()
 
     @classmethod
     def update_scale_factor(cls, width, height):
@@ -50,7 +101,7 @@ class FontManager:
         width_scale = width / cls._base_width
         height_scale = height / cls._base_height
         cls._scale_factor = min(width_scale, height_scale)
-        cls._fonts.clear()
+        cls.clear_cache()
         return cls._scale_factor
 
     @classmethod
@@ -62,6 +113,8 @@ class FontManager:
     def clear_cache(cls):
         """Clear the font cache"""
         cls._fonts.clear()
+        cls._font_keys.clear()
+        cls._text_cache.clear()
 
 
 font_manager = FontManager()
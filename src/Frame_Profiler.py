@@ -0,0 +1,201 @@
+# Property Tycoon Frame_Profiler.py
+# It contains the frame profiler, which times each part of a frame, keeps rolling percentiles and can write a Chrome trace.
+
+import json
+import time
+from collections import deque
+
+FRAME_HISTORY = 300
+SPAN_ORDER = ("events", "sync", "ai", "board", "player_panel", "popups", "flip")
+PERCENTILES = (50, 95, 99)
+OVERLAY_REFRESH_MS = 250
+
+
+class _Span:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = self.profiler.clock()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profiler.record(self.name, self.start, self.profiler.clock())
+        return False
+
+
+class FrameProfiler:
+    def __init__(self, history=FRAME_HISTORY, clock=time.perf_counter):
+        # Each frame is (number, start, end, [(span, start, end), ...]) in clock seconds
+        self.clock = clock
+        self.frames = deque(maxlen=history)
+        self.frame_number = 0
+        self.current_frame = None
+        self.overlay_visible = False
+        self._overlay_stats = None
+        self._overlay_time = 0
+
+    def begin_frame(self):
+        # A frame left early with continue is closed here, before its tick would have slept
+        self.end_frame()
+        self.frame_number += 1
+        self.current_frame = (self.frame_number, self.clock(), [])
+
+    def end_frame(self):
+        if self.current_frame is None:
+            return
+        number, start, spans = self.current_frame
+        self.frames.append((number, start, self.clock(), spans))
+        self.current_frame = None
+
+    def span(self, name):
+        """Time the body of a with block as part of the current frame"""
+        return _Span(self, name)
+
+    def record(self, name, start, end):
+        # Spans outside a frame, e.g. in tools that drive the renderer, are ignored
+        if self.current_frame is not None:
+            self.current_frame[2].append((name, start, end))
+
+    def toggle_overlay(self):
+        self.overlay_visible = not self.overlay_visible
+        self._overlay_stats = None
+
+    def clear(self):
+        self.frames.clear()
+        self.current_frame = None
+        self._overlay_stats = None
+
+    @staticmethod
+    def get_percentile(sorted_values, percentile):
+        index = min(len(sorted_values) - 1, len(sorted_values) * percentile // 100)
+        return sorted_values[index]
+
+    def get_stats(self):
+        """Get p50/p95/p99 and mean, in milliseconds, for every span and the whole frame"""
+        durations = {"frame": []}
+        for _, start, end, spans in self.frames:
+            durations["frame"].append(end - start)
+            # A span that runs more than once in a frame counts as its total
+            frame_totals = {}
+            for name, span_start, span_end in spans:
+                frame_totals[name] = frame_totals.get(name, 0) + span_end - span_start
+            for name, total in frame_totals.items():
+                durations.setdefault(name, []).append(total)
+
+        stats = {}
+        for name, values in durations.items():
+            if not values:
+                continue
+            values.sort()
+            stats[name] = {
+                "count": len(values),
+                "mean": sum(values) * 1000 / len(values),
+                **{
+                    f"p{percentile}": self.get_percentile(values, percentile) * 1000
+                    for percentile in PERCENTILES
+                },
+            }
+        return stats
+
+    def get_chrome_trace(self, first_frame=None, last_frame=None):
+        """Build a Chrome trace (chrome://tracing, Perfetto) for a range of frame numbers"""
+        frames = [
+            frame
+            for frame in self.frames
+            if (first_frame is None or frame[0] >= first_frame)
+            and (last_frame is None or frame[0] <= last_frame)
+        ]
+        events = []
+        if frames:
+            origin = frames[0][1]
+            for number, start, end, spans in frames:
+                events.append(
+                    {
+                        "name": f"frame {number}",
+                        "cat": "frame",
+                        "ph": "X",
+                        "ts": (start - origin) * 1e6,
+                        "dur": (end - start) * 1e6,
+                        "pid": 1,
+                        "tid": 1,
+                    }
+                )
+                for name, span_start, span_end in spans:
+                    events.append(
+                        {
+                            "name": name,
+                            "cat": "span",
+                            "ph": "X",
+                            "ts": (span_start - origin) * 1e6,
+                            "dur": (span_end - span_start) * 1e6,
+                            "pid": 1,
+                            "tid": 1,
+                        }
+                    )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def dump_chrome_trace(self, path, first_frame=None, last_frame=None):
+        trace = self.get_chrome_trace(first_frame, last_frame)
+        with open(path, "w") as file:
+            json.dump(trace, file)
+        return len(trace["traceEvents"])
+
+    def dump_stats(self, path):
+        with open(path, "w") as file:
+            json.dump(self.get_stats(), file, indent=2)
+
+    def draw_overlay(self, screen, font):
+        """Draw the span percentiles in the top-left corner"""
+        import pygame
+        from src.Font_Manager import font_manager
+
+        # Sorting the history every frame would show up in the numbers being drawn
+        now = pygame.time.get_ticks()
+        if (
+            self._overlay_stats is None
+            or now - self._overlay_time >= OVERLAY_REFRESH_MS
+        ):
+            self._overlay_stats = self.get_stats()
+            self._overlay_time = now
+
+        rows = [["ms"] + [f"p{percentile}" for percentile in PERCENTILES]]
+        for name in ("frame",) + SPAN_ORDER:
+            span_stats = self._overlay_stats.get(name)
+            if span_stats:
+                rows.append(
+                    [name]
+                    + [
+                        f"{span_stats[f'p{percentile}']:.1f}"
+                        for percentile in PERCENTILES
+                    ]
+                )
+
+        # Columns are right-aligned since the game fonts are not monospaced
+        line_height = font.get_linesize()
+        name_width = max(font.size(row[0])[0] for row in rows) + 12
+        column_width = font.size("000.0")[0] + 12
+        panel = pygame.Surface(
+            (
+                name_width + column_width * len(PERCENTILES) + 20,
+                line_height * len(rows) + 16,
+            ),
+            pygame.SRCALPHA,
+        )
+        panel.fill((0, 0, 0, 180))
+        for index, row in enumerate(rows):
+            y = 8 + index * line_height
+            text = font_manager.render_text(font, row[0], True, (255, 255, 255))
+            panel.blit(text, (10, y))
+            for column, value in enumerate(row[1:], start=1):
+                text = font_manager.render_text(font, value, True, (255, 255, 255))
+                right = 10 + name_width + column_width * column
+                panel.blit(text, (right - text.get_width(), y))
+        screen.blit(panel, (10, 10))
+        return pygame.Rect(10, 10, panel.get_width(), panel.get_height())
+
+
+frame_profiler = FrameProfiler()
@@ -5,14 +5,17 @@ import pygame
 import sys
 import os
 import time
-import random
 import math
 from src.Board import Board
 from src.Property import Property
 from src.Game_Logic import GameLogic
 from src.Cards import CardType, CardDeck
 from src.Font_Manager import font_manager
+from src.Asset_Manager import asset_manager
 from src.Ai_Player_Logic import EasyAIPlayer, HardAIPlayer
+from src.Ai_Scheduler import AIScheduler, AI_TURN_DELAY_MS
+from src.Auction_Engine import AUCTION_CLOSED
+from src.Rng_Service import RngService, AI_STREAM, DECK_STREAM
 from typing import Optional
 import string
 from src.UI import DevelopmentNotification, AIEmotionUI
@@ -69,7 +72,12 @@ KEY_PASS = [pygame.K_n, pygame.K_ESCAPE]
 
 class Game:
     def __init__(
-        self, players, game_mode="full", time_limit=None, ai_difficulty="easy"
+        self,
+        players,
+        game_mode="full",
+        time_limit=None,
+        ai_difficulty="easy",
+        seed=None,
     ):
         if not pygame.get_init():
             pygame.init()
@@ -92,110 +100,10 @@ class Game:
 
         self.dev_manager = DevelopmentMode(self, self.game_actions)
 
-        window_size = self.screen.get_size()
-        try:
-            bg_path = os.path.join(base_path, "assets/image/starterbackground.png")
-            self.original_background = pygame.image.load(bg_path)
-            background = pygame.transform.scale(self.original_background, window_size)
-
-            board_path = os.path.join(base_path, "assets/image/board.png")
-            self.original_board = pygame.image.load(board_path)
-
-            board_width = int(window_size[0] * 0.3)
-            board_height = int(board_width)
-            board_image = pygame.transform.scale(
-                self.original_board, (board_width, board_height)
-            )
-
-            board_x = (window_size[0] - board_width) // 2
-            board_y = (window_size[1] - board_height) // 2 - 50
-
-            self.screen.blit(background, (0, 0))
-
-            overlay = pygame.Surface(window_size, pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 180))
-            self.screen.blit(overlay, (0, 0))
-
-            border_size = 10
-            border_rect = pygame.Rect(
-                board_x - border_size,
-                board_y - border_size,
-                board_width + (border_size * 2),
-                board_height + (border_size * 2),
-            )
-            pygame.draw.rect(self.screen, (218, 165, 32), border_rect, border_radius=10)
-
-            for alpha in range(0, 256, 10):
-                board_surface = board_image.copy()
-                board_surface.set_alpha(alpha)
-                self.screen.blit(background, (0, 0))
-                self.screen.blit(overlay, (0, 0))
-                pygame.draw.rect(
-                    self.screen, (218, 165, 32), border_rect, border_radius=10
-                )
-                self.screen.blit(board_surface, (board_x, board_y))
-
-                tip_text = "TIP: You can move the board position using WASD and zoom with +/- keys"
-
-                shadow_surface = self.small_font.render(tip_text, True, (0, 0, 0))
-                shadow_rect = shadow_surface.get_rect(
-                    center=(window_size[0] // 2 + 2, window_size[1] - 100 + 2)
-                )
-                shadow_surface.set_alpha(min(alpha, 150))
-                self.screen.blit(shadow_surface, shadow_rect)
-
-                text_surface = self.small_font.render(tip_text, True, (255, 255, 255))
-                text_rect = text_surface.get_rect(
-                    center=(window_size[0] // 2, window_size[1] - 100)
-                )
-                text_surface.set_alpha(alpha)
-                self.screen.blit(text_surface, text_rect)
-
-                pygame.display.flip()
-                pygame.time.delay(20)
-
-            pygame.time.wait(2000)
-
-            shuffling_path = os.path.join(base_path, "assets/image/Cards shuffling.png")
-            self.original_shuffling = pygame.image.load(shuffling_path)
-            shuffling_image = pygame.transform.scale(
-                self.original_shuffling, window_size
-            )
-
-            self.screen.blit(background, (0, 0))
-            self.screen.blit(shuffling_image, (0, 0))
-            pygame.display.flip()
-            pygame.time.wait(1000)
-
-            start_path = os.path.join(base_path, "assets/image/Gamestart.png")
-            self.original_start_image = pygame.image.load(start_path)
-            logo_width = int(window_size[0] * 0.5)
-            logo_height = int(
-                logo_width
-                * (
-                    self.original_start_image.get_height()
-                    / self.original_start_image.get_width()
-                )
-            )
-            start_image = pygame.transform.scale(
-                self.original_start_image, (logo_width, logo_height)
-            )
-
-            self.screen.blit(background, (0, 0))
-            overlay = pygame.Surface(window_size, pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 128))
-            self.screen.blit(overlay, (0, 0))
-            logo_x = (window_size[0] - logo_width) // 2
-            logo_y = (window_size[1] - logo_height) // 2
-            self.screen.blit(start_image, (logo_x, logo_y))
-            pygame.display.flip()
-            pygame.time.wait(1000)
-        except Exception as e:
-            print(f"Error loading startup animations: {e}")
-
         self.game_mode = game_mode
         self.time_limit = time_limit
         self.ai_difficulty = ai_difficulty
+        self.ai_scheduler = AIScheduler()
         self.start_time = pygame.time.get_ticks() if time_limit else None
 
         if self.game_mode == "abridged" and self.time_limit:
@@ -223,32 +131,32 @@ class Game:
         self.auction_end_delay = 3000
 
         self.dice_images = {}
-        try:
-            for i in range(1, 7):
-                dice_path = os.path.join(
-                    base_path, "assets", "image", "Dice", f"{i}.png"
-                )
-                if os.path.exists(dice_path):
-                    print(f"Loading dice image: {dice_path}")
-                    self.dice_images[i] = pygame.image.load(dice_path)
-                else:
-                    print(f"Dice image not found: {dice_path}")
-        except Exception as e:
-            print(f"Error loading dice images: {e}")
+        for i in range(1, 7):
+            try:
+                self.dice_images[i] = asset_manager.get_image(f"Dice/{i}.png")
+            except (pygame.error, FileNotFoundError) as e:
+                print(f"Could not load dice image {i}: {e}")
 
         try:
-            self.logic = GameLogic()
+            # A seed of None picks one at random; it is kept in rng_service for the replay log
+            self.rng_service = RngService(seed)
+            self.logic = GameLogic(rng_service=self.rng_service)
             self.logic.game = self
             self.logic.ai_difficulty = self.ai_difficulty
+            ai_rng = self.rng_service.stream(AI_STREAM)
+
+            if self.ai_difficulty == "expert":
+                from src.Expert_AI import ExpertAIPlayer
 
-            if self.ai_difficulty == "hard":
+                self.logic.ai_player = ExpertAIPlayer(self.logic, rng=ai_rng)
+            elif self.ai_difficulty == "hard":
                 from src.Ai_Player_Logic import HardAIPlayer
 
-                self.logic.ai_player = HardAIPlayer()
+                self.logic.ai_player = HardAIPlayer(rng=ai_rng)
             else:
                 from src.Ai_Player_Logic import EasyAIPlayer
 
-                self.logic.ai_player = EasyAIPlayer()
+                self.logic.ai_player = EasyAIPlayer(rng=ai_rng)
 
             if not self.logic.game_start():
                 raise RuntimeError("Failed to initialize game data")
@@ -257,12 +165,17 @@ class Game:
                 raise ValueError("No players provided")
 
             self.players = players
+            self.players_by_name = {player.name: player for player in players}
+            for player in players:
+                if player.is_ai:
+                    player.rng = self.rng_service.ai_stream(player.name)
             self.board = Board(self.players)
 
             from src.Cards import CardDeck, CardType
 
-            self.pot_luck_deck = CardDeck(CardType.POT_LUCK)
-            self.opportunity_deck = CardDeck(CardType.OPPORTUNITY_KNOCKS)
+            deck_rng = self.rng_service.stream(DECK_STREAM)
+            self.pot_luck_deck = CardDeck(CardType.POT_LUCK, rng=deck_rng)
+            self.opportunity_deck = CardDeck(CardType.OPPORTUNITY_KNOCKS, rng=deck_rng)
 
             self.board.update_board_positions()
             self.board.update_ownership(self.logic.properties)
@@ -285,6 +198,11 @@ class Game:
                     raise RuntimeError(f"Failed to add player {player.name}")
                 self.player_colors[player.name] = player.color
 
+            self.logic.player_store.subscribe(self.on_player_state_change)
+            self.logic.auction_engine.subscribe(AUCTION_CLOSED, self.on_auction_closed)
+            self.synchronize_player_positions()
+            self.synchronize_player_money()
+
             window_size = self.screen.get_size()
             button_width = 120
             button_height = 45
@@ -339,6 +257,8 @@ class Game:
 
             self.current_player_is_ai = False
             self.notification = None
+            self.dev_notification = None
+            self.selected_property = None
             self.notification_time = 0
             self.NOTIFICATION_DURATION = 3000
 
@@ -356,7 +276,7 @@ class Game:
 
             self.emotion_uis = {}
             for player in self.players:
-                if player.is_ai and self.ai_difficulty == "hard":
+                if player.is_ai and self.ai_difficulty in ("hard", "expert"):
                     self.emotion_uis[player.name] = AIEmotionUI(
                         self.screen, player, self
                     )
@@ -369,6 +289,48 @@ class Game:
 
         self.update_current_player()
 
+    @property
+    def free_parking_pot(self):
+        return self.logic.free_parking_fund
+
+    @free_parking_pot.setter
+    def free_parking_pot(self, amount):
+        self.logic.free_parking_fund = amount
+
+    def get_player(self, player_name):
+        return self.players_by_name.get(player_name)
+
+    def on_player_state_change(self, logic_player, key, old_value, new_value):
+        player = self.get_player(logic_player["name"])
+        if player is None:
+            return
+
+        if key == "money":
+            player.money = new_value
+        elif key == "position" and not (player.bankrupt or player.voluntary_exit):
+            if not isinstance(new_value, int) or not (1 <= new_value <= 40):
+                print(
+                    f"Warning: Invalid position {new_value} for {player.name} in game logic, resetting to position 1"
+                )
+                logic_player["position"] = 1
+            elif player.is_ai:
+                # Human tokens follow their own move animation to the new space
+                player.position = new_value
+
+    def on_auction_closed(self, auction, winner=None, amount=0):
+        property_name = auction["property"].get("name", "Unknown property")
+        if winner:
+            self.board.add_message(
+                f"{winner['name']} won {property_name} for £{amount}"
+            )
+        else:
+            self.board.add_message(f"No one bid on {property_name}")
+
+        self.auction_end_time = pygame.time.get_ticks()
+        self.auction_end_delay = 3000
+        self.auction_completed = True
+        self.board.update_ownership(self.logic.properties)
+
     def add_message(self, text):
         self.board.add_message(text)
 
@@ -423,9 +385,7 @@ class Game:
         self.board.update_board_positions()
         self.board.update_ownership(self.logic.properties)
 
-        current_player_obj = next(
-            (p for p in self.players if p.name == current_player["name"]), None
-        )
+        current_player_obj = self.get_player(current_player["name"])
 
         if position == 20:
             print(f"Player landed on Free Parking space")
@@ -533,17 +493,26 @@ class Game:
 
                     self.renderer.draw()
                     pygame.display.flip()
-                    pygame.time.delay(500)
 
                     if current_player_obj and current_player_obj.is_ai:
                         print("\nAI player making purchase decision")
-                        pygame.time.delay(1000)
-                        will_buy = (
-                            random.random() < 0.7
-                            and current_player["money"] >= space["price"]
-                        )
-                        print(f"AI decision: {'Buy' if will_buy else 'Pass'}")
-                        self.game_actions.handle_buy_decision(will_buy)
+                        if self.ai_difficulty == "expert":
+                            self.game_actions.request_ai_buy_decision(current_player)
+                        else:
+
+                            ai_rng = self.rng_service.ai_stream(current_player["name"])
+
+                            def decide_buy():
+                                return (
+                                    ai_rng.random() < 0.7
+                                    and current_player["money"] >= space["price"]
+                                )
+
+                            self.game_actions.request_ai_buy_decision(
+                                current_player, decide_buy
+                            )
+                    else:
+                        pygame.time.delay(500)
             else:
                 print("Property already owned or not purchasable")
                 self.state = "ROLL"
@@ -551,22 +520,7 @@ class Game:
                 pygame.display.flip()
 
                 if current_player_obj and current_player_obj.is_ai:
-                    property_to_develop = (
-                        self.logic.ai_player.handle_property_development(
-                            current_player, self.logic.properties
-                        )
-                    )
-                    if property_to_develop:
-                        house_cost = property_to_develop["price"] / 2
-                        if current_player["money"] >= house_cost:
-                            property_to_develop["houses"] = (
-                                property_to_develop.get("houses", 0) + 1
-                            )
-                            current_player["money"] -= house_cost
-                            self.board.add_message(
-                                f"{current_player['name']} built a house on {property_to_develop['name']}"
-                            )
-                            self.board.update_ownership(self.logic.properties)
+                    self.request_ai_development(current_player)
         else:
             print("Not a property space or already processed by card handling")
             self.state = "ROLL"
@@ -594,11 +548,7 @@ class Game:
         self.development_mode = True
 
         current_player = self.logic.players[self.logic.current_player_index]
-        owned_properties = [
-            p
-            for p in self.logic.properties.values()
-            if p.get("owner") == current_player["name"]
-        ]
+        owned_properties = self.logic.properties.get_owned(current_player["name"])
 
         if not owned_properties:
             self.development_mode = False
@@ -673,14 +623,13 @@ class Game:
                         assets = {}
                         for player in self.logic.players:
                             total = player["money"]
-                            for prop in self.logic.properties.values():
-                                if prop.get("owner") == player["name"]:
-                                    total += prop.get("price", 0)
-                                    if "houses" in prop:
-                                        house_costs = prop.get("house_costs", [])
-                                        houses_count = prop["houses"]
-                                        if house_costs and houses_count > 0:
-                                            total += sum(house_costs[:houses_count])
+                            for prop in self.logic.properties.get_owned(player["name"]):
+                                total += prop.get("price", 0)
+                                if "houses" in prop:
+                                    house_costs = prop.get("house_costs", [])
+                                    houses_count = prop["houses"]
+                                    if house_costs and houses_count > 0:
+                                        total += sum(house_costs[:houses_count])
                             assets[player["name"]] = total
 
                         max_asset_value = max(assets.values())
@@ -736,9 +685,7 @@ class Game:
                 pygame.display.flip()
                 return None, None
 
-            player_obj = next(
-                (p for p in self.players if p.name == current_player["name"]), None
-            )
+            player_obj = self.get_player(current_player["name"])
             is_ai_player = (
                 player_obj.is_ai if player_obj else current_player.get("is_ai", False)
             )
@@ -751,18 +698,7 @@ class Game:
                 pygame.display.flip()
                 return "can_buy", None
             else:
-                if self.logic.ai_player.should_buy_property(
-                    space,
-                    current_player["money"],
-                    [
-                        p
-                        for p in self.logic.properties.values()
-                        if p.get("owner") == current_player["name"]
-                    ],
-                ):
-                    self.game_actions.handle_buy_decision(True)
-                else:
-                    self.game_actions.handle_buy_decision(False)
+                self.game_actions.request_ai_buy_decision(current_player)
                 return None, None
 
         result, message = self.logic.handle_space(current_player)
@@ -790,11 +726,17 @@ class Game:
                     break
 
     def get_jail_choice(self, player):
-        player_obj = next((p for p in self.players if p.name == player["name"]), None)
+        player_obj = self.get_player(player["name"])
         if player_obj and player_obj.is_ai:
+            ai_choice = self.logic.get_ai_jail_choice(player)
+            if ai_choice:
+                return ai_choice
             if self.logic.jail_free_cards.get(player["name"], 0) > 0:
                 return "card"
-            elif player["money"] >= 50 and random.random() < 0.5:
+            elif (
+                player["money"] >= 50
+                and self.rng_service.ai_stream(player["name"]).random() < 0.5
+            ):
                 return "pay"
             return "roll"
 
@@ -988,9 +930,7 @@ class Game:
         result, message = self.logic.handle_card_draw(player, card_type)
 
         if result == "moved":
-            player_obj = next(
-                (p for p in self.players if p.name == player["name"]), None
-            )
+            player_obj = self.get_player(player["name"])
             if player_obj:
                 player_obj.start_move([player["position"]])
                 self.wait_for_animations()
@@ -1134,6 +1074,7 @@ class Game:
                         ).get("name", "Unknown")
                         print(f"Auction for {property_name} canceled due to time limit")
                     self.logic.current_auction = None
+                    self.logic.auction_engine.clear()
 
                 print("Clearing UI states to continue the game...")
                 self.state = "ROLL"
@@ -1144,9 +1085,7 @@ class Game:
 
                 self.final_lap = {}
                 for player_name, lap in self.lap_count.items():
-                    player_obj = next(
-                        (p for p in self.players if p.name == player_name), None
-                    )
+                    player_obj = self.get_player(player_name)
                     if (
                         player_obj
                         and not player_obj.bankrupt
@@ -1165,9 +1104,7 @@ class Game:
                 try:
                     for logic_player in self.logic.players:
                         player_name = logic_player["name"]
-                        player_obj = next(
-                            (p for p in self.players if p.name == player_name), None
-                        )
+                        player_obj = self.get_player(player_name)
 
                         if player_obj and player_obj.voluntary_exit:
                             assets = player_obj.final_assets
@@ -1235,7 +1172,7 @@ class Game:
 
         for logic_player in self.logic.players:
             player_name = logic_player["name"]
-            player_obj = next((p for p in self.players if p.name == player_name), None)
+            player_obj = self.get_player(player_name)
 
             if player_obj and player_obj.voluntary_exit:
                 final_assets[player_name] = player_obj.final_assets
@@ -1263,7 +1200,7 @@ class Game:
 
         for logic_player in self.logic.players:
             player_name = logic_player["name"]
-            player_obj = next((p for p in self.players if p.name == player_name), None)
+            player_obj = self.get_player(player_name)
 
             if player_obj and player_obj.voluntary_exit:
                 final_assets[player_name] = player_obj.final_assets
@@ -1406,83 +1343,45 @@ class Game:
         new_position = player.position
 
         if new_position < old_position and not self.logic.is_going_to_jail:
-            player_dict = next(
-                p for p in self.logic.players if p["name"] == player.name
-            )
+            player_dict = self.logic.get_player(player.name)
             player_dict["money"] += 200
             self.logic.bank_money -= 200
             self.board.add_message(f"{player.name} collected £200 for passing GO")
 
     def synchronize_player_positions(self):
-        try:
-            for player in self.players:
-                if player.bankrupt or player.voluntary_exit:
-                    continue
-
-                if not isinstance(player.position, int) or not (
-                    1 <= player.position <= 40
-                ):
-                    player.position = 1
-
-            for logic_player in self.logic.players:
-                if not isinstance(logic_player.get("position"), int) or not (
-                    1 <= logic_player.get("position", 0) <= 40
-                ):
-                    logic_player["position"] = 1
+        # Full resync for when the logic players are replaced; changes after
+        # that are pushed through on_player_state_change
+        for player in self.players:
+            if player.bankrupt or player.voluntary_exit:
+                continue
 
-            for player in self.players:
-                if player.bankrupt or player.voluntary_exit:
-                    continue
-
-                found = False
-                for logic_player in self.logic.players:
-                    if player.name == logic_player["name"]:
-                        found = True
-
-                        if player.position != logic_player["position"]:
-                            if player.is_ai:
-                                player.position = logic_player["position"]
-                            else:
-                                if abs(player.position - logic_player["position"]) <= 3:
-                                    logic_player["position"] = player.position
-                        break
+            if not isinstance(player.position, int) or not (1 <= player.position <= 40):
+                player.position = 1
 
-                if not found and not player.bankrupt and not player.voluntary_exit:
-                    print(
-                        f"Warning: Player {player.name} exists in UI but not in game logic"
-                    )
+            logic_player = self.logic.get_player(player.name)
+            if logic_player is None:
+                print(
+                    f"Warning: Player {player.name} exists in UI but not in game logic"
+                )
+                continue
 
-            for logic_player in self.logic.players:
-                found = False
-                for player in self.players:
-                    if logic_player["name"] == player.name:
-                        found = True
-                        break
+            position = logic_player.get("position")
+            if not isinstance(position, int) or not (1 <= position <= 40):
+                logic_player["position"] = player.position
+            elif player.position != position:
+                player.position = position
 
-                if not found:
-                    print(
-                        f"Warning: Player {logic_player['name']} exists in game logic but not in UI"
-                    )
-        except Exception as e:
-            print(f"Error in synchronize_player_positions: {e}")
+        for logic_player in self.logic.players:
+            if self.get_player(logic_player["name"]) is None:
+                print(
+                    f"Warning: Player {logic_player['name']} exists in game logic but not in UI"
+                )
 
     def synchronize_player_money(self):
         for player in self.players:
-            for logic_player in self.logic.players:
-                if player.name == logic_player["name"]:
-                    if hasattr(player, "money") and player.money != logic_player.get(
-                        "money", 0
-                    ):
-                        old_money = player.money
-                        player.money = logic_player.get("money", 0)
-                        print(
-                            f"Money synchronized for {player.name}: {old_money} -> {player.money}"
-                        )
-                    break
-
-    def synchronize_free_parking_pot(self):
-        if hasattr(self.logic, "free_parking_fund"):
-            self.free_parking_pot = self.logic.free_parking_fund
+            logic_player = self.logic.get_player(player.name)
+            if logic_player is not None:
+                player.money = logic_player.get("money", 0)
 
     def show_exit_confirmation(self):
         window_size = self.screen.get_size()
@@ -1666,9 +1565,7 @@ class Game:
             ) % len(self.logic.players)
             return self.check_and_trigger_ai_turn(recursion_depth + 1)
 
-        player_obj = next(
-            (p for p in self.players if p.name == current_player["name"]), None
-        )
+        player_obj = self.get_player(current_player["name"])
 
         if not player_obj:
             print(f"Could not find Player object for {current_player['name']}")
@@ -1697,47 +1594,27 @@ class Game:
             return self.check_and_trigger_ai_turn(recursion_depth + 1)
 
         if player_obj.is_ai:
+            if self.ai_scheduler.is_pending("turn"):
+                return True
             print(
                 f"Player {current_player['name']} is an AI - automatically triggering their turn"
             )
             self.current_player_is_ai = True
-            pygame.time.delay(500)
-            try:
-                if player_obj.in_jail and current_player.get("in_jail", False):
-                    print(
-                        f"AI player {current_player['name']} is in jail - handling jail turn first"
-                    )
-                    jail_result = self.game_actions.handle_jail_turn(current_player)
-                    if not jail_result:
-                        print(
-                            f"AI player {current_player['name']} stays in jail - moving to next player"
-                        )
-                        self.handle_turn_end()
-                        return self.check_and_trigger_ai_turn(recursion_depth + 1)
 
-                if self.state == "DEVELOPMENT" and self.dev_manager.is_active:
-                    print(
-                        f"AI player {current_player['name']} is in development mode - automatically handling development"
-                    )
-                    self.handle_turn_end()
-                    return self.check_and_trigger_ai_turn(recursion_depth + 1)
+            # The jail choice is worked out on the AI worker while the turn delay runs
+            decide_jail = None
+            if player_obj.in_jail and current_player.get("in_jail", False):
 
-                if self.state == "ROLL":
-                    turn_result = self.game_actions.play_turn()
-                    if turn_result:
-                        print(
-                            f"AI player {current_player['name']} completed their turn"
-                        )
-                        return True
-                    return False
+                def decide_jail():
+                    return self.logic.decide_ai_jail_choice(current_player)
 
-                return True
-            except Exception as e:
-                print(f"Error in AI turn for {current_player['name']}: {e}")
-                self.logic.current_player_index = (
-                    self.logic.current_player_index + 1
-                ) % len(self.logic.players)
-                return self.check_and_trigger_ai_turn(recursion_depth + 1)
+            def start_turn(jail_choice):
+                self.start_ai_turn(current_player, jail_choice, recursion_depth)
+
+            self.ai_scheduler.submit(
+                "turn", decide_jail, start_turn, delay_ms=AI_TURN_DELAY_MS
+            )
+            return True
         else:
             print(
                 f"Player {current_player['name']} is not an AI - waiting for user input"
@@ -1745,13 +1622,81 @@ class Game:
             self.current_player_is_ai = False
             return False
 
+    def start_ai_turn(self, current_player, jail_choice=None, recursion_depth=0):
+        # The game may have moved on while the turn delay ran
+        if (
+            not self.logic.players
+            or self.logic.players[self.logic.current_player_index] is not current_player
+            or self.state not in ("ROLL", "DEVELOPMENT")
+        ):
+            return False
+
+        player_obj = self.get_player(current_player["name"])
+        if not player_obj:
+            return False
+        if jail_choice:
+            self.logic.prepare_ai_jail_choice(current_player, jail_choice)
+
+        try:
+            if player_obj.in_jail and current_player.get("in_jail", False):
+                print(
+                    f"AI player {current_player['name']} is in jail - handling jail turn first"
+                )
+                jail_result = self.game_actions.handle_jail_turn(current_player)
+                if not jail_result:
+                    print(
+                        f"AI player {current_player['name']} stays in jail - moving to next player"
+                    )
+                    self.handle_turn_end()
+                    return self.check_and_trigger_ai_turn(recursion_depth + 1)
+
+            if self.state == "DEVELOPMENT" and self.dev_manager.is_active:
+                print(
+                    f"AI player {current_player['name']} is in development mode - automatically handling development"
+                )
+                self.handle_turn_end()
+                return self.check_and_trigger_ai_turn(recursion_depth + 1)
+
+            if self.state == "ROLL":
+                turn_result = self.game_actions.play_turn()
+                if turn_result:
+                    print(f"AI player {current_player['name']} completed their turn")
+                    return True
+                return False
+
+            return True
+        except Exception as e:
+            print(f"Error in AI turn for {current_player['name']}: {e}")
+            self.logic.current_player_index = (
+                self.logic.current_player_index + 1
+            ) % len(self.logic.players)
+            return self.check_and_trigger_ai_turn(recursion_depth + 1)
+
+    def request_ai_development(self, current_player):
+        """Let the AI pick a house to build on the AI worker and build it once chosen"""
+
+        def decide():
+            return self.logic.ai_player.handle_property_development(
+                current_player, self.logic.properties
+            )
+
+        def build(property_to_develop):
+            if not property_to_develop or current_player not in self.logic.players:
+                return
+            if property_to_develop.get("houses", 0) < 4:
+                built = self.logic.build_house(property_to_develop, current_player)
+            else:
+                built = self.logic.build_hotel(property_to_develop, current_player)
+            if built:
+                self.board.update_ownership(self.logic.properties)
+
+        return self.ai_scheduler.submit("develop", decide, build)
+
     def update_ai_mood(self, ai_player_name, is_happy):
 
-        ai_player_obj = next(
-            (p for p in self.players if p.name == ai_player_name and p.is_ai), None
-        )
+        ai_player_obj = self.get_player(ai_player_name)
 
-        if not ai_player_obj:
+        if not ai_player_obj or not ai_player_obj.is_ai:
             print(f"Warning: Could not find AI player object for {ai_player_name}")
             return False
 
@@ -1793,10 +1738,7 @@ class Game:
             ) % len(self.logic.players)
             return self.update_current_player()
 
-        current_player = next(
-            (p for p in self.players if p.name == current_logic_player["name"]),
-            None,
-        )
+        current_player = self.get_player(current_logic_player["name"])
 
         if not current_player or (
             hasattr(current_player, "voluntary_exit") and current_player.voluntary_exit
@@ -1841,9 +1783,7 @@ class Game:
 
     def handle_turn_end(self):
         current_player = self.logic.players[self.logic.current_player_index]
-        player_obj = next(
-            (p for p in self.players if p.name == current_player["name"]), None
-        )
+        player_obj = self.get_player(current_player["name"])
         is_ai_player = player_obj and player_obj.is_ai
 
         print(f"\n=== DEVELOPMENT MODE DEBUG - Turn End ===")
@@ -1853,11 +1793,7 @@ class Game:
         print(f"Current state: {self.state}")
         print(f"Is AI player: {is_ai_player}")
 
-        owned_properties = [
-            prop
-            for prop in self.logic.properties.values()
-            if prop.get("owner") == current_player["name"]
-        ]
+        owned_properties = self.logic.properties.get_owned(current_player["name"])
         print(f"Owned properties: {len(owned_properties)}")
         for prop in owned_properties:
             print(f"  - {prop['name']} (Group: {prop.get('group', 'None')})")
@@ -5,7 +5,6 @@ import pygame
 import sys
 import os
 import time
-import random
 import math
 from src.Board import Board
 from src.Property import Property
@@ -14,6 +13,8 @@ from src.Cards import CardType, CardDeck
 from src.Font_Manager import font_manager
 from src.Sound_Manager import sound_manager
 from src.Ai_Player_Logic import EasyAIPlayer, HardAIPlayer
+from src.Ai_Scheduler import AI_BUY_DELAY_MS
+from src.Replay_Log import BUY_EVENT, JAIL_EVENT
 from typing import Optional
 import string
 from src.UI import DevelopmentNotification, AIEmotionUI
@@ -60,9 +61,7 @@ class GameActions:
             self.game.board.add_message("Error: No current player found")
             return False
 
-        player_obj = next(
-            (p for p in self.game.players if p.name == current_player["name"]), None
-        )
+        player_obj = self.game.get_player(current_player["name"])
         is_ai_player = player_obj and player_obj.is_ai
 
         if self.game.development_mode and not is_ai_player:
@@ -190,6 +189,7 @@ class GameActions:
         )
 
         print(f"Property owner before: {property_data.get('owner', 'None')}")
+        self.game.logic.record_decision(BUY_EVENT, current_player, bool(wants_to_buy))
 
         if wants_to_buy:
             if current_player["money"] >= property_data["price"]:
@@ -230,14 +230,14 @@ class GameActions:
                     print("Auction in progress - maintaining AUCTION state")
 
                 print("\nPlayer properties after purchase:")
-                owned_count = 0
-                for prop_pos, prop in self.game.logic.properties.items():
-                    if prop.get("owner") == current_player["name"]:
-                        owned_count += 1
-                        print(
-                            f"  - {prop['name']} (Position: {prop_pos}, Group: {prop.get('group', 'None')})"
-                        )
-                print(f"Total properties owned: {owned_count}")
+                owned_properties = self.game.logic.properties.get_owned(
+                    current_player["name"]
+                )
+                for prop in owned_properties:
+                    print(
+                        f"  - {prop['name']} (Position: {prop.key}, Group: {prop.get('group', 'None')})"
+                    )
+                print(f"Total properties owned: {len(owned_properties)}")
 
                 self.game.board.update_ownership(self.game.logic.properties)
 
@@ -346,9 +346,7 @@ class GameActions:
             print("Player not in jail - exiting jail handler")
             return False
 
-        player_obj = next(
-            (p for p in self.game.players if p.name == player["name"]), None
-        )
+        player_obj = self.game.get_player(player["name"])
         if not player_obj:
             print(f"Warning: Could not find player object for {player['name']}")
             return False
@@ -358,154 +356,76 @@ class GameActions:
             player_obj.in_jail = True
             player_obj.jail_turns = player["jail_turns"]
 
+        logic = self.game.logic
         if player_obj.is_ai:
             print(f"AI player {player['name']} deciding how to handle jail")
+            ai_choice = logic.get_ai_jail_choice(player)
 
-            if self.game.logic.jail_free_cards.get(player["name"], 0) > 0:
-                print(f"AI using 'Get Out of Jail Free' card")
-                card_type = player_obj.use_jail_card()
-                if card_type == CardType.POT_LUCK:
-                    self.game.pot_luck_deck.return_jail_card(card_type)
-                    print("Returned Pot Luck jail card to deck")
-                else:
-                    self.game.opportunity_deck.return_jail_card(card_type)
-                    print("Returned Opportunity Knocks jail card to deck")
-
-                player["in_jail"] = False
-                player["jail_turns"] = 0
-                player_obj.in_jail = False
-                player_obj.jail_turns = 0
-                player_obj.stay_in_jail = False
-                self.game.board.add_message(
-                    f"{player['name']} used Get Out of Jail Free card and left jail!"
-                )
-                print(f"AI player {player['name']} successfully left jail using card")
-                return True
-            elif player["money"] >= 50 and random.random() < 0.5:
-                print(
-                    f"AI player {player['name']} paying £50 to leave jail (randomly decided)"
-                )
-                player["money"] -= 50
-                self.game.logic.free_parking_fund += 50
-                self.game.synchronize_free_parking_pot()
-                player["in_jail"] = False
-                player["jail_turns"] = 0
-                player_obj.in_jail = False
-                player_obj.jail_turns = 0
-                player_obj.stay_in_jail = False
-                self.game.board.add_message(f"{player['name']} paid £50 and left jail!")
-                print(
-                    f"AI player {player['name']} successfully left jail by paying £50"
-                )
-                return True
+            if logic.jail_free_cards.get(player["name"], 0) > 0 and ai_choice in (
+                None,
+                "card",
+            ):
+                choice = "card"
+            elif player["money"] >= 50 and (
+                ai_choice == "pay"
+                if ai_choice
+                else self.game.rng_service.ai_stream(player["name"]).random() < 0.5
+            ):
+                choice = "pay"
             else:
-                print(f"AI player {player['name']} will try to roll doubles")
+                choice = "wait"
         else:
             print(f"Human player {player['name']} choosing jail option")
             self.game.renderer.draw()
             pygame.display.flip()
 
             choice = self.game.get_jail_choice(player)
-            print(f"Human player selected option: {choice}")
+        print(f"{player['name']} chose jail option: {choice}")
+        logic.record_decision(JAIL_EVENT, player, choice)
 
-            if (
-                choice == "card"
-                and self.game.logic.jail_free_cards.get(player["name"], 0) > 0
-            ):
-                print(f"Using 'Get Out of Jail Free' card")
-                card_type = player_obj.use_jail_card()
-                if card_type == CardType.POT_LUCK:
-                    self.game.pot_luck_deck.return_jail_card(card_type)
-                else:
-                    self.game.opportunity_deck.return_jail_card(card_type)
-                player["in_jail"] = False
-                player["jail_turns"] = 0
-                player_obj.in_jail = False
-                player_obj.jail_turns = 0
-                player_obj.stay_in_jail = False
-                self.game.board.add_message(
-                    f"{player['name']} used Get Out of Jail Free card and left jail!"
-                )
-                print(f"Player {player['name']} successfully left jail using card")
-                return True
-            elif choice == "pay" and player["money"] >= 50:
-                print(f"Paying £50 to leave jail")
-                player["money"] -= 50
-                self.game.logic.free_parking_fund += 50
-                self.game.synchronize_free_parking_pot()
-                player["in_jail"] = False
-                player["jail_turns"] = 0
-                player_obj.in_jail = False
-                player_obj.jail_turns = 0
-                player_obj.stay_in_jail = False
-                self.game.board.add_message(f"{player['name']} paid £50 and left jail!")
-                try:
-                    self.game.board.add_message(
-                        f"{player['name']} paid £50 and left jail!"
-                    )
-                except AttributeError:
-                    print("Error: board.add_message call failed")
-                print(f"Player {player['name']} successfully left jail by paying £50")
-                return True
-            elif choice == "stay":
-                print(f"Player {player['name']} chose to stay in jail")
+        outcome = logic.apply_jail_choice(player, choice)
+        player_obj.jail_turns = player.get("jail_turns", 0)
+
+        if outcome == "roll":
+            print(f"Player {player['name']} will try to roll doubles")
+            return True
+
+        if outcome == "stay":
+            if choice == "stay":
                 player_obj.stay_in_jail = True
-                player["jail_turns"] = player.get("jail_turns", 0) + 1
-                player_obj.jail_turns = player["jail_turns"]
                 self.game.board.add_message(f"{player['name']} chose to stay in jail!")
-                return False
-            elif choice == "roll":
-                print(f"Player {player['name']} will try to roll doubles")
-                return True
+            print(f"Player {player['name']} remains in jail - jail turn handled\n")
+            return False
 
-        player["jail_turns"] = player.get("jail_turns", 0) + 1
-        player_obj.jail_turns = player["jail_turns"]
-        print(f"Jail turn count increased to {player['jail_turns']}")
-
-        if player["jail_turns"] >= 3:
-            print(f"Player {player['name']} has been in jail for 3 turns")
-            if player["money"] >= 50:
-                print("Forcing payment after 3 turns")
-                player["money"] -= 50
-                self.game.logic.free_parking_fund += 50
-                self.game.synchronize_free_parking_pot()
-                player["in_jail"] = False
-                player["jail_turns"] = 0
-                player_obj.in_jail = False
-                player_obj.jail_turns = 0
-                player_obj.stay_in_jail = False
-                self.game.board.add_message(
-                    f"{player['name']} paid £50 after 3 turns and left jail!"
-                )
-                print(
-                    f"Player {player['name']} successfully left jail after 3 turns by paying £50"
-                )
-                return True
+        if outcome == "card":
+            card_type = player_obj.use_jail_card()
+            if card_type == CardType.POT_LUCK:
+                self.game.pot_luck_deck.return_jail_card(card_type)
             else:
-                print(
-                    f"Player {player['name']} can't pay jail fine - leaving jail bankrupt"
-                )
-                player["in_jail"] = False
-                player["jail_turns"] = 0
-                player_obj.in_jail = False
-                player_obj.jail_turns = 0
-                player_obj.stay_in_jail = False
-                self.game.board.add_message(
-                    f"{player['name']} couldn't pay jail fine and left jail bankrupt!"
-                )
-                self.handle_bankruptcy(player)
-                return True
+                self.game.opportunity_deck.return_jail_card(card_type)
+            message = f"{player['name']} used Get Out of Jail Free card and left jail!"
+        elif outcome == "pay":
+            message = f"{player['name']} paid £50 and left jail!"
+        elif outcome == "fine":
+            message = f"{player['name']} paid £50 after 3 turns and left jail!"
+        else:
+            message = f"{player['name']} couldn't pay jail fine and left jail bankrupt!"
 
-        print(f"Player {player['name']} remains in jail - jail turn handled\n")
-        return False
+        player_obj.in_jail = False
+        player_obj.jail_turns = 0
+        player_obj.stay_in_jail = False
+        self.game.board.add_message(message)
+        print(message)
+
+        if outcome == "bankrupt":
+            self.handle_bankruptcy(player)
+        return True
 
     def handle_voluntary_exit(self, player_name, final_assets):
         print(f"\n=== Voluntary Exit Debug ===")
         print(f"Player {player_name} is exiting the game")
 
-        logic_player = next(
-            (p for p in self.game.logic.players if p["name"] == player_name), None
-        )
+        logic_player = self.game.logic.get_player(player_name)
         if logic_player:
             actual_final_assets = self.calculate_player_assets(logic_player)
             print(f"Final assets calculated from game logic: {actual_final_assets}")
@@ -520,18 +440,14 @@ class GameActions:
 
         self.game.board.add_message(f"{player_name} exits game")
 
-        player_obj = next((p for p in self.game.players if p.name == player_name), None)
+        player_obj = self.game.get_player(player_name)
         if not player_obj:
             print(f"Error: Could not find player object for {player_name}")
             return False
 
         print(f"Found player object: {player_obj.name}")
 
-        player_properties = [
-            p
-            for p in self.game.logic.properties.values()
-            if p.get("owner") == player_name
-        ]
+        player_properties = self.game.logic.properties.get_owned(player_name)
         print(
             f"Player has {len(player_properties)} properties that will be returned to bank"
         )
@@ -545,9 +461,7 @@ class GameActions:
         print(f"Game logic marked player as exited: {result}")
 
         if result:
-            exited_player = next(
-                (p for p in self.game.logic.players if p["name"] == player_name), None
-            )
+            exited_player = self.game.logic.get_player(player_name)
             if exited_player and exited_player.get("exited", False):
                 print(f"Player {player_name} successfully marked as exited")
             else:
@@ -619,22 +533,18 @@ class GameActions:
                 print("Warning: No properties found in game logic")
                 return total
 
-            for prop_id, prop in self.game.logic.properties.items():
-                if not isinstance(prop, dict):
-                    continue
-
-                if prop.get("owner") == player.get("name"):
-                    total += prop.get("price", 0)
+            for prop in self.game.logic.properties.get_owned(player.get("name")):
+                total += prop.get("price", 0)
 
-                    if "houses" in prop and prop["houses"] > 0:
-                        house_costs = prop.get("house_costs", [])
+                if "houses" in prop and prop["houses"] > 0:
+                    house_costs = prop.get("house_costs", [])
 
-                        if isinstance(house_costs, list) and house_costs:
-                            houses_count = min(prop["houses"], len(house_costs))
-                            for i in range(houses_count):
-                                total += house_costs[i]
-                        elif isinstance(house_costs, (int, float)):
-                            total += house_costs * prop["houses"]
+                    if isinstance(house_costs, list) and house_costs:
+                        houses_count = min(prop["houses"], len(house_costs))
+                        for i in range(houses_count):
+                            total += house_costs[i]
+                    elif isinstance(house_costs, (int, float)):
+                        total += house_costs * prop["houses"]
 
             return total
 
@@ -643,18 +553,8 @@ class GameActions:
             return player.get("money", 0)
 
     def handle_ai_turn(self, ai_player):
-        MAX_ITERATIONS = 100
-        iteration_count = 0
-
         try:
-            player_obj = next(
-                (
-                    player
-                    for player in self.game.players
-                    if player.name == ai_player["name"]
-                ),
-                None,
-            )
+            player_obj = self.game.get_player(ai_player["name"])
 
             if not player_obj:
                 return None
@@ -684,53 +584,8 @@ class GameActions:
 
         if self.game.state == "ROLL":
             self.play_turn()
-
-            start_time = pygame.time.get_ticks()
-            while self.game.state == "BUY" and self.game.current_property:
-
-                current_time = pygame.time.get_ticks()
-                if current_time - start_time > 5000:
-                    print(
-                        f"Timeout reached for AI {ai_player['name']} in BUY state - forcing decision"
-                    )
-                    self.handle_buy_decision(False)
-                    break
-
-                iteration_count += 1
-                if iteration_count > MAX_ITERATIONS:
-                    print(
-                        f"Maximum iterations reached for AI {ai_player['name']} in BUY state - forcing decision"
-                    )
-                    self.handle_buy_decision(False)
-                    break
-
-                print(f"\n=== AI Purchase Decision ===")
-                print(f"AI Player: {ai_player['name']}")
-                print(f"Property: {self.game.current_property['name']}")
-                print(f"Price: £{self.game.current_property['price']}")
-                print(f"AI Money: £{ai_player['money']}")
-
-                try:
-                    should_buy = self.game.logic.ai_player.should_buy_property(
-                        self.game.current_property,
-                        ai_player["money"],
-                        [
-                            p
-                            for p in self.game.logic.properties.values()
-                            if p.get("owner") == ai_player["name"]
-                        ],
-                    )
-
-                    if should_buy:
-                        print("AI Decision: Buy")
-                        self.handle_buy_decision(True)
-                    else:
-                        print("AI Decision: Pass")
-                        self.handle_buy_decision(False)
-                except Exception as e:
-                    print(f"Error in AI purchase decision: {e}")
-                    self.handle_buy_decision(False)
-                break
+            if self.game.state == "BUY" and self.game.current_property:
+                self.request_ai_buy_decision(ai_player)
 
         elif self.game.state == "AUCTION" and hasattr(
             self.game.logic, "current_auction"
@@ -741,76 +596,81 @@ class GameActions:
                 print("Warning: Auction data is None in handle_ai_turn")
                 return None
 
-            start_time = pygame.time.get_ticks()
-            while (
-                auction_data["active_players"][auction_data["current_bidder_index"]][
-                    "name"
-                ]
-                == ai_player["name"]
-            ):
-                current_time = pygame.time.get_ticks()
-                if current_time - start_time > 5000:
-                    print(
-                        f"Timeout reached for AI {ai_player['name']} in AUCTION state - forcing pass"
-                    )
-                    success, message = self.game.logic.process_auction_pass(ai_player)
-                    if message:
-                        self.game.board.add_message(message)
-                    break
+            current_bidder = auction_data["active_players"][
+                auction_data["current_bidder_index"]
+            ]
+            if current_bidder["name"] == ai_player["name"]:
+                self.request_ai_auction_bid(ai_player)
 
-                iteration_count += 1
-                if iteration_count > MAX_ITERATIONS:
-                    print(
-                        f"Maximum iterations reached for AI {ai_player['name']} in AUCTION state - forcing pass"
-                    )
-                    success, message = self.game.logic.process_auction_pass(ai_player)
-                    if message:
-                        self.game.board.add_message(message)
-                    break
+        return None
 
-                print(f"\n=== AI Auction Turn ===")
-                print(f"AI Player: {ai_player['name']}")
-                print(f"Property: {auction_data['property']['name']}")
-                print(f"Current bid: £{auction_data['current_bid']}")
-                print(f"Minimum bid: £{auction_data['minimum_bid']}")
+    def request_ai_buy_decision(self, ai_player, decide=None):
+        """Work out an AI purchase on the AI worker and make it once it is ready"""
+        property_data = self.game.current_property
+        if decide is None:
+
+            def decide():
+                return self.game.logic.ai_player.should_buy_property(
+                    property_data,
+                    ai_player["money"],
+                    self.game.logic.properties.get_owned(ai_player["name"]),
+                    ai_player["name"],
+                )
 
-                if ai_player["name"] in auction_data.get("passed_players", set()):
-                    print(f"AI {ai_player['name']} has already passed")
-                    break
+        def apply(should_buy):
+            # Skip decisions the game has moved past, e.g. after an AI timeout
+            if (
+                self.game.state != "BUY"
+                or self.game.current_property is not property_data
+                or self.game.logic.players[self.game.logic.current_player_index]["name"]
+                != ai_player["name"]
+            ):
+                return
+            print(f"\n=== AI Purchase Decision ===")
+            print(f"AI Player: {ai_player['name']}")
+            print(f"Property: {property_data['name']}")
+            print(f"AI Decision: {'Buy' if should_buy else 'Pass'}")
+            self.handle_buy_decision(bool(should_buy))
+
+        return self.game.ai_scheduler.submit(
+            "buy", decide, apply, delay_ms=AI_BUY_DELAY_MS, default=False
+        )
 
-                try:
-                    bid_amount = self.game.logic.get_ai_auction_bid(
-                        ai_player, auction_data["property"], auction_data["current_bid"]
-                    )
+    def request_ai_auction_bid(self, ai_player, choose_bid=None):
+        """Work out an AI auction bid on the AI worker and place it once it is ready"""
+        auction_data = self.game.logic.current_auction
+        if ai_player["name"] in auction_data.get("passed_players", set()):
+            print(f"AI {ai_player['name']} has already passed")
+            return False
+        if choose_bid is None:
 
-                    if bid_amount and bid_amount >= auction_data["minimum_bid"]:
-                        print(f"AI Decision: Bid £{bid_amount}")
-                        success, message = self.game.logic.process_auction_bid(
-                            ai_player, bid_amount
-                        )
-                        if message:
-                            self.game.board.add_message(message)
-                    else:
-                        print("AI Decision: Pass")
-                        success, message = self.game.logic.process_auction_pass(
-                            ai_player
-                        )
-                        if message:
-                            self.game.board.add_message(message)
-                except Exception as e:
-                    print(f"Error in AI auction decision: {e}")
-                    success, message = self.game.logic.process_auction_pass(ai_player)
-                    if message:
-                        self.game.board.add_message(message)
-
-                result_message = self.game.logic.check_auction_end()
-                if result_message:
-                    self.game.board.add_message(result_message)
-                    self.game.state = "ROLL"
-                    self.game.board.update_ownership(self.game.logic.properties)
-                break
+            def choose_bid():
+                return self.game.logic.get_ai_auction_bid(
+                    ai_player, auction_data["property"], auction_data["current_bid"]
+                )
 
-        return None
+        def apply(bid_amount):
+            if (
+                self.game.logic.current_auction is not auction_data
+                or auction_data.get("completed", False)
+                or auction_data["active_players"][auction_data["current_bidder_index"]][
+                    "name"
+                ]
+                != ai_player["name"]
+            ):
+                return
+            if bid_amount and bid_amount >= auction_data["minimum_bid"]:
+                print(f"AI {ai_player['name']} bids £{bid_amount}")
+                success, message = self.game.logic.process_auction_bid(
+                    ai_player, bid_amount
+                )
+            else:
+                print(f"AI {ai_player['name']} passes")
+                success, message = self.game.logic.process_auction_pass(ai_player)
+            if message:
+                self.game.board.add_message(message)
+
+        return self.game.ai_scheduler.submit("auction", choose_bid, apply)
 
     def handle_bankruptcy(self, player):
         for ui_player in self.game.players:
@@ -847,7 +707,6 @@ class GameActions:
             amount = self.game.free_parking_pot
             player["money"] += amount
             self.game.free_parking_pot = 0
-            self.game.logic.free_parking_fund = 0
             self.game.board.add_message(
                 f"{player['name']} collected £{amount} from Free Parking!"
             )
@@ -4,6 +4,7 @@
 import pygame
 import sys
 from src.Cards import CardType
+from src.Frame_Profiler import frame_profiler
 
 KEY_ROLL = [pygame.K_SPACE, pygame.K_RETURN]
 KEY_BUY = [pygame.K_y, pygame.K_RETURN]
@@ -16,6 +17,10 @@ class GameEventHandler:
         self.game_actions = game_actions
 
     def handle_input(self):
+        with frame_profiler.span("events"):
+            return self._handle_input()
+
+    def _handle_input(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
@@ -379,9 +384,7 @@ class GameEventHandler:
         current_bidder = auction_data["active_players"][
             auction_data["current_bidder_index"]
         ]
-        current_bidder_obj = next(
-            (p for p in self.game.players if p.name == current_bidder["name"]), None
-        )
+        current_bidder_obj = self.game.get_player(current_bidder["name"])
 
         print(f"Processing auction input for {current_bidder['name']}")
 
@@ -496,9 +499,7 @@ class GameEventHandler:
             self.game.logic.move_to_next_bidder()
             return False
 
-        current_bidder_obj = next(
-            (p for p in self.game.players if p.name == current_bidder["name"]), None
-        )
+        current_bidder_obj = self.game.get_player(current_bidder["name"])
 
         if not current_bidder_obj or (
             hasattr(current_bidder_obj, "voluntary_exit")
@@ -567,29 +568,8 @@ class GameEventHandler:
         print(f"Auction end check result: {result_message}")
 
         if result_message == "auction_completed":
+            # Game.on_auction_closed has already shown the result and started the delay
             print("Auction is completed - showing results before changing state")
-
-            if (
-                hasattr(self.game.logic, "current_auction")
-                and self.game.logic.current_auction
-            ):
-                auction_data = self.game.logic.current_auction
-                if auction_data and auction_data.get("highest_bidder"):
-                    winner = auction_data["highest_bidder"]
-                    property_name = auction_data["property"]["name"]
-                    bid_amount = auction_data["current_bid"]
-                    self.game.board.add_message(
-                        f"{winner['name']} won {property_name} for £{bid_amount}"
-                    )
-                else:
-                    property_name = auction_data["property"]["name"]
-                    self.game.board.add_message(f"No one bid on {property_name}")
-
-            self.game.auction_end_time = pygame.time.get_ticks()
-            self.game.auction_end_delay = 3000
-            self.game.auction_completed = True
-
-            self.game.board.update_ownership(self.game.logic.properties)
             return False
 
         print("Auction continues - returning False")
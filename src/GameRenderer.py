@@ -5,6 +5,7 @@ import pygame
 import math
 import os
 from src.Font_Manager import font_manager
+from src.Frame_Profiler import frame_profiler
 from src.UI import DevelopmentNotification, AIEmotionUI
 
 WHITE = (255, 255, 255)
@@ -58,6 +59,13 @@ class GameRenderer:
         self.button_font = game.button_font
         self.message_font = game.message_font
 
+        self.last_scene = None
+        self.needs_full_update = True
+        self.player_panel_rect = None
+        self.free_parking_rect = None
+        self.time_panel_rect = None
+        self.tooltip_rect = None
+
     def draw_button(self, button, text, hover=False, active=True):
         if not active:
             base_color = GRAY
@@ -105,13 +113,13 @@ class GameRenderer:
 
         self.screen.blit(button_surface, button)
 
-        text_shadow = self.font.render(text, True, BLACK)
+        text_shadow = font_manager.render_text(self.font, text, True, BLACK)
         text_rect_shadow = text_shadow.get_rect(center=button.center)
         text_rect_shadow.x += 1
         text_rect_shadow.y += 1
         self.screen.blit(text_shadow, text_rect_shadow)
 
-        text_surface = self.font.render(text, True, CREAM)
+        text_surface = font_manager.render_text(self.font, text, True, CREAM)
         text_rect = text_surface.get_rect(center=button.center)
         self.screen.blit(text_surface, text_rect)
 
@@ -203,9 +211,10 @@ class GameRenderer:
                 banner_surface.fill(banner_color)
                 self.screen.blit(banner_surface, (0, 0))
 
-                font = pygame.font.Font(None, 28)
-                text = font.render(
-                    "TIME'S UP! Finishing current lap...", True, (255, 255, 255)
+                # A managed font lets the banner text come from the text cache too
+                font = font_manager.get_font(28)
+                text = font_manager.render_text(
+                    font, "TIME'S UP! Finishing current lap...", True, (255, 255, 255)
                 )
                 text_rect = text.get_rect(
                     center=(window_size[0] // 2, banner_height // 2)
@@ -246,13 +255,17 @@ class GameRenderer:
                     ),
                     border_radius=10,
                 )
-            self.screen.blit(glow_surface, (panel_x - 5, panel_y - 5))
+            self.time_panel_rect = self.screen.blit(
+                glow_surface, (panel_x - 5, panel_y - 5)
+            )
 
             panel = pygame.Surface((panel_width, panel_height))
             panel.fill(UI_BG)
             self.screen.blit(panel, (panel_x, panel_y))
 
-            panel_title = self.small_font.render("GAME STATUS", True, LIGHT_GRAY)
+            panel_title = font_manager.render_text(
+                self.small_font, "GAME STATUS", True, LIGHT_GRAY
+            )
             panel_title_rect = panel_title.get_rect(
                 centerx=panel_x + panel_width // 2, top=panel_y + 10
             )
@@ -271,19 +284,25 @@ class GameRenderer:
 
             lap_y = panel_title_rect.bottom + 7
             lap_icon_text = "🏁"
-            lap_icon = self.small_font.render(lap_icon_text, True, LIGHT_GRAY)
+            lap_icon = font_manager.render_text(
+                self.small_font, lap_icon_text, True, LIGHT_GRAY
+            )
             self.screen.blit(lap_icon, (panel_x + 15, lap_y))
 
-            lap_text = self.font.render(f"Lap {min_lap}", True, ACCENT_COLOR)
+            lap_text = font_manager.render_text(
+                self.font, f"Lap {min_lap}", True, ACCENT_COLOR
+            )
             self.screen.blit(lap_text, (panel_x + 40, lap_y - 5))
 
             time_y = lap_y + 25
             time_icon_text = "⏱️"
-            time_icon = self.small_font.render(time_icon_text, True, LIGHT_GRAY)
+            time_icon = font_manager.render_text(
+                self.small_font, time_icon_text, True, LIGHT_GRAY
+            )
             self.screen.blit(time_icon, (panel_x + 15, time_y))
 
-            time_text = self.font.render(
-                f"{minutes:02d}:{seconds:02d}", True, time_color
+            time_text = font_manager.render_text(
+                self.font, f"{minutes:02d}:{seconds:02d}", True, time_color
             )
             self.screen.blit(time_text, (panel_x + 40, time_y - 5))
 
@@ -311,37 +330,158 @@ class GameRenderer:
                     border_radius=4,
                 )
 
-    def draw(self):
-        if self.game.game_mode == "abridged" and self.game.check_time_limit():
-            return
+    def invalidate(self):
+        self.needs_full_update = True
 
-        if not pygame.display.get_surface():
-            return
+    def get_time_remaining(self):
+        current_time = pygame.time.get_ticks()
+        if self.game.game_paused:
+            current_time = self.game.pause_start_time
+        elapsed = (
+            current_time - self.game.start_time - self.game.total_pause_time
+        ) // 1000
+        return max(0, self.game.time_limit - elapsed)
+
+    def get_scene(self, window_size, mouse_pos, any_player_moving):
+        # Returns what an idle frame shows, or None while anything is animating
+        game = self.game
+        logic = game.logic
+        current_time = pygame.time.get_ticks()
 
-        window_size = self.screen.get_size()
-        self.screen.fill(UI_BG)
-        gradient = pygame.Surface(window_size, pygame.SRCALPHA)
-        for i in range(window_size[1]):
-            alpha = int(255 * (1 - i / window_size[1]))
-            pygame.draw.line(
-                gradient, (*ACCENT_COLOR[:3], alpha), (0, i), (window_size[0], i)
+        if (
+            game.state != "ROLL"
+            or any_player_moving
+            or game.dice_animation
+            or game.show_card
+            or game.show_popup
+            or game.notification
+            or game.development_mode
+            or game.dev_manager.is_active
+            or game.game_over
+            or game.auction_completed
+            or getattr(game, "waiting_for_animation", False)
+            or (
+                game.last_roll
+                and current_time - game.roll_time < game.ROLL_DISPLAY_TIME
             )
-        self.screen.blit(gradient, (0, 0))
+            or not logic.players
+        ):
+            return None
+
+        current_name = logic.players[logic.current_player_index]["name"]
+        if any(p.is_ai for p in game.players if p.name == current_name):
+            return None
+
+        time_remaining = None
+        if game.game_mode == "abridged" and game.time_limit:
+            time_remaining = self.get_time_remaining()
+            if time_remaining <= game.time_warning_start or game.time_limit_reached:
+                return None
+
+        camera = game.board.camera
+        return {
+            "layout": (
+                window_size,
+                camera.zoom_level,
+                camera.offset_x,
+                camera.offset_y,
+                camera.is_zooming(),
+                logic.current_player_index,
+                game.game_paused,
+                tuple(
+                    (p.name, p.position, p.bankrupt, p.voluntary_exit)
+                    for p in game.players
+                ),
+            ),
+            "mouse": mouse_pos,
+            # Tokens ease up and down after a turn change; blit positions are truncated,
+            # so the drawn pixel only moves when the ceiling of the offset does
+            "tokens": tuple(math.ceil(p.animation_offset) for p in game.players),
+            "players": tuple(
+                (
+                    p["name"],
+                    p["money"],
+                    p.get("in_jail", False),
+                    p.get("bankrupt", False),
+                    p.get("exited", False),
+                )
+                for p in logic.players
+            ),
+            "properties": logic.properties.version,
+            "messages": tuple(game.board.messages),
+            "free_parking": game.free_parking_pot,
+            "time": time_remaining,
+            "emotions": tuple(
+                (
+                    ui.visible,
+                    ui.happy_hover,
+                    ui.angry_hover,
+                    ui.happy_clicks_after_limit + ui.angry_clicks_after_limit,
+                    getattr(
+                        getattr(ui.ai_player, "ai_controller", None),
+                        "mood_modifier",
+                        None,
+                    ),
+                )
+                for ui in game.emotion_uis.values()
+            ),
+        }
 
-        if self.game.state == "DEVELOPMENT" and self.game.dev_manager.is_active:
-            self.game.dev_manager.draw(pygame.mouse.get_pos())
+    def get_dirty_rects(self, scene):
+        # None means the whole window has to be presented
+        if scene is None or self.last_scene is None or self.needs_full_update:
+            return None
 
-        self.game.board.draw(self.screen)
+        changed = [part for part in scene if scene[part] != self.last_scene[part]]
+        if "layout" in changed:
+            return None
 
-        if self.game.development_mode:
-            self.game.dev_manager.draw(pygame.mouse.get_pos())
+        emotion_rects = [
+            ui.panel_rect.inflate(8, 8) for ui in self.game.emotion_uis.values()
+        ]
+        button_rects = [
+            button.inflate(8, 12)
+            for button in (
+                self.game.roll_button,
+                self.game.pause_button,
+                self.game.quit_button,
+            )
+        ]
+        regions = {
+            "mouse": button_rects + emotion_rects + [self.player_panel_rect],
+            "tokens": [None],
+            "players": [self.player_panel_rect],
+            "properties": [self.player_panel_rect],
+            "messages": [self.game.board.message_log_rect],
+            "free_parking": [self.free_parking_rect],
+            "time": [self.time_panel_rect],
+            "emotions": emotion_rects,
+        }
+
+        dirty_rects = []
+        for part in changed:
+            dirty_rects.extend(regions[part])
+        if None in dirty_rects:
+            return None
+        return dirty_rects
+
+    def present(self, dirty_rects):
+        with frame_profiler.span("flip"):
+            if dirty_rects is None:
+                pygame.display.flip()
+            elif dirty_rects:
+                pygame.display.update(dirty_rects)
+        self.needs_full_update = False
 
-        for emotion_ui in self.game.emotion_uis.values():
-            emotion_ui.draw()
+    def draw(self):
+        if self.game.game_mode == "abridged" and self.game.check_time_limit():
+            return
 
-        self.game.synchronize_player_positions()
-        self.game.synchronize_player_money()
-        self.game.synchronize_free_parking_pot()
+        if not pygame.display.get_surface():
+            return
+
+        window_size = self.screen.get_size()
+        mouse_pos = pygame.mouse.get_pos()
 
         for player in self.game.players:
             player.update_animation()
@@ -379,10 +519,59 @@ class GameRenderer:
                 self.game.state = "ROLL"
                 self.game.auction_completed = False
 
-        self.game.board.draw(self.screen)
+        self.game.board.camera.handle_camera_controls(pygame.key.get_pressed())
+        self.game.board.update_board_positions()
 
-        mouse_pos = pygame.mouse.get_pos()
+        # Idle frames keep last frame's pixels; otherwise only changed regions are presented
+        scene = self.get_scene(window_size, mouse_pos, any_player_moving)
+        if frame_profiler.overlay_visible:
+            # The overlay changes every frame, so no frame counts as idle
+            scene = None
+        if (
+            scene is not None
+            and scene == self.last_scene
+            and not self.needs_full_update
+        ):
+            self.check_game_over()
+            return
+
+        dirty_rects = self.get_dirty_rects(scene)
+        previous_tooltip_rect = self.tooltip_rect
+        self.tooltip_rect = None
+        self.last_scene = scene
+
+        self.draw_scene(window_size, mouse_pos, any_player_moving)
+        if frame_profiler.overlay_visible:
+            frame_profiler.draw_overlay(self.screen, self.small_font)
+        self.check_game_over()
+
+        if dirty_rects is not None:
+            dirty_rects.extend(
+                rect for rect in (previous_tooltip_rect, self.tooltip_rect) if rect
+            )
+        self.present(dirty_rects)
+
+    def check_game_over(self):
+        if not self.game.game_over:
+            game_over_data = self.game.check_game_over()
+            if game_over_data:
+                if "winner" in game_over_data:
+                    self.game.handle_game_over(game_over_data["winner"])
+
+    def draw_scene(self, window_size, mouse_pos, any_player_moving):
+        with frame_profiler.span("board"):
+            self.game.board.draw(self.screen)
+
+            if self.game.development_mode:
+                self.game.dev_manager.draw(pygame.mouse.get_pos())
 
+        with frame_profiler.span("player_panel"):
+            self.draw_player_panel(window_size, mouse_pos)
+
+        with frame_profiler.span("popups"):
+            self.draw_state_ui(mouse_pos, any_player_moving)
+
+    def draw_player_panel(self, window_size, mouse_pos):
         panel_width = 280
         panel_spacing = 10
         player_height = 100
@@ -397,15 +586,16 @@ class GameRenderer:
             panel_surface, (0, 0, 0, 180), panel_surface.get_rect(), border_radius=15
         )
         self.screen.blit(panel_surface, (panel_x, panel_y))
+        self.player_panel_rect = pygame.Rect(
+            panel_x, panel_y, panel_width, total_height
+        )
 
         current_y = panel_y
         hovered_property = None
 
         for i, player_data in enumerate(self.game.logic.players):
             is_current = i == self.game.logic.current_player_index
-            player_obj = next(
-                (p for p in self.game.players if p.name == player_data["name"]), None
-            )
+            player_obj = self.game.get_player(player_data["name"])
 
             player_rect = pygame.Rect(panel_x, current_y, panel_width, player_height)
 
@@ -466,20 +656,26 @@ class GameRenderer:
             else:
                 name_text = player_data["name"]
 
-            name_surface = self.font.render(name_text, True, name_color)
+            name_surface = font_manager.render_text(
+                self.font, name_text, True, name_color
+            )
             self.screen.blit(name_surface, (info_x, info_y))
 
             if player_data.get("exited", False) or (
                 player_obj and player_obj.voluntary_exit
             ):
-                exit_text = self.small_font.render("[EXITED]", True, (200, 0, 0))
+                exit_text = font_manager.render_text(
+                    self.small_font, "[EXITED]", True, (200, 0, 0)
+                )
                 self.screen.blit(
                     exit_text, (info_x, info_y + name_surface.get_height())
                 )
             elif player_data.get("bankrupt", False) or (
                 player_obj and player_obj.bankrupt
             ):
-                bankrupt_text = self.small_font.render("[BANKRUPT]", True, (200, 0, 0))
+                bankrupt_text = font_manager.render_text(
+                    self.small_font, "[BANKRUPT]", True, (200, 0, 0)
+                )
                 self.screen.blit(
                     bankrupt_text, (info_x, info_y + name_surface.get_height())
                 )
@@ -498,14 +694,12 @@ class GameRenderer:
                 if player_data["money"] > 500
                 else ERROR_COLOR if player_data["money"] < 200 else WHITE
             )
-            money_surface = self.small_font.render(money_text, True, money_color)
+            money_surface = font_manager.render_text(
+                self.small_font, money_text, True, money_color
+            )
             self.screen.blit(money_surface, (info_x, money_y))
 
-            props = [
-                prop
-                for prop in self.game.logic.properties.values()
-                if prop.get("owner") == player_data["name"]
-            ]
+            props = self.game.logic.properties.get_owned(player_data["name"])
 
             if props:
                 prop_x = info_x
@@ -535,8 +729,8 @@ class GameRenderer:
                             indicator_color = GREEN
                             indicator_text = str(houses)
 
-                        indicator_surface = self.tiny_font.render(
-                            indicator_text, True, WHITE
+                        indicator_surface = font_manager.render_text(
+                            self.tiny_font, indicator_text, True, WHITE
                         )
                         indicator_rect = indicator_surface.get_rect(
                             center=prop_rect.center
@@ -563,6 +757,7 @@ class GameRenderer:
         if hovered_property:
             self.draw_property_tooltip(hovered_property, mouse_pos)
 
+    def draw_state_ui(self, mouse_pos, any_player_moving):
         self.draw_time_remaining()
 
         self.draw_free_parking_pot()
@@ -573,16 +768,8 @@ class GameRenderer:
             emotion_ui.draw()
 
         if self.game.state == "ROLL":
-            current_player = next(
-                (
-                    p
-                    for p in self.game.players
-                    if p.name
-                    == self.game.logic.players[self.game.logic.current_player_index][
-                        "name"
-                    ]
-                ),
-                None,
+            current_player = self.game.get_player(
+                self.game.logic.players[self.game.logic.current_player_index]["name"]
             )
             self.game.current_player_is_ai = current_player and current_player.is_ai
 
@@ -637,9 +824,13 @@ class GameRenderer:
                         )
                     self.screen.blit(gradient, self.game.quit_button)
 
-                    quit_text = self.font.render("Leave", True, WHITE)
+                    quit_text = font_manager.render_text(
+                        self.font, "Leave", True, WHITE
+                    )
                     text_rect = quit_text.get_rect(center=self.game.quit_button.center)
-                    text_shadow = self.font.render("Leave", True, BLACK)
+                    text_shadow = font_manager.render_text(
+                        self.font, "Leave", True, BLACK
+                    )
                     text_shadow_rect = text_shadow.get_rect(
                         center=self.game.quit_button.center
                     )
@@ -666,36 +857,9 @@ class GameRenderer:
                 self.game.state = "ROLL"
                 return
 
+            # The auction engine reports the result through Game.on_auction_closed
             if self.game.logic.current_auction:
                 self.draw_auction(self.game.logic.current_auction)
-                result_message = self.game.logic.check_auction_end()
-                if result_message == "auction_completed":
-                    print("Auction completed in draw method - setting up delay")
-
-                    if (
-                        self.game.logic.current_auction
-                        and self.game.logic.current_auction.get("highest_bidder")
-                    ):
-                        winner = self.game.logic.current_auction["highest_bidder"]
-                        property_name = self.game.logic.current_auction.get(
-                            "property", {}
-                        ).get("name", "Unknown property")
-                        bid_amount = self.game.logic.current_auction.get(
-                            "current_bid", 0
-                        )
-                        self.game.board.add_message(
-                            f"{winner['name']} won {property_name} for £{bid_amount}"
-                        )
-                    else:
-                        property_name = self.game.logic.current_auction.get(
-                            "property", {}
-                        ).get("name", "Unknown property")
-                        self.game.board.add_message(f"No one bid on {property_name}")
-
-                    self.game.auction_end_time = pygame.time.get_ticks()
-                    self.game.auction_end_delay = 3000
-                    self.game.auction_completed = True
-                    self.game.board.update_ownership(self.game.logic.properties)
         elif (
             self.game.state == "DEVELOPMENT" and self.game.selected_property is not None
         ):
@@ -708,10 +872,7 @@ class GameRenderer:
                 current_player = self.game.logic.players[
                     self.game.logic.current_player_index
                 ]
-                player_obj = next(
-                    (p for p in self.game.players if p.name == current_player["name"]),
-                    None,
-                )
+                player_obj = self.game.get_player(current_player["name"])
 
                 if player_obj and player_obj.is_ai:
                     print(
@@ -734,6 +895,7 @@ class GameRenderer:
             self.game.development_mode
             and not any_player_moving
             and not self.game.dice_animation
+            and not self.game.current_player_is_ai
         ):
             if self.game.state in ["BUY", "AUCTION"]:
                 return
@@ -747,11 +909,9 @@ class GameRenderer:
                 current_player = self.game.logic.players[
                     self.game.logic.current_player_index
                 ]
-                owned_properties = [
-                    p
-                    for p in self.game.logic.properties.values()
-                    if p.get("owner") == current_player["name"]
-                ]
+                owned_properties = self.game.logic.properties.get_owned(
+                    current_player["name"]
+                )
                 if owned_properties:
                     if not self.game.dev_notification:
                         self.game.dev_notification = DevelopmentNotification(
@@ -789,21 +949,9 @@ class GameRenderer:
                 self.game.current_card = None
                 self.game.current_card_player = None
 
-        self.game.board.camera.handle_camera_controls(pygame.key.get_pressed())
-
-        self.game.board.update_board_positions()
-
-        if not self.game.game_over:
-            game_over_data = self.game.check_game_over()
-            if game_over_data:
-                if "winner" in game_over_data:
-                    self.game.handle_game_over(game_over_data["winner"])
-
         if self.game.show_popup:
             self.draw_popup_message()
 
-        pygame.display.flip()
-
     def draw_dice(self, dice1, dice2, is_rolling):
         window_size = self.screen.get_size()
         dice_size = int(window_size[1] * 0.08)
@@ -829,7 +977,7 @@ class GameRenderer:
                 image_rect = scaled_dice.get_rect(center=dice_rect.center)
                 self.screen.blit(scaled_dice, image_rect)
             else:
-                dice_text = self.font.render(str(value), True, BLACK)
+                dice_text = font_manager.render_text(self.font, str(value), True, BLACK)
                 dice_text_rect = dice_text.get_rect(center=dice_rect.center)
                 self.screen.blit(dice_text, dice_text_rect)
 
@@ -888,29 +1036,34 @@ class GameRenderer:
                 pygame.Rect(card_x, card_y + header_height - 15, card_width, 15),
             )
 
-        name_text = self.font.render(property_data["name"], True, BLACK)
+        name_text = font_manager.render_text(
+            self.font, property_data["name"], True, BLACK
+        )
         name_rect = name_text.get_rect(centerx=card_rect.centerx, top=card_y + 50)
         self.screen.blit(name_text, name_rect)
 
         y_offset = name_rect.bottom + 20
         padding = 20
 
-        price_text = self.font.render(
-            f"Price: £{property_data['price']}", True, ACCENT_COLOR
+        price_text = font_manager.render_text(
+            self.font, f"Price: £{property_data['price']}", True, ACCENT_COLOR
         )
         self.screen.blit(price_text, (card_x + padding, y_offset))
         y_offset += 35
 
-        rent_text = self.small_font.render(
-            f"Base Rent: £{property_data.get('rent', 0)}", True, BLACK
+        rent_text = font_manager.render_text(
+            self.small_font, f"Base Rent: £{property_data.get('rent', 0)}", True, BLACK
         )
         self.screen.blit(rent_text, (card_x + padding, y_offset))
         y_offset += 25
 
         if "house_costs" in property_data:
             for i, cost in enumerate(property_data["house_costs"], 1):
-                house_text = self.small_font.render(
-                    f"{i} House{'s' if i > 1 else ''}: £{cost}", True, BLACK
+                house_text = font_manager.render_text(
+                    self.small_font,
+                    f"{i} House{'s' if i > 1 else ''}: £{cost}",
+                    True,
+                    BLACK,
                 )
                 self.screen.blit(house_text, (card_x + padding, y_offset))
                 y_offset += 25
@@ -923,17 +1076,17 @@ class GameRenderer:
                 "4 Stations: £200",
             ]
             for rule in rent_rules:
-                rule_text = self.small_font.render(rule, True, BLACK)
+                rule_text = font_manager.render_text(self.small_font, rule, True, BLACK)
                 self.screen.blit(rule_text, (card_x + padding, y_offset))
                 y_offset += 25
         elif property_data["name"] in ["Tesla Power Co", "Edison Water"]:
-            utility_text = self.small_font.render(
-                "Rent = 4x dice if 1 owned", True, BLACK
+            utility_text = font_manager.render_text(
+                self.small_font, "Rent = 4x dice if 1 owned", True, BLACK
             )
             self.screen.blit(utility_text, (card_x + padding, y_offset))
             y_offset += 25
-            utility_text2 = self.small_font.render(
-                "Rent = 10x dice if both owned", True, BLACK
+            utility_text2 = font_manager.render_text(
+                self.small_font, "Rent = 10x dice if both owned", True, BLACK
             )
             self.screen.blit(utility_text2, (card_x + padding, y_offset))
 
@@ -942,7 +1095,7 @@ class GameRenderer:
             window_size = self.screen.get_size()
             message = "AI player is deciding..."
 
-            message_surface = self.font.render(message, True, GOLD)
+            message_surface = font_manager.render_text(self.font, message, True, GOLD)
 
             msg_x = (window_size[0] - message_surface.get_width()) // 2
             msg_y = window_size[1] // 4
@@ -1013,6 +1166,7 @@ class GameRenderer:
             shadow_surface, (0, 0, 0, 128), shadow_surface.get_rect(), border_radius=10
         )
         self.screen.blit(shadow_surface, (x + 2, y + 2))
+        self.tooltip_rect = pygame.Rect(x, y, tooltip_width + 6, tooltip_height + 6)
 
         tooltip_surface = pygame.Surface(
             (tooltip_width, tooltip_height), pygame.SRCALPHA
@@ -1043,26 +1197,31 @@ class GameRenderer:
 
         current_y = y + padding
 
-        name_text = self.small_font.render(property_data["name"], True, WHITE)
+        name_text = font_manager.render_text(
+            self.small_font, property_data["name"], True, WHITE
+        )
         self.screen.blit(name_text, (x + padding, current_y))
         current_y += line_height
 
         if property_data.get("group"):
-            group_text = self.small_font.render(
-                f"Group: {property_data['group']}", True, LIGHT_GRAY
+            group_text = font_manager.render_text(
+                self.small_font, f"Group: {property_data['group']}", True, LIGHT_GRAY
             )
             self.screen.blit(group_text, (x + padding, current_y))
             current_y += line_height
 
-        price_text = self.small_font.render(
-            f"Price: £{property_data.get('price', 0):,}", True, SUCCESS_COLOR
+        price_text = font_manager.render_text(
+            self.small_font,
+            f"Price: £{property_data.get('price', 0):,}",
+            True,
+            SUCCESS_COLOR,
         )
         self.screen.blit(price_text, (x + padding, current_y))
         current_y += line_height
 
         base_rent = property_data.get("rent", 0)
-        rent_text = self.small_font.render(
-            f"Base Rent: £{base_rent:,}", True, ACCENT_COLOR
+        rent_text = font_manager.render_text(
+            self.small_font, f"Base Rent: £{base_rent:,}", True, ACCENT_COLOR
         )
         self.screen.blit(rent_text, (x + padding, current_y))
         current_y += line_height
@@ -1070,26 +1229,35 @@ class GameRenderer:
         if property_data.get("houses", 0) > 0:
             houses = property_data["houses"]
             if houses == 5:
-                hotel_text = self.small_font.render("Has Hotel", True, RED)
+                hotel_text = font_manager.render_text(
+                    self.small_font, "Has Hotel", True, RED
+                )
                 self.screen.blit(hotel_text, (x + padding, current_y))
             else:
-                house_text = self.small_font.render(
-                    f"Houses Built: {houses}", True, GREEN
+                house_text = font_manager.render_text(
+                    self.small_font, f"Houses Built: {houses}", True, GREEN
                 )
                 self.screen.blit(house_text, (x + padding, current_y))
             current_y += line_height
         elif property_data.get("has_hotel", False):
-            hotel_text = self.small_font.render("Has Hotel", True, RED)
+            hotel_text = font_manager.render_text(
+                self.small_font, "Has Hotel", True, RED
+            )
             self.screen.blit(hotel_text, (x + padding, current_y))
             current_y += line_height
 
         if property_data.get("mortgaged", False):
-            mortgage_text = self.small_font.render("[MORTGAGED]", True, ERROR_COLOR)
+            mortgage_text = font_manager.render_text(
+                self.small_font, "[MORTGAGED]", True, ERROR_COLOR
+            )
             self.screen.blit(mortgage_text, (x + padding, current_y))
         else:
             mortgage_value = property_data.get("price", 0) // 2
-            mortgage_text = self.small_font.render(
-                f"Mortgage Value: £{mortgage_value:,}", True, LIGHT_GRAY
+            mortgage_text = font_manager.render_text(
+                self.small_font,
+                f"Mortgage Value: £{mortgage_value:,}",
+                True,
+                LIGHT_GRAY,
             )
             self.screen.blit(mortgage_text, (x + padding, current_y))
 
@@ -1113,7 +1281,9 @@ class GameRenderer:
         window_size = self.screen.get_size()
         padding = 20
 
-        notification_text = self.font.render(self.game.notification, True, WHITE)
+        notification_text = font_manager.render_text(
+            self.font, self.game.notification, True, WHITE
+        )
         bg_width = notification_text.get_width() + padding * 2
         bg_height = notification_text.get_height() + padding * 2
         bg_surface = pygame.Surface((bg_width, bg_height), pygame.SRCALPHA)
@@ -1167,8 +1337,8 @@ class GameRenderer:
             pygame.Rect(card_x, card_y + header_height - 15, card_width, 15),
         )
 
-        header_text = self.font.render(card["type"], True, WHITE)
-        header_shadow = self.font.render(card["type"], True, BLACK)
+        header_text = font_manager.render_text(self.font, card["type"], True, WHITE)
+        header_shadow = font_manager.render_text(self.font, card["type"], True, BLACK)
         header_rect = header_text.get_rect(
             center=(card_x + card_width // 2, card_y + header_height // 2)
         )
@@ -1179,18 +1349,20 @@ class GameRenderer:
         self.screen.blit(header_text, header_rect)
 
         player_y = card_y + header_height + 20
-        player_text = self.font.render(f"Player: {player['name']}", True, BLACK)
+        player_text = font_manager.render_text(
+            self.font, f"Player: {player['name']}", True, BLACK
+        )
         self.screen.blit(player_text, (card_x + 20, player_y))
 
         message_y = player_y + 40
         message_lines = self.wrap_text(card["message"], card_width - 40)
         for i, line in enumerate(message_lines):
-            message_text = self.small_font.render(line, True, BLACK)
+            message_text = font_manager.render_text(self.small_font, line, True, BLACK)
             self.screen.blit(message_text, (card_x + 20, message_y + i * 30))
 
         continue_y = card_y + card_height - 25
-        continue_text = self.small_font.render(
-            "Tap or click to continue...", True, GRAY
+        continue_text = font_manager.render_text(
+            self.small_font, "Tap or click to continue...", True, GRAY
         )
         continue_rect = continue_text.get_rect(
             centerx=card_x + card_width // 2, bottom=continue_y
@@ -1204,8 +1376,7 @@ class GameRenderer:
 
         for word in words:
             test_line = " ".join(current_line + [word])
-            test_surface = self.small_font.render(test_line, True, BLACK)
-            if test_surface.get_width() <= max_width:
+            if self.small_font.size(test_line)[0] <= max_width:
                 current_line.append(word)
             else:
                 if current_line:
@@ -1245,7 +1416,9 @@ class GameRenderer:
         )
 
         if self.game.popup_title:
-            title_surface = self.font.render(self.game.popup_title, True, ACCENT_COLOR)
+            title_surface = font_manager.render_text(
+                self.font, self.game.popup_title, True, ACCENT_COLOR
+            )
             title_rect = title_surface.get_rect(
                 centerx=popup_x + popup_width // 2, top=popup_y + 20
             )
@@ -1258,8 +1431,7 @@ class GameRenderer:
 
             for word in words:
                 test_line = " ".join(current_line + [word])
-                test_surface = self.small_font.render(test_line, True, BLACK)
-                if test_surface.get_width() <= popup_width - 40:
+                if self.small_font.size(test_line)[0] <= popup_width - 40:
                     current_line.append(word)
                 else:
                     lines.append(" ".join(current_line))
@@ -1269,7 +1441,9 @@ class GameRenderer:
 
             y_offset = popup_y + 80
             for line in lines:
-                text_surface = self.small_font.render(line, True, BLACK)
+                text_surface = font_manager.render_text(
+                    self.small_font, line, True, BLACK
+                )
                 text_rect = text_surface.get_rect(
                     centerx=popup_x + popup_width // 2, top=y_offset
                 )
@@ -1288,7 +1462,7 @@ class GameRenderer:
         )
 
         pygame.draw.rect(self.screen, button_color, button_rect, border_radius=5)
-        button_text = self.small_font.render("OK", True, WHITE)
+        button_text = font_manager.render_text(self.small_font, "OK", True, WHITE)
         text_rect = button_text.get_rect(center=button_rect.center)
         self.screen.blit(button_text, text_rect)
 
@@ -1327,15 +1501,6 @@ class GameRenderer:
             self.game.state = "ROLL"
             return
 
-        current_bidder_index = auction_data.get("current_bidder_index", 0)
-        if current_bidder_index < len(auction_data["active_players"]):
-            current_bidder = auction_data["active_players"][current_bidder_index]
-            if current_bidder.get("is_ai", False):
-                ai_player = current_bidder
-                print(f"Auto-handling AI auction turn for {ai_player['name']}")
-                self.game.handle_ai_turn(ai_player)
-                pygame.time.delay(500)
-
         print(f"\n=== Drawing Auction UI ===")
         print(f"Property: {auction_data['property']['name']}")
         print(f"Current bid: £{auction_data['current_bid']}")
@@ -1388,25 +1553,22 @@ class GameRenderer:
             border_radius=15,
         )
 
-        current_time = pygame.time.get_ticks()
-        time_remaining = max(
-            0,
-            (auction_data["start_time"] + auction_data["duration"] - current_time)
-            // 1000,
+        time_remaining = (
+            self.game.logic.auction_engine.time_remaining(auction_data) // 1000
         )
 
         current_bidder = auction_data["active_players"][
             auction_data["current_bidder_index"]
         ]
-        current_bidder_obj = next(
-            (p for p in self.game.players if p.name == current_bidder["name"]), None
-        )
+        current_bidder_obj = self.game.get_player(current_bidder["name"])
 
         header_color = ERROR_COLOR if time_remaining <= 10 else ACCENT_COLOR
-        header_text = self.font.render(
-            f"{current_bidder['name']}'s Turn", True, header_color
+        header_text = font_manager.render_text(
+            self.font, f"{current_bidder['name']}'s Turn", True, header_color
+        )
+        timer_text = font_manager.render_text(
+            self.font, f"Time: {time_remaining}s", True, header_color
         )
-        timer_text = self.font.render(f"Time: {time_remaining}s", True, header_color)
 
         header_y = card_y + 20
         self.screen.blit(header_text, (card_x + 20, header_y))
@@ -1415,26 +1577,29 @@ class GameRenderer:
         )
 
         title_y = header_y + 50
-        title = self.font.render("AUCTION", True, BLACK)
-        property_name = self.font.render(auction_data["property"]["name"], True, BLACK)
+        title = font_manager.render_text(self.font, "AUCTION", True, BLACK)
+        property_name = font_manager.render_text(
+            self.font, auction_data["property"]["name"], True, BLACK
+        )
         self.screen.blit(
             title, (card_x + (card_width - title.get_width()) // 2, title_y)
         )
         self.screen.blit(property_name, (card_x + 20, title_y + 40))
 
         info_y = title_y + 90
-        current_bid = self.font.render(
-            f"Current Bid: £{auction_data['current_bid']}", True, BLACK
+        current_bid = font_manager.render_text(
+            self.font, f"Current Bid: £{auction_data['current_bid']}", True, BLACK
         )
-        min_bid = self.font.render(
-            f"Minimum Bid: £{auction_data['minimum_bid']}", True, BLACK
+        min_bid = font_manager.render_text(
+            self.font, f"Minimum Bid: £{auction_data['minimum_bid']}", True, BLACK
         )
         self.screen.blit(current_bid, (card_x + 20, info_y))
         self.screen.blit(min_bid, (card_x + 20, info_y + 40))
 
         if auction_data["highest_bidder"]:
             highest_y = info_y + 80
-            highest_text = self.font.render(
+            highest_text = font_manager.render_text(
+                self.font,
                 f"Highest Bidder: {auction_data['highest_bidder']['name']}",
                 True,
                 SUCCESS_COLOR,
@@ -1454,9 +1619,13 @@ class GameRenderer:
             pygame.draw.rect(self.screen, ACCENT_COLOR, self.game.auction_input, 2)
 
             if self.game.auction_bid_amount:
-                bid_text = self.font.render(self.game.auction_bid_amount, True, BLACK)
+                bid_text = font_manager.render_text(
+                    self.font, self.game.auction_bid_amount, True, BLACK
+                )
             else:
-                bid_text = self.small_font.render("Enter bid amount...", True, GRAY)
+                bid_text = font_manager.render_text(
+                    self.small_font, "Enter bid amount...", True, GRAY
+                )
             self.screen.blit(
                 bid_text,
                 (
@@ -1488,7 +1657,9 @@ class GameRenderer:
                 color = BUTTON_HOVER if mouse_over else ACCENT_COLOR
                 pygame.draw.rect(self.screen, color, btn_rect, border_radius=5)
 
-                btn_text = self.font.render(btn_name.title(), True, WHITE)
+                btn_text = font_manager.render_text(
+                    self.font, btn_name.title(), True, WHITE
+                )
                 self.screen.blit(
                     btn_text,
                     (
@@ -1498,8 +1669,11 @@ class GameRenderer:
                 )
 
         if auction_data.get("passed_players"):
-            passed_text = self.small_font.render(
-                "Passed: " + ", ".join(auction_data["passed_players"]), True, GRAY
+            passed_text = font_manager.render_text(
+                self.small_font,
+                "Passed: " + ", ".join(auction_data["passed_players"]),
+                True,
+                GRAY,
             )
             self.screen.blit(passed_text, (card_x + 20, card_y + card_height - 30))
 
@@ -1529,7 +1703,9 @@ class GameRenderer:
             border_radius=15,
         )
 
-        title_text = self.font.render("Jail Options", True, ACCENT_COLOR)
+        title_text = font_manager.render_text(
+            self.font, "Jail Options", True, ACCENT_COLOR
+        )
         title_rect = title_text.get_rect(
             centerx=card_x + card_width // 2, y=card_y + 20
         )
@@ -1557,8 +1733,11 @@ class GameRenderer:
 
             y_offset += button_height + button_margin
 
-        turns_text = self.small_font.render(
-            f"Turns in jail: {player.get('jail_turns', 0)}/3", True, ERROR_COLOR
+        turns_text = font_manager.render_text(
+            self.small_font,
+            f"Turns in jail: {player.get('jail_turns', 0)}/3",
+            True,
+            ERROR_COLOR,
         )
         turns_rect = turns_text.get_rect(
             centerx=card_x + card_width // 2, bottom=card_y + card_height - 20
@@ -1584,21 +1763,25 @@ class GameRenderer:
                 pygame.Rect(i, i, panel_width + 10 - i * 2, panel_height + 10 - i * 2),
                 border_radius=10,
             )
-        self.screen.blit(glow_surface, (panel_x - 5, panel_y - 5))
+        self.free_parking_rect = self.screen.blit(
+            glow_surface, (panel_x - 5, panel_y - 5)
+        )
 
         panel = pygame.Surface((panel_width, panel_height))
         panel.fill(UI_BG)
         self.screen.blit(panel, (panel_x, panel_y))
 
-        title_text = self.small_font.render("Free Parking Pot", True, LIGHT_GRAY)
+        title_text = font_manager.render_text(
+            self.small_font, "Free Parking Pot", True, LIGHT_GRAY
+        )
         title_rect = title_text.get_rect(
             centerx=panel_x + panel_width // 2, top=panel_y + 10
         )
         self.screen.blit(title_text, title_rect)
 
         money_color = SUCCESS_COLOR if self.game.free_parking_pot > 0 else LIGHT_GRAY
-        money_text = self.font.render(
-            f"£{self.game.free_parking_pot:,}", True, money_color
+        money_text = font_manager.render_text(
+            self.font, f"£{self.game.free_parking_pot:,}", True, money_color
         )
         money_rect = money_text.get_rect(
             centerx=panel_x + panel_width // 2, top=title_rect.bottom + 10
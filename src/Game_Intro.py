@@ -0,0 +1,171 @@
+# Property Tycoon Game_Intro.py
+# It contains the game intro, which plays the board fade-in, card shuffle and game start screens on the asyncio loop so it never blocks and can be skipped.
+
+import asyncio
+import json
+import os
+import pygame
+from src.Font_Manager import font_manager
+from src.Asset_Manager import asset_manager
+
+base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SETTINGS_PATH = os.path.join(base_path, "settings.json")
+
+INTRO_IMAGES = {
+    "background": "starterbackground.png",
+    "board": "board.png",
+    "shuffling": "Cards shuffling.png",
+    "start": "Gamestart.png",
+}
+
+TIP_TEXT = "TIP: You can move the board position using WASD and zoom with +/- keys"
+BORDER_COLOR = (218, 165, 32)
+
+FADE_STEP = 10
+FADE_STEP_MS = 20
+BOARD_HOLD_MS = 2000
+SHUFFLE_HOLD_MS = 1000
+START_HOLD_MS = 1000
+FRAME_SLEEP = 0.01
+
+SKIP_EVENTS = (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.QUIT)
+
+
+def _load_settings():
+    try:
+        if os.path.exists(SETTINGS_PATH):
+            with open(SETTINGS_PATH, "r") as f:
+                return json.load(f)
+    except Exception as e:
+        print(f"Error loading settings: {e}")
+    return {}
+
+
+def is_fast_start():
+    """Whether new games start straight away, without the intro"""
+    return bool(_load_settings().get("fast_start", False))
+
+
+def set_fast_start(enabled):
+    # Shares settings.json with the sound manager, so other keys are kept
+    settings = _load_settings()
+    settings["fast_start"] = bool(enabled)
+    try:
+        with open(SETTINGS_PATH, "w") as f:
+            json.dump(settings, f)
+    except Exception as e:
+        print(f"Error saving settings: {e}")
+
+
+class GameIntro:
+    def __init__(self, screen):
+        self.screen = screen
+        self.images = {}
+        self.skipped = False
+
+    def load_images(self):
+        for key, name in INTRO_IMAGES.items():
+            self.images[key] = asset_manager.get_image(name)
+
+    def _skip_requested(self):
+        for event in pygame.event.get(SKIP_EVENTS):
+            if event.type == pygame.QUIT:
+                # Put it back so the game loop still sees the window being closed
+                pygame.event.post(event)
+            self.skipped = True
+        return self.skipped
+
+    async def _hold(self, duration_ms):
+        """Wait without blocking the loop, returning False if the player skipped"""
+        end_time = pygame.time.get_ticks() + duration_ms
+        while pygame.time.get_ticks() < end_time:
+            if self._skip_requested():
+                return False
+            await asyncio.sleep(FRAME_SLEEP)
+        return not self._skip_requested()
+
+    async def play(self):
+        """Play the intro to the end, or until a key press or click skips it"""
+        try:
+            # The asset preloader has read these by now, so this only converts them
+            self.load_images()
+        except Exception as e:
+            print(f"Error loading startup animations: {e}")
+            return False
+
+        screen = self.screen
+        window_size = screen.get_size()
+        small_font = font_manager.get_font(24)
+
+        background = pygame.transform.scale(self.images["background"], window_size)
+
+        board_width = int(window_size[0] * 0.3)
+        board_height = int(board_width)
+        board_image = pygame.transform.scale(
+            self.images["board"], (board_width, board_height)
+        )
+        board_x = (window_size[0] - board_width) // 2
+        board_y = (window_size[1] - board_height) // 2 - 50
+
+        overlay = pygame.Surface(window_size, pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 180))
+
+        border_size = 10
+        border_rect = pygame.Rect(
+            board_x - border_size,
+            board_y - border_size,
+            board_width + (border_size * 2),
+            board_height + (border_size * 2),
+        )
+
+        shadow_surface = small_font.render(TIP_TEXT, True, (0, 0, 0))
+        shadow_rect = shadow_surface.get_rect(
+            center=(window_size[0] // 2 + 2, window_size[1] - 100 + 2)
+        )
+        text_surface = small_font.render(TIP_TEXT, True, (255, 255, 255))
+        text_rect = text_surface.get_rect(
+            center=(window_size[0] // 2, window_size[1] - 100)
+        )
+
+        for alpha in range(0, 256, FADE_STEP):
+            board_image.set_alpha(alpha)
+            screen.blit(background, (0, 0))
+            screen.blit(overlay, (0, 0))
+            pygame.draw.rect(screen, BORDER_COLOR, border_rect, border_radius=10)
+            screen.blit(board_image, (board_x, board_y))
+
+            shadow_surface.set_alpha(min(alpha, 150))
+            screen.blit(shadow_surface, shadow_rect)
+            text_surface.set_alpha(alpha)
+            screen.blit(text_surface, text_rect)
+
+            pygame.display.flip()
+            if not await self._hold(FADE_STEP_MS):
+                return False
+
+        if not await self._hold(BOARD_HOLD_MS):
+            return False
+
+        shuffling_image = pygame.transform.scale(self.images["shuffling"], window_size)
+        screen.blit(background, (0, 0))
+        screen.blit(shuffling_image, (0, 0))
+        pygame.display.flip()
+        if not await self._hold(SHUFFLE_HOLD_MS):
+            return False
+
+        start_image = self.images["start"]
+        logo_width = int(window_size[0] * 0.5)
+        logo_height = int(
+            logo_width * (start_image.get_height() / start_image.get_width())
+        )
+        start_image = pygame.transform.scale(start_image, (logo_width, logo_height))
+
+        overlay.fill((0, 0, 0, 128))
+        screen.blit(background, (0, 0))
+        screen.blit(overlay, (0, 0))
+        screen.blit(
+            start_image,
+            ((window_size[0] - logo_width) // 2, (window_size[1] - logo_height) // 2),
+        )
+        pygame.display.flip()
+        return await self._hold(START_HOLD_MS)
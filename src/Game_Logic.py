@@ -2,10 +2,28 @@
 # script based on Eric's provided flowchart photo (flowchart.drawio.png)
 # will add more comment later to reference for which part of code is based on which part of the flowchart
 
-import pygame
-import random
+import logging
 from src.Loadexcel import load_property_data
 from src.Ai_Player_Logic import EasyAIPlayer, HardAIPlayer
+from src.Player_State import PlayerStore
+from src.Property_Registry import PropertyRegistry
+from src.Rent_Table import RentTable
+from src.Valuation_Cache import get_cached_valuation
+from src.Auction_Engine import (
+    AuctionEngine,
+    AUCTION_BID_ACCEPTED,
+    AUCTION_BIDDER_PASSED,
+    AUCTION_TURN_MS,
+)
+from src.Replay_Log import (
+    BID_EVENT,
+    DEVELOP_EVENT,
+    EXIT_EVENT,
+    TURN_EVENT,
+)
+from src.Rng_Service import RngService, AI_STREAM, DECK_STREAM, DICE_STREAM
+
+logger = logging.getLogger(__name__)
 
 pot_luck_cards = [
     {
@@ -232,13 +250,28 @@ opportunity_knocks_cards = [
 ]
 
 
+def pygame_ticks():
+    import pygame
+
+    return pygame.time.get_ticks()
+
+
 class GameLogic:
     BANK_LIMIT = 50000
     MAX_HOUSES_PER_PROPERTY = 4
     MAX_HOTELS_PER_PROPERTY = 1
     GAME_TOKENS = ["boot", "smartphone", "ship", "hatstand", "cat", "iron"]
 
-    def __init__(self):
+    def __init__(self, clock=None, rng=None, rng_service=None):
+        # clock returns milliseconds; passing one rng instead of rng_service makes every stream share it
+        self.clock = clock or pygame_ticks
+        self.rng_service = rng_service or RngService(shared=rng)
+        self.rng = self.rng_service.stream(DICE_STREAM)
+        self.replay_log = None
+        self.turn_count = 0
+        self.current_auction = None
+        self.auction_engine = AuctionEngine(self)
+        self.player_store = PlayerStore()
         self.players = []
         self.bank_money = self.BANK_LIMIT
         self.free_parking_fund = 0
@@ -251,16 +284,35 @@ class GameLogic:
         self.bankrupted_players = []
         self.voluntary_exits = []
         self.jail_free_cards = {}
+        self.prepared_jail_choices = {}
         self.completed_circuits = {}
         self.available_tokens = self.GAME_TOKENS.copy()
         self.pot_luck_cards = pot_luck_cards.copy()
         self.opportunity_knocks_cards = opportunity_knocks_cards.copy()
-        random.shuffle(self.pot_luck_cards)
-        random.shuffle(self.opportunity_knocks_cards)
+        deck_rng = self.rng_service.stream(DECK_STREAM)
+        deck_rng.shuffle(self.pot_luck_cards)
+        deck_rng.shuffle(self.opportunity_knocks_cards)
         self.ai_difficulty = "easy"
-        self.ai_player = EasyAIPlayer()
+        self.ai_player = EasyAIPlayer(rng=self.rng_service.stream(AI_STREAM))
         self.game = None
 
+    @property
+    def properties(self):
+        return self._properties
+
+    @properties.setter
+    def properties(self, properties):
+        # Wrapping the board keeps the owner and group indexes in step with it
+        if properties is not None and not isinstance(properties, PropertyRegistry):
+            properties = PropertyRegistry(properties)
+
+        old_table = getattr(self, "rent_table", None)
+        if old_table is not None:
+            old_table.properties.unsubscribe(old_table.on_property_change)
+
+        self._properties = properties
+        self.rent_table = RentTable(properties) if properties is not None else None
+
     def validate_bank_transaction(self, amount):
         if amount > self.bank_money:
             raise ValueError("Bank does not have sufficient funds")
@@ -302,19 +354,24 @@ class GameLogic:
                 min(token_index - 1, len(self.GAME_TOKENS) - 1) % len(self.GAME_TOKENS)
             ]
 
-            new_player = {
-                "name": player_name,
-                "money": 1500,
-                "position": 1,
-                "is_ai": player_is_ai,
-                "properties": [],
-                "token": token,
-            }
+            new_player = self.player_store.create(
+                {
+                    "name": player_name,
+                    "money": 1500,
+                    "position": 1,
+                    "is_ai": player_is_ai,
+                    "properties": [],
+                    "token": token,
+                }
+            )
             self.players.append(new_player)
             self.completed_circuits[player_name] = 0
             return True, f"Added player {player_name} with {token} token"
         return False, "Maximum number of players reached"
 
+    def get_player(self, player_name):
+        return self.player_store.get(player_name)
+
     def advance_to_next_player(self):
         if not self.players:
             return
@@ -346,13 +403,25 @@ class GameLogic:
             current_player = self.players[self.current_player_index]
 
         self.is_going_to_jail = False
+        self.last_space_result = None
 
-        dice1 = random.randint(1, 6)
-        dice2 = random.randint(1, 6)
+        money_before = current_player["money"]
+        position_before = current_player["position"]
+        dice1 = self.rng.randint(1, 6)
+        dice2 = self.rng.randint(1, 6)
         self.last_dice_roll = (dice1, dice2)
+        self.turn_count += 1
+        self.record_decision(
+            TURN_EVENT,
+            current_player,
+            [dice1, dice2, money_before, position_before],
+        )
 
         if current_player.get("in_jail", False):
             success, message = self.try_leave_jail(current_player, dice1, dice2)
+            if current_player.get("bankrupt", False):
+                # Already out of the game, and the index has moved on to the next player
+                return dice1, dice2
             if not success:
                 self.advance_to_next_player()
                 return dice1, dice2
@@ -384,6 +453,7 @@ class GameLogic:
             print(f"{current_player['name']} collected £200 for passing GO")
 
         result, message = self.handle_space(current_player)
+        self.last_space_result = result
         if result == "bankrupt":
             print(f"{current_player['name']} is bankrupt!")
         elif result == "jail":
@@ -399,6 +469,11 @@ class GameLogic:
         self.message_queue.append(message)
         print(f"[GAME] {message}")
 
+    def record_decision(self, kind, player, value=None):
+        """Add a turn or a player's decision to the replay log, if one is attached"""
+        if self.replay_log is not None:
+            self.replay_log.record(kind, self.turn_count, player["name"], value)
+
     def handle_space(self, player):
         position = str(player["position"])
         if position not in self.properties:
@@ -440,7 +515,7 @@ class GameLogic:
             return "can_buy", None
 
         elif space["owner"] != player["name"]:
-            owner = next((p for p in self.players if p["name"] == space["owner"]), None)
+            owner = self.get_player(space["owner"])
             if owner.get("in_jail", False):
                 self.add_message(f"{owner['name']} is in jail and cannot collect rent")
                 return None, None
@@ -478,10 +553,12 @@ class GameLogic:
         if "jail_turns" not in player:
             player["jail_turns"] = 0
 
+        ai_choice = self.get_ai_jail_choice(player)
+
         if self.jail_free_cards.get(player["name"], 0) > 0 and (
-            player.get("is_ai", False)
-            or self.game
-            and self.game.get_jail_choice(player) == "card"
+            ai_choice in (None, "card")
+            if player.get("is_ai", False)
+            else self.game and self.game.get_jail_choice(player) == "card"
         ):
             self.jail_free_cards[player["name"]] -= 1
             player["in_jail"] = False
@@ -501,9 +578,9 @@ class GameLogic:
             )
 
         if player["money"] >= 50 and (
-            player.get("is_ai", False)
-            or self.game
-            and self.game.get_jail_choice(player) == "pay"
+            ai_choice in (None, "pay")
+            if player.get("is_ai", False)
+            else self.game and self.game.get_jail_choice(player) == "pay"
         ):
             player["money"] -= 50
             self.free_parking_fund += 50
@@ -531,6 +608,35 @@ class GameLogic:
 
         return False, f"{player['name']} stays in jail (turn {player['jail_turns']}/3)"
 
+    def apply_jail_choice(self, player, choice):
+        """Apply the choice made at the start of a jail turn and say how the turn goes on"""
+        # "card", "pay" and "fine" leave jail, "roll" tries for doubles, "bankrupt"
+        # leaves jail without the fine and "stay" ends the turn in jail
+        name = player["name"]
+        if choice == "card" and self.jail_free_cards.get(name, 0) > 0:
+            self.jail_free_cards[name] -= 1
+            outcome = "card"
+        elif choice == "pay" and player["money"] >= 50:
+            player["money"] -= 50
+            self.free_parking_fund += 50
+            outcome = "pay"
+        elif choice == "roll":
+            return "roll"
+        else:
+            player["jail_turns"] = player.get("jail_turns", 0) + 1
+            if choice == "stay" or player["jail_turns"] < 3:
+                return "stay"
+            if player["money"] >= 50:
+                player["money"] -= 50
+                self.free_parking_fund += 50
+                outcome = "fine"
+            else:
+                outcome = "bankrupt"
+
+        player["in_jail"] = False
+        player["jail_turns"] = 0
+        return outcome
+
     def check_game_over(self):
         if self.game_mode == "full":
             active_players = [p for p in self.players if p["money"] > 0]
@@ -545,13 +651,10 @@ class GameLogic:
                 assets = {}
                 for player in self.players:
                     total = player["money"]
-                    for prop in self.properties.values():
-                        if prop.get("owner") == player["name"]:
-                            total += prop["price"]
-                            if not prop.get("is_mortgaged", False):
-                                total += prop.get("houses", 0) * prop.get(
-                                    "house_cost", 0
-                                )
+                    for prop in self.properties.get_owned(player["name"]):
+                        total += prop["price"]
+                        if not prop.get("is_mortgaged", False):
+                            total += prop.get("houses", 0) * prop.get("house_cost", 0)
                     assets[player["name"]] = total
                 winner = max(assets.items(), key=lambda x: x[1])[0]
                 return True, winner
@@ -559,45 +662,18 @@ class GameLogic:
         return False, None
 
     def calculate_space_rent(self, space, player):
+        dice_total = sum(self.last_dice_roll) if self.last_dice_roll else 7
+        if getattr(space, "registry", None) is self.properties:
+            return self.rent_table.get_rent(space.key, dice_total)
+
+        # Copies of a space are not in the table, so work their rent out directly
         if space.get("is_mortgaged", False):
             return 0
-
-        if "Station" in space["name"]:
-            station_count = sum(
-                1
-                for prop in self.properties.values()
-                if "Station" in prop.get("name", "")
-                and prop.get("owner") == space["owner"]
-            )
-            return 25 * (2 ** (station_count - 1))
-
-        elif space["name"] in ["Tesla Power Co", "Edison Water"]:
-            utility_count = sum(
-                1
-                for prop in self.properties.values()
-                if prop.get("name") in ["Tesla Power Co", "Edison Water"]
-                and prop.get("owner") == space["owner"]
-            )
-            dice_total = sum(self.last_dice_roll) if self.last_dice_roll else 7
-            return dice_total * (10 if utility_count > 1 else 4)
-
-        base_rent = space.get("rent", 0)
-        if space.get("houses", 0) > 0:
-            house_rents = space.get("house_costs", [])
-            house_index = min(space["houses"] - 1, len(house_rents) - 1)
-            return house_rents[house_index]
-
-        color_group = space.get("group")
-        if color_group:
-            all_owned = all(
-                p.get("owner") == space["owner"]
-                for p in self.properties.values()
-                if p.get("group") == color_group
+        if space.get("type") == "utility":
+            return dice_total * self.rent_table.get_utility_multiplier(
+                space.get("owner")
             )
-            if all_owned:
-                return base_rent * 2
-
-        return base_rent
+        return self.rent_table.calculate_rent(space, space.get("owner"))
 
     def handle_card_draw(self, player, card_type):
         cards = (
@@ -650,35 +726,21 @@ class GameLogic:
 
     def calculate_repair_cost(self, player, house_cost, hotel_cost):
         total_cost = 0
-        for prop in self.properties.values():
-            if prop.get("owner") == player["name"]:
-                houses = prop.get("houses", 0)
-                if houses == 5:
-                    total_cost += hotel_cost
-                else:
-                    total_cost += houses * house_cost
+        for prop in self.properties.get_owned(player["name"]):
+            houses = prop.get("houses", 0)
+            if houses == 5:
+                total_cost += hotel_cost
+            else:
+                total_cost += houses * house_cost
         return total_cost
 
     def check_property_group_completion(self, player_name):
-        groups = {}
-        for prop in self.properties.values():
-            if prop.get("group") and prop.get("owner") == player_name:
-                groups[prop["group"]] = groups.get(prop["group"], 0) + 1
-
-        group_totals = {}
-        for prop in self.properties.values():
-            if prop.get("group"):
-                group = prop["group"]
-                group_totals[group] = group_totals.get(group, 0) + 1
-
-        completed_groups = []
-        for group, count in groups.items():
-            if group in group_totals and count == group_totals[group]:
-                completed_groups.append(group)
-                self.add_message(f"🎊 MONOPOLY! 🎊")
-                self.add_message(f"{player_name} completed the {group} set!")
-                if group not in ["Utilities", "Stations"]:
-                    self.add_message(f"Houses can now be built on these properties!")
+        completed_groups = self.properties.get_completed_groups(player_name)
+        for group in completed_groups:
+            self.add_message(f"🎊 MONOPOLY! 🎊")
+            self.add_message(f"{player_name} completed the {group} set!")
+            if group not in ["Utilities", "Stations"]:
+                self.add_message(f"Houses can now be built on these properties!")
 
         return len(completed_groups) > 0
 
@@ -750,11 +812,13 @@ class GameLogic:
             "current_bid": 0,
             "minimum_bid": starting_bid,
             "current_bidder_index": 0,
-            "start_time": pygame.time.get_ticks(),
-            "duration": 30000,
+            "start_time": self.clock(),
+            "duration": AUCTION_TURN_MS,
             "completed": False,
+            "settled": False,
             "message": f"Auction started for {property_data['name']} - Starting bid: £{starting_bid}",
         }
+        self.auction_engine.start(self.current_auction)
 
         print(f"Auction initialized with {len(eligible_players)} active players")
         print(f"First bidder: {self.current_auction['active_players'][0]['name']}")
@@ -767,7 +831,7 @@ class GameLogic:
         print(f"\n=== Processing Bid: {player['name']} ===")
         print(f"Attempted bid amount: £{bid_amount}")
 
-        if not hasattr(self, "current_auction") or self.current_auction["completed"]:
+        if not self.current_auction or self.current_auction["completed"]:
             print("Error: No active auction")
             return False, "No active auction in progress"
 
@@ -785,17 +849,11 @@ class GameLogic:
             print(f"Error: Insufficient funds (available: £{player['money']})")
             return False, "You don't have enough money"
 
-        current_time = pygame.time.get_ticks()
-        remaining_time = max(
-            0,
-            self.current_auction["start_time"]
-            + self.current_auction["duration"]
-            - current_time,
-        )
+        remaining_time = self.auction_engine.time_remaining(self.current_auction)
 
         if remaining_time <= 0:
             print("Error: Bid timeout")
-            self.current_auction["passed_players"].add(player["name"])
+            self.process_auction_pass(player)
             return (
                 False,
                 f"{player['name']} took too long to bid - automatically passed",
@@ -809,18 +867,22 @@ class GameLogic:
         )
         print(f"- New leader: {player['name']}")
 
+        self.record_decision(BID_EVENT, player, bid_amount)
         self.current_auction["current_bid"] = bid_amount
         self.current_auction["highest_bidder"] = player
         self.current_auction["minimum_bid"] = bid_amount + 10
 
         self.add_message(f"{player['name']} bids £{bid_amount}")
+        self.auction_engine.emit(
+            AUCTION_BID_ACCEPTED, self.current_auction, player=player, amount=bid_amount
+        )
         self.move_to_next_bidder()
         return True, f"{player['name']} bids £{bid_amount}"
 
     def process_auction_pass(self, player):
         print(f"\n=== Processing Pass: {player['name']} ===")
 
-        if not hasattr(self, "current_auction") or self.current_auction["completed"]:
+        if not self.current_auction or self.current_auction["completed"]:
             print("Error: No active auction")
             return False, "No active auction in progress"
 
@@ -829,8 +891,12 @@ class GameLogic:
             return False, "You have already passed on this auction"
 
         print(f"{player['name']} passes on bidding")
+        self.record_decision(BID_EVENT, player)
         self.current_auction["passed_players"].add(player["name"])
         self.add_message(f"{player['name']} passes")
+        self.auction_engine.emit(
+            AUCTION_BIDDER_PASSED, self.current_auction, player=player
+        )
 
         active_bidders = [
             p
@@ -845,32 +911,45 @@ class GameLogic:
         self.move_to_next_bidder()
         return True, f"{player['name']} passes"
 
-    def check_auction_end(self):
-        if not hasattr(self, "current_auction") or not self.current_auction:
-            return None
+    def close_auction(self):
+        """Mark the current auction as completed and settle it, once"""
+        auction = self.current_auction
+        if not auction:
+            return
+        auction["completed"] = True
+        if auction.get("settled", False):
+            return
+        auction["settled"] = True
+        print("Auction is marked as completed - processing outcome")
 
-        if self.current_auction.get("completed", False):
-            print("Auction is marked as completed - processing outcome")
+        property_data = auction["property"]
+        highest_bidder = auction["highest_bidder"]
 
-            property_data = self.current_auction["property"]
-            highest_bidder = self.current_auction["highest_bidder"]
+        if highest_bidder:
+            bid_amount = auction["current_bid"]
+            highest_bidder["money"] -= bid_amount
+            self.bank_money += bid_amount
+            self.buy_property_after_auction(highest_bidder, property_data)
 
-            if highest_bidder:
-                bid_amount = self.current_auction["current_bid"]
-                highest_bidder["money"] -= bid_amount
-                self.bank_money += bid_amount
-                self.buy_property_after_auction(highest_bidder, property_data)
+            result_message = f"{highest_bidder['name']} bought {property_data['name']} for £{bid_amount}"
+            print(f"Auction completed - {result_message}")
+            self.add_message(result_message)
+        else:
+            result_message = f"No one bid on {property_data['name']}, it remains unsold"
+            print(f"Auction completed - {result_message}")
+            self.add_message(result_message)
 
-                result_message = f"{highest_bidder['name']} bought {property_data['name']} for £{bid_amount}"
-                print(f"Auction completed - {result_message}")
-                self.add_message(result_message)
-            else:
-                result_message = (
-                    f"No one bid on {property_data['name']}, it remains unsold"
-                )
-                print(f"Auction completed - {result_message}")
-                self.add_message(result_message)
+        self.auction_engine.finish(auction)
 
+    def check_auction_end(self):
+        if not self.current_auction:
+            return None
+
+        # Deadlines live on the engine's timer heap, so this only looks at the earliest one
+        self.auction_engine.poll()
+
+        if self.current_auction.get("completed", False):
+            self.close_auction()
             return "auction_completed"
 
         active_bidders = [
@@ -887,22 +966,13 @@ class GameLogic:
             print(
                 "All players have passed or only highest bidder remains - auction is complete"
             )
-            self.current_auction["completed"] = True
-            return self.check_auction_end()
-
-        current_time = pygame.time.get_ticks()
-        if (
-            current_time - self.current_auction["start_time"]
-            > self.current_auction["duration"]
-        ):
-            print("Auction timed out - marking as complete")
-            self.current_auction["completed"] = True
-            return self.check_auction_end()
+            self.close_auction()
+            return "auction_completed"
 
         return None
 
     def move_to_next_bidder(self):
-        if not hasattr(self, "current_auction"):
+        if not self.current_auction:
             print("Error: No active auction")
             return
 
@@ -926,7 +996,7 @@ class GameLogic:
                 print(
                     f"Auction ending - {self.current_auction['highest_bidder']['name']} wins with bid of £{self.current_auction['current_bid']}"
                 )
-                self.current_auction["completed"] = True
+                self.close_auction()
                 return
             elif (
                 len(active_players) == 1 and not self.current_auction["highest_bidder"]
@@ -940,7 +1010,7 @@ class GameLogic:
                         break
             else:
                 print("No active players or highest bidder - auction will end")
-                self.current_auction["completed"] = True
+                self.close_auction()
                 return
         else:
             current_index = self.current_auction["current_bidder_index"]
@@ -971,10 +1041,10 @@ class GameLogic:
 
                 if current_index == original_index:
                     print("Cycled through all players - no eligible bidders found")
-                    self.current_auction["completed"] = True
+                    self.close_auction()
                     return
 
-        self.current_auction["start_time"] = pygame.time.get_ticks()
+        self.auction_engine.restart_turn(self.current_auction)
         print(f"Timer reset for next bidder")
 
     def is_game_over(self):
@@ -993,15 +1063,15 @@ class GameLogic:
         return None
 
     def remove_player(self, player_name, voluntary=False):
-        player = next((p for p in self.players if p["name"] == player_name), None)
+        player = self.get_player(player_name)
         if player:
-            for prop in self.properties.values():
-                if prop.get("owner") == player_name:
-                    prop["owner"] = None
-                    if "houses" in prop:
-                        prop["houses"] = 0
+            for prop in self.properties.get_owned(player_name):
+                prop["owner"] = None
+                if "houses" in prop:
+                    prop["houses"] = 0
 
             if voluntary:
+                self.record_decision(EXIT_EVENT, player)
                 player["exited"] = True
                 self.voluntary_exits.append(player_name)
             else:
@@ -1148,105 +1218,110 @@ class GameLogic:
         print("\nAuction ended with no winner")
         return None
 
-    def get_ai_bid(self, player, current_minimum, property_data):
-        print(f"\n=== AI Bid Evaluation ===")
-        print(f"AI Player: {player['name']}")
-        print(f"Property: {property_data['name']}")
-        print(f"Current minimum: £{current_minimum}")
-        print(f"Available money: £{player['money']}")
-
-        if player["money"] < current_minimum:
-            print("DECISION: Cannot bid - insufficient funds")
-            return None
-
+    def calculate_ai_property_value(self, player, property_data):
         base_value = property_data["price"]
         value_multiplier = 1.0
 
-        print(f"Base value assessment:")
-        print(f"- Property price: £{base_value}")
+        logger.debug("Base value assessment:")
+        logger.debug("- Property price: £%s", base_value)
 
         if "group" in property_data:
-            owned_in_group = sum(
-                1
-                for p in self.properties.values()
-                if p.get("group") == property_data["group"]
-                and p.get("owner") == player["name"]
-            )
-            total_in_group = sum(
-                1
-                for p in self.properties.values()
-                if p.get("group") == property_data["group"]
+            owned_in_group = self.properties.count_owned_in_group(
+                player["name"], property_data["group"]
             )
+            total_in_group = self.properties.get_group_size(property_data["group"])
 
-            print(f"Group analysis:")
-            print(f"- Group: {property_data['group']}")
-            print(f"- Owned in group: {owned_in_group}/{total_in_group}")
+            logger.debug("Group analysis:")
+            logger.debug("- Group: %s", property_data["group"])
+            logger.debug("- Owned in group: %s/%s", owned_in_group, total_in_group)
 
             if owned_in_group > 0:
                 group_bonus = 0.3 * (owned_in_group / total_in_group)
                 value_multiplier += group_bonus
-                print(f"- Adding group bonus: +{group_bonus:.2f}x")
+                logger.debug("- Adding group bonus: +%.2fx", group_bonus)
 
         if "Station" in property_data["name"]:
-            owned_stations = sum(
-                1
-                for p in self.properties.values()
-                if "Station" in p.get("name", "") and p.get("owner") == player["name"]
+            owned_stations = self.properties.count_owned_of_type(
+                player["name"], "station"
             )
             station_bonus = 0.25 * owned_stations
             value_multiplier += station_bonus
-            print(f"Station analysis:")
-            print(f"- Owned stations: {owned_stations}")
-            print(f"- Adding station bonus: +{station_bonus:.2f}x")
+            logger.debug("Station analysis:")
+            logger.debug("- Owned stations: %s", owned_stations)
+            logger.debug("- Adding station bonus: +%.2fx", station_bonus)
 
         elif property_data["name"] in ["Tesla Power Co", "Edison Water"]:
-            owned_utilities = sum(
-                1
-                for p in self.properties.values()
-                if p.get("name") in ["Tesla Power Co", "Edison Water"]
-                and p.get("owner") == player["name"]
+            owned_utilities = self.properties.count_owned_of_type(
+                player["name"], "utility"
             )
-            print(f"Utility analysis:")
-            print(f"- Owned utilities: {owned_utilities}")
+            logger.debug("Utility analysis:")
+            logger.debug("- Owned utilities: %s", owned_utilities)
             if owned_utilities > 0:
                 value_multiplier += 0.5
-                print("- Adding utility bonus: +0.5x")
+                logger.debug("- Adding utility bonus: +0.5x")
+
+        from src.Landing_Model import get_landing_model
+
+        landing_model = get_landing_model()
+        if landing_model and "position" in property_data:
+            landing_weight = landing_model.get_landing_weight(property_data["position"])
+            value_multiplier *= landing_weight
+            logger.debug("- Landing frequency weight: %.2fx", landing_weight)
 
         perceived_value = base_value * value_multiplier
-        print(f"\nValue calculation:")
-        print(f"- Base value: £{base_value}")
-        print(f"- Final multiplier: {value_multiplier:.2f}x")
-        print(f"- Perceived value: £{perceived_value}")
+        logger.debug("Value calculation:")
+        logger.debug("- Base value: £%s", base_value)
+        logger.debug("- Final multiplier: %.2fx", value_multiplier)
+        logger.debug("- Perceived value: £%s", perceived_value)
+        return perceived_value
+
+    def get_ai_bid(self, player, current_minimum, property_data):
+        logger.debug("=== AI Bid Evaluation ===")
+        logger.debug("AI Player: %s", player["name"])
+        logger.debug("Property: %s", property_data["name"])
+        logger.debug("Current minimum: £%s", current_minimum)
+        logger.debug("Available money: £%s", player["money"])
+
+        if player["money"] < current_minimum:
+            logger.debug("DECISION: Cannot bid - insufficient funds")
+            return None
+
+        # Reused until the board's ownership or development changes
+        perceived_value = get_cached_valuation(
+            "bid",
+            property_data,
+            self.properties.get_owned(player["name"]),
+            lambda: self.calculate_ai_property_value(player, property_data),
+        )
 
         max_bid = min(player["money"], perceived_value)
-        print(f"Maximum possible bid: £{max_bid}")
+        logger.debug("Maximum possible bid: £%s", max_bid)
 
         if max_bid <= current_minimum:
-            print("DECISION: Pass - maximum bid below minimum")
+            logger.debug("DECISION: Pass - maximum bid below minimum")
             return None
 
-        import random
-
         bid_headroom = max_bid - current_minimum
         increment = min(50, max(10, int(bid_headroom * 0.2)))
-        bid = current_minimum + random.randint(10, increment)
+        ai_rng = self.rng_service.ai_stream(player["name"])
+        bid = current_minimum + ai_rng.randint(10, increment)
         bid = min(bid, max_bid)
 
-        print(f"Bid calculation:")
-        print(f"- Bid headroom: £{bid_headroom}")
-        print(f"- Chosen increment: £{increment}")
-        print(f"- Initial bid: £{bid}")
+        logger.debug("Bid calculation:")
+        logger.debug("- Bid headroom: £%s", bid_headroom)
+        logger.debug("- Chosen increment: £%s", increment)
+        logger.debug("- Initial bid: £%s", bid)
 
         if bid > perceived_value * 0.8:
-            risky_bid_chance = random.random()
-            print(f"\nRisk assessment:")
-            print(f"- Bid (£{bid}) is above 80% of perceived value")
-            print(f"- Risk check: {risky_bid_chance:.2f} (will pass if < 0.3)")
+            risky_bid_chance = ai_rng.random()
+            logger.debug("Risk assessment:")
+            logger.debug("- Bid (£%s) is above 80%% of perceived value", bid)
+            logger.debug("- Risk check: %.2f (will pass if < 0.3)", risky_bid_chance)
             if risky_bid_chance < 0.3:
-                print("DECISION: Pass due to risk assessment")
+                logger.debug("DECISION: Pass due to risk assessment")
                 return None
 
-        print(f"FINAL DECISION: Bid £{bid}")
+        logger.debug("FINAL DECISION: Bid £%s", bid)
         return bid
 
     def get_human_bid(self, player, current_minimum, property_data):
@@ -1320,18 +1395,17 @@ class GameLogic:
         total_liquidated = 0
         property_list = []
 
-        for prop in self.properties.values():
-            if prop.get("owner") == player["name"]:
-                value = prop["price"]
-                if "houses" in prop and prop["houses"] > 0:
-                    house_costs = prop.get("house_costs", [])
-                    if house_costs and isinstance(house_costs, list):
-                        house_value = sum(house_costs[: prop["houses"]])
-                    else:
-                        house_value = 0
-                    value += house_value
-                property_list.append((prop["name"], value))
-                total_liquidated += value
+        for prop in self.properties.get_owned(player["name"]):
+            value = prop["price"]
+            if "houses" in prop and prop["houses"] > 0:
+                house_costs = prop.get("house_costs", [])
+                if house_costs and isinstance(house_costs, list):
+                    house_value = sum(house_costs[: prop["houses"]])
+                else:
+                    house_value = 0
+                value += house_value
+            property_list.append((prop["name"], value))
+            total_liquidated += value
 
         if property_list:
             self.add_message(f"🏦 Liquidating {player['name']}'s properties:")
@@ -1339,14 +1413,14 @@ class GameLogic:
                 self.add_message(f"- {prop_name}: £{value}")
             self.add_message(f"Total liquidated: £{total_liquidated}")
 
-        for prop in self.properties.values():
-            if prop.get("owner") == player["name"]:
-                prop["owner"] = None
-                if "houses" in prop:
-                    prop["houses"] = 0
+        for prop in self.properties.get_owned(player["name"]):
+            prop["owner"] = None
+            if "houses" in prop:
+                prop["houses"] = 0
 
         player["bankrupt"] = True
         self.players.remove(player)
+        self.player_store.remove(player["name"])
         self.bankrupted_players.append(player["name"])
 
         if len(self.players) > 0:
@@ -1371,9 +1445,7 @@ class GameLogic:
             print("Cannot build - not a valid property group")
             return False, "Cannot build houses on this type of property"
 
-        color_group_properties = [
-            p for p in self.properties.values() if p.get("group") == color_group
-        ]
+        color_group_properties = self.properties.get_group(color_group)
 
         print(f"Total properties in group: {len(color_group_properties)}")
         for prop in color_group_properties:
@@ -1415,9 +1487,8 @@ class GameLogic:
 
         color_group = [
             p
-            for p in self.properties.values()
+            for p in self.properties.get_owned(player["name"])
             if p.get("color") == property_data.get("color")
-            and p.get("owner") == player["name"]
         ]
 
         current_houses = property_data.get("houses", 0)
@@ -1435,7 +1506,18 @@ class GameLogic:
 
         return True, None
 
+    def get_house_cost(self, property_data):
+        # The board data has no house_cost column, so a house costs half the
+        # property price, as the development panel shows
+        return property_data.get("house_cost", property_data.get("price", 0) // 2)
+
+    def record_development(self, action, property_data, player):
+        self.record_decision(
+            DEVELOP_EVENT, player, [action, str(property_data.get("position"))]
+        )
+
     def build_house(self, property_data, player):
+        self.record_development("build_house", property_data, player)
         can_build, error = self.can_build_house(property_data, player)
         if not can_build:
             self.add_message(error)
@@ -1446,7 +1528,7 @@ class GameLogic:
             self.add_message("Maximum number of houses already built")
             return False
 
-        house_cost = property_data.get("house_cost", 0)
+        house_cost = self.get_house_cost(property_data)
         if player["money"] >= house_cost:
             if self.validate_bank_transaction(house_cost):
                 player["money"] -= house_cost
@@ -1461,12 +1543,13 @@ class GameLogic:
         return False
 
     def build_hotel(self, property_data, player):
+        self.record_development("build_hotel", property_data, player)
         can_build, error = self.can_build_hotel(property_data, player)
         if not can_build:
             self.add_message(error)
             return False
 
-        hotel_cost = property_data.get("house_cost", 0)
+        hotel_cost = self.get_house_cost(property_data)
         if player["money"] >= hotel_cost:
             if self.validate_bank_transaction(hotel_cost):
                 player["money"] -= hotel_cost
@@ -1481,6 +1564,7 @@ class GameLogic:
         return False
 
     def sell_house(self, property_data, player):
+        self.record_development("sell_house", property_data, player)
         current_houses = property_data.get("houses", 0)
         if current_houses == 0:
             self.add_message("No houses to sell")
@@ -1488,9 +1572,8 @@ class GameLogic:
 
         color_group = [
             p
-            for p in self.properties.values()
+            for p in self.properties.get_owned(player["name"])
             if p.get("color") == property_data.get("color")
-            and p.get("owner") == player["name"]
         ]
 
         for prop in color_group:
@@ -1502,7 +1585,7 @@ class GameLogic:
                     )
                     return False
 
-        house_cost = property_data.get("house_cost", 0)
+        house_cost = self.get_house_cost(property_data)
         player["money"] += house_cost // 2
         self.bank_money -= house_cost // 2
         property_data["houses"] = current_houses - 1
@@ -1510,11 +1593,12 @@ class GameLogic:
         return True
 
     def sell_hotel(self, property_data, player):
+        self.record_development("sell_hotel", property_data, player)
         if property_data.get("houses", 0) != 5:
             self.add_message("No hotel to sell")
             return False
 
-        hotel_cost = property_data.get("house_cost", 0) * 5
+        hotel_cost = self.get_house_cost(property_data) * 5
         player["money"] += hotel_cost // 2
         self.bank_money -= hotel_cost // 2
         property_data["houses"] = 4
@@ -1522,6 +1606,7 @@ class GameLogic:
         return True
 
     def mortgage_property(self, property_data, player):
+        self.record_development("mortgage_property", property_data, player)
         if property_data.get("is_mortgaged", False):
             self.add_message(f"{property_data['name']} is already mortgaged")
             return False
@@ -1539,6 +1624,7 @@ class GameLogic:
         return True
 
     def unmortgage_property(self, property_data, player):
+        self.record_development("unmortgage_property", property_data, player)
         if not property_data.get("is_mortgaged", False):
             self.add_message(f"{property_data['name']} is not mortgaged")
             return False
@@ -1560,9 +1646,7 @@ class GameLogic:
             self.add_message(f"Property is mortgaged - no rent due")
             return True
 
-        owner = next(
-            (p for p in self.players if p["name"] == property_data["owner"]), None
-        )
+        owner = self.get_player(property_data["owner"])
         if not owner or owner.get("in_jail", False):
             self.add_message(f"Owner is in jail - no rent collected")
             return True
@@ -1610,11 +1694,7 @@ class GameLogic:
                 player["in_jail"] = False
                 player["jail_turns"] = 0
 
-        owned_properties = [
-            prop
-            for prop in self.properties.values()
-            if prop.get("owner") == player["name"]
-        ]
+        owned_properties = self.properties.get_owned(player["name"])
         development_priorities = self.ai_player.get_development_priority(
             owned_properties
         )
@@ -1642,17 +1722,31 @@ class GameLogic:
 
         return None
 
+    def prepare_ai_jail_choice(self, player, choice):
+        """Keep a jail choice worked out ahead of time for the player's next jail check"""
+        self.prepared_jail_choices[player["name"]] = choice
+
+    def get_ai_jail_choice(self, player):
+        if player["name"] in self.prepared_jail_choices:
+            return self.prepared_jail_choices.pop(player["name"])
+        return self.decide_ai_jail_choice(player)
+
+    def decide_ai_jail_choice(self, player):
+        # None means the AI takes the first way out it has, as easy and hard always do
+        if not player.get("is_ai", False):
+            return None
+        get_jail_choice = getattr(self.ai_player, "get_jail_choice", None)
+        if get_jail_choice is None:
+            return None
+        return get_jail_choice(player)
+
     def process_ai_property_purchase(self, player, property_data):
         if not player.get("is_ai", False):
             return False
 
-        owned_properties = [
-            prop
-            for prop in self.properties.values()
-            if prop.get("owner") == player["name"]
-        ]
+        owned_properties = self.properties.get_owned(player["name"])
         if self.ai_player.should_buy_property(
-            property_data, player["money"], owned_properties
+            property_data, player["money"], owned_properties, player["name"]
         ):
             if property_data["price"] <= player["money"]:
                 self.pay_to_bank(player, property_data["price"])
@@ -1668,25 +1762,25 @@ class GameLogic:
             return None
 
         try:
-            print(f"\n=== AI Auction Bid Logic ===")
-            print(f"AI Player: {player['name']}")
-            print(f"Property: {property_data['name']}")
-            print(f"Current bid: £{current_bid}")
-            print(f"Player money: £{player['money']}")
+            logger.debug("=== AI Auction Bid Logic ===")
+            logger.debug("AI Player: %s", player["name"])
+            logger.debug("Property: %s", property_data["name"])
+            logger.debug("Current bid: £%s", current_bid)
+            logger.debug("Player money: £%s", player["money"])
 
             minimum_bid = max(current_bid + 10, property_data["price"] // 2)
             if player["money"] < minimum_bid:
-                print(f"AI can't afford minimum bid of £{minimum_bid}")
+                logger.debug("AI can't afford minimum bid of £%s", minimum_bid)
                 return None
 
-            owned_properties = [
-                prop
-                for prop in self.properties.values()
-                if prop.get("owner") == player["name"]
-            ]
+            owned_properties = self.properties.get_owned(player["name"])
 
             bid_amount = self.ai_player.make_auction_bid(
-                property_data, current_bid, player["money"], owned_properties
+                property_data,
+                current_bid,
+                player["money"],
+                owned_properties,
+                player["name"],
             )
 
             if (
@@ -1695,10 +1789,10 @@ class GameLogic:
                 and bid_amount <= player["money"]
             ):
                 bid_amount = max(bid_amount, current_bid + 10)
-                print(f"AI {player['name']} decided to bid £{bid_amount}")
+                logger.debug("AI %s decided to bid £%s", player["name"], bid_amount)
                 return bid_amount
             else:
-                print(f"AI {player['name']} decided to pass")
+                logger.debug("AI %s decided to pass", player["name"])
                 return None
         except Exception as e:
             print(f"Error in AI auction bidding: {e}")
@@ -1706,11 +1800,7 @@ class GameLogic:
 
     def handle_ai_bankruptcy_prevention(self, player, amount_needed):
 
-        owned_properties = [
-            prop
-            for prop in self.properties.values()
-            if prop.get("owner") == player["name"]
-        ]
+        owned_properties = self.properties.get_owned(player["name"])
         if not owned_properties:
             return False
 
@@ -1722,13 +1812,20 @@ class GameLogic:
                         f"{player['name']} sold hotel on {prop['name']} to raise funds"
                     )
                 else:
-                    self.sell_house(prop, player)
+                    if not self.sell_house(prop, player):
+                        break
                     self.add_message(
                         f"{player['name']} sold house on {prop['name']} to raise funds"
                     )
                 if player["money"] >= amount_needed:
                     return True
 
+        get_mortgage_order = getattr(self.ai_player, "get_mortgage_order", None)
+        if get_mortgage_order is not None:
+            owned_properties = get_mortgage_order(
+                player, owned_properties, amount_needed
+            )
+
         for prop in owned_properties:
             if not prop.get("is_mortgaged", False) and player["money"] < amount_needed:
                 if prop.get("houses", 0) == 0:
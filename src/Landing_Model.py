@@ -0,0 +1,205 @@
+# Property Tycoon Landing_Model.py
+# It contains the Markov-chain model of the board, which gives landing probabilities per space.
+
+import hashlib
+import json
+import threading
+import numpy as np
+from src.Loadexcel import load_property_data
+from src.Game_Logic import pot_luck_cards, opportunity_knocks_cards
+
+BOARD_SIZE = 40
+JAIL_POSITION = 11
+GO_TO_JAIL_POSITION = 31
+POT_LUCK_SPACES = [3, 18, 34]
+OPPORTUNITY_KNOCKS_SPACES = [8, 23, 37]
+
+# Roll states are (position, doubles rolled this turn) plus three in-jail states
+DOUBLES_STATES = 3
+JAIL_STATES = 3
+STATE_COUNT = BOARD_SIZE * DOUBLES_STATES + JAIL_STATES
+
+OWNABLE_TYPES = ("property", "station", "utility")
+
+# Large enough that a money result from a card can never look like a position
+PROBE_MONEY = 10**9
+
+STATIC_FIELDS = ("name", "position", "type", "group", "price", "rent", "house_costs")
+
+_model_cache = {}
+_model_lock = threading.Lock()
+
+
+def _dice_distribution():
+    doubles = np.zeros(13)
+    others = np.zeros(13)
+    for dice1 in range(1, 7):
+        for dice2 in range(1, 7):
+            if dice1 == dice2:
+                doubles[dice1 + dice2] += 1 / 36
+            else:
+                others[dice1 + dice2] += 1 / 36
+    return doubles, others
+
+
+def _move_matrix(distribution):
+    # move[i, j] is the chance of going from space i to space j with this roll
+    identity = np.eye(BOARD_SIZE)
+    return sum(
+        probability * np.roll(identity, total, axis=1)
+        for total, probability in enumerate(distribution)
+        if probability
+    )
+
+
+def _card_destination(card, position):
+    # Returns the space a card sends a player on `position` to, or None for jail
+    if card["text"] == "Get out of jail free":
+        return position
+    if card["text"].lower().startswith("go to jail"):
+        return None
+
+    probe = {"name": "", "position": position, "money": PROBE_MONEY}
+    try:
+        result, _, _ = card["action"](probe, 0, 0)
+    except (AttributeError, TypeError):
+        # Payment cards need the live board and never move the player
+        return position
+
+    if isinstance(result, int) and 1 <= result <= BOARD_SIZE:
+        return result
+    return position
+
+
+def _resolution_matrix():
+    # resolution[i, j] is the chance that arriving on space i ends the move on j;
+    # the extra last column is going to jail
+    resolution = np.zeros((BOARD_SIZE, BOARD_SIZE + 1))
+    for position in range(1, BOARD_SIZE + 1):
+        index = position - 1
+        if position == GO_TO_JAIL_POSITION:
+            resolution[index, BOARD_SIZE] = 1.0
+            continue
+
+        if position in POT_LUCK_SPACES:
+            deck = pot_luck_cards
+        elif position in OPPORTUNITY_KNOCKS_SPACES:
+            deck = opportunity_knocks_cards
+        else:
+            resolution[index, index] = 1.0
+            continue
+
+        for card in deck:
+            destination = _card_destination(card, position)
+            column = BOARD_SIZE if destination is None else destination - 1
+            resolution[index, column] += 1 / len(deck)
+    return resolution
+
+
+def build_transition_matrix(jail_strategy="leave"):
+    # jail_strategy "leave" pays the fine straight away like the AI players do,
+    # "stay" waits for doubles until the third turn forces the fine
+    doubles, others = _dice_distribution()
+    resolution = _resolution_matrix()
+    double_moves = _move_matrix(doubles) @ resolution
+    other_moves = _move_matrix(others) @ resolution
+
+    transition = np.zeros((STATE_COUNT, STATE_COUNT))
+    jail_state = BOARD_SIZE * DOUBLES_STATES
+
+    def add_moves(rows, columns_block, moves):
+        start = columns_block * BOARD_SIZE
+        transition[rows, start : start + BOARD_SIZE] += moves[:, :BOARD_SIZE]
+        transition[rows, jail_state] += moves[:, BOARD_SIZE]
+
+    for doubles_rolled in range(DOUBLES_STATES):
+        rows = slice(doubles_rolled * BOARD_SIZE, (doubles_rolled + 1) * BOARD_SIZE)
+        add_moves(rows, 0, other_moves)
+        if doubles_rolled + 1 < DOUBLES_STATES:
+            add_moves(rows, doubles_rolled + 1, double_moves)
+        else:
+            # Third double in a row goes straight to jail
+            transition[rows, jail_state] += doubles.sum()
+
+    jail_index = JAIL_POSITION - 1
+    for turns_served in range(JAIL_STATES):
+        row = jail_state + turns_served
+        add_moves([row], 1, double_moves[[jail_index]])
+        if jail_strategy == "stay" and turns_served + 1 < JAIL_STATES:
+            transition[row, row + 1] += others.sum()
+        else:
+            add_moves([row], 0, other_moves[[jail_index]])
+
+    return transition
+
+
+def solve_steady_state(transition):
+    size = len(transition)
+    system = transition.T - np.eye(size)
+    system[-1] = 1.0
+    target = np.zeros(size)
+    target[-1] = 1.0
+    return np.linalg.solve(system, target)
+
+
+def _board_hash(properties):
+    static = {
+        key: {field: space.get(field) for field in STATIC_FIELDS}
+        for key, space in properties.items()
+    }
+    encoded = json.dumps(static, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class LandingModel:
+    def __init__(self, properties, jail_strategy="leave"):
+        self.board_hash = _board_hash(properties)
+        self.jail_strategy = jail_strategy
+        self.transition = build_transition_matrix(jail_strategy)
+        self.steady_state = solve_steady_state(self.transition)
+
+        moving_states = self.steady_state[: BOARD_SIZE * DOUBLES_STATES]
+        jail_states = self.steady_state[BOARD_SIZE * DOUBLES_STATES :]
+
+        # Every roll state is an arrival except the turns spent sitting in jail
+        arrivals = moving_states.reshape(DOUBLES_STATES, BOARD_SIZE).sum(axis=0)
+        arrivals[JAIL_POSITION - 1] += jail_states[0]
+        turns = moving_states[:BOARD_SIZE].sum() + jail_states.sum()
+
+        # Expected landings on each space per turn, index 0 is position 1
+        self.landing_probability = arrivals / turns
+
+        ownable = np.zeros(BOARD_SIZE, dtype=bool)
+        for space in properties.values():
+            if space.get("type") in OWNABLE_TYPES:
+                ownable[space["position"] - 1] = True
+        self.average_ownable_probability = self.landing_probability[ownable].mean()
+
+    def get_landing_probability(self, position):
+        return float(self.landing_probability[int(position) - 1])
+
+    def get_landing_weight(self, position):
+        # How often a space is landed on compared with an average ownable space
+        return self.get_landing_probability(position) / self.average_ownable_probability
+
+
+def get_landing_model(properties=None, jail_strategy="leave"):
+    if properties is None:
+        # The shipped board is looked up once per process without rehashing
+        model = _model_cache.get(jail_strategy)
+        if model is not None:
+            return model
+        properties = load_property_data()
+        if properties is None:
+            return None
+        model = get_landing_model(properties, jail_strategy)
+        _model_cache[jail_strategy] = model
+        return model
+
+    key = (_board_hash(properties), jail_strategy)
+    with _model_lock:
+        model = _model_cache.get(key)
+        if model is None:
+            model = LandingModel(properties, jail_strategy)
+            _model_cache[key] = model
+    return model
@@ -1,15 +1,308 @@
 # Property Tycoon Loadexcel.py
 # It contains the classes for loading the property data, the game text, and the card data.
 
-import pandas as pd
 import os
+import json
+import hashlib
+import threading
+from types import MappingProxyType
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_DIR = "cache"
+
+# Parsed board data shared by every caller in this process, keyed by xlsx path
+_property_data_cache = {}
+_property_data_lock = threading.Lock()
+
+SPACE_FIELDS = {
+    "name": str,
+    "position": int,
+    "can_be_bought": bool,
+    "type": str,
+}
+
+TYPE_FIELDS = {
+    "tax": {"amount": int},
+    "special": {},
+    "station": {"price": int, "rent": int, "is_station": bool},
+    "utility": {"price": int, "rent": int, "is_utility": bool},
+    "property": {
+        "price": int,
+        "rent": int,
+        "house_costs": list,
+        "houses": int,
+        "is_mortgaged": bool,
+    },
+}
+
+
+def _get_snapshot_path(file_path):
+    current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    name = os.path.splitext(os.path.basename(file_path))[0]
+    return os.path.join(current_dir, SNAPSHOT_DIR, f"{name}.json")
+
+
+def _hash_file(file_path):
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _validate_property_data(properties_data):
+    if not isinstance(properties_data, dict) or not properties_data:
+        raise ValueError("Property data must be a non-empty dict")
+
+    for key, space in properties_data.items():
+        if not isinstance(space, dict):
+            raise ValueError(f"Space {key} is not a dict")
+
+        for field, field_type in SPACE_FIELDS.items():
+            if not isinstance(space.get(field), field_type):
+                raise ValueError(f"Space {key} has invalid '{field}'")
+
+        if key != str(space["position"]):
+            raise ValueError(f"Space {key} does not match its position")
+
+        if space["type"] not in TYPE_FIELDS:
+            raise ValueError(f"Space {key} has unknown type '{space['type']}'")
+
+        for field, field_type in TYPE_FIELDS[space["type"]].items():
+            value = space.get(field)
+            if not isinstance(value, field_type) or (
+                field_type is int and isinstance(value, bool)
+            ):
+                raise ValueError(f"Space {key} has invalid '{field}'")
+
+        for field in ("group", "action"):
+            if space.get(field) is not None and not isinstance(space[field], str):
+                raise ValueError(f"Space {key} has invalid '{field}'")
+
+        if space["type"] == "property" and not all(
+            isinstance(cost, int) for cost in space["house_costs"]
+        ):
+            raise ValueError(f"Space {key} has invalid 'house_costs'")
+
+    return True
+
+
+def _read_property_snapshot(snapshot_path):
+    if not os.path.exists(snapshot_path):
+        return None
+
+    try:
+        with open(snapshot_path, "r", encoding="utf-8") as f:
+            snapshot = json.load(f)
+
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            return None
+
+        source = snapshot["source"]
+        if not isinstance(source.get("sha256"), str):
+            return None
+
+        _validate_property_data(snapshot["properties"])
+        return snapshot
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+        print(f"Ignoring invalid property snapshot {snapshot_path}: {e}")
+        return None
+
+
+def _write_property_snapshot(snapshot_path, stat, source_hash, properties_data):
+    snapshot = {
+        "version": SNAPSHOT_VERSION,
+        "source": {
+            "mtime": stat.st_mtime,
+            "size": stat.st_size,
+            "sha256": source_hash,
+        },
+        "properties": properties_data,
+    }
+
+    try:
+        os.makedirs(os.path.dirname(snapshot_path), exist_ok=True)
+        temp_path = f"{snapshot_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(temp_path, snapshot_path)
+    except OSError as e:
+        print(f"Could not write property snapshot {snapshot_path}: {e}")
+
+
+def _freeze_property_data(properties_data):
+    return MappingProxyType(
+        {
+            key: MappingProxyType(
+                {
+                    field: tuple(value) if isinstance(value, list) else value
+                    for field, value in space.items()
+                }
+            )
+            for key, space in properties_data.items()
+        }
+    )
+
+
+def _copy_property_data(frozen_data):
+    return {
+        key: {
+            field: list(value) if isinstance(value, tuple) else value
+            for field, value in space.items()
+        }
+        for key, space in frozen_data.items()
+    }
+
+
+def _parse_property_workbook(file_path):
+    # pandas/openpyxl are only imported when the snapshot cannot be used
+    import pandas as pd
+
+    df = pd.read_excel(file_path, header=3)
+    df = df.fillna("")
+    print(f"Successfully read Excel file. Found {len(df)} rows")
+
+    properties_data = {}
+    for _, row in df.iterrows():
+        try:
+            if not str(row["Position"]).strip().isdigit():
+                continue
+
+            position = int(row["Position"])
+            property_name = str(row["Space/property"]).strip()
+
+            print(f"Processing position {position}: {property_name}")
+
+            property_data = {
+                "name": property_name,
+                "position": position,
+                "group": str(row["Group"]).strip() if row["Group"] else None,
+                "action": str(row["Action"]).strip() if row["Action"] else None,
+                "can_be_bought": str(row["Can be bought?"]).strip().lower() == "yes",
+            }
+
+            # Handle special spaces
+            if property_name in ["Income Tax", "Super Tax"]:
+                property_data.update(
+                    {
+                        "type": "tax",
+                        "amount": 200 if property_name == "Income Tax" else 100,
+                    }
+                )
+            elif property_name in ["Jail", "Go to Jail", "Free Parking", "Go"]:
+                property_data.update({"type": "special"})
+            # Handle stations
+            elif "Station" in property_name:
+                property_data.update(
+                    {
+                        "type": "station",
+                        "price": 200,
+                        "rent": 25,  # Base rent, multiplied based on number of stations owned
+                        "owner": None,
+                        "is_station": True,
+                    }
+                )
+            elif property_name in ["Tesla Power Co", "Edison Water"]:
+                property_data.update(
+                    {
+                        "type": "utility",
+                        "price": 150,
+                        "rent": 0,
+                        "owner": None,
+                        "is_utility": True,
+                    }
+                )
+            elif property_data["can_be_bought"] and row["£"]:
+                try:
+                    price_str = str(row["£"]).replace("£", "").strip()
+                    rent_str = str(row["£.1"]).replace("£", "").strip() or "0"
+
+                    property_data.update(
+                        {
+                            "type": "property",
+                            "price": int(float(price_str)),
+                            "rent": int(float(rent_str)),
+                            "owner": None,
+                            "house_costs": [],
+                            "houses": 0,
+                            "is_mortgaged": False,
+                        }
+                    )
+
+                    for i in range(2, 7):
+                        cost = row.get(f"£.{i}", "")
+                        if cost and str(cost).strip():
+                            try:
+                                cost_str = str(cost).replace("£", "").strip()
+                                property_data["house_costs"].append(
+                                    int(float(cost_str))
+                                )
+                            except (ValueError, TypeError):
+                                continue
+                except (ValueError, TypeError) as e:
+                    print(f"Error processing costs for position {position}: {e}")
+                    continue
+            else:
+                property_data.update({"type": "special"})
+
+            properties_data[str(position)] = property_data
+
+        except (ValueError, TypeError) as e:
+            print(f"Error processing row: {e}")
+            continue
+
+    positions_loaded = sorted([int(pos) for pos in properties_data.keys()])
+    print(f"Successfully loaded properties for positions: {positions_loaded}")
+    print(f"Total properties loaded: {len(properties_data)}")
+    return properties_data
+
+
+def _load_cached_property_data(file_path):
+    stat = os.stat(file_path)
+    cached = _property_data_cache.get(file_path)
+    if cached and cached["mtime"] == stat.st_mtime and cached["size"] == stat.st_size:
+        return _copy_property_data(cached["properties"])
+
+    snapshot_path = _get_snapshot_path(file_path)
+    snapshot = _read_property_snapshot(snapshot_path)
+    properties_data = None
+    source_hash = None
+
+    if snapshot:
+        source = snapshot["source"]
+        if source["mtime"] == stat.st_mtime and source["size"] == stat.st_size:
+            properties_data = snapshot["properties"]
+        else:
+            source_hash = _hash_file(file_path)
+            if source["sha256"] == source_hash:
+                properties_data = snapshot["properties"]
+                _write_property_snapshot(
+                    snapshot_path, stat, source_hash, properties_data
+                )
+
+    if properties_data is None:
+        print(f"Loading property data from: {file_path}")
+        properties_data = _parse_property_workbook(file_path)
+        _validate_property_data(properties_data)
+        _write_property_snapshot(
+            snapshot_path,
+            stat,
+            source_hash or _hash_file(file_path),
+            properties_data,
+        )
+
+    _property_data_cache[file_path] = {
+        "mtime": stat.st_mtime,
+        "size": stat.st_size,
+        "properties": _freeze_property_data(properties_data),
+    }
+    return _copy_property_data(_property_data_cache[file_path]["properties"])
 
 
 def load_property_data(filename="assets/gamedata/PropertyTycoonBoardData.xlsx"):
     try:
         current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         file_path = os.path.join(current_dir, filename)
-        print(f"Loading property data from: {file_path}")
 
         if not os.path.exists(file_path):
             print(f"File not found at {file_path}")
@@ -22,104 +315,8 @@ def load_property_data(filename="assets/gamedata/PropertyTycoonBoardData.xlsx"):
             else:
                 raise FileNotFoundError(f"Neither {file_path} nor {alt_path} exists")
 
-        df = pd.read_excel(file_path, header=3)
-        df = df.fillna("")
-        print(f"Successfully read Excel file. Found {len(df)} rows")
-
-        properties_data = {}
-        for _, row in df.iterrows():
-            try:
-                if not str(row["Position"]).strip().isdigit():
-                    continue
-
-                position = int(row["Position"])
-                property_name = str(row["Space/property"]).strip()
-
-                print(f"Processing position {position}: {property_name}")
-
-                property_data = {
-                    "name": property_name,
-                    "position": position,
-                    "group": str(row["Group"]).strip() if row["Group"] else None,
-                    "action": str(row["Action"]).strip() if row["Action"] else None,
-                    "can_be_bought": str(row["Can be bought?"]).strip().lower()
-                    == "yes",
-                }
-
-                # Handle special spaces
-                if property_name in ["Income Tax", "Super Tax"]:
-                    property_data.update(
-                        {
-                            "type": "tax",
-                            "amount": 200 if property_name == "Income Tax" else 100,
-                        }
-                    )
-                elif property_name in ["Jail", "Go to Jail", "Free Parking", "Go"]:
-                    property_data.update({"type": "special"})
-                # Handle stations
-                elif "Station" in property_name:
-                    property_data.update(
-                        {
-                            "type": "station",
-                            "price": 200,
-                            "rent": 25,  # Base rent, multiplied based on number of stations owned
-                            "owner": None,
-                            "is_station": True,
-                        }
-                    )
-                elif property_name in ["Tesla Power Co", "Edison Water"]:
-                    property_data.update(
-                        {
-                            "type": "utility",
-                            "price": 150,
-                            "rent": 0,
-                            "owner": None,
-                            "is_utility": True,
-                        }
-                    )
-                elif property_data["can_be_bought"] and row["£"]:
-                    try:
-                        price_str = str(row["£"]).replace("£", "").strip()
-                        rent_str = str(row["£.1"]).replace("£", "").strip() or "0"
-
-                        property_data.update(
-                            {
-                                "type": "property",
-                                "price": int(float(price_str)),
-                                "rent": int(float(rent_str)),
-                                "owner": None,
-                                "house_costs": [],
-                                "houses": 0,
-                                "is_mortgaged": False,
-                            }
-                        )
-
-                        for i in range(2, 7):
-                            cost = row.get(f"£.{i}", "")
-                            if cost and str(cost).strip():
-                                try:
-                                    cost_str = str(cost).replace("£", "").strip()
-                                    property_data["house_costs"].append(
-                                        int(float(cost_str))
-                                    )
-                                except (ValueError, TypeError):
-                                    continue
-                    except (ValueError, TypeError) as e:
-                        print(f"Error processing costs for position {position}: {e}")
-                        continue
-                else:
-                    property_data.update({"type": "special"})
-
-                properties_data[str(position)] = property_data
-
-            except (ValueError, TypeError) as e:
-                print(f"Error processing row: {e}")
-                continue
-
-        positions_loaded = sorted([int(pos) for pos in properties_data.keys()])
-        print(f"Successfully loaded properties for positions: {positions_loaded}")
-        print(f"Total properties loaded: {len(properties_data)}")
-        return properties_data
+        with _property_data_lock:
+            return _load_cached_property_data(file_path)
 
     except Exception as e:
         print(f"Error loading Excel file: {e}")
@@ -133,6 +330,8 @@ def load_game_text(
     filename="assets/gamedata/PropertyTycoonCardData.xlsx", sheet_name="Game Text"
 ):
     try:
+        import pandas as pd
+
         current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         file_path = os.path.join(current_dir, filename)
         df = pd.read_excel(file_path, sheet_name=sheet_name)
@@ -155,3 +354,16 @@ def load_game_text(
     except Exception as e:
         print(f"Error loading card data from Excel: {e}")
         return None
+
+
+def preload_property_data(filename="assets/gamedata/PropertyTycoonBoardData.xlsx"):
+    # Warms the shared board data on a worker thread so a cache miss (and the
+    # pandas import it needs) overlaps with the startup logo screens
+    thread = threading.Thread(
+        target=load_property_data,
+        args=(filename,),
+        name="property-data-preload",
+        daemon=True,
+    )
+    thread.start()
+    return thread
@@ -0,0 +1,265 @@
+# Property Tycoon Log_Manager.py
+# It contains the log manager, which queues log records on the game thread and writes them in batches from a background thread.
+
+import atexit
+import logging
+import os
+import sys
+import threading
+from collections import deque
+
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+LOG_QUEUE_SIZE = 20000
+LOG_BATCH_SIZE = 1000
+LOG_FLUSH_INTERVAL = 0.25
+
+# Comma separated module=LEVEL pairs, e.g. "src.Ai_Player_Logic=WARNING,src.Game_Logic=INFO"
+LOG_LEVELS_ENV = "PROPERTY_TYCOON_LOG_LEVELS"
+
+# Per-frame and per-bid debug output stays off unless turned on through LOG_LEVELS_ENV
+DEFAULT_MODULE_LEVELS = {
+    "src.Player": logging.INFO,
+    "src.Ai_Player_Logic": logging.INFO,
+    "src.Game_Logic": logging.INFO,
+    "src.Expert_AI": logging.INFO,
+}
+
+
+class LogRingBuffer:
+    def __init__(self, maxsize=LOG_QUEUE_SIZE):
+        self._records = deque(maxlen=maxsize)
+        self._ready = threading.Condition(threading.Lock())
+        self.dropped = 0
+
+    def put_nowait(self, record):
+        """Queue a record, dropping the oldest one when the buffer is full"""
+        with self._ready:
+            if len(self._records) == self._records.maxlen:
+                self.dropped += 1
+            self._records.append(record)
+            self._ready.notify()
+
+    def get_batch(self, max_records, timeout):
+        """Wait up to timeout seconds for records and take at most max_records"""
+        with self._ready:
+            if not self._records:
+                self._ready.wait(timeout)
+            count = min(len(self._records), max_records)
+            return [self._records.popleft() for _ in range(count)]
+
+    def wake(self):
+        with self._ready:
+            self._ready.notify_all()
+
+    def __len__(self):
+        return len(self._records)
+
+
+class RingBufferHandler(logging.Handler):
+    def __init__(self, queue):
+        super().__init__()
+        self.queue = queue
+
+    def handle(self, record):
+        # The ring buffer does its own locking, so emit skips the handler lock
+        result = self.filter(record)
+        if isinstance(result, logging.LogRecord):
+            record = result
+        if result:
+            self.emit(record)
+        return result
+
+    def emit(self, record):
+        # Merge the arguments now so the record is safe to format on another thread
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        self.queue.put_nowait(record)
+
+
+class BatchedLogListener:
+    def __init__(
+        self,
+        queue,
+        handlers,
+        batch_size=LOG_BATCH_SIZE,
+        flush_interval=LOG_FLUSH_INTERVAL,
+    ):
+        self.queue = queue
+        self.handlers = handlers
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.batches_written = 0
+        self.records_written = 0
+        self._stopping = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._run, name="LogListener", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Write out everything still queued and stop the writer thread"""
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self.queue.wake()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        while not self._stopping.is_set() or len(self.queue):
+            batch = self.queue.get_batch(self.batch_size, self.flush_interval)
+            if batch:
+                self.write_batch(batch)
+
+    def write_batch(self, batch):
+        """Format a batch and hand it to each handler as a single write"""
+        for handler in self.handlers:
+            lines = [
+                handler.format(record) + handler.terminator
+                for record in batch
+                if record.levelno >= handler.level
+            ]
+            if not lines:
+                continue
+
+            handler.acquire()
+            try:
+                handler.stream.write("".join(lines))
+                handler.flush()
+            except Exception as e:
+                print(f"Error writing log batch: {e}", file=sys.__stderr__)
+            finally:
+                handler.release()
+
+        self.batches_written += 1
+        self.records_written += len(batch)
+
+
+class PrintRedirector:
+    def __init__(self, level):
+        self.level = level
+        self._loggers = {}
+
+    def write(self, text):
+        # print() is C code, so the frame above this one is whoever called print
+        module = sys._getframe(1).f_globals.get("__name__", "root")
+        module_logger = self._loggers.get(module)
+        if module_logger is None:
+            module_logger = logging.getLogger(module)
+            self._loggers[module] = module_logger
+
+        if module_logger.isEnabledFor(self.level):
+            for line in text.rstrip().splitlines():
+                if line.strip():
+                    module_logger.log(self.level, line.rstrip())
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def isatty(self):
+        return False
+
+
+def parse_module_levels(value):
+    """Parse module=LEVEL pairs into a dictionary of logging levels"""
+    levels = {}
+    for pair in (value or "").split(","):
+        if "=" not in pair:
+            continue
+        module, level_name = pair.split("=", 1)
+        level = logging.getLevelName(level_name.strip().upper())
+        if isinstance(level, int):
+            levels[module.strip()] = level
+        else:
+            print(f"Unknown log level '{level_name}' for {module}")
+    return levels
+
+
+class LogManager:
+    def __init__(self):
+        self.queue = None
+        self.listener = None
+        self.queue_handler = None
+        self.handlers = []
+        self.module_levels = {}
+
+    def start(self, log_filename, console_level=logging.INFO, module_levels=None):
+        """Set up queued logging to a file and the console and capture print output"""
+        if self.listener is not None:
+            return
+
+        formatter = logging.Formatter(LOG_FORMAT)
+        file_handler = logging.FileHandler(log_filename, mode="w", encoding="utf-8")
+        file_handler.setLevel(logging.DEBUG)
+        console_handler = logging.StreamHandler(sys.__stderr__)
+        console_handler.setLevel(console_level)
+        for handler in (file_handler, console_handler):
+            handler.setFormatter(formatter)
+        self.handlers = [file_handler, console_handler]
+
+        self.queue = LogRingBuffer()
+        self.queue_handler = RingBufferHandler(self.queue)
+        self.listener = BatchedLogListener(self.queue, self.handlers)
+
+        root = logging.getLogger()
+        root.setLevel(logging.DEBUG)
+        root.addHandler(self.queue_handler)
+
+        self.set_module_levels(DEFAULT_MODULE_LEVELS)
+        self.set_module_levels(parse_module_levels(os.environ.get(LOG_LEVELS_ENV)))
+        if module_levels:
+            self.set_module_levels(module_levels)
+
+        sys.stdout = PrintRedirector(logging.INFO)
+        sys.stderr = PrintRedirector(logging.ERROR)
+
+        self.listener.start()
+        atexit.register(self.stop)
+
+    def set_module_levels(self, module_levels):
+        """Change the lowest level logged for each named module"""
+        for module, level in module_levels.items():
+            logging.getLogger(module).setLevel(level)
+            self.module_levels[module] = level
+
+    def stop(self):
+        """Restore stdout/stderr, write out queued records and close the log files"""
+        if self.listener is None:
+            return
+
+        if isinstance(sys.stdout, PrintRedirector):
+            sys.stdout = sys.__stdout__
+        if isinstance(sys.stderr, PrintRedirector):
+            sys.stderr = sys.__stderr__
+
+        logging.getLogger().removeHandler(self.queue_handler)
+        self.listener.stop()
+        for handler in self.handlers:
+            if isinstance(handler, logging.FileHandler):
+                handler.close()
+
+        self.listener = None
+        self.queue_handler = None
+        self.handlers = []
+
+    def get_stats(self):
+        """Get the queue length, dropped record count and batches written"""
+        if self.listener is None:
+            return {"queued": 0, "dropped": 0, "batches": 0, "records": 0}
+        return {
+            "queued": len(self.queue),
+            "dropped": self.queue.dropped,
+            "batches": self.listener.batches_written,
+            "records": self.listener.records_written,
+        }
+
+
+log_manager = LogManager()
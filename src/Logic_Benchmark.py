@@ -0,0 +1,450 @@
+# Property Tycoon Logic_Benchmark.py
+# It contains the rules-engine micro-benchmarks, which time GameLogic's hot paths on seeded mid-game and late-game boards.
+
+import argparse
+import contextlib
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from src.Property_Registry import INDEXED_KEYS
+from src.Simulation import HeadlessGame, _NullWriter
+
+RESULT_VERSION = 1
+
+BASELINE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "benchmarks",
+    "logic_baseline.json",
+)
+
+BENCHMARK_CALLS = 200
+BENCHMARK_REPEATS = 10
+ALLOCATION_CALLS = 50
+CALIBRATION_LOOPS = 500
+CALIBRATION_ROUNDS = 30
+
+# A path regresses when its p50 is this much slower than the baseline, and by at least MIN_REGRESSION_US
+REGRESSION_THRESHOLD = 0.3
+MIN_REGRESSION_US = 2.0
+
+CARD_TYPES = ("Pot Luck", "Opportunity Knocks")
+
+BOARD_SETTINGS = {
+    "mid_game": {
+        "players": 4,
+        "completed_groups": 2,
+        "owned_share": 0.5,
+        "mortgaged_share": 0.0,
+        "max_houses": 2,
+        "money": (600, 1500),
+        "circuits": 3,
+    },
+    "late_game": {
+        "players": 3,
+        "completed_groups": 5,
+        "owned_share": 1.0,
+        "mortgaged_share": 0.15,
+        "max_houses": 5,
+        "money": (150, 900),
+        "circuits": 12,
+    },
+}
+BOARDS = tuple(BOARD_SETTINGS)
+
+
+def create_board(board, seed=0):
+    """Build a headless game whose board looks like a game at that stage"""
+    settings = BOARD_SETTINGS[board]
+    game = HeadlessGame(player_count=settings["players"], seed=seed)
+    logic = game.logic
+    rng = random.Random(seed)
+    names = [player["name"] for player in logic.players]
+
+    groups = {}
+    for space in logic.properties.values():
+        if space.get("can_be_bought", False):
+            groups.setdefault(space["group"], []).append(space)
+    colour_groups = sorted(
+        group for group in groups if group not in ("Station", "Utilities")
+    )
+    completed = set(rng.sample(colour_groups, settings["completed_groups"]))
+
+    with contextlib.redirect_stdout(_NullWriter()):
+        for group in sorted(groups):
+            if group in completed:
+                owner = rng.choice(names)
+                houses = rng.randint(0, settings["max_houses"])
+                for space in groups[group]:
+                    space["owner"] = owner
+                    space["houses"] = houses
+                continue
+            for space in groups[group]:
+                if rng.random() < settings["owned_share"]:
+                    space["owner"] = rng.choice(names)
+                    space["is_mortgaged"] = rng.random() < settings["mortgaged_share"]
+
+        for player in logic.players:
+            player["money"] = rng.randint(*settings["money"])
+            player["position"] = rng.randint(1, 40)
+            logic.completed_circuits[player["name"]] = settings["circuits"]
+
+    return logic
+
+
+class BoardSnapshot:
+    def __init__(self, logic):
+        # Card decks are left alone so repeated draws work through the whole deck
+        self.logic = logic
+        self.players = [(player, dict(player)) for player in logic.players]
+        self.spaces = {
+            key: {field: space.get(field) for field in INDEXED_KEYS}
+            for key, space in logic.properties.items()
+        }
+        self.values = {
+            name: getattr(logic, name)
+            for name in (
+                "bank_money",
+                "free_parking_fund",
+                "current_player_index",
+                "doubles_count",
+                "is_going_to_jail",
+                "last_dice_roll",
+            )
+        }
+        self.completed_circuits = dict(logic.completed_circuits)
+        self.jail_free_cards = dict(logic.jail_free_cards)
+
+    def restore(self):
+        """Put the board back the way it was, touching only what changed"""
+        logic = self.logic
+        logic.players[:] = [player for player, _ in self.players]
+        for player, fields in self.players:
+            if player != fields:
+                player.clear()
+                player.update(fields)
+            if logic.player_store.get(player["name"]) is not player:
+                logic.player_store.add(player)
+
+        for key, fields in self.spaces.items():
+            space = logic.properties[key]
+            for field, value in fields.items():
+                if space.get(field) != value:
+                    space[field] = value
+
+        for name, value in self.values.items():
+            setattr(logic, name, value)
+        logic.completed_circuits = dict(self.completed_circuits)
+        logic.jail_free_cards = dict(self.jail_free_cards)
+        logic.bankrupted_players.clear()
+        logic.message_queue.clear()
+        logic.current_auction = None
+        logic.auction_engine.clear()
+
+
+def _buyable_spaces(logic):
+    return [space for space in logic.properties.values() if space.get("can_be_bought")]
+
+
+def _setup_play_turn(logic, rng):
+    return logic.play_turn, ()
+
+
+def _setup_handle_space(logic, rng):
+    player = logic.players[logic.current_player_index]
+    player["position"] = rng.randint(1, 40)
+    return logic.handle_space, (player,)
+
+
+def _setup_space_rent(logic, rng):
+    space = rng.choice(
+        [space for space in _buyable_spaces(logic) if space.get("owner")]
+    )
+    player = rng.choice([p for p in logic.players if p["name"] != space["owner"]])
+    return logic.calculate_space_rent, (space, player)
+
+
+def _setup_card_draw(logic, rng):
+    return logic.handle_card_draw, (rng.choice(logic.players), rng.choice(CARD_TYPES))
+
+
+def _setup_place_bids(logic, rng):
+    return logic.placeBids, (list(logic.players), rng.choice(_buyable_spaces(logic)))
+
+
+def _setup_auction_bid(logic, rng):
+    richest = max(player["money"] for player in logic.players)
+    space = rng.choice(
+        [space for space in _buyable_spaces(logic) if space["price"] // 2 <= richest]
+    )
+    logic.auction_property(space.key)
+    auction = logic.current_auction
+    bidder = auction["active_players"][auction["current_bidder_index"]]
+    return logic.process_auction_bid, (bidder, auction["minimum_bid"])
+
+
+def _setup_group_completion(logic, rng):
+    return logic.check_property_group_completion, (rng.choice(logic.players)["name"],)
+
+
+def _setup_build_house(logic, rng):
+    space = rng.choice(
+        [space for space in _buyable_spaces(logic) if space["type"] == "property"]
+    )
+    player = logic.get_player(space.get("owner")) or rng.choice(logic.players)
+    return logic.can_build_house, (space, player)
+
+
+def _setup_bankruptcy(logic, rng):
+    return logic.handle_bankruptcy, (rng.choice(logic.players),)
+
+
+# Each setup runs untimed on a freshly restored board and returns (function, args) for one call
+CASES = {
+    "play_turn": _setup_play_turn,
+    "handle_space": _setup_handle_space,
+    "calculate_space_rent": _setup_space_rent,
+    "handle_card_draw": _setup_card_draw,
+    "placeBids": _setup_place_bids,
+    "process_auction_bid": _setup_auction_bid,
+    "check_property_group_completion": _setup_group_completion,
+    "can_build_house": _setup_build_house,
+    "handle_bankruptcy": _setup_bankruptcy,
+}
+
+
+def calibrate():
+    """Time a fixed pure-Python loop, so results from different machines can be compared"""
+    data = {str(position): {"owner": position % 4} for position in range(1, 41)}
+    best = None
+    for _ in range(CALIBRATION_ROUNDS):
+        start = time.perf_counter()
+        total = 0
+        for _ in range(CALIBRATION_LOOPS):
+            for space in data.values():
+                total += space["owner"]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+class BenchmarkCase:
+    def __init__(self, case, board, seed=0):
+        self.case = case
+        self.board = board
+        self.seed = seed
+        self.setup = CASES[case]
+        self.logic = create_board(board, seed)
+        self.snapshot = BoardSnapshot(self.logic)
+        self.call_times = None
+        self.repeats = 0
+
+    def _calls(self, calls):
+        # Dice, cards and AI bids all draw from logic.rng, so every repeat makes the same calls
+        self.logic.rng.seed(self.seed)
+        rng = random.Random(self.seed)
+        for _ in range(calls):
+            self.snapshot.restore()
+            yield self.setup(self.logic, rng)
+        self.snapshot.restore()
+
+    def time_calls(self, calls=BENCHMARK_CALLS):
+        """Time one repeat, keeping it if it is the quickest so far"""
+        call_times = []
+        for function, args in self._calls(calls):
+            start = time.perf_counter()
+            function(*args)
+            call_times.append(time.perf_counter() - start)
+        call_times.sort()
+
+        # As with timeit, the quickest repeat is the one least disturbed by the rest of the machine
+        self.repeats += 1
+        if self.call_times is None or get_median(call_times) < get_median(
+            self.call_times
+        ):
+            self.call_times = call_times
+
+    def get_result(self):
+        # tracemalloc slows every allocation down, so it gets its own shorter pass
+        peaks = []
+        retained = []
+        tracemalloc.start()
+        try:
+            for function, args in self._calls(ALLOCATION_CALLS):
+                tracemalloc.reset_peak()
+                before, _ = tracemalloc.get_traced_memory()
+                function(*args)
+                current, peak = tracemalloc.get_traced_memory()
+                peaks.append(peak - before)
+                retained.append(current - before)
+        finally:
+            tracemalloc.stop()
+
+        call_times = self.call_times
+        p50 = get_median(call_times)
+        return {
+            "case": self.case,
+            "board": self.board,
+            "calls": len(call_times),
+            "repeats": self.repeats,
+            "ops_per_sec": round(1 / p50) if p50 else None,
+            "us": {
+                "mean": round(statistics.fmean(call_times) * 1e6, 2),
+                "p50": round(p50 * 1e6, 2),
+                "p95": round(call_times[len(call_times) * 95 // 100] * 1e6, 2),
+            },
+            "alloc_peak_bytes": round(statistics.fmean(peaks)),
+            "alloc_retained_bytes": round(statistics.fmean(retained)),
+        }
+
+
+def get_median(sorted_values):
+    return sorted_values[len(sorted_values) // 2]
+
+
+def run_benchmark(
+    cases=tuple(CASES),
+    boards=BOARDS,
+    calls=BENCHMARK_CALLS,
+    seed=0,
+    repeats=BENCHMARK_REPEATS,
+):
+    # GameLogic prints debug output on every path, which would swamp the report
+    with contextlib.redirect_stdout(_NullWriter()):
+        benchmarks = [
+            BenchmarkCase(case, board, seed) for case in cases for board in boards
+        ]
+        # Repeats take turns across every case, so a slow spell on the machine hits them all a little
+        calibration = calibrate()
+        for _ in range(repeats):
+            for benchmark in benchmarks:
+                benchmark.time_calls(calls)
+        calibration = min(calibration, calibrate())
+        results = {
+            f"{benchmark.case}@{benchmark.board}": benchmark.get_result()
+            for benchmark in benchmarks
+        }
+
+    return {
+        "version": RESULT_VERSION,
+        "settings": {
+            "calls": calls,
+            "repeats": repeats,
+            "seed": seed,
+            "cases": list(cases),
+            "boards": list(boards),
+            "calibration_ms": round(calibration * 1000, 3),
+            "python": sys.version.split()[0],
+        },
+        "results": results,
+    }
+
+
+def compare_with_baseline(
+    report, baseline, threshold=REGRESSION_THRESHOLD, normalise=False
+):
+    """Get (path, baseline p50, expected p50, new p50) for every path that got slower than allowed"""
+    # Normalising scales the baseline by the calibration loop, for a baseline from another machine
+    scale = 1.0
+    old_calibration = baseline.get("settings", {}).get("calibration_ms")
+    if normalise and old_calibration:
+        scale = report["settings"]["calibration_ms"] / old_calibration
+
+    regressions = []
+    for key, result in report["results"].items():
+        previous = baseline.get("results", {}).get(key)
+        if previous is None:
+            continue
+        old_us = previous["us"]["p50"]
+        expected_us = old_us * scale
+        new_us = result["us"]["p50"]
+        if new_us - expected_us > max(expected_us * threshold, MIN_REGRESSION_US):
+            regressions.append((key, old_us, expected_us, new_us))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark GameLogic hot paths")
+    parser.add_argument(
+        "--case",
+        action="append",
+        dest="cases",
+        choices=tuple(CASES),
+        help="Path to run; repeat to pick several (default: all)",
+    )
+    parser.add_argument(
+        "--board", action="append", dest="boards", choices=BOARDS, help="Board stage"
+    )
+    parser.add_argument(
+        "--calls", type=int, default=BENCHMARK_CALLS, help="Calls per repeat"
+    )
+    parser.add_argument("--repeats", type=int, default=BENCHMARK_REPEATS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="logic_benchmark.json")
+    parser.add_argument(
+        "--baseline",
+        default=BASELINE_PATH,
+        help="Earlier results to compare against (default: the checked-in baseline)",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Write the results over the baseline instead of comparing with it",
+    )
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    parser.add_argument(
+        "--normalise",
+        action="store_true",
+        help="Scale the baseline by the calibration loop when it came from another machine",
+    )
+    args = parser.parse_args()
+
+    report = run_benchmark(
+        cases=args.cases or tuple(CASES),
+        boards=args.boards or BOARDS,
+        calls=args.calls,
+        seed=args.seed,
+        repeats=args.repeats,
+    )
+
+    output = args.baseline if args.update_baseline else args.output
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=1, sort_keys=True)
+        f.write("\n")
+
+    for key, result in report["results"].items():
+        print(
+            f"{key}: {result['ops_per_sec']} ops/s, p50 {result['us']['p50']:.1f}us "
+            f"p95 {result['us']['p95']:.1f}us, {result['alloc_peak_bytes']}B peak per call"
+        )
+    print(f"Results written to {output}")
+
+    if args.update_baseline:
+        return
+    if not os.path.exists(args.baseline):
+        print(
+            f"No baseline at {args.baseline}; run with --update-baseline to create one"
+        )
+        return
+
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare_with_baseline(
+        report, baseline, args.threshold, args.normalise
+    )
+    for key, old_us, expected_us, new_us in regressions:
+        print(
+            f"REGRESSION {key}: p50 {old_us:.1f}us in the baseline "
+            f"({expected_us:.1f}us on this machine) -> {new_us:.1f}us"
+        )
+    if regressions:
+        sys.exit(1)
+    print(f"No logic regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+# Property Tycoon Page_Router.py
+# It contains the page router, which builds each menu page once and keeps it until the window size changes.
+
+from src.UI import get_window_size
+
+
+class PageRouter:
+    def __init__(self, pages, **page_args):
+        # pages maps a route name to its page class; page_args are passed to every page built
+        self.pages = pages
+        self.page_args = page_args
+        self.current = None
+        self.builds = 0
+        self._built = {}
+        self._window_size = None
+
+    def get(self, name):
+        """Get the page for a route, building it the first time or after the window size changes"""
+        window_size = get_window_size()
+        if window_size != self._window_size:
+            # Pages lay themselves out when built, so a new size means building them again
+            self._built.clear()
+            self._window_size = window_size
+
+        page = self._built.get(name)
+        if page is None:
+            page = self.pages[name](**self.page_args)
+            self._built[name] = page
+            self.builds += 1
+        return page
+
+    def show(self, name):
+        self.current = name
+        return self.get(name)
+
+    def reset(self, *names):
+        """Drop built pages so they start fresh next time; with no names, drop them all"""
+        if not names:
+            self._built.clear()
+        for name in names:
+            self._built.pop(name, None)
@@ -4,7 +4,10 @@
 import pygame
 import math
 import os
+import logging
+import random
 from src.Font_Manager import font_manager
+from src.Asset_Manager import asset_manager
 
 WHITE = (255, 255, 255)
 HUMAN_COLOR = (75, 139, 190)
@@ -12,6 +15,8 @@ AI_COLOR = (190, 75, 75)
 
 base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+logger = logging.getLogger(__name__)
+
 
 class Player:
     def __init__(self, name, player_number=1, is_ai=False, ai_difficulty="easy"):
@@ -27,6 +32,8 @@ class Player:
 
         self.player_number = player_number
         self.ai_difficulty = ai_difficulty
+        # The game swaps in this player's own seeded stream
+        self.rng = random
         self.rect = pygame.Rect(0, 0, 40, 40)
         self.color = AI_COLOR if is_ai else HUMAN_COLOR
         self.in_jail = False
@@ -57,7 +64,15 @@ class Player:
         if self.is_ai:
             from src.Ai_Player_Logic import EasyAIPlayer, HardAIPlayer
 
-            if ai_difficulty.lower() == "hard":
+            if ai_difficulty.lower() == "expert":
+                from src.Expert_AI import ExpertAIPlayer
+
+                # Mood only; the game's own ExpertAIPlayer makes the decisions
+                self.ai_controller = ExpertAIPlayer()
+                print(
+                    f"Initialized Expert AI controller for {self.name} with emotion system"
+                )
+            elif ai_difficulty.lower() == "hard":
                 self.ai_controller = HardAIPlayer()
                 print(
                     f"Initialized Hard AI controller for {self.name} with emotion system"
@@ -71,36 +86,11 @@ class Player:
 
     def load_player_image(self):
         try:
-            image_path = os.path.join(
-                base_path, "assets", "image", f"Playertoken ({self.player_number}).png"
+            # Tokens share one scaled surface per image, which is copied before any drawing on it
+            self.player_image = asset_manager.get_scaled(
+                f"Playertoken ({self.player_number}).png", (40, 40)
             )
-            print(f"Attempting to load player image from: {image_path}")
-
-            if os.path.exists(image_path):
-                self.player_image = pygame.image.load(image_path)
-                self.player_image = pygame.transform.scale(self.player_image, (40, 40))
-                print(f"Successfully loaded player {self.player_number} image")
-            else:
-                print(f"Image file not found at {image_path}, trying absolute path...")
-                current_dir = os.getcwd()
-                abs_path = os.path.join(
-                    current_dir,
-                    "assets",
-                    "image",
-                    f"Playertoken ({self.player_number}).png",
-                )
-                if os.path.exists(abs_path):
-                    self.player_image = pygame.image.load(abs_path)
-                    self.player_image = pygame.transform.scale(
-                        self.player_image, (40, 40)
-                    )
-                    print(
-                        f"Successfully loaded player {self.player_number} image from absolute path"
-                    )
-                else:
-                    print(f"Image file not found at {abs_path}")
-                    self.create_fallback_token()
-        except pygame.error as e:
+        except (pygame.error, FileNotFoundError) as e:
             print(f"Could not load player image {self.player_number}: {e}")
             self.create_fallback_token()
 
@@ -192,7 +182,9 @@ class Player:
             )
             self.position = 1
 
-        print(f"Drawing player {self.name} at screen coordinates: ({x}, {y})")
+        logger.debug(
+            "Drawing player %s at screen coordinates: (%s, %s)", self.name, x, y
+        )
         current_time = pygame.time.get_ticks()
         self.animation_offset = abs(math.sin(current_time * 0.003)) * 5
         self.rect.x = x
@@ -412,11 +404,9 @@ class Player:
             return False
 
         if self.is_ai:
-            import random
-
-            if self.jail_cards and random.random() < 0.7:
+            if self.jail_cards and self.rng.random() < 0.7:
                 return self.use_jail_card()
-            elif self.money >= 50 and random.random() < 0.5:
+            elif self.money >= 50 and self.rng.random() < 0.5:
                 self.pay(50)
                 self.in_jail = False
                 self.jail_turns = 0
@@ -0,0 +1,55 @@
+# Property Tycoon Player_State.py
+# It contains the player state store, which owns the game logic's player dictionaries and tells observers when they change.
+
+WATCHED_KEYS = ("money", "position")
+
+
+class PlayerState(dict):
+    __slots__ = ("store",)
+
+    def __init__(self, store, fields):
+        super().__init__(fields)
+        self.store = store
+
+    def __setitem__(self, key, value):
+        old_value = self.get(key)
+        super().__setitem__(key, value)
+        if key in WATCHED_KEYS and old_value != value and self.store is not None:
+            self.store.notify(self, key, old_value, value)
+
+
+class PlayerStore:
+    def __init__(self):
+        self._players = {}
+        self._listeners = []
+
+    def create(self, fields):
+        """Create the state for a player and look it up by name from now on"""
+        player = PlayerState(self, fields)
+        self._players[player["name"]] = player
+        return player
+
+    def add(self, player):
+        """Look up an existing player state by name again, e.g. one restored from a snapshot"""
+        player.store = self
+        self._players[player["name"]] = player
+
+    def get(self, name):
+        """Get a player's state by name, or None if they are not in the game"""
+        return self._players.get(name)
+
+    def remove(self, name):
+        self._players.pop(name, None)
+
+    def subscribe(self, listener):
+        """Call listener(player, key, old_value, new_value) when money or position changes"""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def notify(self, player, key, old_value, new_value):
+        for listener in self._listeners:
+            listener(player, key, old_value, new_value)
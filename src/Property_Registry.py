@@ -0,0 +1,152 @@
+# Property Tycoon Property_Registry.py
+# It contains the property registry, which holds the board's spaces and keeps owner and group indexes up to date as they change.
+
+from src.Valuation_Cache import ValuationCache
+
+INDEXED_KEYS = ("owner", "houses", "is_mortgaged")
+
+
+class PropertyState(dict):
+    __slots__ = ("registry", "key")
+
+    def __init__(self, registry, key, fields):
+        super().__init__(fields)
+        self.registry = registry
+        self.key = key
+
+    def __setitem__(self, key, value):
+        old_value = self.get(key)
+        super().__setitem__(key, value)
+        if key in INDEXED_KEYS and old_value != value and self.registry is not None:
+            self.registry.on_change(self, key, old_value, value)
+
+
+class PropertyRegistry(dict):
+    def __init__(self, properties):
+        super().__init__()
+        # Positions are kept in board order so lookups match a full scan
+        self.group_positions = {}
+        self.owner_positions = {}
+        self.owner_group_counts = {}
+        self.owner_type_counts = {}
+        self.mortgaged_positions = set()
+        self.version = 0
+        self.valuations = ValuationCache()
+        self._listeners = []
+
+        for key in sorted(properties, key=self._board_order):
+            space = PropertyState(self, key, properties[key])
+            dict.__setitem__(self, key, space)
+            self.group_positions.setdefault(space.get("group"), []).append(key)
+            self._add_owner(space, space.get("owner"))
+            if space.get("is_mortgaged", False):
+                self.mortgaged_positions.add(key)
+
+    @staticmethod
+    def _board_order(key):
+        try:
+            return 0, int(key)
+        except (TypeError, ValueError):
+            return 1, str(key)
+
+    def _add_owner(self, space, owner):
+        if owner is None:
+            return
+        positions = self.owner_positions.setdefault(owner, [])
+        positions.append(space.key)
+        positions.sort(key=self._board_order)
+        self._count(self.owner_group_counts, owner, space.get("group"), 1)
+        self._count(self.owner_type_counts, owner, space.get("type"), 1)
+
+    def _remove_owner(self, space, owner):
+        if owner is None:
+            return
+        positions = self.owner_positions.get(owner, [])
+        if space.key in positions:
+            positions.remove(space.key)
+        if not positions:
+            self.owner_positions.pop(owner, None)
+        self._count(self.owner_group_counts, owner, space.get("group"), -1)
+        self._count(self.owner_type_counts, owner, space.get("type"), -1)
+
+    @staticmethod
+    def _count(counts, owner, name, change):
+        owner_counts = counts.setdefault(owner, {})
+        owner_counts[name] = owner_counts.get(name, 0) + change
+        if owner_counts[name] <= 0:
+            del owner_counts[name]
+        if not owner_counts:
+            del counts[owner]
+
+    def on_change(self, space, key, old_value, new_value):
+        """Update the indexes after an owner, house or mortgage change"""
+        if key == "owner":
+            self._remove_owner(space, old_value)
+            self._add_owner(space, new_value)
+        elif key == "is_mortgaged":
+            if new_value:
+                self.mortgaged_positions.add(space.key)
+            else:
+                self.mortgaged_positions.discard(space.key)
+
+        self.version += 1
+        for listener in self._listeners:
+            listener(space, key, old_value, new_value)
+
+    def subscribe(self, listener):
+        """Call listener(space, key, old_value, new_value) after the indexes change"""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def get_owned(self, owner):
+        """Get the spaces an owner has, in board order"""
+        return [self[key] for key in self.owner_positions.get(owner, [])]
+
+    def get_group(self, group):
+        """Get every space in a group, in board order"""
+        return [self[key] for key in self.group_positions.get(group, [])]
+
+    def get_group_size(self, group):
+        return len(self.group_positions.get(group, []))
+
+    def count_owned_in_group(self, owner, group):
+        return self.owner_group_counts.get(owner, {}).get(group, 0)
+
+    def count_owned_of_type(self, owner, space_type):
+        return self.owner_type_counts.get(owner, {}).get(space_type, 0)
+
+    def owns_group(self, owner, group):
+        """Check whether an owner has every space in a group"""
+        if owner is None or not group:
+            return False
+        return self.count_owned_in_group(owner, group) == self.get_group_size(group)
+
+    def get_completed_groups(self, owner):
+        """Get the groups an owner has every space of, in board order"""
+        owned = self.owner_group_counts.get(owner, {})
+        return [
+            group
+            for group in self.group_positions
+            if group in owned and self.owns_group(owner, group)
+        ]
+
+    def find_index_errors(self):
+        """Compare the indexes with a full scan and describe any differences"""
+        expected = PropertyRegistry(self)
+        errors = []
+        for name in (
+            "group_positions",
+            "owner_positions",
+            "owner_group_counts",
+            "owner_type_counts",
+            "mortgaged_positions",
+        ):
+            if getattr(self, name) != getattr(expected, name):
+                errors.append(
+                    f"{name} is {getattr(self, name)}, a full scan gives {getattr(expected, name)}"
+                )
+        return errors
@@ -0,0 +1,315 @@
+# Property Tycoon Render_Benchmark.py
+# It contains the headless render benchmark, which times GameRenderer.draw in scripted scenes on SDL's dummy drivers.
+
+import argparse
+import contextlib
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+# Set before pygame is imported so no window or audio device is opened
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+RESULT_VERSION = 1
+
+BASELINE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "benchmarks",
+    "render_baseline.json",
+)
+
+SCENARIOS = ("idle", "moving", "auction", "development", "emotion")
+WINDOW_SIZES = ((1280, 720), (1920, 1080))
+ZOOM_LEVELS = (1.0, 1.5)
+
+WARMUP_FRAMES = 5
+BENCHMARK_FRAMES = 120
+ALLOCATION_FRAMES = 30
+
+# A case regresses when its p50 is this much slower than the baseline, and by at least MIN_REGRESSION_MS
+REGRESSION_THRESHOLD = 0.25
+MIN_REGRESSION_MS = 0.5
+
+
+class _NullWriter:
+    def write(self, text):
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+def _make_move_step(game):
+    def move_players():
+        for player in game.players:
+            if not player.is_moving:
+                player.move(6)
+
+    return move_players
+
+
+def create_scene(scenario, window_size):
+    from src.Font_Manager import font_manager
+    from src.Game import Game
+    from src.GameActions import GameActions
+    from src.GameRenderer import GameRenderer
+    from src.Player import Player
+
+    pygame.display.set_mode(window_size)
+    font_manager.update_scale_factor(*window_size)
+
+    # The human seat is current throughout, so the AI never takes a turn mid-benchmark
+    players = [
+        Player("Player 1", 1),
+        Player("Player 2", 2),
+        Player("Bot", 3, is_ai=True, ai_difficulty="hard"),
+    ]
+    game = Game(players, ai_difficulty="hard")
+    game_actions = GameActions(game)
+    renderer = GameRenderer(game, game_actions)
+    game.renderer = renderer
+
+    logic = game.logic
+    human = logic.players[0]
+    step = None
+
+    if scenario == "moving":
+        step = _make_move_step(game)
+    elif scenario == "auction":
+        for player in logic.players:
+            logic.completed_circuits[player["name"]] = 1
+        logic.auction_property("2")
+        game.state = "AUCTION"
+    elif scenario == "development":
+        game.lap_count[human["name"]] = 1
+        logic.completed_circuits[human["name"]] = 1
+        brown = logic.properties.get_group(logic.properties["2"].get("group"))
+        for space in brown:
+            space["owner"] = human["name"]
+        game.board.update_ownership(logic.properties)
+        # Same steps as choosing a property in development mode
+        game.state = "DEVELOPMENT"
+        game.development_mode = True
+        game.dev_manager.activate(human)
+        game.dev_manager.selected_property = brown[0]
+    elif scenario == "emotion":
+        for emotion_ui in game.emotion_uis.values():
+            emotion_ui.show()
+
+    return game, renderer, step
+
+
+def _summarise_ms(values):
+    values = sorted(values)
+
+    def percentile(p):
+        return values[min(len(values) - 1, len(values) * p // 100)]
+
+    return {
+        "mean": round(statistics.fmean(values) * 1000, 3),
+        "p50": round(percentile(50) * 1000, 3),
+        "p95": round(percentile(95) * 1000, 3),
+        "p99": round(percentile(99) * 1000, 3),
+        "max": round(values[-1] * 1000, 3),
+    }
+
+
+def _time_frames(renderer, step, frames, full_redraw):
+    frame_times = []
+    for _ in range(frames):
+        if step:
+            step()
+        if full_redraw:
+            renderer.invalidate()
+        start = time.perf_counter()
+        renderer.draw()
+        frame_times.append(time.perf_counter() - start)
+    return frame_times
+
+
+def run_case(renderer, step, zoom, frames=BENCHMARK_FRAMES):
+    renderer.game.board.camera.zoom_level = zoom
+    renderer.invalidate()
+
+    for _ in range(WARMUP_FRAMES):
+        if step:
+            step()
+        renderer.draw()
+
+    # Steady frames may be skipped or partly presented; full redraws repaint everything
+    frame_times = _time_frames(renderer, step, frames, full_redraw=False)
+    redraw_times = _time_frames(renderer, step, frames, full_redraw=True)
+
+    # tracemalloc slows every allocation down, so it gets its own shorter pass.
+    # It only sees Python objects, not pixel buffers SDL allocates
+    peaks = []
+    retained = []
+    tracemalloc.start()
+    try:
+        for _ in range(min(frames, ALLOCATION_FRAMES)):
+            if step:
+                step()
+            renderer.invalidate()
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            renderer.draw()
+            current, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before)
+            retained.append(current - before)
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "zoom": zoom,
+        "frames": frames,
+        "frame_ms": _summarise_ms(frame_times),
+        "full_redraw_ms": _summarise_ms(redraw_times),
+        "alloc_peak_kb": round(statistics.fmean(peaks) / 1024, 1),
+        "alloc_retained_kb": round(statistics.fmean(retained) / 1024, 1),
+    }
+
+
+def run_benchmark(
+    scenarios=SCENARIOS,
+    window_sizes=WINDOW_SIZES,
+    zoom_levels=ZOOM_LEVELS,
+    frames=BENCHMARK_FRAMES,
+    quiet=True,
+):
+    pygame.init()
+    results = {}
+    # The renderer prints debug output every frame, which would swamp the report
+    output = (
+        contextlib.redirect_stdout(_NullWriter()) if quiet else contextlib.nullcontext()
+    )
+    with output:
+        for scenario in scenarios:
+            for window_size in window_sizes:
+                # Building a Game loads the board and tokens, so zoom levels share one scene
+                game, renderer, step = create_scene(scenario, window_size)
+                for zoom in zoom_levels:
+                    key = f"{scenario}@{window_size[0]}x{window_size[1]}@{zoom:g}x"
+                    results[key] = {
+                        "scenario": scenario,
+                        "window_size": list(window_size),
+                        **run_case(renderer, step, zoom, frames),
+                    }
+
+    return {
+        "version": RESULT_VERSION,
+        "settings": {
+            "frames": frames,
+            "scenarios": list(scenarios),
+            "window_sizes": [list(size) for size in window_sizes],
+            "zoom_levels": list(zoom_levels),
+            "video_driver": os.environ.get("SDL_VIDEODRIVER"),
+        },
+        "results": results,
+    }
+
+
+def compare_with_baseline(report, baseline, threshold=REGRESSION_THRESHOLD):
+    """Get (case, timing, baseline p50, new p50) for every timing that got slower than allowed"""
+    regressions = []
+    for key, result in report["results"].items():
+        previous = baseline.get("results", {}).get(key)
+        if previous is None:
+            continue
+        for timing in ("frame_ms", "full_redraw_ms"):
+            if timing not in previous:
+                continue
+            old_ms = previous[timing]["p50"]
+            new_ms = result[timing]["p50"]
+            if new_ms - old_ms > max(old_ms * threshold, MIN_REGRESSION_MS):
+                regressions.append((key, timing, old_ms, new_ms))
+    return regressions
+
+
+def _parse_size(text):
+    width, height = text.lower().split("x")
+    return int(width), int(height)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark GameRenderer.draw headless")
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        dest="scenarios",
+        choices=SCENARIOS,
+        help="Scenario to run; repeat to pick several (default: all)",
+    )
+    parser.add_argument(
+        "--size",
+        action="append",
+        dest="sizes",
+        type=_parse_size,
+        help="Window size such as 1280x720; repeat to pick several",
+    )
+    parser.add_argument(
+        "--zoom", action="append", dest="zooms", type=float, help="Board zoom level"
+    )
+    parser.add_argument("--frames", type=int, default=BENCHMARK_FRAMES)
+    parser.add_argument("--output", default="render_benchmark.json")
+    parser.add_argument(
+        "--baseline",
+        default=BASELINE_PATH,
+        help="Earlier results to compare against (default: the checked-in baseline)",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Write the results over the baseline instead of comparing with it",
+    )
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    args = parser.parse_args()
+
+    report = run_benchmark(
+        scenarios=args.scenarios or SCENARIOS,
+        window_sizes=args.sizes or WINDOW_SIZES,
+        zoom_levels=args.zooms or ZOOM_LEVELS,
+        frames=args.frames,
+    )
+
+    output = args.baseline if args.update_baseline else args.output
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=1, sort_keys=True)
+        f.write("\n")
+
+    for key, result in report["results"].items():
+        frame_ms = result["frame_ms"]
+        redraw_ms = result["full_redraw_ms"]
+        print(
+            f"{key}: p50 {frame_ms['p50']:.2f}ms p95 {frame_ms['p95']:.2f}ms "
+            f"p99 {frame_ms['p99']:.2f}ms, full redraw p50 {redraw_ms['p50']:.2f}ms, "
+            f"{result['alloc_peak_kb']:.0f}KB peak per frame"
+        )
+    print(f"Results written to {output}")
+
+    if args.update_baseline:
+        return
+    if not os.path.exists(args.baseline):
+        print(
+            f"No baseline at {args.baseline}; run with --update-baseline to create one"
+        )
+        return
+
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare_with_baseline(report, baseline, args.threshold)
+    for key, timing, old_ms, new_ms in regressions:
+        print(f"REGRESSION {key} {timing}: p50 {old_ms:.2f}ms -> {new_ms:.2f}ms")
+    if regressions:
+        sys.exit(1)
+    print(f"No render regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+# Property Tycoon Rent_Table.py
+# It contains the rent table, which keeps the current rent for every space and recalculates only the group that changed.
+
+STATION_BASE_RENT = 25
+UTILITY_MULTIPLIERS = (4, 10)
+AVERAGE_DICE_TOTAL = 7
+
+
+class RentTable:
+    def __init__(self, properties):
+        self.properties = properties
+        # Utilities charge a multiple of the dice roll, so their entry is the multiplier
+        self.rents = {}
+        self.utility_multipliers = {}
+        self.type_positions = {}
+        self.recalculations = 0
+
+        for key, space in properties.items():
+            self.type_positions.setdefault(space.get("type"), []).append(key)
+        for group in properties.group_positions:
+            self.update_group(group)
+
+        properties.subscribe(self.on_property_change)
+
+    def on_property_change(self, space, key, old_value, new_value):
+        self.update_group(space.get("group"))
+        # Station and utility rents depend on how many of the type an owner has
+        if space.get("type") in ("station", "utility"):
+            self.update_positions(self.type_positions.get(space["type"], []))
+
+    def update_group(self, group):
+        self.update_positions(self.properties.group_positions.get(group, []))
+
+    def update_positions(self, keys):
+        for key in keys:
+            space = self.properties[key]
+            if space.get("type") == "utility":
+                self.utility_multipliers[key] = self.get_utility_multiplier(
+                    space.get("owner")
+                )
+                self.rents.pop(key, None)
+            else:
+                self.rents[key] = self.calculate_rent(space, space.get("owner"))
+            self.recalculations += 1
+
+    def get_utility_multiplier(self, owner):
+        utility_count = self.properties.count_owned_of_type(owner, "utility")
+        return UTILITY_MULTIPLIERS[1] if utility_count > 1 else UTILITY_MULTIPLIERS[0]
+
+    def calculate_rent(self, space, owner, owned_count_change=0):
+        """Work out the rent for a space as if owner held it"""
+        if owner is None or space.get("is_mortgaged", False):
+            return 0
+
+        if space.get("type") == "station":
+            station_count = (
+                self.properties.count_owned_of_type(owner, "station")
+                + owned_count_change
+            )
+            return STATION_BASE_RENT * (2 ** (station_count - 1))
+
+        if space.get("type") == "utility":
+            utility_count = (
+                self.properties.count_owned_of_type(owner, "utility")
+                + owned_count_change
+            )
+            multiplier = UTILITY_MULTIPLIERS[1 if utility_count > 1 else 0]
+            return AVERAGE_DICE_TOTAL * multiplier
+
+        base_rent = space.get("rent", 0)
+        if space.get("houses", 0) > 0:
+            house_rents = space.get("house_costs", [])
+            house_index = min(space["houses"] - 1, len(house_rents) - 1)
+            return house_rents[house_index]
+
+        group = space.get("group")
+        if group:
+            owned = self.properties.count_owned_in_group(owner, group)
+            if owned + owned_count_change == self.properties.get_group_size(group):
+                return base_rent * 2
+        return base_rent
+
+    def get_rent(self, key, dice_total=None):
+        """Get the rent due on a space right now"""
+        key = str(key)
+        if key in self.utility_multipliers:
+            space = self.properties[key]
+            if space.get("owner") is None or space.get("is_mortgaged", False):
+                return 0
+            return (dice_total or AVERAGE_DICE_TOTAL) * self.utility_multipliers[key]
+        return self.rents.get(key, 0)
+
+    def get_rent_if_owned(self, key, owner):
+        """Get the rent a space would charge if owner bought it now"""
+        space = self.properties[str(key)]
+        if space.get("owner") == owner:
+            return self.get_rent(key)
+        return self.calculate_rent(space, owner, owned_count_change=1)
+
+    def scan_rent(self, space, owner):
+        """Work out a space's stored entry from a scan of the board, without the registry's counts"""
+        owned = [
+            other for other in self.properties.values() if other.get("owner") == owner
+        ]
+        if space.get("type") == "utility":
+            utility_count = sum(1 for other in owned if other.get("type") == "utility")
+            return UTILITY_MULTIPLIERS[1 if owner and utility_count > 1 else 0]
+
+        if owner is None or space.get("is_mortgaged", False):
+            return 0
+
+        if space.get("type") == "station":
+            station_count = sum(1 for other in owned if other.get("type") == "station")
+            return STATION_BASE_RENT * (2 ** (station_count - 1))
+
+        base_rent = space.get("rent", 0)
+        if space.get("houses", 0) > 0:
+            house_rents = space.get("house_costs", [])
+            house_index = min(space["houses"] - 1, len(house_rents) - 1)
+            return house_rents[house_index]
+
+        group = space.get("group")
+        if group and all(
+            other.get("owner") == owner
+            for other in self.properties.values()
+            if other.get("group") == group
+        ):
+            return base_rent * 2
+        return base_rent
+
+    def find_rent_errors(self):
+        """Compare every stored rent with a full scan of the board"""
+        errors = []
+        for key, space in self.properties.items():
+            expected = self.scan_rent(space, space.get("owner"))
+            if space.get("type") == "utility":
+                stored = self.utility_multipliers.get(key)
+            else:
+                stored = self.rents.get(key)
+            if stored != expected:
+                errors.append(
+                    f"{space.get('name')} has rent {stored}, a full scan gives {expected}"
+                )
+        return errors
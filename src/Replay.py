@@ -0,0 +1,227 @@
+# Property Tycoon Replay.py
+# It contains the replay runner, which plays a game back from its replay log on the headless engine at full speed.
+
+import argparse
+import cProfile
+import pstats
+import sys
+import time
+from collections import deque
+from src.Replay_Log import (
+    ReplayLog,
+    BID_EVENT,
+    BUY_EVENT,
+    DEVELOP_EVENT,
+    EXIT_EVENT,
+    JAIL_EVENT,
+    TURN_EVENT,
+)
+from src.Rng_Service import RngService
+from src.Simulation import HeadlessGame
+
+PROFILE_LINES = 25
+
+DEVELOPMENT_ACTIONS = (
+    "build_house",
+    "build_hotel",
+    "sell_house",
+    "sell_hotel",
+    "mortgage_property",
+    "unmortgage_property",
+)
+
+
+class ReplayGame(HeadlessGame):
+    def __init__(self, replay, quiet=True):
+        header = replay.header
+        self.replay = replay
+        self.turns = deque(event for event in replay.events if event[0] == TURN_EVENT)
+        self.recorded_turns = len(self.turns)
+        self.decisions = {}
+        for kind, turn, player_name, value in replay.events:
+            if kind != TURN_EVENT:
+                self.decisions.setdefault((kind, player_name), deque()).append(
+                    (turn, value)
+                )
+        self.staying_in_jail = set()
+        self.divergence = None
+
+        seat_configs = [
+            {
+                "name": player["name"],
+                "player_name": player["name"],
+                "ai_difficulty": player.get("ai_difficulty")
+                or header.get("ai_difficulty", "easy"),
+                "is_ai": player.get("is_ai", False),
+            }
+            for player in header["players"]
+        ]
+        super().__init__(
+            seat_configs=seat_configs,
+            ai_difficulty=header.get("ai_difficulty", "easy"),
+            seed=header["seed"],
+            rng_service=RngService(header["seed"]),
+            max_turns=self.recorded_turns,
+            quiet=quiet,
+        )
+        # The replay keeps its own log, so each turn can be checked against the recording
+        self.logic.replay_log = ReplayLog()
+
+    def has_decision(self, kind, player_name):
+        return bool(self.decisions.get((kind, player_name)))
+
+    def next_decision(self, kind, player_name):
+        """Take the player's next recorded decision of that kind"""
+        return self.decisions[(kind, player_name)].popleft()[1]
+
+    def _missing_decision(self, kind, player_name):
+        # Making one up would let the replay wander off without saying so
+        if self.divergence is None:
+            self.divergence = {
+                "turn": self.logic.turn_count,
+                "reason": f"missing recorded {kind} for {player_name}",
+            }
+
+    def _take_due(self, kind, player_name):
+        # Decisions made up to the current turn, e.g. building before or after the roll
+        queue = self.decisions.get((kind, player_name))
+        due = []
+        while queue and queue[0][0] <= self.logic.turn_count:
+            due.append(queue.popleft()[1])
+        return due
+
+    def is_over(self):
+        return self.divergence is not None or super().is_over()
+
+    def _play_turn(self):
+        logic = self.logic
+        for player in list(logic.players):
+            if self._take_due(EXIT_EVENT, player["name"]):
+                logic.remove_player(player["name"], voluntary=True)
+        if all(player.get("exited", False) for player in logic.players):
+            self.divergence = {"turn": logic.turn_count, "reason": "no players left"}
+            return
+
+        player = logic.players[logic.current_player_index]
+        while player.get("exited", False):
+            player = logic.advance_to_next_player()
+
+        if player.get("in_jail", False) and not self._handle_jail(player):
+            self._end_turn(player)
+            return
+
+        events = logic.replay_log.events
+        first_event = len(events)
+        super()._play_turn()
+        for event in events[first_event:]:
+            if event[0] == TURN_EVENT:
+                self._check_turn(event)
+
+    def _check_turn(self, event):
+        expected = self.turns.popleft() if self.turns else None
+        if event != expected and self.divergence is None:
+            self.divergence = {
+                "turn": event[1],
+                "expected": expected,
+                "replayed": event,
+            }
+
+    def _handle_jail(self, player):
+        # Same steps as GameActions.handle_jail_turn with the recorded choice; False ends the turn in jail
+        logic = self.logic
+        name = player["name"]
+        if name in self.staying_in_jail:
+            return False
+        if not self.has_decision(JAIL_EVENT, name):
+            self._missing_decision("jail choice", name)
+            return False
+
+        choice = self.next_decision(JAIL_EVENT, name)
+        outcome = logic.apply_jail_choice(player, choice)
+        if outcome == "stay":
+            if choice == "stay":
+                self.staying_in_jail.add(name)
+            return False
+        if outcome == "bankrupt":
+            logic.handle_bankruptcy(player)
+            return False
+        return True
+
+    def _decide_purchase(self, player, space):
+        if not self.has_decision(BUY_EVENT, player["name"]):
+            self._missing_decision("buy", player["name"])
+            return False
+        decision = self.next_decision(BUY_EVENT, player["name"])
+        return decision and player["money"] >= space["price"]
+
+    def _choose_bid(self, bidder, auction):
+        if not self.has_decision(BID_EVENT, bidder["name"]):
+            self._missing_decision("bid", bidder["name"])
+            return None
+        return self.next_decision(BID_EVENT, bidder["name"])
+
+    def _develop(self, player):
+        # Only recorded development is replayed, AI builds included
+        logic = self.logic
+        for action, position in self._take_due(DEVELOP_EVENT, player["name"]):
+            space = logic.properties.get(position)
+            if space is None:
+                continue
+            if action in DEVELOPMENT_ACTIONS:
+                getattr(logic, action)(space, player)
+
+    def get_result(self):
+        result = super().get_result()
+        result["recorded_turns"] = self.recorded_turns
+        result["divergence"] = self.divergence
+        return result
+
+
+def replay_game(path, quiet=True):
+    return ReplayGame(ReplayLog.load(path), quiet=quiet).run()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Play a game back from its replay log, headless and at full speed"
+    )
+    parser.add_argument(
+        "replay", help="Replay log written by the game (logs/replay_*.jsonl)"
+    )
+    parser.add_argument(
+        "--profile", help="Run under cProfile and write the stats to this file"
+    )
+    parser.add_argument(
+        "--verbose", action="store_true", help="Show the game's own output"
+    )
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.profile:
+        profiler = cProfile.Profile()
+        result = profiler.runcall(replay_game, args.replay, not args.verbose)
+        profiler.dump_stats(args.profile)
+    else:
+        result = replay_game(args.replay, quiet=not args.verbose)
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"Replayed {result['turns']} of {result['recorded_turns']} turns "
+        f"in {elapsed:.2f}s (seed {result['seed']})"
+    )
+    print(f"Winner: {result['winner']}, final money: {result['final_money']}")
+    if args.profile:
+        print(f"Profile written to {args.profile}")
+        pstats.Stats(args.profile).sort_stats("cumulative").print_stats(PROFILE_LINES)
+
+    divergence = result["divergence"]
+    if divergence:
+        print(f"Replay departed from the recording at turn {divergence['turn']}:")
+        for key in ("expected", "replayed", "reason"):
+            if key in divergence:
+                print(f"  {key}: {divergence[key]}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# Property Tycoon Replay_Log.py
+# It contains the replay log, which writes a game's seed, turns and player decisions to a JSON lines file as they happen.
+
+import json
+
+REPLAY_VERSION = 1
+
+# Events are compact lists, [kind, turn, player, value]; a turn's value is
+# [dice1, dice2, money, position] with money and position from before the roll
+TURN_EVENT = "turn"
+BUY_EVENT = "buy"
+BID_EVENT = "bid"
+JAIL_EVENT = "jail"
+DEVELOP_EVENT = "develop"
+EXIT_EVENT = "exit"
+
+
+class ReplayLog:
+    def __init__(self, path=None):
+        self.path = path
+        self.header = None
+        self.events = []
+        self._file = None
+
+    def start(self, seed, players, **settings):
+        """Write the header; players is a list of {"name", "is_ai", "ai_difficulty"}"""
+        self.header = {
+            "version": REPLAY_VERSION,
+            "seed": seed,
+            "players": players,
+            **settings,
+        }
+        if self.path:
+            # Line buffered, so a crash loses at most the event being written
+            self._file = open(self.path, "w", encoding="utf-8", buffering=1)
+            self._write(self.header)
+
+    def record(self, kind, turn, player_name, value=None):
+        event = [kind, turn, player_name, value]
+        self.events.append(event)
+        if self._file:
+            self._write(event)
+
+    def _write(self, entry):
+        try:
+            self._file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        except (OSError, ValueError) as e:
+            print(f"Error writing replay log: {e}")
+            self._file = None
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    @classmethod
+    def load(cls, path):
+        replay = cls()
+        with open(path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f):
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A game that crashed mid-write leaves a partial last line
+                    break
+                if line_number == 0:
+                    replay.header = entry
+                else:
+                    replay.events.append(entry)
+        if not replay.header or replay.header.get("version") != REPLAY_VERSION:
+            raise ValueError(f"{path} is not a version {REPLAY_VERSION} replay log")
+        return replay
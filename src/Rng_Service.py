@@ -0,0 +1,37 @@
+# Property Tycoon Rng_Service.py
+# It contains the RNG service, which hands out named random streams that are all seeded from one game seed.
+
+import random
+
+DICE_STREAM = "dice"
+DECK_STREAM = "decks"
+AI_STREAM = "ai"
+
+
+class RngService:
+    def __init__(self, seed=None, shared=None):
+        # shared hands every stream the same generator, for tools that seed a single rng
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(32)
+        self.seed = seed
+        self.shared = shared
+        self.streams = {}
+
+    def stream(self, name):
+        """Get a named stream, seeded from the game seed and the name so streams never share draws"""
+        if self.shared is not None:
+            return self.shared
+        if name not in self.streams:
+            self.streams[name] = random.Random(f"{self.seed}:{name}")
+        return self.streams[name]
+
+    def ai_stream(self, player_name):
+        """Get the stream for one AI player's own choices"""
+        return self.stream(f"{AI_STREAM}:{player_name}")
+
+    def reseed(self, seed):
+        self.seed = seed
+        if self.shared is not None:
+            self.shared.seed(seed)
+        for name, stream in self.streams.items():
+            stream.seed(f"{seed}:{name}")
@@ -0,0 +1,438 @@
+# Property Tycoon Save_Game.py
+# It contains the save game format, which stores a game as a binary snapshot followed by per-turn deltas, and the background autosaver.
+
+import json
+import os
+import struct
+import threading
+import zlib
+import pygame
+from src.Game_Logic import pot_luck_cards, opportunity_knocks_cards
+
+SAVE_VERSION = 1
+SAVE_MAGIC = b"PTSAVE"
+SAVES_DIR = "saves"
+AUTOSAVE_PATH = os.path.join(SAVES_DIR, "autosave.ptsave")
+
+# The file header is the magic and version, then each frame is a kind, payload
+# length and CRC32 followed by the payload, which is zlib compressed JSON
+FILE_HEADER = struct.Struct("<6sH")
+FRAME_HEADER = struct.Struct("<BII")
+SNAPSHOT_FRAME = 1
+DELTA_FRAME = 2
+
+# The snapshot is rewritten after this many deltas so loading never replays a long chain
+COMPACT_EVERY = 20
+
+LOGIC_FIELDS = (
+    "bank_money",
+    "free_parking_fund",
+    "current_player_index",
+    "turn_count",
+    "doubles_count",
+    "completed_circuits",
+    "jail_free_cards",
+    "bankrupted_players",
+    "voluntary_exits",
+    "available_tokens",
+)
+PROPERTY_FIELDS = ("owner", "houses", "is_mortgaged")
+GAME_FIELDS = (
+    "state",
+    "lap_count",
+    "rounds_completed",
+    "final_lap",
+    "time_limit_reached",
+    "game_over",
+)
+TOKEN_FIELDS = (
+    "position",
+    "money",
+    "in_jail",
+    "jail_turns",
+    "jail_cards",
+    "stay_in_jail",
+    "bankrupt",
+    "voluntary_exit",
+    "final_assets",
+    "is_moving",
+    "move_start_position",
+    "move_target_position",
+    "move_progress",
+    "move_path",
+    "current_path_index",
+)
+
+
+def _copy(value):
+    # Sections are handed to the autosave thread, so nothing mutable is shared with the game
+    if isinstance(value, dict):
+        return {key: _copy(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [_copy(item) for item in value]
+    return value
+
+
+def _deck_order(cards, deck):
+    index = {id(card): i for i, card in enumerate(deck)}
+    return [index[id(card)] for card in cards]
+
+
+def _capture_auction(auction):
+    if not auction or auction.get("completed", False):
+        return None
+    return {
+        "property_position": auction["property_position"],
+        "active_players": [p["name"] for p in auction["active_players"]],
+        "passed_players": sorted(auction["passed_players"]),
+        "highest_bidder": (
+            auction["highest_bidder"]["name"] if auction["highest_bidder"] else None
+        ),
+        "current_bid": auction["current_bid"],
+        "minimum_bid": auction["minimum_bid"],
+        "current_bidder_index": auction["current_bidder_index"],
+        "duration": auction["duration"],
+    }
+
+
+def capture_state(game):
+    """Copy everything needed to rebuild the game into plain sections; call on the game thread"""
+    logic = game.logic
+    logic_state = {field: _copy(getattr(logic, field)) for field in LOGIC_FIELDS}
+    logic_state["player_order"] = [player["name"] for player in logic.players]
+    logic_state["pot_luck_order"] = _deck_order(logic.pot_luck_cards, pot_luck_cards)
+    logic_state["opportunity_knocks_order"] = _deck_order(
+        logic.opportunity_knocks_cards, opportunity_knocks_cards
+    )
+    logic_state["auction"] = _capture_auction(logic.current_auction)
+
+    game_state = {field: _copy(getattr(game, field, None)) for field in GAME_FIELDS}
+    if game.time_limit and game.start_time is not None:
+        game_state["elapsed_ms"] = (
+            pygame.time.get_ticks() - game.start_time - game.total_pause_time
+        )
+
+    return {
+        "settings": {
+            "game_mode": game.game_mode,
+            "time_limit": game.time_limit,
+            "ai_difficulty": game.ai_difficulty,
+            "seed": game.rng_service.seed,
+            "seats": [
+                {
+                    "name": player.name,
+                    "player_number": player.player_number,
+                    "is_ai": player.is_ai,
+                    "ai_difficulty": player.ai_difficulty,
+                }
+                for player in game.players
+            ],
+        },
+        "logic": logic_state,
+        "players": {player["name"]: _copy(dict(player)) for player in logic.players},
+        "properties": {
+            key: {field: space[field] for field in PROPERTY_FIELDS if field in space}
+            for key, space in logic.properties.items()
+        },
+        "game": game_state,
+        "tokens": {
+            player.name: {
+                field: _copy(getattr(player, field)) for field in TOKEN_FIELDS
+            }
+            for player in game.players
+        },
+    }
+
+
+def diff_state(old, new):
+    """Get the keys of each section that changed or went away, or None if nothing did"""
+    changed = {}
+    removed = {}
+    for section, values in new.items():
+        old_values = old.get(section, {})
+        section_changed = {
+            key: value
+            for key, value in values.items()
+            if key not in old_values or old_values[key] != value
+        }
+        section_removed = [key for key in old_values if key not in values]
+        if section_changed:
+            changed[section] = section_changed
+        if section_removed:
+            removed[section] = section_removed
+    if not changed and not removed:
+        return None
+    return {"set": changed, "del": removed}
+
+
+def apply_delta(state, delta):
+    for section, values in delta.get("set", {}).items():
+        state.setdefault(section, {}).update(values)
+    for section, keys in delta.get("del", {}).items():
+        for key in keys:
+            state.get(section, {}).pop(key, None)
+    return state
+
+
+def _encode_frame(kind, data):
+    payload = zlib.compress(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+    return FRAME_HEADER.pack(kind, len(payload), zlib.crc32(payload)) + payload
+
+
+def write_snapshot(path, state):
+    """Write a new save holding just a snapshot, replacing the old file in one step"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    data = FILE_HEADER.pack(SAVE_MAGIC, SAVE_VERSION) + _encode_frame(
+        SNAPSHOT_FRAME, state
+    )
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(data)
+    os.replace(temp_path, path)
+    return len(data)
+
+
+def append_delta(path, delta):
+    frame = _encode_frame(DELTA_FRAME, delta)
+    with open(path, "ab") as f:
+        f.write(frame)
+    return len(frame)
+
+
+def read_save(path):
+    """Read a save back into one state, stopping at a frame that was cut short or is damaged"""
+    with open(path, "rb") as f:
+        data = f.read()
+
+    if len(data) < FILE_HEADER.size:
+        raise ValueError(f"{path} is not a save file")
+    magic, version = FILE_HEADER.unpack_from(data)
+    if magic != SAVE_MAGIC:
+        raise ValueError(f"{path} is not a save file")
+    if version != SAVE_VERSION:
+        raise ValueError(f"{path} is a version {version} save, expected {SAVE_VERSION}")
+
+    state = None
+    offset = FILE_HEADER.size
+    while offset + FRAME_HEADER.size <= len(data):
+        kind, length, checksum = FRAME_HEADER.unpack_from(data, offset)
+        start = offset + FRAME_HEADER.size
+        payload = data[start : start + length]
+        if len(payload) < length or zlib.crc32(payload) != checksum:
+            # A write the game never finished, e.g. it was closed mid-autosave
+            print(f"Ignoring damaged save frame at byte {offset} of {path}")
+            break
+        frame = json.loads(zlib.decompress(payload).decode("utf-8"))
+        if kind == SNAPSHOT_FRAME:
+            state = frame
+        elif kind == DELTA_FRAME and state is not None:
+            apply_delta(state, frame)
+        offset = start + length
+
+    if state is None:
+        raise ValueError(f"{path} has no snapshot to load")
+    return state
+
+
+def has_autosave(path=AUTOSAVE_PATH):
+    return os.path.exists(path)
+
+
+def _restore_auction(logic, saved):
+    position = saved["property_position"]
+    active_players = [logic.get_player(name) for name in saved["active_players"]]
+    if position not in logic.properties or None in active_players:
+        print("Saved auction refers to missing players or property - dropping it")
+        return False
+
+    highest_bidder = saved["highest_bidder"]
+    logic.current_auction = {
+        "property": logic.properties[position],
+        "property_position": position,
+        "active_players": active_players,
+        "passed_players": set(saved["passed_players"]),
+        "highest_bidder": logic.get_player(highest_bidder) if highest_bidder else None,
+        "current_bid": saved["current_bid"],
+        "minimum_bid": saved["minimum_bid"],
+        "current_bidder_index": saved["current_bidder_index"],
+        "start_time": logic.clock(),
+        "duration": saved["duration"],
+        "completed": False,
+        "settled": False,
+        "message": f"Auction resumed for {logic.properties[position]['name']}",
+    }
+    # The current bidder gets a full turn again, since the old deadline is long gone
+    logic.auction_engine.start(logic.current_auction)
+    return True
+
+
+def restore_state(game, state):
+    """Write a saved state into a freshly built Game with the same seats"""
+    logic = game.logic
+    logic_state = state["logic"]
+
+    for name, fields in state["players"].items():
+        logic_player = logic.get_player(name)
+        if logic_player is None:
+            print(f"Warning: Saved player {name} is not in this game")
+            continue
+        for key, value in fields.items():
+            if logic_player.get(key) != value:
+                logic_player[key] = value
+
+    order = logic_state["player_order"]
+    for player in list(logic.players):
+        if player["name"] not in order:
+            logic.player_store.remove(player["name"])
+    logic.players = [
+        logic.get_player(name) for name in order if logic.get_player(name) is not None
+    ]
+
+    for key, fields in state["properties"].items():
+        space = logic.properties.get(key)
+        if space is None:
+            continue
+        for field, value in fields.items():
+            if space.get(field) != value:
+                space[field] = value
+
+    for field in LOGIC_FIELDS:
+        if field in logic_state:
+            setattr(logic, field, logic_state[field])
+    logic.pot_luck_cards = [pot_luck_cards[i] for i in logic_state["pot_luck_order"]]
+    logic.opportunity_knocks_cards = [
+        opportunity_knocks_cards[i] for i in logic_state["opportunity_knocks_order"]
+    ]
+
+    for name, fields in state["tokens"].items():
+        player = game.get_player(name)
+        if player is None:
+            continue
+        for field, value in fields.items():
+            setattr(player, field, value)
+
+    game_state = state["game"]
+    for field in GAME_FIELDS:
+        if field in game_state:
+            setattr(game, field, game_state[field])
+    if game.time_limit and "elapsed_ms" in game_state:
+        game.start_time = pygame.time.get_ticks() - game_state["elapsed_ms"]
+        game.total_pause_time = 0
+
+    game.state = "ROLL"
+    if logic_state.get("auction") and _restore_auction(logic, logic_state["auction"]):
+        game.state = "AUCTION"
+
+    game.board.update_ownership(logic.properties)
+    game.synchronize_player_positions()
+    game.synchronize_player_money()
+    game.update_current_player()
+
+
+def load_game(path=AUTOSAVE_PATH):
+    """Build a Game from a save file; returns the game and its settings"""
+    from src.Game import Game
+    from src.Player import Player
+
+    state = read_save(path)
+    settings = state["settings"]
+    players = [
+        Player(
+            seat["name"],
+            player_number=seat["player_number"],
+            is_ai=seat["is_ai"],
+            ai_difficulty=seat["ai_difficulty"],
+        )
+        for seat in settings["seats"]
+    ]
+    # Dice and decks carry on from a fresh seed rather than repeating the saved game's opening
+    game = Game(
+        players,
+        game_mode=settings["game_mode"],
+        time_limit=settings["time_limit"],
+        ai_difficulty=settings["ai_difficulty"],
+    )
+    restore_state(game, state)
+    game_settings = {
+        "mode": settings["game_mode"],
+        "time_limit": settings["time_limit"],
+        "ai_difficulty": settings["ai_difficulty"],
+    }
+    return game, game_settings
+
+
+class Autosaver:
+    def __init__(self, path=AUTOSAVE_PATH, compact_every=COMPACT_EVERY):
+        self.path = path
+        self.compact_every = compact_every
+        self.saves_written = 0
+        self.bytes_written = 0
+        self._last_state = None
+        self._deltas_since_snapshot = 0
+        self._pending = None
+        self._stopping = False
+        self._ready = threading.Condition(threading.Lock())
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="Autosave", daemon=True)
+        self._thread.start()
+
+    def save(self, game):
+        """Capture the game now and hand it to the writer thread"""
+        state = capture_state(game)
+        with self._ready:
+            # Only the newest state matters, so an unwritten older one is replaced
+            self._pending = state
+            self._ready.notify()
+
+    def stop(self):
+        """Write out any pending save and stop the writer thread"""
+        if self._thread is None:
+            return
+        with self._ready:
+            self._stopping = True
+            self._ready.notify()
+        self._thread.join()
+        self._thread = None
+
+    def discard(self):
+        """Delete the save, e.g. once the game it holds is over"""
+        self.stop()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def _run(self):
+        while True:
+            with self._ready:
+                while self._pending is None and not self._stopping:
+                    self._ready.wait()
+                state, self._pending = self._pending, None
+            if state is None:
+                return
+            try:
+                self._write(state)
+            except (OSError, TypeError, ValueError) as e:
+                print(f"Error writing autosave: {e}")
+                # The next save starts a fresh snapshot instead of building on a broken file
+                self._last_state = None
+
+    def _write(self, state):
+        if (
+            self._last_state is None
+            or self._deltas_since_snapshot >= self.compact_every
+        ):
+            self.bytes_written += write_snapshot(self.path, state)
+            self._deltas_since_snapshot = 0
+        else:
+            delta = diff_state(self._last_state, state)
+            if delta is None:
+                return
+            self.bytes_written += append_delta(self.path, delta)
+            self._deltas_since_snapshot += 1
+        self._last_state = state
+        self.saves_written += 1
@@ -0,0 +1,392 @@
+# Property Tycoon Simulation.py
+# It contains the headless simulation engine, which plays AI-only games on GameLogic without pygame.
+
+import argparse
+import contextlib
+import random
+import time
+from src.Game_Logic import GameLogic
+from src.Ai_Player_Logic import EasyAIPlayer, HardAIPlayer
+from src.Expert_AI import ExpertAIPlayer
+from src.Rng_Service import RngService, AI_STREAM
+
+POT_LUCK_SPACES = [3, 18, 34]
+OPPORTUNITY_KNOCKS_SPACES = [8, 23, 37]
+GO_TO_JAIL_SPACE = 31
+
+MAX_PLAYERS = 5
+MAX_AUCTION_STEPS = 200
+
+# Same odds the running game uses for AI purchases and auction bids
+AI_BUY_CHANCE = 0.7
+AI_BID_CHANCE = 0.5
+
+TURN_DURATION_MS = 1000
+
+# Expert seats play a fixed number of rounds instead of a time budget, so seeded games repeat
+EXPERT_SIMULATION_ROUNDS = 30
+
+
+class SimulationClock:
+    def __init__(self, start=0):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, milliseconds):
+        self.now += milliseconds
+
+
+class SimulatedPlayer:
+    def __init__(self, name, player_number, config):
+        self.name = name
+        self.player_number = player_number
+        self.is_ai = config.get("is_ai", True)
+        self.config = config
+        self.buy_chance = config.get("buy_chance", AI_BUY_CHANCE)
+        self.bid_chance = config.get("bid_chance", AI_BID_CHANCE)
+        self.ai_player = None
+
+
+def create_ai_player(difficulty, rng, logic=None):
+    if difficulty == "expert":
+        return ExpertAIPlayer(
+            logic, rng=rng, time_budget=None, max_rounds=EXPERT_SIMULATION_ROUNDS
+        )
+    if difficulty == "hard":
+        return HardAIPlayer(rng=rng)
+    return EasyAIPlayer(rng=rng)
+
+
+class _NullWriter:
+    def write(self, text):
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+class HeadlessGame:
+    def __init__(
+        self,
+        player_count=4,
+        ai_difficulty="easy",
+        seed=None,
+        clock=None,
+        rng=None,
+        rng_service=None,
+        max_turns=1000,
+        quiet=True,
+        buy_chance=AI_BUY_CHANCE,
+        bid_chance=AI_BID_CHANCE,
+        seat_configs=None,
+    ):
+        # seat_configs gives each seat its own settings, e.g.
+        # {"name": "hard", "ai_difficulty": "hard", "buy_chance": 0.7};
+        # "player_name" and "is_ai" override the seat's name and AI flag.
+        # Without rng_service, rng (or one seeded from seed) drives every stream
+        if seat_configs is None:
+            seat_configs = [
+                {
+                    "name": ai_difficulty,
+                    "ai_difficulty": ai_difficulty,
+                    "buy_chance": buy_chance,
+                    "bid_chance": bid_chance,
+                }
+            ] * player_count
+        player_count = len(seat_configs)
+
+        if not 2 <= player_count <= MAX_PLAYERS:
+            raise ValueError(f"player_count must be between 2 and {MAX_PLAYERS}")
+
+        self.seed = seed
+        self.rng = rng or random.Random(seed)
+        self.rng_service = rng_service or RngService(seed, shared=self.rng)
+        self.clock = clock or SimulationClock()
+        self.ai_difficulty = ai_difficulty
+        self.max_turns = max_turns
+        self.quiet = quiet
+
+        self.turn = 0
+        self.winner = None
+        self.bankruptcy_turns = {}
+        self.auction_prices = []
+
+        with self._output():
+            self.logic = GameLogic(clock=self.clock, rng_service=self.rng_service)
+            if self.logic.properties is None:
+                raise RuntimeError("Failed to load board data")
+
+            self.logic.ai_difficulty = ai_difficulty
+            self.logic.ai_player = create_ai_player(
+                ai_difficulty, self.rng_service.stream(AI_STREAM), self.logic
+            )
+
+            self.seats = {}
+            for number, config in enumerate(seat_configs, start=1):
+                seat = SimulatedPlayer(
+                    config.get("player_name", f"AI {number}"), number, config
+                )
+                seat.ai_player = create_ai_player(
+                    config.get("ai_difficulty", ai_difficulty),
+                    self.rng_service.ai_stream(seat.name),
+                    self.logic,
+                )
+                self.seats[seat.name] = seat
+                self.logic.add_player(seat)
+
+        self.player_names = [player["name"] for player in self.logic.players]
+
+    def _output(self):
+        if self.quiet:
+            return contextlib.redirect_stdout(_NullWriter())
+        return contextlib.nullcontext()
+
+    def is_over(self):
+        return len(self.logic.players) <= 1 or self.turn >= self.max_turns
+
+    def play_turn(self):
+        if self.is_over():
+            return False
+
+        with self._output():
+            self._play_turn()
+        return True
+
+    def run(self):
+        with self._output():
+            while not self.is_over():
+                self._play_turn()
+
+        return self.get_result()
+
+    def _play_turn(self):
+        logic = self.logic
+        player = logic.players[logic.current_player_index]
+        # Jail and mortgage choices go through logic.ai_player
+        logic.ai_player = self.seats[player["name"]].ai_player
+
+        logic.play_turn()
+        self.turn += 1
+        self.clock.advance(TURN_DURATION_MS)
+
+        if self._check_bankrupt(player) or player.get("in_jail", False):
+            return
+
+        position = player["position"]
+        if position == GO_TO_JAIL_SPACE:
+            logic.handle_jail(player)
+            self._end_turn(player)
+        elif position in POT_LUCK_SPACES:
+            self._draw_card(player, "Pot Luck")
+        elif position in OPPORTUNITY_KNOCKS_SPACES:
+            self._draw_card(player, "Opportunity Knocks")
+        elif logic.last_space_result == "can_buy":
+            self._resolve_purchase(player)
+
+        if not self._check_bankrupt(player):
+            self._develop(player)
+
+        logic.message_queue.clear()
+
+    def _end_turn(self, player):
+        logic = self.logic
+        logic.doubles_count = 0
+        if (
+            player in logic.players
+            and logic.players[logic.current_player_index] is player
+        ):
+            logic.advance_to_next_player()
+
+    def _draw_card(self, player, card_type):
+        logic = self.logic
+        result, message = logic.handle_card_draw(player, card_type)
+
+        if self._check_bankrupt(player):
+            return
+
+        if message and message.lower().startswith("go to jail"):
+            logic.handle_jail(player)
+            self._end_turn(player)
+        elif result == "moved":
+            space_result, _ = logic.handle_space(player)
+            if space_result == "can_buy":
+                self._resolve_purchase(player)
+
+    def _resolve_purchase(self, player):
+        # Mirrors Game.finish_dice_animation and GameActions.handle_buy_decision
+        logic = self.logic
+        space = logic.properties[str(player["position"])]
+
+        if self._decide_purchase(player, space):
+            player["money"] -= space["price"]
+            logic.bank_money += space["price"]
+            space["owner"] = player["name"]
+            logic.check_property_group_completion(player["name"])
+        elif logic.auction_property(player["position"]) == "auction_in_progress":
+            self._run_auction()
+
+    def _decide_purchase(self, player, space):
+        seat = self.seats[player["name"]]
+        if isinstance(seat.ai_player, ExpertAIPlayer):
+            return seat.ai_player.should_buy_property(
+                space,
+                player["money"],
+                self.logic.properties.get_owned(player["name"]),
+                player["name"],
+            )
+        return (
+            self.rng_service.ai_stream(seat.name).random() < seat.buy_chance
+            and player["money"] >= space["price"]
+        )
+
+    def _choose_bid(self, bidder, auction):
+        # Mirrors the AI auction turn in Main.run_game
+        seat = self.seats[bidder["name"]]
+        if isinstance(seat.ai_player, ExpertAIPlayer):
+            return seat.ai_player.make_auction_bid(
+                auction["property"],
+                auction["current_bid"],
+                bidder["money"],
+                self.logic.properties.get_owned(bidder["name"]),
+                bidder["name"],
+            )
+        ai_rng = self.rng_service.ai_stream(seat.name)
+        if (
+            ai_rng.random() < seat.bid_chance
+            and bidder["money"] >= auction["minimum_bid"]
+        ):
+            return min(bidder["money"], auction["minimum_bid"] + ai_rng.randint(10, 50))
+        return None
+
+    def _run_auction(self):
+        # Every seat is an AI, so the auction plays out without touching the clock
+        logic = self.logic
+        auction = logic.auction_engine.fast_forward(
+            self._choose_bid, max_steps=MAX_AUCTION_STEPS
+        )
+
+        if auction:
+            if auction["highest_bidder"]:
+                self.auction_prices.append(
+                    (
+                        auction["property"]["name"],
+                        auction["current_bid"],
+                        auction["highest_bidder"]["name"],
+                    )
+                )
+            logic.current_auction = None
+
+    def _develop(self, player):
+        # Mirrors the AI development step in Game.finish_dice_animation
+        ai_player = self.seats[player["name"]].ai_player
+        prop = ai_player.handle_property_development(player, self.logic.properties)
+        if isinstance(prop, dict):
+            if prop.get("houses", 0) < 4:
+                self.logic.build_house(prop, player)
+            else:
+                self.logic.build_hotel(prop, player)
+
+    def _check_bankrupt(self, player):
+        logic = self.logic
+
+        if player in logic.players and player["money"] < 0:
+            logic.handle_ai_bankruptcy_prevention(player, 0)
+            if player["money"] < 0:
+                logic.handle_bankruptcy(player)
+
+        if player not in logic.players:
+            self.bankruptcy_turns.setdefault(player["name"], self.turn)
+            return True
+        return False
+
+    def get_total_assets(self, player):
+        total = player["money"]
+        for prop in self.logic.properties.values():
+            if prop.get("owner") == player["name"]:
+                total += prop.get("price", 0)
+        return total
+
+    def get_result(self):
+        players = self.logic.players
+        if len(players) == 1:
+            self.winner = players[0]["name"]
+        elif players:
+            self.winner = max(players, key=self.get_total_assets)["name"]
+
+        return {
+            "seed": self.seed,
+            "ai_difficulty": self.ai_difficulty,
+            "players": self.player_names,
+            "seats": {
+                name: seat.config.get("name", seat.config.get("ai_difficulty"))
+                for name, seat in self.seats.items()
+            },
+            "turns": self.turn,
+            "finished": len(players) <= 1,
+            "winner": self.winner,
+            "bankruptcy_turns": dict(self.bankruptcy_turns),
+            "auction_prices": list(self.auction_prices),
+            "final_money": {p["name"]: p["money"] for p in players},
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run headless AI-only games")
+    parser.add_argument("--games", type=int, default=10)
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument(
+        "--difficulty", choices=["easy", "hard", "expert"], default="easy"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-turns", type=int, default=1000)
+    parser.add_argument(
+        "--check-index",
+        action="store_true",
+        help="Compare the property indexes and rent table with a full scan after every turn",
+    )
+    args = parser.parse_args()
+
+    total_turns = 0
+    valuation_hits = valuation_misses = 0
+    start = time.perf_counter()
+    for game_number in range(args.games):
+        game = HeadlessGame(
+            player_count=args.players,
+            ai_difficulty=args.difficulty,
+            seed=args.seed + game_number,
+            max_turns=args.max_turns,
+        )
+        if args.check_index:
+            while game.play_turn():
+                errors = game.logic.properties.find_index_errors()
+                errors += game.logic.rent_table.find_rent_errors()
+                if errors:
+                    raise RuntimeError(
+                        f"Property index out of step on turn {game.turn}: {errors}"
+                    )
+            result = game.get_result()
+        else:
+            result = game.run()
+        total_turns += result["turns"]
+        valuation_stats = game.logic.properties.valuations.get_stats()
+        valuation_hits += valuation_stats["hits"]
+        valuation_misses += valuation_stats["misses"]
+        print(
+            f"Game {game_number + 1}: winner {result['winner']} after {result['turns']} turns"
+        )
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"{total_turns} turns in {elapsed:.2f}s ({total_turns / elapsed:.0f} turns/s)"
+    )
+    if valuation_hits + valuation_misses:
+        print(
+            f"Valuation cache: {valuation_hits} hits, {valuation_misses} misses "
+            f"({valuation_hits / (valuation_hits + valuation_misses):.0%} reused)"
+        )
+
+
+if __name__ == "__main__":
+    main()
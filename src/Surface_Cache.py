@@ -0,0 +1,78 @@
+# Property Tycoon Surface_Cache.py
+# It contains the surface cache, which keeps pre-scaled surfaces in least-recently-used order within a memory budget.
+
+from collections import OrderedDict
+
+DEFAULT_BUDGET_BYTES = 64 * 1024 * 1024
+
+
+class SurfaceCache:
+    def __init__(self, budget_bytes=DEFAULT_BUDGET_BYTES):
+        self._surfaces = OrderedDict()
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def get_surface_size(surface):
+        """Get the number of bytes a surface's pixels take up"""
+        width, height = surface.get_size()
+        return width * height * surface.get_bytesize()
+
+    def get(self, key):
+        """Get a cached surface and mark it as recently used"""
+        surface = self._surfaces.get(key)
+        if surface is None:
+            self.misses += 1
+            return None
+
+        self._surfaces.move_to_end(key)
+        self.hits += 1
+        return surface
+
+    def put(self, key, surface):
+        """Cache a surface, evicting the least recently used ones over budget"""
+        self.discard(key)
+
+        size = self.get_surface_size(surface)
+        if size > self.budget_bytes:
+            return surface
+
+        self._surfaces[key] = surface
+        self.used_bytes += size
+        while self.used_bytes > self.budget_bytes:
+            _, evicted = self._surfaces.popitem(last=False)
+            self.used_bytes -= self.get_surface_size(evicted)
+        return surface
+
+    def discard(self, key):
+        """Remove a surface from the cache if it is there"""
+        surface = self._surfaces.pop(key, None)
+        if surface is not None:
+            self.used_bytes -= self.get_surface_size(surface)
+
+    def set_budget(self, budget_bytes):
+        """Change the memory budget and evict anything over it"""
+        self.budget_bytes = budget_bytes
+        while self._surfaces and self.used_bytes > self.budget_bytes:
+            _, evicted = self._surfaces.popitem(last=False)
+            self.used_bytes -= self.get_surface_size(evicted)
+
+    def clear(self):
+        """Clear the surface cache"""
+        self._surfaces.clear()
+        self.used_bytes = 0
+
+    def get_stats(self):
+        """Get the entry count, memory use and hit/miss counters"""
+        return {
+            "entries": len(self._surfaces),
+            "used_bytes": self.used_bytes,
+            "budget_bytes": self.budget_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+surface_cache = SurfaceCache()
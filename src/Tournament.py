@@ -0,0 +1,199 @@
+# Property Tycoon Tournament.py
+# It contains the tournament runner, which plays seeded headless games across a process pool and aggregates AI results.
+
+import argparse
+import json
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from src.Simulation import HeadlessGame, AI_BUY_CHANCE, AI_BID_CHANCE
+
+RESULT_VERSION = 1
+
+AI_CONFIGS = {
+    "easy": {"name": "easy", "ai_difficulty": "easy"},
+    "hard": {"name": "hard", "ai_difficulty": "hard"},
+    "expert": {"name": "expert", "ai_difficulty": "expert"},
+}
+
+
+def build_game_specs(configs, games, players, seed, max_turns):
+    specs = []
+    for game_number in range(games):
+        # Rotate seats so no configuration always moves first
+        seats = [
+            configs[(game_number + seat) % len(configs)] for seat in range(players)
+        ]
+        specs.append(
+            {
+                "game": game_number,
+                "seed": seed + game_number,
+                "seat_configs": seats,
+                "max_turns": max_turns,
+            }
+        )
+    return specs
+
+
+def play_game(spec):
+    game = HeadlessGame(
+        seed=spec["seed"],
+        seat_configs=spec["seat_configs"],
+        max_turns=spec["max_turns"],
+    )
+    result = game.run()
+    result["game"] = spec["game"]
+    return result
+
+
+def _summarise(values):
+    if not values:
+        return None
+    return {
+        "count": len(values),
+        "mean": round(statistics.fmean(values), 2),
+        "median": statistics.median(values),
+        "min": min(values),
+        "max": max(values),
+    }
+
+
+def aggregate_results(configs, results):
+    stats = {
+        config["name"]: {
+            "seats": 0,
+            "wins": 0,
+            "game_turns": [],
+            "bankruptcy_turns": [],
+            "auction_prices": [],
+        }
+        for config in configs
+    }
+
+    for result in results:
+        seats = result["seats"]
+        for player_name, config_name in seats.items():
+            config_stats = stats[config_name]
+            config_stats["seats"] += 1
+            config_stats["game_turns"].append(result["turns"])
+            if player_name == result["winner"]:
+                config_stats["wins"] += 1
+            if player_name in result["bankruptcy_turns"]:
+                config_stats["bankruptcy_turns"].append(
+                    result["bankruptcy_turns"][player_name]
+                )
+
+        # auction_prices only records the price, so credit it to the winner's seat
+        for property_name, price, winner in result["auction_prices"]:
+            stats[seats[winner]]["auction_prices"].append(price)
+
+    summary = {}
+    for name, config_stats in stats.items():
+        seats = config_stats["seats"]
+        summary[name] = {
+            "seats": seats,
+            "wins": config_stats["wins"],
+            "win_rate": round(config_stats["wins"] / seats, 4) if seats else 0.0,
+            "game_length": _summarise(config_stats["game_turns"]),
+            "bankruptcy_turn": _summarise(config_stats["bankruptcy_turns"]),
+            "auction_price": _summarise(config_stats["auction_prices"]),
+        }
+    return summary
+
+
+def run_tournament(configs, games=100, players=4, seed=0, max_turns=1000, workers=None):
+    specs = build_game_specs(configs, games, players, seed, max_turns)
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(specs) // (workers * 4))
+
+    start = time.perf_counter()
+    if workers == 1:
+        results = [play_game(spec) for spec in specs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(play_game, specs, chunksize=chunksize))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "version": RESULT_VERSION,
+        "settings": {
+            "games": games,
+            "players": players,
+            "seed": seed,
+            "max_turns": max_turns,
+            "configs": configs,
+        },
+        "summary": aggregate_results(configs, results),
+        "games": [
+            {
+                "seed": result["seed"],
+                "turns": result["turns"],
+                "finished": result["finished"],
+                "winner": result["seats"].get(result["winner"]),
+            }
+            for result in results
+        ],
+    }, elapsed
+
+
+def load_configs(names, config_file=None):
+    configs = dict(AI_CONFIGS)
+    if config_file:
+        with open(config_file, "r", encoding="utf-8") as f:
+            for config in json.load(f):
+                configs[config["name"]] = config
+
+    selected = []
+    for name in names or ["easy", "hard"]:
+        if name not in configs:
+            raise ValueError(f"Unknown AI configuration '{name}'")
+        config = dict(configs[name])
+        config.setdefault("buy_chance", AI_BUY_CHANCE)
+        config.setdefault("bid_chance", AI_BID_CHANCE)
+        selected.append(config)
+    return selected
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a seeded AI tournament")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-turns", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument(
+        "--config",
+        action="append",
+        dest="configs",
+        help="AI configuration name; repeat to compare several",
+    )
+    parser.add_argument(
+        "--config-file", help="JSON list of extra AI configurations to choose from"
+    )
+    parser.add_argument("--output", default="tournament_results.json")
+    args = parser.parse_args()
+
+    configs = load_configs(args.configs, args.config_file)
+    report, elapsed = run_tournament(
+        configs,
+        games=args.games,
+        players=args.players,
+        seed=args.seed,
+        max_turns=args.max_turns,
+        workers=args.workers,
+    )
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=1, sort_keys=True)
+        f.write("\n")
+
+    for name, summary in report["summary"].items():
+        print(
+            f"{name}: win rate {summary['win_rate']:.1%} over {summary['seats']} seats"
+        )
+    print(f"{args.games} games in {elapsed:.2f}s, results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,8 @@ import math
 import random
 from src.Font_Manager import font_manager
 from src.Sound_Manager import sound_manager
+from src.Asset_Manager import asset_manager
+from src.Game_Intro import is_fast_start, set_fast_start
 import os
 import webbrowser
 
@@ -103,8 +105,8 @@ class UIButton:
 
         screen.blit(button_surface, self.rect)
 
-        text_shadow = self.font.render(self.text, True, BLACK)
-        text_surface = self.font.render(self.text, True, CREAM)
+        text_shadow = font_manager.render_text(self.font, self.text, True, BLACK)
+        text_surface = font_manager.render_text(self.font, self.text, True, CREAM)
 
         text_rect = text_surface.get_rect(center=self.rect.center)
         shadow_rect = text_rect.copy()
@@ -170,7 +172,7 @@ class UIInput:
         else:
             color = LIGHT_GRAY
             text = self.placeholder
-        text_surface = self.font.render(text, True, color)
+        text_surface = font_manager.render_text(self.font, text, True, color)
         text_rect = text_surface.get_rect(center=self.rect.center)
         screen.blit(text_surface, text_rect)
         border_color = WHITE if self.active or self.is_selected else LIGHT_GRAY
@@ -182,26 +184,27 @@ class UIInput:
 class BasePage:
     def __init__(self, instructions=None):
         window_size = get_window_size()
-        self.screen = pygame.display.set_mode(window_size)
+        # set_mode would recreate the window surface and flicker, so the current one is reused
+        self.screen = pygame.display.get_surface()
+        if not self.screen:
+            self.screen = pygame.display.set_mode(window_size)
         try:
-            asset_path = os.path.join(base_path, "assets/image/Logo.png")
-            self.logo_image = pygame.image.load(asset_path)
+            logo_image = asset_manager.get_image("Logo.png")
             logo_width = int(window_size[0] * 0.3)
             logo_height = int(
-                logo_width
-                * (self.logo_image.get_height() / self.logo_image.get_width())
+                logo_width * (logo_image.get_height() / logo_image.get_width())
             )
-            self.logo_image = pygame.transform.scale(
-                self.logo_image, (logo_width, logo_height)
+            self.logo_image = asset_manager.get_scaled(
+                "Logo.png", (logo_width, logo_height)
             )
         except (pygame.error, FileNotFoundError):
             print("Could not load game logo")
             self.logo_image = None
 
         try:
-            asset_path = os.path.join(base_path, "assets/image/starterbackground.png")
-            self.background_image = pygame.image.load(asset_path)
-            self.original_background = self.background_image.copy()
+            self.background_key = "starterbackground.png"
+            self.background_image = asset_manager.get_image(self.background_key)
+            self.original_background = self.background_image
         except (pygame.error, FileNotFoundError):
             print("Could not load background image")
             self.background_image = None
@@ -232,8 +235,9 @@ class BasePage:
             pos_x = (window_width - scaled_width) // 2
             pos_y = (window_height - scaled_height) // 2
 
-            scaled_bg = pygame.transform.scale(
-                self.original_background, (scaled_width, scaled_height)
+            # Scaled once per window size and shared by every page
+            scaled_bg = asset_manager.get_scaled(
+                self.background_key, (scaled_width, scaled_height)
             )
             self.screen.blit(scaled_bg, (pos_x, pos_y))
         else:
@@ -257,14 +261,14 @@ class BasePage:
             logo_rect = self.logo_image.get_rect(centerx=window_size[0] // 2, y=80)
             self.screen.blit(self.logo_image, logo_rect)
         elif isinstance(self, MainMenuPage) or isinstance(self, HowToPlayPage):
-            title_shadow = self.title_font.render(
-                "Property Tycoon Alpha 25.03.2025", True, BLACK
+            title_shadow = font_manager.render_text(
+                self.title_font, "Property Tycoon Alpha 25.03.2025", True, BLACK
             )
-            title_glow = self.title_font.render(
-                "Property Tycoon Alpha 25.03.2025", True, ACCENT_COLOR
+            title_glow = font_manager.render_text(
+                self.title_font, "Property Tycoon Alpha 25.03.2025", True, ACCENT_COLOR
             )
-            title_text = self.title_font.render(
-                "Property Tycoon Alpha 25.03.2025", True, WHITE
+            title_text = font_manager.render_text(
+                self.title_font, "Property Tycoon Alpha 25.03.2025", True, WHITE
             )
             title_rect = title_text.get_rect(centerx=window_size[0] // 2, y=80)
             shadow_rect = title_rect.copy()
@@ -285,7 +289,7 @@ class BasePage:
             total_height = len(self.instructions) * line_height
 
             for i, instruction in enumerate(self.instructions):
-                text_surface = font.render(instruction, True, WHITE)
+                text_surface = font_manager.render_text(font, instruction, True, WHITE)
                 y_position = (
                     window_size[1] - (total_height - (i * line_height)) - padding
                 )
@@ -299,9 +303,10 @@ class BasePage:
 
 
 class MainMenuPage(BasePage):
-    def __init__(self, instructions=None):
+    def __init__(self, instructions=None, can_continue=False):
         super().__init__(instructions=instructions)
         self.small_font = font_manager.get_font(24)
+        self.can_continue = can_continue
         button_width = 300
         button_height = 60
 
@@ -328,6 +333,18 @@ class MainMenuPage(BasePage):
             color=MODE_COLOR,
         )
 
+        self.continue_button = UIButton(
+            pygame.Rect(
+                (get_window_size()[0] - button_width) // 2,
+                get_window_size()[1] // 2 + 160,
+                button_width,
+                button_height,
+            ),
+            "Continue Game",
+            self.button_font,
+            color=SUCCESS_COLOR,
+        )
+
         self.settings_button = UIButton(
             pygame.Rect(
                 20,
@@ -340,14 +357,10 @@ class MainMenuPage(BasePage):
         )
 
         try:
-            youtube_path = os.path.join(base_path, "assets/image/Youtube Logo.png")
-            self.youtube_logo = pygame.image.load(youtube_path)
-            self.youtube_logo = pygame.transform.scale(self.youtube_logo, (40, 40))
+            self.youtube_logo = asset_manager.get_scaled("Youtube Logo.png", (40, 40))
             self.youtube_rect = self.youtube_logo.get_rect(topleft=(20, 20))
 
-            github_path = os.path.join(base_path, "assets/image/GitHub-Symbol.png")
-            self.github_logo = pygame.image.load(github_path)
-            self.github_logo = pygame.transform.scale(self.github_logo, (40, 40))
+            self.github_logo = asset_manager.get_scaled("GitHub-Symbol.png", (40, 40))
             self.github_rect = self.github_logo.get_rect(topleft=(80, 20))
 
             self.github_hover = False
@@ -367,6 +380,8 @@ class MainMenuPage(BasePage):
         self.start_button.draw(self.screen)
         self.how_to_play_button.draw(self.screen)
         self.settings_button.draw(self.screen)
+        if self.can_continue:
+            self.continue_button.draw(self.screen)
 
         if hasattr(self, "youtube_logo") and self.youtube_logo:
             if self.youtube_hover:
@@ -406,19 +421,26 @@ class MainMenuPage(BasePage):
                 )
             self.screen.blit(self.github_logo, self.github_rect)
 
-        version_text = self.version_font.render(
-            "Build Version: Alpha 25.03.2025", True, ERROR_COLOR
+        version_text = font_manager.render_text(
+            self.version_font, "Build Version: Alpha 25.03.2025", True, ERROR_COLOR
         )
         version_rect = version_text.get_rect(
             right=get_window_size()[0] - 20, bottom=get_window_size()[1] - 20
         )
         self.screen.blit(version_text, version_rect)
 
-        controls_text1 = self.small_font.render(
-            "Press ENTER to start", True, LIGHT_GRAY
+        controls_text1 = font_manager.render_text(
+            self.small_font, "Press ENTER to start", True, LIGHT_GRAY
         )
-        controls_text2 = self.small_font.render(
-            "H for how to play, S for settings", True, LIGHT_GRAY
+        controls_text2 = font_manager.render_text(
+            self.small_font,
+            (
+                "H for how to play, S for settings, C to continue"
+                if self.can_continue
+                else "H for how to play, S for settings"
+            ),
+            True,
+            LIGHT_GRAY,
         )
 
         controls_rect1 = controls_text1.get_rect(
@@ -440,6 +462,8 @@ class MainMenuPage(BasePage):
             return "how_to_play"
         elif self.settings_button.check_hover(pos):
             return "settings"
+        elif self.can_continue and self.continue_button.check_hover(pos):
+            return "continue"
         elif hasattr(self, "github_rect") and self.github_rect.collidepoint(pos):
             try:
                 webbrowser.open(self.github_url)
@@ -458,6 +482,8 @@ class MainMenuPage(BasePage):
         self.start_button.check_hover(pos)
         self.how_to_play_button.check_hover(pos)
         self.settings_button.check_hover(pos)
+        if self.can_continue:
+            self.continue_button.check_hover(pos)
 
         if hasattr(self, "github_rect"):
             self.github_hover = self.github_rect.collidepoint(pos)
@@ -471,6 +497,8 @@ class MainMenuPage(BasePage):
             return "how_to_play"
         elif event.key == pygame.K_s:
             return "settings"
+        elif event.key == pygame.K_c and self.can_continue:
+            return "continue"
         return None
 
 
@@ -502,6 +530,7 @@ class SettingsPage(BasePage):
 
         self.sound_volume = int(self.sound_manager.sound_volume * 100)
         self.music_volume = int(self.sound_manager.music_volume * 100)
+        self.fast_start = is_fast_start()
 
         button_width = 500
         button_height = 60
@@ -552,11 +581,23 @@ class SettingsPage(BasePage):
             color=MODE_COLOR,
         )
 
+        self.intro_button = UIButton(
+            pygame.Rect(
+                (get_window_size()[0] - button_width) // 2,
+                get_window_size()[1] // 2 + 60,
+                button_width,
+                button_height,
+            ),
+            f"Game Intro: {'Off' if self.fast_start else 'On'}",
+            self.button_font,
+            color=MODE_COLOR,
+        )
+
         confirm_button_width = 350
         self.confirm_button = UIButton(
             pygame.Rect(
                 (get_window_size()[0] - confirm_button_width) // 2,
-                get_window_size()[1] // 2 + 60,
+                get_window_size()[1] // 2 + 130,
                 confirm_button_width,
                 button_height,
             ),
@@ -598,15 +639,20 @@ class SettingsPage(BasePage):
         self.draw_background()
         self.draw_title()
 
-        settings_text = self.button_font.render("Game Settings", True, WHITE)
+        settings_text = font_manager.render_text(
+            self.button_font, "Game Settings", True, WHITE
+        )
         settings_rect = settings_text.get_rect(centerx=get_window_size()[0] // 2, y=100)
         self.screen.blit(settings_text, settings_rect)
 
         self.resolution_button.text = f"Screen Size: {self.resolution_options[self.current_resolution][0]}x{self.resolution_options[self.current_resolution][1]}"
         self.resolution_button.draw(self.screen)
 
-        info_text = self.small_font.render(
-            "All resolutions maintain 16:9 aspect ratio", True, LIGHT_GRAY
+        info_text = font_manager.render_text(
+            self.small_font,
+            "All resolutions maintain 16:9 aspect ratio",
+            True,
+            LIGHT_GRAY,
         )
         info_rect = info_text.get_rect(
             centerx=get_window_size()[0] // 2,
@@ -625,11 +671,17 @@ class SettingsPage(BasePage):
         self.music_volume_button.draw(self.screen)
         self.test_music_button.draw(self.screen)
 
+        self.intro_button.text = f"Game Intro: {'Off' if self.fast_start else 'On'}"
+        self.intro_button.draw(self.screen)
+
         if self.show_confirmation:
             current_time = pygame.time.get_ticks()
             if current_time - self.confirmation_time < self.CONFIRMATION_DURATION:
-                confirm_text = self.small_font.render(
-                    "Press ENTER or click Confirm to apply changes", True, SUCCESS_COLOR
+                confirm_text = font_manager.render_text(
+                    self.small_font,
+                    "Press ENTER or click Confirm to apply changes",
+                    True,
+                    SUCCESS_COLOR,
                 )
                 confirm_rect = confirm_text.get_rect(
                     centerx=get_window_size()[0] // 2,
@@ -645,12 +697,15 @@ class SettingsPage(BasePage):
             "F - Change font",
             "S - Adjust sound volume",
             "M - Adjust music volume",
+            "I - Turn the game intro on or off",
             "Enter/Space - Apply and return",
         ]
 
-        y_offset = get_window_size()[1] - 180
+        y_offset = get_window_size()[1] - 205
         for hint in controls:
-            hint_text = self.small_font.render(hint, True, LIGHT_GRAY)
+            hint_text = font_manager.render_text(
+                self.small_font, hint, True, LIGHT_GRAY
+            )
             hint_rect = hint_text.get_rect(right=get_window_size()[0] - 20, y=y_offset)
             self.screen.blit(hint_text, hint_rect)
             y_offset += 25
@@ -685,6 +740,9 @@ class SettingsPage(BasePage):
             self.show_confirmation = True
             self.confirmation_time = pygame.time.get_ticks()
             return False
+        elif self.intro_button.check_hover(pos):
+            self.toggle_fast_start()
+            return False
         elif self.test_sound_button.check_hover(pos):
             self.sound_manager.play_sound("menu_click")
             return False
@@ -715,6 +773,7 @@ class SettingsPage(BasePage):
         self.font_button.check_hover(pos)
         self.sound_volume_button.check_hover(pos)
         self.music_volume_button.check_hover(pos)
+        self.intro_button.check_hover(pos)
         self.test_sound_button.check_hover(pos)
         self.test_music_button.check_hover(pos)
         self.confirm_button.check_hover(pos)
@@ -745,6 +804,9 @@ class SettingsPage(BasePage):
             self.show_confirmation = True
             self.confirmation_time = pygame.time.get_ticks()
             return False
+        elif event.key == pygame.K_i:
+            self.toggle_fast_start()
+            return False
         elif event.key in [pygame.K_RETURN, pygame.K_SPACE]:
             current_resolution = get_window_size()
             new_resolution = self.resolution_options[self.current_resolution]
@@ -760,6 +822,11 @@ class SettingsPage(BasePage):
             return "back"
         return False
 
+    def toggle_fast_start(self):
+        # Saved straight away, like the volume settings
+        self.fast_start = not self.fast_start
+        set_fast_start(self.fast_start)
+
     def get_settings(self):
         return {
             "resolution": self.resolution_options[self.current_resolution],
@@ -768,13 +835,13 @@ class SettingsPage(BasePage):
             ),
             "sound_volume": self.sound_volume / 100.0,
             "music_volume": self.music_volume / 100.0,
+            "fast_start": self.fast_start,
         }
 
 
 class StartPage(BasePage):
     def __init__(self, instructions=None):
         super().__init__(instructions=instructions)
-        self.screen = pygame.display.set_mode(get_window_size())
         pygame.display.set_caption("Property Tycoon Alpha 25.03.2025")
         self.title_font = font_manager.get_font(82)
         self.button_font = font_manager.get_font(42)
@@ -794,18 +861,9 @@ class StartPage(BasePage):
         self.token_images = []
         for i in range(1, 7):
             try:
-                image_path = os.path.join(
-                    base_path, "assets", "image", f"Playertoken ({i}).png"
+                self.token_images.append(
+                    asset_manager.get_scaled(f"Playertoken ({i}).png", (40, 40))
                 )
-                if os.path.exists(image_path):
-                    token_image = pygame.image.load(image_path)
-                    token_image = pygame.transform.scale(token_image, (40, 40))
-                    self.token_images.append(token_image)
-                else:
-                    print(f"Token image {i} not found at {image_path}")
-                    fallback = pygame.Surface((40, 40), pygame.SRCALPHA)
-                    pygame.draw.circle(fallback, (50 * i, 100, 150), (20, 20), 20)
-                    self.token_images.append(fallback)
             except Exception as e:
                 print(f"Error loading token image {i}: {e}")
                 fallback = pygame.Surface((40, 40), pygame.SRCALPHA)
@@ -948,7 +1006,9 @@ class StartPage(BasePage):
         self.draw_background()
         self.draw_title()
 
-        player_setup_title = self.button_font.render("Player Setup", True, WHITE)
+        player_setup_title = font_manager.render_text(
+            self.button_font, "Player Setup", True, WHITE
+        )
         title_rect = player_setup_title.get_rect(
             centerx=get_window_size()[0] // 2, y=100
         )
@@ -958,24 +1018,24 @@ class StartPage(BasePage):
 
         player_controls_y = input_y_start - 120
 
-        human_text = self.button_font.render(
-            f"Human Players: {self.human_count}", True, HUMAN_COLOR
+        human_text = font_manager.render_text(
+            self.button_font, f"Human Players: {self.human_count}", True, HUMAN_COLOR
         )
         human_rect = human_text.get_rect(
             centerx=get_window_size()[0] // 2 - 150, y=player_controls_y - 40
         )
         self.screen.blit(human_text, human_rect)
 
-        ai_text = self.button_font.render(
-            f"AI Players: {self.ai_count}", True, AI_COLOR
+        ai_text = font_manager.render_text(
+            self.button_font, f"AI Players: {self.ai_count}", True, AI_COLOR
         )
         ai_rect = ai_text.get_rect(
             centerx=get_window_size()[0] // 2 + 150, y=player_controls_y - 40
         )
         self.screen.blit(ai_text, ai_rect)
 
-        total_text = self.small_font.render(
-            f"Total Players: {self.total_players}/5", True, LIGHT_GRAY
+        total_text = font_manager.render_text(
+            self.small_font, f"Total Players: {self.total_players}/5", True, LIGHT_GRAY
         )
         total_rect = total_text.get_rect(
             centerx=get_window_size()[0] // 2, y=player_controls_y + 20
@@ -1011,7 +1071,9 @@ class StartPage(BasePage):
                 )
                 self.name_inputs[i].draw(self.screen)
 
-                human_label = self.small_font.render("Human", True, HUMAN_COLOR)
+                human_label = font_manager.render_text(
+                    self.small_font, "Human", True, HUMAN_COLOR
+                )
                 label_rect = human_label.get_rect(
                     right=self.name_inputs[i].rect.left - 10,
                     centery=self.name_inputs[i].rect.centery,
@@ -1055,7 +1117,9 @@ class StartPage(BasePage):
                         self.screen, ACCENT_COLOR, ai_input_rect, 2, border_radius=5
                     )
 
-                ai_text = self.input_font.render(self.ai_names[i], True, LIGHT_GRAY)
+                ai_text = font_manager.render_text(
+                    self.input_font, self.ai_names[i], True, LIGHT_GRAY
+                )
                 ai_rect = ai_text.get_rect(center=ai_input_rect.center)
 
                 pygame.draw.rect(
@@ -1063,7 +1127,9 @@ class StartPage(BasePage):
                 )
                 self.screen.blit(ai_text, ai_rect)
 
-                ai_label = self.small_font.render("AI", True, AI_COLOR)
+                ai_label = font_manager.render_text(
+                    self.small_font, "AI", True, AI_COLOR
+                )
                 label_rect = ai_label.get_rect(
                     right=ai_input_rect.left - 10, centery=ai_input_rect.centery
                 )
@@ -1119,7 +1185,9 @@ class StartPage(BasePage):
 
         y_offset = get_window_size()[1] - 210
         for hint in controls:
-            hint_text = self.small_font.render(hint, True, LIGHT_GRAY)
+            hint_text = font_manager.render_text(
+                self.small_font, hint, True, LIGHT_GRAY
+            )
             hint_rect = hint_text.get_rect(right=get_window_size()[0] - 20, y=y_offset)
             self.screen.blit(hint_text, hint_rect)
             y_offset += 20
@@ -1152,16 +1220,19 @@ class StartPage(BasePage):
 
         player_type = "AI" if self.token_selection_is_ai else "Human"
         player_index = self.token_selection_for_player + 1
-        title_text = self.button_font.render(
-            f"Select Token for {player_type} {player_index}", True, WHITE
+        title_text = font_manager.render_text(
+            self.button_font,
+            f"Select Token for {player_type} {player_index}",
+            True,
+            WHITE,
         )
         title_rect = title_text.get_rect(
             centerx=panel_x + panel_width // 2, top=panel_y + 20
         )
         self.screen.blit(title_text, title_rect)
 
-        hint_text = self.small_font.render(
-            "Click any token to select", True, LIGHT_GRAY
+        hint_text = font_manager.render_text(
+            self.small_font, "Click any token to select", True, LIGHT_GRAY
         )
         hint_rect = hint_text.get_rect(
             centerx=panel_x + panel_width // 2, top=panel_y + 60
@@ -1236,7 +1307,8 @@ class StartPage(BasePage):
                     and token_user == self.token_selection_for_player + 1
                 )
             ):
-                user_text = self.small_font.render(
+                user_text = font_manager.render_text(
+                    self.small_font,
                     f"{'AI' if token_is_ai else 'P'}{token_user}",
                     True,
                     AI_COLOR if token_is_ai else HUMAN_COLOR,
@@ -1258,7 +1330,7 @@ class StartPage(BasePage):
         )
 
         pygame.draw.rect(self.screen, ACCENT_COLOR, close_button_rect, border_radius=5)
-        close_text = self.small_font.render("Close", True, WHITE)
+        close_text = font_manager.render_text(self.small_font, "Close", True, WHITE)
         close_rect = close_text.get_rect(center=close_button_rect.center)
         self.screen.blit(close_text, close_rect)
 
@@ -1632,13 +1704,17 @@ class PlayerSelectPage(BasePage):
         self.draw_background()
         self.draw_title()
 
-        section_title = self.button_font.render("Select Number of Players", True, WHITE)
+        section_title = font_manager.render_text(
+            self.button_font, "Select Number of Players", True, WHITE
+        )
         title_rect = section_title.get_rect(
             centerx=get_window_size()[0] // 2, y=get_window_size()[1] // 2 - 170
         )
         self.screen.blit(section_title, title_rect)
 
-        count_text = self.button_font.render(str(self.player_count), True, WHITE)
+        count_text = font_manager.render_text(
+            self.button_font, str(self.player_count), True, WHITE
+        )
         count_rect = count_text.get_rect(
             centerx=get_window_size()[0] // 2, y=get_window_size()[1] // 2 - 130
         )
@@ -1651,7 +1727,9 @@ class PlayerSelectPage(BasePage):
         self.minus_button.draw(self.screen)
         self.plus_button.draw(self.screen)
 
-        name_section_title = self.button_font.render("Enter Player Names", True, WHITE)
+        name_section_title = font_manager.render_text(
+            self.button_font, "Enter Player Names", True, WHITE
+        )
         name_title_rect = name_section_title.get_rect(
             centerx=get_window_size()[0] // 2, y=get_window_size()[1] // 2 - 90
         )
@@ -1666,8 +1744,8 @@ class PlayerSelectPage(BasePage):
             self.name_inputs[i].draw(self.screen)
 
             if i == self.active_input:
-                help_text = self.small_font.render(
-                    "Type name and press Enter", True, LIGHT_GRAY
+                help_text = font_manager.render_text(
+                    self.small_font, "Type name and press Enter", True, LIGHT_GRAY
                 )
                 help_rect = help_text.get_rect(
                     left=self.name_inputs[i].rect.right + 10,
@@ -1691,7 +1769,9 @@ class PlayerSelectPage(BasePage):
 
         y_offset = get_window_size()[1] - 80
         for hint in controls:
-            hint_text = self.small_font.render(hint, True, LIGHT_GRAY)
+            hint_text = font_manager.render_text(
+                self.small_font, hint, True, LIGHT_GRAY
+            )
             hint_rect = hint_text.get_rect(
                 centerx=get_window_size()[0] // 2, y=y_offset
             )
@@ -1856,7 +1936,9 @@ class HowToPlayPage(BasePage):
         )
 
         title = self.instructions[0]
-        title_surface = self.button_font.render(title, True, ACCENT_COLOR)
+        title_surface = font_manager.render_text(
+            self.button_font, title, True, ACCENT_COLOR
+        )
         title_rect = title_surface.get_rect(
             centerx=get_window_size()[0] // 2, y=panel_y + 15
         )
@@ -1871,10 +1953,14 @@ class HowToPlayPage(BasePage):
                 y_offset += 12
                 continue
             elif line.endswith(":"):
-                text_surface = self.button_font.render(line, True, ACCENT_COLOR)
+                text_surface = font_manager.render_text(
+                    self.button_font, line, True, ACCENT_COLOR
+                )
                 y_offset += 10
             else:
-                text_surface = self.small_font.render(line, True, BLACK)
+                text_surface = font_manager.render_text(
+                    self.small_font, line, True, BLACK
+                )
 
             text_rect = text_surface.get_rect(
                 centerx=get_window_size()[0] // 2, y=y_offset
@@ -1885,8 +1971,8 @@ class HowToPlayPage(BasePage):
         self.back_button.draw(self.screen)
         self.shortcuts_button.draw(self.screen)
 
-        hint_text = self.small_font.render(
-            "Press ESC or BACKSPACE to return", True, LIGHT_GRAY
+        hint_text = font_manager.render_text(
+            self.small_font, "Press ESC or BACKSPACE to return", True, LIGHT_GRAY
         )
         hint_rect = hint_text.get_rect(
             right=get_window_size()[0] - 20, y=get_window_size()[1] - 180
@@ -1964,7 +2050,7 @@ class KeyboardShortcutsPage(BasePage):
         self.draw_background()
 
         title = "Keyboard Shortcuts"
-        title_surface = self.title_font.render(title, True, DARK_RED)
+        title_surface = font_manager.render_text(self.title_font, title, True, DARK_RED)
         title_rect = title_surface.get_rect(centerx=get_window_size()[0] // 2, y=50)
         self.screen.blit(title_surface, title_rect)
 
@@ -2013,17 +2099,23 @@ class KeyboardShortcutsPage(BasePage):
                 continue
 
             if description == "":
-                text_surface = section_header_font.render(key, True, ACCENT_COLOR)
+                text_surface = font_manager.render_text(
+                    section_header_font, key, True, ACCENT_COLOR
+                )
                 text_rect = text_surface.get_rect(x=panel_x + 30, y=y_offset)
                 self.screen.blit(text_surface, text_rect)
                 y_offset += 35
             else:
                 key_width = 200
-                key_surface = self.small_font.render(key, True, BLACK)
+                key_surface = font_manager.render_text(
+                    self.small_font, key, True, BLACK
+                )
                 key_rect = key_surface.get_rect(x=panel_x + 50, y=y_offset)
                 self.screen.blit(key_surface, key_rect)
 
-                desc_surface = self.small_font.render(description, True, BLACK)
+                desc_surface = font_manager.render_text(
+                    self.small_font, description, True, BLACK
+                )
                 desc_rect = desc_surface.get_rect(
                     x=panel_x + 50 + key_width, y=y_offset
                 )
@@ -2040,17 +2132,23 @@ class KeyboardShortcutsPage(BasePage):
                 continue
 
             if description == "":
-                text_surface = section_header_font.render(key, True, ACCENT_COLOR)
+                text_surface = font_manager.render_text(
+                    section_header_font, key, True, ACCENT_COLOR
+                )
                 text_rect = text_surface.get_rect(x=right_x + 30, y=y_offset)
                 self.screen.blit(text_surface, text_rect)
                 y_offset += 35
             else:
                 key_width = 200
-                key_surface = self.small_font.render(key, True, BLACK)
+                key_surface = font_manager.render_text(
+                    self.small_font, key, True, BLACK
+                )
                 key_rect = key_surface.get_rect(x=right_x + 50, y=y_offset)
                 self.screen.blit(key_surface, key_rect)
 
-                desc_surface = self.small_font.render(description, True, BLACK)
+                desc_surface = font_manager.render_text(
+                    self.small_font, description, True, BLACK
+                )
                 desc_rect = desc_surface.get_rect(
                     x=right_x + 50 + key_width, y=y_offset
                 )
@@ -2060,8 +2158,8 @@ class KeyboardShortcutsPage(BasePage):
 
         self.back_button.draw(self.screen)
 
-        hint_text = self.small_font.render(
-            "Press ESC or BACKSPACE to return", True, LIGHT_GRAY
+        hint_text = font_manager.render_text(
+            self.small_font, "Press ESC or BACKSPACE to return", True, LIGHT_GRAY
         )
         hint_rect = hint_text.get_rect(
             right=get_window_size()[0] - 20, y=get_window_size()[1] - 180
@@ -2150,7 +2248,9 @@ class GameModePage(BasePage):
         self.draw_background()
         self.draw_title()
 
-        mode_title = self.button_font.render("Select Game Mode", True, WHITE)
+        mode_title = font_manager.render_text(
+            self.button_font, "Select Game Mode", True, WHITE
+        )
         mode_title_rect = mode_title.get_rect(centerx=get_window_size()[0] // 2, y=100)
         self.screen.blit(mode_title, mode_title_rect)
 
@@ -2163,14 +2263,18 @@ class GameModePage(BasePage):
         mode_info = (
             self.abridged_text if self.game_mode == "abridged" else self.full_game_text
         )
-        info_text = self.small_font.render(mode_info, True, LIGHT_GRAY)
+        info_text = font_manager.render_text(
+            self.small_font, mode_info, True, LIGHT_GRAY
+        )
         info_rect = info_text.get_rect(
             centerx=get_window_size()[0] // 2, top=self.mode_button.rect.bottom + 10
         )
         self.screen.blit(info_text, info_rect)
 
         if self.game_mode == "abridged":
-            label_text = self.small_font.render(self.time_label, True, LIGHT_GRAY)
+            label_text = font_manager.render_text(
+                self.small_font, self.time_label, True, LIGHT_GRAY
+            )
             label_rect = label_text.get_rect(
                 centerx=get_window_size()[0] // 2,
                 bottom=self.custom_time_input.rect.top - 15,
@@ -2180,7 +2284,9 @@ class GameModePage(BasePage):
             self.custom_time_input.draw(self.screen)
 
             if self.input_error:
-                error_text = self.small_font.render(self.input_error, True, ERROR_COLOR)
+                error_text = font_manager.render_text(
+                    self.small_font, self.input_error, True, ERROR_COLOR
+                )
                 error_rect = error_text.get_rect(
                     centerx=get_window_size()[0] // 2,
                     top=self.custom_time_input.rect.bottom + 5,
@@ -2190,7 +2296,9 @@ class GameModePage(BasePage):
                 try:
                     minutes = int(self.custom_time_input.text)
                     time_info = f"Game will end after {minutes} minutes"
-                    time_text = self.small_font.render(time_info, True, LIGHT_GRAY)
+                    time_text = font_manager.render_text(
+                        self.small_font, time_info, True, LIGHT_GRAY
+                    )
                     time_rect = time_text.get_rect(
                         centerx=get_window_size()[0] // 2,
                         top=self.custom_time_input.rect.bottom + 5,
@@ -2211,7 +2319,9 @@ class GameModePage(BasePage):
 
         y_offset = get_window_size()[1] - 180
         for hint in controls:
-            hint_text = self.small_font.render(hint, True, LIGHT_GRAY)
+            hint_text = font_manager.render_text(
+                self.small_font, hint, True, LIGHT_GRAY
+            )
             hint_rect = hint_text.get_rect(right=get_window_size()[0] - 20, y=y_offset)
             self.screen.blit(hint_text, hint_rect)
             y_offset += 25
@@ -2405,8 +2515,7 @@ class EndGamePage(BasePage):
             print("Using existing surface for EndGamePage")
 
         try:
-            endgame_bg_path = os.path.join(base_path, "assets/image/EndgamePageBG.jpg")
-            self.original_endgame_bg = pygame.image.load(endgame_bg_path)
+            self.original_endgame_bg = asset_manager.get_image("EndgamePageBG.jpg")
             print("Loaded EndgamePageBG.jpg successfully")
         except (pygame.error, FileNotFoundError) as e:
             print(f"Could not load end game background: {e}")
@@ -2525,7 +2634,9 @@ class EndGamePage(BasePage):
             border_radius=15,
         )
 
-        winner_text = self.title_font.render("Game Over!", True, ACCENT_COLOR)
+        winner_text = font_manager.render_text(
+            self.title_font, "Game Over!", True, ACCENT_COLOR
+        )
         self.screen.blit(
             winner_text,
             (card_x + (card_width - winner_text.get_width()) // 2, card_y + 40),
@@ -2557,22 +2668,27 @@ class EndGamePage(BasePage):
 
         if self.winner_name == "Tie" and self.tied_winners:
             winner_text = "It's a Tie!"
-            winner_name = self.button_font.render(winner_text, True, SUCCESS_COLOR)
+            winner_name = font_manager.render_text(
+                self.button_font, winner_text, True, SUCCESS_COLOR
+            )
             self.screen.blit(
                 winner_name,
                 (card_x + (card_width - winner_name.get_width()) // 2, card_y + 180),
             )
 
-            tied_text = self.small_font.render(
-                f"Tied players: {', '.join(self.tied_winners)}", True, ACCENT_COLOR
+            tied_text = font_manager.render_text(
+                self.small_font,
+                f"Tied players: {', '.join(self.tied_winners)}",
+                True,
+                ACCENT_COLOR,
             )
             self.screen.blit(
                 tied_text,
                 (card_x + (card_width - tied_text.get_width()) // 2, card_y + 220),
             )
         else:
-            winner_name = self.button_font.render(
-                f"Winner: {self.winner_name}", True, SUCCESS_COLOR
+            winner_name = font_manager.render_text(
+                self.button_font, f"Winner: {self.winner_name}", True, SUCCESS_COLOR
             )
             self.screen.blit(
                 winner_name,
@@ -2589,7 +2705,9 @@ class EndGamePage(BasePage):
 
         y_offset = card_y + 260
         if self.final_assets:
-            assets_title = self.button_font.render("Final Assets", True, BLACK)
+            assets_title = font_manager.render_text(
+                self.button_font, "Final Assets", True, BLACK
+            )
             self.screen.blit(
                 assets_title,
                 (card_x + (card_width - assets_title.get_width()) // 2, y_offset),
@@ -2615,8 +2733,8 @@ class EndGamePage(BasePage):
                 else:
                     text_color = LIGHT_GRAY
 
-                player_text = self.small_font.render(
-                    f"{name}: £{amount:,}", True, text_color
+                player_text = font_manager.render_text(
+                    self.small_font, f"{name}: £{amount:,}", True, text_color
                 )
                 self.screen.blit(player_text, (x_pos, y_pos))
 
@@ -2627,28 +2745,34 @@ class EndGamePage(BasePage):
                 + 20
             )
 
-            bankrupt_title = self.small_font.render(
-                "Bankrupted Players:", True, ERROR_COLOR
+            bankrupt_title = font_manager.render_text(
+                self.small_font, "Bankrupted Players:", True, ERROR_COLOR
             )
             self.screen.blit(bankrupt_title, (card_x + 50, y_offset))
             y_offset += 30
 
-            bankrupt_text = self.small_font.render(
-                f"{', '.join(self.bankrupted_players)}", True, ERROR_COLOR
+            bankrupt_text = font_manager.render_text(
+                self.small_font,
+                f"{', '.join(self.bankrupted_players)}",
+                True,
+                ERROR_COLOR,
             )
             self.screen.blit(bankrupt_text, (card_x + 70, y_offset))
             y_offset += 40
 
         if self.voluntary_exits:
             y_offset += 20
-            voluntary_title = self.small_font.render(
-                "Voluntary Exits:", True, ACCENT_COLOR
+            voluntary_title = font_manager.render_text(
+                self.small_font, "Voluntary Exits:", True, ACCENT_COLOR
             )
             self.screen.blit(voluntary_title, (card_x + 50, y_offset))
             y_offset += 30
 
-            voluntary_text = self.small_font.render(
-                f"{', '.join(self.voluntary_exits)}", True, ACCENT_COLOR
+            voluntary_text = font_manager.render_text(
+                self.small_font,
+                f"{', '.join(self.voluntary_exits)}",
+                True,
+                ACCENT_COLOR,
             )
             self.screen.blit(voluntary_text, (card_x + 70, y_offset))
             y_offset += 40
@@ -2656,7 +2780,9 @@ class EndGamePage(BasePage):
         if self.lap_count:
             y_offset += 50
 
-            lap_title = self.small_font.render("Laps Completed:", True, ACCENT_COLOR)
+            lap_title = font_manager.render_text(
+                self.small_font, "Laps Completed:", True, ACCENT_COLOR
+            )
             self.screen.blit(lap_title, (card_x + 50, y_offset))
             y_offset += 30
 
@@ -2676,18 +2802,15 @@ class EndGamePage(BasePage):
             lap_text_combined = ", ".join(lap_text_parts)
             max_width = card_width - 140
 
-            test_text = self.small_font.render(lap_text_combined, True, ACCENT_COLOR)
-            if test_text.get_width() > max_width:
+            if self.small_font.size(lap_text_combined)[0] > max_width:
                 current_line = ""
                 current_y = y_offset
 
                 for i, part in enumerate(lap_text_parts):
                     test_line = current_line + (", " if current_line else "") + part
-                    test_render = self.small_font.render(test_line, True, ACCENT_COLOR)
-
-                    if test_render.get_width() > max_width and current_line:
-                        line_text = self.small_font.render(
-                            current_line, True, ACCENT_COLOR
+                    if self.small_font.size(test_line)[0] > max_width and current_line:
+                        line_text = font_manager.render_text(
+                            self.small_font, current_line, True, ACCENT_COLOR
                         )
                         self.screen.blit(line_text, (card_x + 70, current_y))
                         current_y += 25
@@ -2700,10 +2823,14 @@ class EndGamePage(BasePage):
                         )
 
                 if current_line:
-                    line_text = self.small_font.render(current_line, True, ACCENT_COLOR)
+                    line_text = font_manager.render_text(
+                        self.small_font, current_line, True, ACCENT_COLOR
+                    )
                     self.screen.blit(line_text, (card_x + 70, current_y))
             else:
-                lap_text = self.small_font.render(lap_text_combined, True, ACCENT_COLOR)
+                lap_text = font_manager.render_text(
+                    self.small_font, lap_text_combined, True, ACCENT_COLOR
+                )
                 self.screen.blit(lap_text, (card_x + 70, y_offset))
 
         self.play_again_button.draw(self.screen)
@@ -2760,7 +2887,9 @@ class CreditsPage(BasePage):
     def draw(self):
         self.draw_background()
 
-        title_text = self.title_font.render("Property Tycoon", True, ERROR_COLOR)
+        title_text = font_manager.render_text(
+            self.title_font, "Property Tycoon", True, ERROR_COLOR
+        )
         title_rect = title_text.get_rect(centerx=get_window_size()[0] // 2, y=80)
         self.screen.blit(title_text, title_rect)
 
@@ -2784,7 +2913,9 @@ class CreditsPage(BasePage):
             border_radius=15,
         )
 
-        credits_text = self.button_font.render("Developers", True, ACCENT_COLOR)
+        credits_text = font_manager.render_text(
+            self.button_font, "Developers", True, ACCENT_COLOR
+        )
         credits_rect = credits_text.get_rect(
             centerx=get_window_size()[0] // 2, y=panel_y + 30
         )
@@ -2802,14 +2933,16 @@ class CreditsPage(BasePage):
         line_spacing = 35
 
         for dev in self.developers:
-            dev_text = self.button_font.render(dev, True, BLACK)
+            dev_text = font_manager.render_text(self.button_font, dev, True, BLACK)
             dev_rect = dev_text.get_rect(centerx=get_window_size()[0] // 2, y=y_offset)
             self.screen.blit(dev_text, dev_rect)
             y_offset += line_spacing
 
         y_offset = panel_y + panel_height - 170
 
-        thanks_text = self.button_font.render("Special Thanks", True, ACCENT_COLOR)
+        thanks_text = font_manager.render_text(
+            self.button_font, "Special Thanks", True, ACCENT_COLOR
+        )
         thanks_rect = thanks_text.get_rect(
             centerx=get_window_size()[0] // 2, y=y_offset
         )
@@ -2823,23 +2956,25 @@ class CreditsPage(BasePage):
             2,
         )
 
-        quentin_text = self.small_font.render(
-            "Mr Quentin Raffles @ Watson Games", True, BLACK
+        quentin_text = font_manager.render_text(
+            self.small_font, "Mr Quentin Raffles @ Watson Games", True, BLACK
         )
         quentin_rect = quentin_text.get_rect(
             centerx=get_window_size()[0] // 2, y=thanks_rect.bottom + 15
         )
         self.screen.blit(quentin_text, quentin_rect)
 
-        thanks_msg_text = self.small_font.render(
-            "Thank you for playing our game!", True, BLACK
+        thanks_msg_text = font_manager.render_text(
+            self.small_font, "Thank you for playing our game!", True, BLACK
         )
         thanks_msg_rect = thanks_msg_text.get_rect(
             centerx=get_window_size()[0] // 2, y=quentin_rect.bottom + 15
         )
         self.screen.blit(thanks_msg_text, thanks_msg_rect)
 
-        watson_text = self.small_font.render("Watson Games © 2025", True, BLACK)
+        watson_text = font_manager.render_text(
+            self.small_font, "Watson Games © 2025", True, BLACK
+        )
         watson_rect = watson_text.get_rect(
             centerx=get_window_size()[0] // 2, y=thanks_msg_rect.bottom + 10
         )
@@ -2847,8 +2982,8 @@ class CreditsPage(BasePage):
 
         self.back_button.draw(self.screen)
 
-        hint_text = self.small_font.render(
-            "Press ESC or BACKSPACE to return", True, LIGHT_GRAY
+        hint_text = font_manager.render_text(
+            self.small_font, "Press ESC or BACKSPACE to return", True, LIGHT_GRAY
         )
         hint_rect = hint_text.get_rect(
             right=get_window_size()[0] - 20, y=get_window_size()[1] - 180
@@ -2882,7 +3017,7 @@ class AIDifficultyPage(BasePage):
         self.easy_button = UIButton(
             pygame.Rect(
                 (get_window_size()[0] - button_width) // 2,
-                center_y - 50,
+                center_y - 100,
                 button_width,
                 button_height,
             ),
@@ -2894,7 +3029,7 @@ class AIDifficultyPage(BasePage):
         self.hard_button = UIButton(
             pygame.Rect(
                 (get_window_size()[0] - button_width) // 2,
-                center_y + 50,
+                center_y,
                 button_width,
                 button_height,
             ),
@@ -2903,6 +3038,18 @@ class AIDifficultyPage(BasePage):
             color=ERROR_COLOR,
         )
 
+        self.expert_button = UIButton(
+            pygame.Rect(
+                (get_window_size()[0] - button_width) // 2,
+                center_y + 100,
+                button_width,
+                button_height,
+            ),
+            "Expert",
+            self.button_font,
+            color=ACCENT_COLOR,
+        )
+
         self.back_button = UIButton(
             pygame.Rect(20, get_window_size()[1] - 80, 200, button_height),
             "Back",
@@ -2913,34 +3060,54 @@ class AIDifficultyPage(BasePage):
         self.draw_background()
         self.draw_title()
 
-        difficulty_text = self.button_font.render("Select AI Difficulty", True, WHITE)
+        difficulty_text = font_manager.render_text(
+            self.button_font, "Select AI Difficulty", True, WHITE
+        )
         text_rect = difficulty_text.get_rect(centerx=get_window_size()[0] // 2, y=100)
         self.screen.blit(difficulty_text, text_rect)
 
-        easy_desc = self.small_font.render(
-            "AI will make basic decisions", True, LIGHT_GRAY
+        easy_desc = font_manager.render_text(
+            self.small_font, "AI will make basic decisions", True, LIGHT_GRAY
         )
         easy_rect = easy_desc.get_rect(
             centerx=get_window_size()[0] // 2, y=self.easy_button.rect.bottom + 10
         )
 
-        hard_desc = self.small_font.render(
-            "AI will make strategic decisions", True, LIGHT_GRAY
+        hard_desc = font_manager.render_text(
+            self.small_font, "AI will make strategic decisions", True, LIGHT_GRAY
         )
         hard_rect = hard_desc.get_rect(
             centerx=get_window_size()[0] // 2, y=self.hard_button.rect.bottom + 10
         )
 
+        expert_desc = font_manager.render_text(
+            self.small_font,
+            "AI will play out each choice before making it",
+            True,
+            LIGHT_GRAY,
+        )
+        expert_rect = expert_desc.get_rect(
+            centerx=get_window_size()[0] // 2, y=self.expert_button.rect.bottom + 10
+        )
+
         self.easy_button.draw(self.screen)
         self.hard_button.draw(self.screen)
+        self.expert_button.draw(self.screen)
 
         self.screen.blit(easy_desc, easy_rect)
         self.screen.blit(hard_desc, hard_rect)
+        self.screen.blit(expert_desc, expert_rect)
 
-        controls = ["Press E for Easy mode", "Press H for Hard mode"]
+        controls = [
+            "Press E for Easy mode",
+            "Press H for Hard mode",
+            "Press X for Expert mode",
+        ]
         y_offset = get_window_size()[1] - 180
         for hint in controls:
-            hint_text = self.small_font.render(hint, True, LIGHT_GRAY)
+            hint_text = font_manager.render_text(
+                self.small_font, hint, True, LIGHT_GRAY
+            )
             hint_rect = hint_text.get_rect(right=get_window_size()[0] - 20, y=y_offset)
             self.screen.blit(hint_text, hint_rect)
             y_offset += 25
@@ -2956,12 +3123,15 @@ class AIDifficultyPage(BasePage):
             return "easy"
         elif self.hard_button.check_hover(pos):
             return "hard"
+        elif self.expert_button.check_hover(pos):
+            return "expert"
         return None
 
     def handle_motion(self, pos):
         self.back_button.check_hover(pos)
         self.easy_button.check_hover(pos)
         self.hard_button.check_hover(pos)
+        self.expert_button.check_hover(pos)
 
     def handle_key(self, event):
         if event.key == pygame.K_ESCAPE:
@@ -2970,6 +3140,8 @@ class AIDifficultyPage(BasePage):
             return "easy"
         elif event.key == pygame.K_h:
             return "hard"
+        elif event.key == pygame.K_x:
+            return "expert"
         return None
 
 
@@ -2990,8 +3162,12 @@ class DevelopmentNotification:
         self.sub_text = "Click Continue or press SPACE/ENTER to end your turn"
 
         self.padding = 20
-        self.notification_text = self.dev_font.render(self.text, True, WHITE)
-        self.sub_notification_text = self.font.render(self.sub_text, True, WHITE)
+        self.notification_text = font_manager.render_text(
+            self.dev_font, self.text, True, WHITE
+        )
+        self.sub_notification_text = font_manager.render_text(
+            self.font, self.sub_text, True, WHITE
+        )
 
         text_width = max(
             self.notification_text.get_width(), self.sub_notification_text.get_width()
@@ -3061,7 +3237,7 @@ class DevelopmentNotification:
             self.screen, (255, 255, 255), self.continue_button, 2, border_radius=10
         )
 
-        button_text = self.font.render("Continue", True, WHITE)
+        button_text = font_manager.render_text(self.font, "Continue", True, WHITE)
         text_x = (
             self.continue_button.x
             + (self.continue_button.width - button_text.get_width()) // 2
@@ -3119,13 +3295,8 @@ class AIEmotionUI:
         self.angry_hover = False
 
         try:
-            happy_path = os.path.join(base_path, "assets/image/Happy.png")
-            self.happy_image = pygame.image.load(happy_path)
-            self.happy_image = pygame.transform.scale(self.happy_image, button_size)
-
-            angry_path = os.path.join(base_path, "assets/image/Angry.png")
-            self.angry_image = pygame.image.load(angry_path)
-            self.angry_image = pygame.transform.scale(self.angry_image, button_size)
+            self.happy_image = asset_manager.get_scaled("Happy.png", button_size)
+            self.angry_image = asset_manager.get_scaled("Angry.png", button_size)
         except (pygame.error, FileNotFoundError):
             print("Could not load emotion king images")
             self.happy_image = pygame.Surface(button_size)
@@ -3166,7 +3337,7 @@ class AIEmotionUI:
             self.screen, ACCENT_COLOR, self.panel_rect, 2, border_radius=10
         )
 
-        title_text = self.font.render("Taunt AI", True, WHITE)
+        title_text = font_manager.render_text(self.font, "Taunt AI", True, WHITE)
         title_rect = title_text.get_rect(
             centerx=self.panel_rect.centerx, y=self.panel_rect.y + 5
         )
@@ -3206,7 +3377,7 @@ class AIEmotionUI:
             int(255 * min(1, max(0, (0.3 - mood_value) / 0.6))),
             50,
         )
-        mood_surface = self.font.render(mood_text, True, mood_color)
+        mood_surface = font_manager.render_text(self.font, mood_text, True, mood_color)
         mood_rect = mood_surface.get_rect(
             centerx=self.panel_rect.centerx, bottom=self.panel_rect.bottom - 5
         )
@@ -3215,7 +3386,9 @@ class AIEmotionUI:
         total_clicks = self.happy_clicks_after_limit + self.angry_clicks_after_limit
         if total_clicks > 0 and total_clicks < self.easter_egg_threshold:
             egg_text = f"{self.easter_egg_threshold - total_clicks} more..."
-            egg_surface = self.font.render(egg_text, True, (255, 215, 0))
+            egg_surface = font_manager.render_text(
+                self.font, egg_text, True, (255, 215, 0)
+            )
             egg_rect = egg_surface.get_rect(
                 centerx=self.panel_rect.centerx, bottom=self.panel_rect.bottom - 25
             )
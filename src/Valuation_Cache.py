@@ -0,0 +1,73 @@
+# Property Tycoon Valuation_Cache.py
+# It contains the valuation cache, which remembers AI property valuations until the board's ownership or development changes.
+
+import threading
+
+
+class ValuationCache:
+    def __init__(self):
+        # Keys are (kind, property, player, board version); only the newest version is kept
+        self._values = {}
+        self._lock = threading.Lock()
+        self.version = None
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, key, version, calculate):
+        """Get a cached valuation, or work it out with calculate() and keep it"""
+        full_key = (*key, version)
+        with self._lock:
+            if version != self.version:
+                if self._values:
+                    self.invalidations += 1
+                self._values.clear()
+                self.version = version
+            if full_key in self._values:
+                self.hits += 1
+                return self._values[full_key]
+            self.misses += 1
+
+        # AI decisions run on a worker thread, so the calculation happens outside the lock
+        value = calculate()
+        with self._lock:
+            if version == self.version:
+                self._values[full_key] = value
+        return value
+
+    def clear(self):
+        """Clear the valuation cache"""
+        with self._lock:
+            self._values.clear()
+            self.version = None
+
+    def get_stats(self):
+        """Get the entry count and hit/miss counters"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._values),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def get_cached_valuation(kind, property_data, owned_properties, calculate):
+    """Look up a valuation for the player who owns owned_properties on property_data's board"""
+    # Spaces from a PropertyRegistry carry it with them; anything else is worked out fresh
+    registry = getattr(property_data, "registry", None)
+    if registry is None:
+        return calculate()
+
+    owner = None
+    for space in owned_properties:
+        owner = space.get("owner") if isinstance(space, dict) else None
+        break
+    # The key only stands for the player's real holdings, not a hypothetical list
+    if len(owned_properties) != len(registry.owner_positions.get(owner, [])):
+        return calculate()
+
+    return registry.valuations.get(
+        (kind, property_data.key, owner), registry.version, calculate
+    )
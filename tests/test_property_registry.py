@@ -0,0 +1,115 @@
+# Property Tycoon test_property_registry.py
+# It contains tests that check the property indexes and rent table against a full scan as the board changes.
+
+import random
+import pytest
+from src.Game_Logic import GameLogic
+from src.Simulation import SimulationClock
+
+BROWN = ("2", "4")
+BLUE = ("7", "9", "10")
+STATIONS = ("6", "16")
+UTILITY = "13"
+
+
+def assert_in_step(logic):
+    assert logic.properties.find_index_errors() == []
+    assert logic.rent_table.find_rent_errors() == []
+
+
+@pytest.fixture
+def logic():
+    logic = GameLogic(clock=SimulationClock(), rng=random.Random(0))
+    for name in ("Alice", "Bob"):
+        logic.add_player(name)
+        # Buying needs a lap of the board first
+        logic.completed_circuits[name] = 1
+    assert_in_step(logic)
+    return logic
+
+
+def test_field_changes(logic):
+    properties = logic.properties
+    for key in BROWN + STATIONS + (UTILITY,):
+        properties[key]["owner"] = "Alice"
+        assert_in_step(logic)
+
+    properties["4"]["houses"] = 2
+    assert_in_step(logic)
+    properties["6"]["is_mortgaged"] = True
+    assert_in_step(logic)
+
+    properties["2"]["owner"] = "Bob"
+    assert_in_step(logic)
+    properties["16"]["owner"] = None
+    assert_in_step(logic)
+    properties["4"]["houses"] = 0
+    assert_in_step(logic)
+    properties["6"]["is_mortgaged"] = False
+    assert_in_step(logic)
+
+
+def test_buy(logic):
+    alice = logic.get_player("Alice")
+    for key in BLUE:
+        alice["position"] = int(key)
+        assert logic.buy_property(alice)
+        assert logic.properties[key]["owner"] == "Alice"
+        assert_in_step(logic)
+
+
+def test_auction(logic):
+    alice = logic.get_player("Alice")
+    bob = logic.get_player("Bob")
+
+    assert logic.auction_property(STATIONS[0]) == "auction_in_progress"
+    assert_in_step(logic)
+    accepted, _ = logic.process_auction_bid(alice, 100)
+    assert accepted
+    logic.process_auction_pass(bob)
+    assert logic.check_auction_end() == "auction_completed"
+
+    assert logic.properties[STATIONS[0]]["owner"] == "Alice"
+    assert_in_step(logic)
+
+
+def test_mortgage_and_unmortgage(logic):
+    alice = logic.get_player("Alice")
+    for key in BROWN:
+        alice["position"] = int(key)
+        assert logic.buy_property(alice)
+    assert_in_step(logic)
+
+    space = logic.properties[BROWN[0]]
+    assert logic.mortgage_property(space, alice)
+    assert_in_step(logic)
+    assert logic.unmortgage_property(space, alice)
+    assert_in_step(logic)
+
+
+def test_bankruptcy(logic):
+    alice = logic.get_player("Alice")
+    for key in BROWN + STATIONS:
+        alice["position"] = int(key)
+        assert logic.buy_property(alice)
+    logic.properties[BROWN[0]]["houses"] = 3
+    logic.properties[STATIONS[0]]["is_mortgaged"] = True
+    assert_in_step(logic)
+
+    logic.handle_bankruptcy(alice)
+    assert logic.properties.get_owned("Alice") == []
+    assert_in_step(logic)
+
+
+def test_stale_rents_are_found(logic):
+    properties = logic.properties
+    for key in BROWN + STATIONS + (UTILITY,):
+        properties[key]["owner"] = "Alice"
+    assert_in_step(logic)
+
+    # Changing spaces behind the registry's back leaves its counts and the table stale
+    dict.__setitem__(properties["16"], "owner", "Bob")
+    dict.__setitem__(properties["4"], "houses", 1)
+    errors = logic.rent_table.find_rent_errors()
+    stale = [properties[key]["name"] for key in ("4", "6", "16")]
+    assert [error.split(" has rent")[0] for error in errors] == stale